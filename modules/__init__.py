@@ -13,11 +13,30 @@ from .scanner import VulnerabilityScanner
 from .web_scanner import WebServerScanner
 from .wordpress_scanner import WordPressScanner
 from .joomla_scanner import JoomlaScanner
-from .report_generator import ReportGenerator
+from .report_generator import ReportGenerator, ReportSink
+from .http_client import HttpClient
+from .http_cache import HttpCache
+from .parsed_page import ParsedPage
+from .fingerprint import FingerprintEngine
+from .vulnerability_database import VulnerabilityDatabase
+from .probe_scheduler import ProbeScheduler, iter_wordlist
+from .path_prober import PathProber
+from .link_store import LinkStore, FormStore, normalize_url
+from .crawler import Crawler
+from .tls_inspector import TlsInspector
+from .dns_resolver import DnsResolver
+from .geoip import GeoLocator, GeoIpDatabase
+from .whois_cache import WhoisCache, PublicSuffixList
+from .nmap_stream import NmapXmlStream
+from .nse_planner import NseScriptPlanner
+from .orchestrator import ScanOrchestrator
+from .incremental import load_previous_results, diff_findings
+from .scan_journal import ScanJournal
+from .targets import iter_targets, expand_target
 
 __all__ = [
     'banner', 'check_requirements', 'setup_logger', 'is_valid_ip', 'is_valid_domain',
     'get_target_type', 'resolve_domain_to_ip', 'get_severity_color', 'format_time',
     'VulnerabilityScanner', 'WebServerScanner', 'WordPressScanner', 'JoomlaScanner',
-    'ReportGenerator'
+    'ReportGenerator', 'ReportSink', 'HttpClient', 'HttpCache', 'ParsedPage', 'FingerprintEngine', 'VulnerabilityDatabase', 'ProbeScheduler', 'iter_wordlist', 'PathProber', 'LinkStore', 'FormStore', 'normalize_url', 'Crawler', 'TlsInspector', 'DnsResolver', 'GeoLocator', 'GeoIpDatabase', 'WhoisCache', 'PublicSuffixList', 'NmapXmlStream', 'NseScriptPlanner', 'ScanOrchestrator', 'load_previous_results', 'diff_findings', 'ScanJournal', 'iter_targets', 'expand_target'
 ]
\ No newline at end of file
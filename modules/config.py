@@ -6,6 +6,7 @@
 """
 
 import os
+import copy
 import yaml
 import json
 from pathlib import Path
@@ -34,13 +35,55 @@ DEFAULT_CONFIG = {
             'default', 'banner', 'http-enum', 'http-headers', 'http-methods',
             'http-title', 'ssl-cert', 'ssl-enum-ciphers', 'vuln'
         ],
+        # اكتشاف المنافذ المفتوحة بماسح TCP غير متزامن قبل تشغيل nmap
+        'fast_discovery': False,
+        'discovery_concurrency': 500,
+        'discovery_timeout': 1.0,
+        # عدد أسماء النطاقات المحللة بالتوازي قبل مسح كل دفعة من الأهداف المتعددة
+        'dns_concurrency': 50,
+        # قاعدة بيانات الموقع الجغرافي و ASN المحلية (ملف CSV لنطاقات العناوين أو mmdb، None لعدم استخدامها)
+        # واستخدام ipinfo.io للعناوين غير الموجودة فيها (False للأجهزة المعزولة عن الإنترنت)
+        'geoip_database': None,
+        'geoip_remote': True,
+        # ذاكرة WHOIS الدائمة مفهرسة حسب النطاق القابل للتسجيل (None لذاكرة داخل العملية فقط)،
+        # ومدة صلاحية النتائج وعدم وجود سجل بالثواني، وملف قائمة اللواحق العامة (None للقائمة المضمنة)
+        'whois_cache': os.path.join(os.path.expanduser('~'), '.saudi_attack', 'whois_cache.sqlite'),
+        'whois_ttl': 7 * 24 * 3600,
+        'whois_negative_ttl': 3600,
+        'public_suffix_list': None,
+        # ملف ربط الخدمات المكتشفة بنصوص NSE الخاصة بها (None للملف المضمن)
+        'nse_service_scripts': None,
     },
     
     # إعدادات الويب
     'web': {
+        # الحد الأقصى للاتصالات المفتوحة لكل مضيف (افتراضيًا: عدد المواضيع)
+        'pool_size': None,
+        # الحد الأقصى لحجم ذاكرة التخزين المؤقت للاستجابات بالبايت (0 لتعطيلها)
+        'response_cache_bytes': 8 * 1024 * 1024,
+        # الحد الأقصى لحجم المحتوى المقروء من كل استجابة بالبايت (0 بلا حد)
+        'max_body_bytes': 2 * 1024 * 1024,
+        # مسار ذاكرة HTTP الدائمة للطلبات الشرطية بين عمليات المسح (None لتعطيلها)
+        'http_cache': None,
+        # الحد الأقصى للطلبات في الثانية لكل مضيف أثناء الفحوصات المتزامنة (0 بلا حد)
+        'rate_limit': 0,
+        # عدد الفحوصات المتزامنة (None: عدد المواضيع) والحد الأقصى منها لكل مضيف (0: بلا حد إضافي)
+        'probe_width': None,
+        'per_host_limit': 0,
+        # الحد الأقصى لعدد الروابط والنماذج المجمعة لكل هدف (0 بلا حد)
+        'max_links': 10000,
+        'max_forms': 1000,
+        # الزحف بالعرض أولاً: أقصى عمق، والحد الأقصى للصفحات (0 لتعطيل الزحف) ولحجم الواجهة،
+        # واحترام المسارات الممنوعة في robots.txt
+        'crawl_max_depth': 2,
+        'crawl_max_pages': 50,
+        'crawl_max_frontier': 1000,
+        'crawl_respect_robots': False,
+        # المسارات الحساسة التي يفحصها فاحص المسارات (كل مسار موجود يُسجل كثغرة)
         'paths_to_check': [
-            '/', '/robots.txt', '/sitemap.xml', '/admin', '/login', '/wp-admin',
-            '/administrator', '/phpmyadmin', '/.git', '/.env', '/backup', '/config'
+            '/robots.txt', '/.git/', '/.svn/', '/.env', '/config.php', '/wp-config.php',
+            '/phpinfo.php', '/server-status', '/server-info', '/admin/', '/backup/',
+            '/db/', '/logs/'
         ],
         'security_headers': [
             'Strict-Transport-Security', 'Content-Security-Policy',
@@ -52,22 +95,24 @@ DEFAULT_CONFIG = {
     # إعدادات ووردبريس
     'wordpress': {
         'paths_to_check': [
-            '/wp-login.php', '/wp-admin/', '/wp-config.php', '/wp-content/',
-            '/wp-includes/', '/xmlrpc.php', '/wp-json/'
+            '/wp-config.php', '/wp-config-sample.php', '/wp-content/debug.log',
+            '/.wp-config.php.swp', '/wp-content/uploads/wp-config.php'
         ],
         'version_detection_paths': [
             '/feed/', '/wp-includes/css/dist/block-library/style.min.css',
             '/readme.html', '/wp-includes/js/wp-emoji-release.min.js'
         ],
+        # ملفات قوائم الكلمات لتخمين الإضافات والقوالب (اسم في كل سطر، None لتعطيلها)
+        'plugin_wordlist': None,
+        'theme_wordlist': None,
     },
     
     # إعدادات جوملا
     'joomla': {
         'paths_to_check': [
-            '/administrator/', '/administrator/index.php', '/configuration.php',
-            '/htaccess.txt', '/installation/', '/robots.txt.dist', '/web.config.txt',
-            '/administrator/manifests/files/joomla.xml', '/language/en-GB/en-GB.xml',
-            '/administrator/components/', '/components/'
+            '/configuration.php', '/htaccess.txt', '/web.config.txt',
+            '/administrator/manifests/files/joomla.xml', '/administrator/logs/',
+            '/installation/'
         ],
         'version_detection_paths': [
             '/administrator/manifests/files/joomla.xml',
@@ -100,7 +145,7 @@ class Config:
         المعلمات:
             config_file (str): مسار ملف التكوين الاختياري
         """
-        self.config = DEFAULT_CONFIG.copy()
+        self.config = copy.deepcopy(DEFAULT_CONFIG)
         
         # إنشاء دليل الإخراج الافتراضي إذا لم يكن موجودًا
         os.makedirs(self.config['general']['output_dir'], exist_ok=True)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة الزاحف لأداة SaudiAttack
+
+زاحف بالعرض أولاً (BFS) يبدأ من الصفحة الرئيسية ومن الروابط المذكورة في
+robots.txt و sitemap.xml، ويجلب صفحات كل مستوى بشكل متزامن عبر مجدول الفحوصات
+وعميل HTTP المشترك. الذاكرة محدودة: الواجهة (frontier) لها حد أقصى، والروابط التي
+تمت زيارتها تُحفظ كبصمات قصيرة بحجم ثابت بدلاً من النصوص الكاملة، ويتوقف الزحف
+عند بلوغ حد العمق أو عدد الصفحات.
+"""
+
+import re
+import hashlib
+from collections import deque
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from .link_store import normalize_url
+
+# أنواع المحتوى التي يتم تحليلها واستخراج الروابط منها
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+# الامتدادات التي لا تحتوي على روابط ولا يتم جلبها
+SKIPPED_EXTENSIONS = (
+    ".jpg", ".jpeg", ".png", ".gif", ".svg", ".ico", ".webp", ".css", ".js", ".woff", ".woff2",
+    ".ttf", ".eot", ".pdf", ".zip", ".gz", ".tar", ".rar", ".mp3", ".mp4", ".avi", ".mov"
+)
+
+# الحد الأقصى لعدد الروابط المأخوذة من sitemap.xml
+MAX_SITEMAP_URLS = 1000
+
+
+class Crawler:
+    """
+    فئة الزاحف بالعرض أولاً
+    """
+
+    def __init__(self, http, scheduler, max_depth=2, max_pages=50, max_frontier=1000, respect_robots=False):
+        """
+        تهيئة الزاحف
+
+        المعطيات:
+            http (HttpClient): عميل HTTP المشترك
+            scheduler (ProbeScheduler): مجدول الفحوصات المتزامنة
+            max_depth (int): أقصى عمق للروابط بدءًا من الصفحة الأولى
+            max_pages (int): الحد الأقصى لعدد الصفحات المجلوبة
+            max_frontier (int): الحد الأقصى لعدد الروابط المنتظرة في الواجهة
+            respect_robots (bool): تخطي المسارات الممنوعة في robots.txt
+        """
+        self.http = http
+        self.scheduler = scheduler
+        self.max_depth = max(0, max_depth)
+        self.max_pages = max(0, max_pages)
+        self.max_frontier = max(1, max_frontier)
+        self.respect_robots = respect_robots
+
+    @classmethod
+    def from_config(cls, config, http, scheduler):
+        """
+        إنشاء الزاحف من كائن التكوين
+
+        المعطيات:
+            config (Config): كائن التكوين
+            http (HttpClient): عميل HTTP المشترك
+            scheduler (ProbeScheduler): مجدول الفحوصات المتزامنة
+
+        المخرجات:
+            Crawler: الزاحف
+        """
+        return cls(
+            http,
+            scheduler,
+            max_depth=config.get("web", "crawl_max_depth") or 0,
+            max_pages=config.get("web", "crawl_max_pages") or 0,
+            max_frontier=config.get("web", "crawl_max_frontier") or 1000,
+            respect_robots=bool(config.get("web", "crawl_respect_robots"))
+        )
+
+    def crawl(self, start_url, on_page):
+        """
+        الزحف بدءًا من عنوان URL وتمرير كل صفحة HTML إلى دالة الاستقبال فور جلبها
+
+        المعطيات:
+            start_url (str): عنوان URL للبداية
+            on_page (callable): دالة تستقبل (عنوان URL، الصفحة المحللة)
+
+        المخرجات:
+            int: عدد الصفحات التي تم جلبها
+        """
+        start_url = normalize_url(start_url)
+        if not start_url or not self.max_pages:
+            return 0
+
+        origin = urlparse(start_url).netloc
+        seen = set()
+        frontier = deque()
+
+        def enqueue(url, depth):
+            url = normalize_url(url, start_url)
+            if not url or urlparse(url).netloc != origin or depth > self.max_depth:
+                return
+            if urlparse(url).path.lower().endswith(SKIPPED_EXTENSIONS):
+                return
+            # بصمة بحجم ثابت بدلاً من النص الكامل للرابط
+            key = hashlib.blake2b(url.encode("utf-8", "ignore"), digest_size=8).digest()
+            if key in seen or len(frontier) >= self.max_frontier:
+                return
+            if robots is not None and not robots.can_fetch(self.http.session.headers.get("User-Agent", "*"), url):
+                return
+            seen.add(key)
+            frontier.append((url, depth))
+
+        robots, seeds = self._load_robots(start_url)
+        enqueue(start_url, 0)
+        for url in seeds + self._load_sitemap(start_url, robots_sitemaps=seeds):
+            enqueue(url, 1)
+
+        fetched = 0
+        while frontier and fetched < self.max_pages:
+            # جلب مستوى كامل (أو ما يسمح به حد الصفحات) بشكل متزامن
+            batch = [frontier.popleft() for _ in range(min(len(frontier), self.max_pages - fetched))]
+            results = self.scheduler.map(lambda item: self._fetch(item[0]), batch, host=origin)
+            fetched += len(batch)
+
+            for (url, depth), page in results:
+                on_page(url, page)
+                for link in page.links:
+                    enqueue(link, depth + 1)
+
+        return fetched
+
+    def _fetch(self, url):
+        """
+        جلب صفحة وتحليلها إذا كانت HTML
+
+        المعطيات:
+            url (str): عنوان URL
+
+        المخرجات:
+            ParsedPage: الصفحة المحللة أو None إذا لم تكن صفحة HTML ناجحة
+        """
+        response = self.http.get(url, allow_redirects=True)
+        content_type = response.headers.get("Content-Type", "").lower()
+        if response.status_code != 200 or not content_type.startswith(HTML_CONTENT_TYPES):
+            return None
+        return self.http.page(response)
+
+    def _load_robots(self, start_url):
+        """
+        تحميل robots.txt واستخراج الروابط المذكورة فيه
+
+        المعطيات:
+            start_url (str): عنوان URL للبداية
+
+        المخرجات:
+            tuple: (محلل robots.txt إذا كان يجب احترامه أو None، قائمة الروابط)
+        """
+        robots_url = normalize_url("/robots.txt", start_url)
+        try:
+            response = self.http.get(robots_url)
+        except Exception:
+            return None, []
+        if response.status_code != 200:
+            return None, []
+
+        lines = response.text.splitlines()
+        seeds = []
+        for line in lines:
+            field, _, value = line.partition(":")
+            field = field.strip().lower()
+            value = value.split("#", 1)[0].strip()
+            if field == "sitemap" and value:
+                seeds.append(value)
+            elif field in ("allow", "disallow") and value.startswith("/") and "*" not in value and "$" not in value:
+                if field == "allow" or not self.respect_robots:
+                    seeds.append(value)
+
+        robots = None
+        if self.respect_robots:
+            robots = RobotFileParser(robots_url)
+            robots.parse(lines)
+        return robots, seeds
+
+    def _load_sitemap(self, start_url, robots_sitemaps=()):
+        """
+        استخراج الروابط من sitemap.xml (ومن خرائط الموقع المذكورة في robots.txt)
+
+        المعطيات:
+            start_url (str): عنوان URL للبداية
+            robots_sitemaps (iterable): الروابط المأخوذة من robots.txt
+
+        المخرجات:
+            list: الروابط (بحد أقصى MAX_SITEMAP_URLS)
+        """
+        sitemaps = [normalize_url("/sitemap.xml", start_url)]
+        sitemaps += [url for url in robots_sitemaps if url.lower().endswith(".xml")]
+
+        urls = []
+        for sitemap_url in dict.fromkeys(sitemaps):
+            try:
+                response = self.http.get(sitemap_url)
+            except Exception:
+                continue
+            if response.status_code != 200:
+                continue
+            for match in re.finditer(r"<loc>\s*([^<\s]+)\s*</loc>", response.text, re.IGNORECASE):
+                urls.append(match.group(1))
+                if len(urls) >= MAX_SITEMAP_URLS:
+                    return urls
+        return urls
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة تحليل أسماء النطاقات لأداة SaudiAttack
+
+محلل مشترك يخزن نتائج التحليل (IPv4 و IPv6) في الذاكرة حتى انتهاء مدة صلاحيتها، بحيث
+يتم تحليل كل اسم مرة واحدة فقط لإنشاء الماسح وجمع سجلات DNS وطلبات HTTP ومصافحات TLS.
+إذا كانت حزمة dnspython متوفرة تُستخدم مدة الصلاحية (TTL) الواردة في الإجابة، وإلا
+يُستخدم getaddrinfo مع مدة صلاحية ثابتة. يدعم المحلل تحليل قائمة أسماء بالتوازي قبل
+مسح أهداف متعددة.
+"""
+
+import time
+import socket
+import asyncio
+import ipaddress
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import dns.resolver
+    import dns.exception
+except ImportError:
+    # dnspython اختيارية: بدونها يُستخدم getaddrinfo مع مدة الصلاحية الافتراضية
+    dns = None
+
+# مدة صلاحية النتائج بالثواني عندما لا تتوفر مدة الصلاحية من الإجابة، ومدة صلاحية فشل التحليل
+DEFAULT_DNS_TTL = 300
+NEGATIVE_DNS_TTL = 30
+
+# مهلة الاستعلام الافتراضية بالثواني (عند استخدام dnspython)
+DEFAULT_DNS_TIMEOUT = 5
+
+# الحد الأقصى لعدد الأسماء المخزنة (تُزال الأقدم عند التجاوز)
+MAX_DNS_CACHE_ENTRIES = 100000
+
+# عدد الأسماء المحللة في الوقت نفسه عند التحليل المجمع
+DEFAULT_RESOLVE_CONCURRENCY = 50
+
+
+def _ip_literal(host):
+    """
+    التحقق مما إذا كان المضيف عنوان IP (مع أو بدون أقواس IPv6)
+
+    المعطيات:
+        host (str): المضيف
+
+    المخرجات:
+        ip_address: العنوان أو None إذا كان المضيف اسمًا
+    """
+    try:
+        return ipaddress.ip_address(host.strip("[]"))
+    except ValueError:
+        return None
+
+
+class DnsResolver:
+    """
+    فئة محلل أسماء النطاقات مع تخزين مؤقت يحترم مدة الصلاحية
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, default_ttl=DEFAULT_DNS_TTL, negative_ttl=NEGATIVE_DNS_TTL, timeout=DEFAULT_DNS_TIMEOUT,
+                 max_entries=MAX_DNS_CACHE_ENTRIES):
+        """
+        تهيئة المحلل
+
+        المعطيات:
+            default_ttl (int): مدة صلاحية النتائج عندما لا تتوفر من الإجابة
+            negative_ttl (int): مدة صلاحية فشل التحليل
+            timeout (float): مهلة الاستعلام بالثواني
+            max_entries (int): الحد الأقصى لعدد الأسماء المخزنة
+        """
+        self.default_ttl = default_ttl
+        self.negative_ttl = negative_ttl
+        self.timeout = timeout
+        self.max_entries = max(1, max_entries)
+        self._cache = OrderedDict()
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """
+        الحصول على المحلل المشترك (ذاكرة تخزين واحدة لكل عملية)
+
+        المخرجات:
+            DnsResolver: المحلل
+        """
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+        return cls._shared
+
+    def resolve(self, host):
+        """
+        تحليل اسم إلى عناوينه (يُحلل كل اسم مرة واحدة فقط حتى عند الطلب المتزامن)
+
+        المعطيات:
+            host (str): اسم المضيف أو عنوان IP
+
+        المخرجات:
+            list: السجلات بالشكل {"type": "A" أو "AAAA", "ip": العنوان} (فارغة عند الفشل)
+        """
+        address = _ip_literal(host)
+        if address is not None:
+            return [{"type": "A" if address.version == 4 else "AAAA", "ip": str(address)}]
+
+        key = host.lower().rstrip(".")
+        records = self._cached(key)
+        if records is not None:
+            return records
+
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            records = self._cached(key)
+            if records is None:
+                records, ttl = self._lookup(key)
+                with self._lock:
+                    self._cache[key] = (time.monotonic() + ttl, records)
+                    self._cache.move_to_end(key)
+                    while len(self._cache) > self.max_entries:
+                        evicted, _ = self._cache.popitem(last=False)
+                        self._locks.pop(evicted, None)
+            return [dict(record) for record in records]
+
+    def resolve_one(self, host):
+        """
+        الحصول على عنوان واحد للاتصال (IPv4 أولاً ثم IPv6)
+
+        المعطيات:
+            host (str): اسم المضيف أو عنوان IP
+
+        المخرجات:
+            str: العنوان أو None عند الفشل
+        """
+        records = self.resolve(host)
+        for record_type in ("A", "AAAA"):
+            for record in records:
+                if record["type"] == record_type:
+                    return record["ip"]
+        return None
+
+    def resolve_many(self, hosts, concurrency=DEFAULT_RESOLVE_CONCURRENCY):
+        """
+        تحليل عدة أسماء بالتوازي وتخزين نتائجها
+
+        المعطيات:
+            hosts (iterable): الأسماء
+            concurrency (int): عدد الأسماء المحللة في الوقت نفسه
+
+        المخرجات:
+            dict: السجلات لكل اسم
+        """
+        hosts = list(dict.fromkeys(hosts))
+        if not hosts:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(hosts)))) as executor:
+            return dict(zip(hosts, executor.map(self.resolve, hosts)))
+
+    async def resolve_many_async(self, hosts, concurrency=DEFAULT_RESOLVE_CONCURRENCY):
+        """
+        تحليل عدة أسماء بالتوازي دون حجب حلقة asyncio
+
+        المعطيات:
+            hosts (iterable): الأسماء
+            concurrency (int): عدد الأسماء المحللة في الوقت نفسه
+
+        المخرجات:
+            dict: السجلات لكل اسم
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.resolve_many, list(hosts), concurrency)
+
+    def clear(self):
+        """
+        مسح النتائج المخزنة
+        """
+        with self._lock:
+            self._cache.clear()
+            self._locks.clear()
+
+    def _cached(self, key):
+        """
+        الحصول على نتيجة مخزنة لم تنته صلاحيتها
+
+        المعطيات:
+            key (str): الاسم
+
+        المخرجات:
+            list: السجلات أو None إذا لم تكن مخزنة أو انتهت صلاحيتها
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            expires, records = entry
+            if expires <= time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return [dict(record) for record in records]
+
+    def _lookup(self, host):
+        """
+        تحليل اسم دون تخزين
+
+        المعطيات:
+            host (str): الاسم
+
+        المخرجات:
+            tuple: (السجلات، مدة الصلاحية بالثواني)
+        """
+        if dns is not None:
+            records, ttl = self._lookup_dnspython(host)
+            if records:
+                return records, ttl
+
+        # getaddrinfo يستخدم أيضًا ملف hosts الذي لا يقرؤه dnspython
+        records = []
+        try:
+            for family, _, _, _, sockaddr in socket.getaddrinfo(host, None, proto=socket.IPPROTO_TCP):
+                record = {"type": "A" if family == socket.AF_INET else "AAAA", "ip": sockaddr[0]}
+                if record not in records:
+                    records.append(record)
+        except (socket.gaierror, UnicodeError):
+            pass
+        return records, self.default_ttl if records else self.negative_ttl
+
+    def _lookup_dnspython(self, host):
+        """
+        تحليل اسم باستعلامي A و AAAA مع مدة الصلاحية من الإجابة
+
+        المعطيات:
+            host (str): الاسم
+
+        المخرجات:
+            tuple: (السجلات، أقل مدة صلاحية في الإجابات)
+        """
+        records = []
+        ttls = []
+        for record_type in ("A", "AAAA"):
+            try:
+                answer = dns.resolver.resolve(host, record_type, lifetime=self.timeout)
+            except dns.exception.DNSException:
+                continue
+            ttls.append(answer.rrset.ttl)
+            records.extend({"type": record_type, "ip": item.address} for item in answer)
+        return records, min(ttls) if ttls else self.negative_ttl
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة بصمات التقنيات لأداة SaudiAttack
+
+تُحمّل البصمات من ملف data/technologies.json وتُترجم مرة واحدة لكل عملية. لكل نمط
+في محتوى HTML أو مصادر النصوص البرمجية يُستخرج نص حرفي إلزامي، وتُدمج جميع النصوص
+الحرفية في تعبير نمطي واحد على شكل شجرة بادئات (trie). يمر هذا التعبير على المحتوى
+مرة واحدة فقط، ثم يتم التحقق من الأنماط الكاملة للبصمات المرشحة فقط واستخراج
+الإصدارات منها، لذا لا يتباطأ الفحص خطيًا مع زيادة عدد البصمات.
+
+صيغة ملف البصمات:
+
+    {
+        "WordPress": {
+            "html": ["wp-content", "wp-includes"],
+            "scripts": ["wp-includes/js/"],
+            "meta": {"generator": "WordPress ?(?P<version>[\\d.]+)?"},
+            "headers": {"X-Powered-By": "WordPress"},
+            "cookies": {"wordpress_test_cookie": ""}
+        }
+    }
+
+يتم استخراج الإصدار من المجموعة المسماة version إن وجدت.
+"""
+
+import os
+import re
+import json
+import threading
+
+# المسار الافتراضي لملف البصمات
+DEFAULT_TECHNOLOGIES_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "technologies.json"
+)
+
+# الحقول التي يتم فحصها بالمرشح الحرفي المدمج
+TEXT_FIELDS = ("html", "scripts")
+
+# الحقول التي يتم فحصها حسب المفتاح (اسم الترويسة أو الكوكي أو العلامة الوصفية)
+KEYED_FIELDS = ("headers", "cookies", "meta")
+
+# أقصر نص حرفي يستخدم في المرشح (النصوص الأقصر تنتج مرشحين كثيرين)
+MIN_LITERAL_LENGTH = 3
+
+# رموز الهروب التي تمثل فئة أحرف وليست حرفًا حرفيًا
+_CLASS_ESCAPES = set("dDsSwWbBAZ0123456789")
+
+
+def required_literal(pattern):
+    """
+    استخراج أطول نص حرفي يجب أن يظهر في أي تطابق للنمط
+
+    يتم تجاهل ما داخل المجموعات وفئات الأحرف، ويُعاد None إذا احتوى النمط على
+    بدائل في المستوى الأعلى أو لم يحتو على نص حرفي كافٍ.
+
+    المعطيات:
+        pattern (str): التعبير النمطي
+
+    المخرجات:
+        str: النص الحرفي بأحرف صغيرة أو None
+    """
+    runs = []
+    current = []
+    depth = 0
+    i = 0
+
+    def flush():
+        if current:
+            runs.append("".join(current))
+            del current[:]
+
+    while i < len(pattern):
+        char = pattern[i]
+
+        if char == "\\" and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            i += 2
+            if depth == 0 and escaped not in _CLASS_ESCAPES:
+                current.append(escaped)
+            elif depth == 0:
+                flush()
+            continue
+
+        if char == "[":
+            # تخطي فئة الأحرف كاملة
+            flush()
+            i += 1
+            if i < len(pattern) and pattern[i] == "]":
+                i += 1
+            while i < len(pattern) and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+            i += 1
+            continue
+
+        if char == "(":
+            flush()
+            depth += 1
+        elif char == ")":
+            depth = max(0, depth - 1)
+        elif depth > 0:
+            pass
+        elif char == "|":
+            return None
+        elif char in "?*{":
+            # العنصر السابق اختياري ولا يمكن اعتباره إلزاميًا
+            if current:
+                current.pop()
+            flush()
+            if char == "{":
+                while i < len(pattern) and pattern[i] != "}":
+                    i += 1
+        elif char in "+.^$":
+            flush()
+        else:
+            current.append(char)
+
+        i += 1
+
+    flush()
+    literal = max(runs, key=len, default="").lower()
+    return literal if len(literal) >= MIN_LITERAL_LENGTH else None
+
+
+def _build_trie_pattern(literals):
+    """
+    بناء تعبير نمطي على شكل شجرة بادئات يطابق أطول نص حرفي يبدأ عند كل موضع
+
+    المعطيات:
+        literals (iterable): النصوص الحرفية
+
+    المخرجات:
+        str: التعبير النمطي
+    """
+    trie = {}
+    for literal in literals:
+        node = trie
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node):
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        terminal = "" in node
+        if len(branches) == 1 and not terminal:
+            return branches[0]
+        body = "(?:" + "|".join(branches) + ")"
+        return body + "?" if terminal else body
+
+    return render(trie)
+
+
+class Signature:
+    """
+    فئة بصمة واحدة لتقنية في حقل معين
+    """
+
+    def __init__(self, technology, field, pattern, key=None):
+        """
+        تهيئة البصمة
+
+        المعطيات:
+            technology (str): اسم التقنية
+            field (str): الحقل (html أو scripts أو headers أو cookies أو meta)
+            pattern (str): التعبير النمطي (يمكن أن يحتوي على المجموعة المسماة version)
+            key (str): اسم الترويسة أو الكوكي أو العلامة الوصفية للحقول ذات المفاتيح
+        """
+        self.technology = technology
+        self.field = field
+        self.key = key
+        self.regex = re.compile(pattern, re.IGNORECASE)
+        self.literal = required_literal(pattern) if field in TEXT_FIELDS else None
+
+    def match(self, value):
+        """
+        مطابقة البصمة مع قيمة
+
+        المعطيات:
+            value (str): القيمة المراد فحصها
+
+        المخرجات:
+            str: الإصدار المستخرج (فارغ إذا لم يتوفر) أو None إذا لم تتطابق البصمة
+        """
+        match = self.regex.search(value)
+        if not match:
+            return None
+        return (match.groupdict().get("version") or "").strip()
+
+
+class FingerprintEngine:
+    """
+    فئة محرك بصمات التقنيات
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, technologies):
+        """
+        تهيئة المحرك وترجمة جميع البصمات
+
+        المعطيات:
+            technologies (dict): البصمات مفهرسة حسب اسم التقنية
+        """
+        self.technologies = sorted(technologies)
+
+        # البصمات النصية: مفهرسة حسب النص الحرفي، وتلك التي بلا نص حرفي تُفحص دائمًا
+        self._by_literal = {field: {} for field in TEXT_FIELDS}
+        self._unfiltered = {field: [] for field in TEXT_FIELDS}
+        self._prefilters = {}
+
+        # البصمات ذات المفاتيح: مفهرسة حسب اسم المفتاح بأحرف صغيرة
+        self._by_key = {field: {} for field in KEYED_FIELDS}
+
+        for technology, fields in technologies.items():
+            for field in TEXT_FIELDS:
+                patterns = fields.get(field, [])
+                if isinstance(patterns, str):
+                    patterns = [patterns]
+                for pattern in patterns:
+                    signature = Signature(technology, field, pattern)
+                    if signature.literal:
+                        self._by_literal[field].setdefault(signature.literal, []).append(signature)
+                    else:
+                        self._unfiltered[field].append(signature)
+
+            for field in KEYED_FIELDS:
+                for key, pattern in fields.get(field, {}).items():
+                    signature = Signature(technology, field, pattern, key)
+                    self._by_key[field].setdefault(key.lower(), []).append(signature)
+
+        for field, literals in self._by_literal.items():
+            if literals:
+                self._prefilters[field] = re.compile("(?=(" + _build_trie_pattern(literals) + "))")
+
+    @classmethod
+    def from_file(cls, path=None):
+        """
+        إنشاء المحرك من ملف بصمات JSON
+
+        المعطيات:
+            path (str): مسار ملف البصمات (افتراضيًا: data/technologies.json)
+
+        المخرجات:
+            FingerprintEngine: محرك البصمات
+        """
+        with open(path or DEFAULT_TECHNOLOGIES_FILE, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    @classmethod
+    def shared(cls):
+        """
+        الحصول على محرك البصمات الافتراضي المشترك (يُحمّل مرة واحدة لكل عملية)
+
+        المخرجات:
+            FingerprintEngine: محرك البصمات
+        """
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls.from_file()
+        return cls._shared
+
+    def analyze(self, html="", scripts=None, headers=None, cookies=None, meta=None):
+        """
+        اكتشاف التقنيات المستخدمة
+
+        المعطيات:
+            html (str): محتوى HTML
+            scripts (list): مصادر ملفات JavaScript
+            headers (dict): ترويسات HTTP
+            cookies (iterable): أسماء الكوكيز (أو قاموس الاسم والقيمة)
+            meta (dict): العلامات الوصفية (الاسم ← قائمة القيم)
+
+        المخرجات:
+            dict: التقنيات المكتشفة مع إصداراتها (فارغ إذا لم يتوفر الإصدار)
+        """
+        detected = {}
+
+        self._analyze_text("html", html or "", detected)
+        if scripts:
+            self._analyze_text("scripts", "\n".join(scripts), detected)
+
+        if headers:
+            self._analyze_keyed("headers", headers, detected)
+        if cookies:
+            if not isinstance(cookies, dict):
+                cookies = {name: "" for name in cookies}
+            self._analyze_keyed("cookies", cookies, detected)
+        if meta:
+            self._analyze_keyed("meta", meta, detected)
+
+        return detected
+
+    def _analyze_text(self, field, text, detected):
+        """
+        فحص نص بالمرشح الحرفي المدمج ثم التحقق من البصمات المرشحة
+
+        المعطيات:
+            field (str): الحقل (html أو scripts)
+            text (str): النص المراد فحصه
+            detected (dict): التقنيات المكتشفة (يتم تحديثه)
+        """
+        candidates = list(self._unfiltered[field])
+
+        prefilter = self._prefilters.get(field)
+        if prefilter and text:
+            by_literal = self._by_literal[field]
+            seen_matches = set()
+            seen_literals = set()
+            for match in prefilter.finditer(text.lower()):
+                found = match.group(1)
+                if found in seen_matches:
+                    continue
+                seen_matches.add(found)
+                # جميع النصوص الحرفية التي تمثل بادئة للنص المطابق موجودة أيضًا
+                for end in range(MIN_LITERAL_LENGTH, len(found) + 1):
+                    prefix = found[:end]
+                    if prefix in by_literal and prefix not in seen_literals:
+                        seen_literals.add(prefix)
+                        candidates.extend(by_literal[prefix])
+
+        for signature in candidates:
+            self._record(signature, signature.match(text), detected)
+
+    def _analyze_keyed(self, field, values, detected):
+        """
+        فحص قيم ذات مفاتيح (ترويسات أو كوكيز أو علامات وصفية)
+
+        المعطيات:
+            field (str): الحقل
+            values (dict): القيم مفهرسة حسب المفتاح (القيمة نص أو قائمة نصوص)
+            detected (dict): التقنيات المكتشفة (يتم تحديثه)
+        """
+        signatures_by_key = self._by_key[field]
+        for key, value in values.items():
+            signatures = signatures_by_key.get(str(key).lower())
+            if not signatures:
+                continue
+            for item in value if isinstance(value, (list, tuple)) else [value]:
+                for signature in signatures:
+                    self._record(signature, signature.match(str(item or "")), detected)
+
+    def _record(self, signature, version, detected):
+        """
+        تسجيل تقنية مكتشفة مع الاحتفاظ بأول إصدار غير فارغ
+
+        المعطيات:
+            signature (Signature): البصمة المطابقة
+            version (str): الإصدار المستخرج أو None إذا لم تتطابق البصمة
+            detected (dict): التقنيات المكتشفة (يتم تحديثه)
+        """
+        if version is None:
+            return
+        if not detected.get(signature.technology):
+            detected[signature.technology] = version
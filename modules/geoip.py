@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة الموقع الجغرافي ومعلومات النظام المستقل (ASN) لأداة SaudiAttack
+
+يُحدد الموقع الجغرافي لعنوان IP من قاعدة بيانات محلية دون اتصال بالشبكة: إما ملف CSV
+لنطاقات العناوين يُحمّل مرة واحدة لكل عملية ويُبحث فيه بالبحث الثنائي، أو ملف بتنسيق
+MaxMind (mmdb) يُفتح بالتعيين في الذاكرة إذا كانت حزمة maxminddb متوفرة. واجهة
+ipinfo.io مزود اختياري يُستخدم فقط إذا لم تجد القاعدة المحلية العنوان (ويمكن تعطيله
+على أجهزة المسح المعزولة عن الإنترنت).
+"""
+
+import csv
+import bisect
+import ipaddress
+import threading
+from array import array
+
+import requests
+
+try:
+    import maxminddb
+except ImportError:
+    # maxminddb اختيارية: بدونها تُدعم ملفات CSV فقط
+    maxminddb = None
+
+# حقول معلومات الموقع في النتائج
+GEOIP_FIELDS = ("country", "region", "city", "loc", "asn", "org")
+
+# القيمة المستخدمة للحقول غير المعروفة
+UNKNOWN = "Unknown"
+
+
+def _parse_address(value):
+    """
+    تحويل عنوان IP أو رقم إلى (الإصدار، الرقم)
+
+    المعطيات:
+        value (str): العنوان أو رقمه
+
+    المخرجات:
+        tuple: (4 أو 6، الرقم)
+    """
+    value = value.strip()
+    if value.isdigit():
+        number = int(value)
+        return (4 if number <= 0xFFFFFFFF else 6), number
+    address = ipaddress.ip_address(value)
+    return address.version, int(address)
+
+
+class GeoIpDatabase:
+    """
+    فئة قاعدة بيانات نطاقات العناوين من ملف CSV
+
+    تُخزن بدايات النطاقات ونهاياتها في مصفوفات مرتبة (جدول لكل إصدار من IP)، ويُحدد
+    النطاق الذي يحتوي العنوان بالبحث الثنائي، لذا يكلف البحث بضع ميكروثانيات.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path):
+        """
+        تحميل ملف CSV لنطاقات العناوين
+
+        يحتوي الملف على صف عناوين الأعمدة: start و end (عنوان IP أو رقمه) أو network
+        (بصيغة CIDR)، ثم أي من country و region و city و loc و asn و org.
+
+        المعطيات:
+            path (str): مسار الملف
+        """
+        self.path = path
+        rows = {4: [], 6: []}
+        records = {}
+
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                try:
+                    if row.get("network"):
+                        network = ipaddress.ip_network(row["network"].strip(), strict=False)
+                        version = network.version
+                        start, end = int(network.network_address), int(network.broadcast_address)
+                    else:
+                        version, start = _parse_address(row["start"])
+                        _, end = _parse_address(row["end"])
+                except (KeyError, ValueError, AttributeError):
+                    continue
+
+                # السجلات المتطابقة (نفس الدولة والمؤسسة) تُخزن مرة واحدة
+                record = tuple((row.get(field) or "").strip() for field in GEOIP_FIELDS)
+                rows[version].append((start, end, records.setdefault(record, record)))
+
+        self._tables = {}
+        for version, entries in rows.items():
+            entries.sort(key=lambda entry: entry[0])
+            starts = [entry[0] for entry in entries]
+            ends = [entry[1] for entry in entries]
+            # عناوين IPv4 تُخزن في مصفوفات أعداد صحيحة مضغوطة (IPv6 تحتاج 128 بت)
+            if version == 4:
+                starts, ends = array("L", starts), array("L", ends)
+            self._tables[version] = (starts, ends, [entry[2] for entry in entries])
+
+    @classmethod
+    def for_path(cls, path):
+        """
+        الحصول على قاعدة البيانات المحملة من الملف (تُحمّل مرة واحدة لكل مسار في العملية)
+
+        المعطيات:
+            path (str): مسار الملف
+
+        المخرجات:
+            GeoIpDatabase: قاعدة البيانات
+        """
+        with cls._instances_lock:
+            if path not in cls._instances:
+                cls._instances[path] = cls(path)
+            return cls._instances[path]
+
+    def __len__(self):
+        return sum(len(records) for _, _, records in self._tables.values())
+
+    def lookup(self, ip):
+        """
+        البحث عن عنوان IP
+
+        المعطيات:
+            ip (str): عنوان IP
+
+        المخرجات:
+            dict: معلومات الموقع (فارغة إذا لم يكن العنوان في أي نطاق)
+        """
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return {}
+
+        starts, ends, records = self._tables[address.version]
+        number = int(address)
+        index = bisect.bisect_right(starts, number) - 1
+        if index < 0 or number > ends[index]:
+            return {}
+        return {field: value for field, value in zip(GEOIP_FIELDS, records[index]) if value}
+
+
+class MaxMindDatabase:
+    """
+    فئة قاعدة بيانات بتنسيق MaxMind (mmdb) مفتوحة بالتعيين في الذاكرة
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path):
+        """
+        فتح ملف mmdb
+
+        المعطيات:
+            path (str): مسار الملف
+        """
+        if maxminddb is None:
+            raise ImportError("حزمة maxminddb غير متوفرة لقراءة ملفات mmdb")
+        self.path = path
+        self._reader = maxminddb.open_database(path, maxminddb.MODE_MMAP)
+
+    @classmethod
+    def for_path(cls, path):
+        """
+        الحصول على قاعدة البيانات المفتوحة من الملف (يُفتح قارئ واحد لكل مسار في العملية
+        بدلاً من قارئ لكل ماسح)
+
+        المعطيات:
+            path (str): مسار الملف
+
+        المخرجات:
+            MaxMindDatabase: قاعدة البيانات
+        """
+        with cls._instances_lock:
+            if path not in cls._instances:
+                cls._instances[path] = cls(path)
+            return cls._instances[path]
+
+    def lookup(self, ip):
+        """
+        البحث عن عنوان IP (يدعم قواعد City و ASN من MaxMind أو ما يماثلها)
+
+        المعطيات:
+            ip (str): عنوان IP
+
+        المخرجات:
+            dict: معلومات الموقع
+        """
+        try:
+            data = self._reader.get(ip) or {}
+        except ValueError:
+            return {}
+
+        location = data.get("location", {})
+        subdivisions = data.get("subdivisions") or [{}]
+        info = {
+            "country": data.get("country", {}).get("iso_code", ""),
+            "region": subdivisions[0].get("names", {}).get("en", ""),
+            "city": data.get("city", {}).get("names", {}).get("en", ""),
+            "loc": f"{location['latitude']},{location['longitude']}" if "latitude" in location else "",
+            "asn": str(data.get("autonomous_system_number", "")),
+            "org": data.get("autonomous_system_organization", "")
+        }
+        return {field: value for field, value in info.items() if value}
+
+
+def open_geoip_database(path):
+    """
+    فتح قاعدة بيانات الموقع الجغرافي المحلية المشتركة حسب تنسيق الملف
+
+    المعطيات:
+        path (str): مسار ملف CSV أو mmdb
+
+    المخرجات:
+        GeoIpDatabase أو MaxMindDatabase: قاعدة البيانات (تُطلق استثناءً إذا تعذر فتحها)
+    """
+    if path.endswith(".mmdb"):
+        return MaxMindDatabase.for_path(path)
+    return GeoIpDatabase.for_path(path)
+
+
+class IpInfoProvider:
+    """
+    فئة مزود الموقع الجغرافي البعيد (ipinfo.io)
+    """
+
+    def __init__(self, timeout=5):
+        """
+        تهيئة المزود
+
+        المعطيات:
+            timeout (int): مهلة الطلب بالثواني
+        """
+        self.timeout = timeout
+
+    def lookup(self, ip):
+        """
+        البحث عن عنوان IP عبر ipinfo.io
+
+        المعطيات:
+            ip (str): عنوان IP
+
+        المخرجات:
+            dict: معلومات الموقع (فارغة في حال الفشل)
+        """
+        try:
+            response = requests.get(f"https://ipinfo.io/{ip}/json", timeout=self.timeout)
+            if response.status_code != 200:
+                return {}
+            data = response.json()
+        except (requests.exceptions.RequestException, ValueError):
+            return {}
+
+        info = {field: data.get(field, "") for field in GEOIP_FIELDS if field != "asn"}
+        # حقل org في ipinfo بالشكل "AS15169 Google LLC"
+        asn, _, org = info.get("org", "").partition(" ")
+        if asn.startswith("AS") and asn[2:].isdigit():
+            info["asn"], info["org"] = asn[2:], org
+        return {field: value for field, value in info.items() if value}
+
+
+class GeoLocator:
+    """
+    فئة تحديد الموقع الجغرافي عبر سلسلة من المزودين (المحلي أولاً ثم البعيد)
+    """
+
+    def __init__(self, providers):
+        """
+        تهيئة محدد الموقع
+
+        المعطيات:
+            providers (list): المزودون بالترتيب (كل مزود يوفر lookup(ip))
+        """
+        self.providers = list(providers)
+
+    @classmethod
+    def from_config(cls, config, timeout=5):
+        """
+        إنشاء محدد الموقع من كائن التكوين
+
+        المعطيات:
+            config (Config): كائن التكوين
+            timeout (int): مهلة المزود البعيد بالثواني
+
+        المخرجات:
+            GeoLocator: محدد الموقع
+        """
+        providers = []
+        database = config.get("scanning", "geoip_database")
+        if database:
+            providers.append(open_geoip_database(database))
+        if config.get("scanning", "geoip_remote") is not False:
+            providers.append(IpInfoProvider(timeout=timeout))
+        return cls(providers)
+
+    def lookup(self, ip):
+        """
+        تحديد موقع عنوان IP من أول مزود يجده
+
+        المعطيات:
+            ip (str): عنوان IP
+
+        المخرجات:
+            dict: معلومات الموقع (الحقول غير المعروفة بالقيمة Unknown) أو فارغة إذا لم يجده أي مزود
+        """
+        for provider in self.providers:
+            info = provider.lookup(ip)
+            if info:
+                return {field: info.get(field, UNKNOWN) for field in GEOIP_FIELDS}
+        return {}
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة ذاكرة HTTP الدائمة لأداة SaudiAttack
+
+تُحفظ الاستجابات التي تحمل محددات صلاحية (ETag أو Last-Modified) في قاعدة SQLite
+مفهرسة حسب عنوان URL، مع المعلومات المستخرجة منها (مثل الإصدار المكتشف). في المسح
+التالي يرسل عميل HTTP الترويسات If-None-Match و If-Modified-Since، وعند استجابة 304
+يعيد استخدام المحتوى المخزن والمعلومات المستخرجة دون تنزيل الملف أو تحليله من جديد.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# المسار الافتراضي لقاعدة البيانات عند التفعيل بدون تحديد مسار
+DEFAULT_HTTP_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.saudi_attack', 'http_cache.sqlite')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    truncated INTEGER NOT NULL DEFAULT 0,
+    facts TEXT NOT NULL DEFAULT '{}',
+    updated_at REAL NOT NULL
+)
+"""
+
+
+class HttpCache:
+    """
+    فئة ذاكرة HTTP الدائمة
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path):
+        """
+        فتح قاعدة البيانات (تُنشأ إذا لم تكن موجودة)
+
+        المعطيات:
+            path (str): مسار ملف قاعدة البيانات
+        """
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(SCHEMA)
+
+    @classmethod
+    def for_path(cls, path):
+        """
+        الحصول على ذاكرة HTTP لمسار (اتصال واحد مشترك لكل ملف في العملية)
+
+        المعطيات:
+            path (str): مسار ملف قاعدة البيانات
+
+        المخرجات:
+            HttpCache: ذاكرة HTTP
+        """
+        key = os.path.abspath(os.path.expanduser(path))
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(key)
+            return cls._instances[key]
+
+    def get(self, url):
+        """
+        الحصول على الاستجابة المخزنة لعنوان URL
+
+        المعطيات:
+            url (str): عنوان URL
+
+        المخرجات:
+            dict: السجل المخزن أو None
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT etag, last_modified, status, headers, body, truncated, facts FROM responses WHERE url = ?",
+                (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "url": url,
+            "etag": row[0],
+            "last_modified": row[1],
+            "status": row[2],
+            "headers": json.loads(row[3]),
+            "body": row[4],
+            "truncated": bool(row[5]),
+            "facts": json.loads(row[6])
+        }
+
+    def conditional_headers(self, entry):
+        """
+        ترويسات الطلب الشرطي لسجل مخزن
+
+        المعطيات:
+            entry (dict): السجل المخزن
+
+        المخرجات:
+            dict: الترويسات If-None-Match و If-Modified-Since
+        """
+        headers = {}
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(self, url, response):
+        """
+        تخزين استجابة إذا كانت تحمل محددات صلاحية
+
+        المعطيات:
+            url (str): عنوان URL المطلوب
+            response (Response): كائن الاستجابة (بمحتوى مقروء)
+
+        المخرجات:
+            bool: True إذا تم التخزين
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return False
+
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, etag, last_modified, status, headers, body, truncated, facts, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, '{}', ?)",
+                (
+                    url, etag, last_modified, response.status_code, json.dumps(dict(response.headers)),
+                    response.content or b"", int(bool(getattr(response, "truncated", False))), time.time()
+                )
+            )
+        return True
+
+    def set_fact(self, url, name, value):
+        """
+        حفظ معلومة مستخرجة من الاستجابة المخزنة (مثل الإصدار)
+
+        المعطيات:
+            url (str): عنوان URL
+            name (str): اسم المعلومة
+            value: القيمة (قابلة للتحويل إلى JSON)
+        """
+        with self._lock, self._db:
+            row = self._db.execute("SELECT facts FROM responses WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return
+            facts = json.loads(row[0])
+            facts[name] = value
+            self._db.execute("UPDATE responses SET facts = ? WHERE url = ?", (json.dumps(facts), url))
+
+    def touch(self, url):
+        """
+        تحديث وقت آخر تحقق من السجل (بعد استجابة 304)
+
+        المعطيات:
+            url (str): عنوان URL
+        """
+        with self._lock, self._db:
+            self._db.execute("UPDATE responses SET updated_at = ? WHERE url = ?", (time.time(), url))
+
+    def response(self, entry):
+        """
+        إنشاء كائن استجابة من سجل مخزن
+
+        المعطيات:
+            entry (dict): السجل المخزن
+
+        المخرجات:
+            Response: كائن الاستجابة (مع الخاصية facts)
+        """
+        response = requests.Response()
+        response.url = entry["url"]
+        response.status_code = entry["status"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["body"]
+        response._content_consumed = True
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.truncated = entry["truncated"]
+        response.revalidated = True
+        response.facts = dict(entry["facts"])
+        return response
+
+    def close(self):
+        """
+        إغلاق قاعدة البيانات
+        """
+        with self._lock:
+            self._db.close()
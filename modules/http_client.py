@@ -0,0 +1,513 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة عميل HTTP المشترك لأداة SaudiAttack
+"""
+
+import re
+import asyncio
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .parsed_page import ParsedPage
+from .http_cache import HttpCache
+from .dns_resolver import DnsResolver
+
+# الحد الافتراضي لحجم ذاكرة التخزين المؤقت للاستجابات بالبايت
+DEFAULT_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# طرق الطلب التي يمكن تخزين استجاباتها مؤقتًا
+CACHEABLE_METHODS = ("GET", "HEAD")
+
+# معطيات الطلب التي لا تغير هوية الاستجابة ولا تمنع التخزين المؤقت
+CACHE_NEUTRAL_KWARGS = ("timeout", "allow_redirects")
+
+# الحد الافتراضي لحجم محتوى الاستجابة المقروء بالبايت
+DEFAULT_MAX_BODY_BYTES = 2 * 1024 * 1024
+
+# حجم الأجزاء المقروءة من المحتوى، والتداخل بين الأجزاء عند البحث عن نمط الإيقاف
+BODY_CHUNK_BYTES = 64 * 1024
+STOP_PATTERN_OVERLAP = 1024
+
+
+class _ResolvingConnectionMixin:
+    """
+    اتصال urllib3 يفتح المقبس إلى العنوان المحلول من DnsResolver
+
+    يُستبدل اسم المضيف بالعنوان أثناء فتح المقبس فقط، لذا لا تتغير ترويسة Host ولا
+    اسم SNI ولا التحقق من الشهادة.
+    """
+
+    resolver = None
+
+    def _new_conn(self):
+        address = self.resolver.resolve_one(self._dns_host) if self.resolver is not None else None
+        if not address:
+            return super()._new_conn()
+
+        host = self._dns_host
+        self._dns_host = address
+        try:
+            return super()._new_conn()
+        finally:
+            self._dns_host = host
+
+
+class ResolvingAdapter(HTTPAdapter):
+    """
+    محول requests يحلل أسماء المضيفين عبر DnsResolver بدلاً من getaddrinfo لكل اتصال
+    """
+
+    def __init__(self, resolver, **kwargs):
+        """
+        تهيئة المحول
+
+        المعطيات:
+            resolver (DnsResolver): محلل أسماء النطاقات
+            **kwargs: معطيات HTTPAdapter
+        """
+        self.resolver = resolver
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        attributes = {"resolver": self.resolver}
+        http_connection = type("ResolvingHTTPConnection", (_ResolvingConnectionMixin, HTTPConnection), attributes)
+        https_connection = type("ResolvingHTTPSConnection", (_ResolvingConnectionMixin, HTTPSConnection), attributes)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": type("ResolvingHTTPConnectionPool", (HTTPConnectionPool,), {"ConnectionCls": http_connection}),
+            "https": type("ResolvingHTTPSConnectionPool", (HTTPSConnectionPool,), {"ConnectionCls": https_connection})
+        }
+
+
+class HttpClient:
+    """
+    فئة عميل HTTP مشترك يعيد استخدام الاتصالات
+
+    يحتفظ العميل بجلسة requests واحدة مع مجمع اتصالات لكل مضيف، بحيث تعيد الطلبات
+    المتتالية إلى المضيف نفسه استخدام اتصال TCP/TLS مفتوح بدلاً من إنشاء اتصال جديد
+    لكل طلب.
+
+    تُخزن استجابات طلبات GET و HEAD مؤقتًا طوال مدة المسح (مفتاح التخزين هو طريقة
+    الطلب وعنوان URL)، مع حد أقصى للذاكرة وإزالة الأقدم استخدامًا (LRU)، بحيث يتم
+    تنزيل كل عنوان مرة واحدة فقط وتتم مشاركة الصفحة المحللة بين جميع الفحوصات.
+
+    يُقرأ محتوى الاستجابات على أجزاء حتى حد أقصى من البايتات (max_body_bytes)، ويمكن
+    إيقاف القراءة مبكرًا عند تطابق نمط (مثل "Stable tag:")، لذا لا يُحمّل ملف ضخم
+    (سجل أو نسخة احتياطية) في الذاكرة كاملًا. الخاصية truncated في الاستجابة تبين ما إذا
+    توقفت القراءة قبل نهاية المحتوى.
+
+    إذا تم تمرير ذاكرة HTTP دائمة (HttpCache) تُرسل طلبات GET بشكل شرطي اعتمادًا على
+    ETag و Last-Modified المخزنة من مسح سابق، وعند استجابة 304 يُعاد المحتوى المخزن مع
+    المعلومات المستخرجة منه (انظر fact).
+
+    إذا تم تمرير محلل أسماء (DnsResolver) تُفتح الاتصالات الجديدة إلى العنوان المخزن فيه
+    بدلاً من تحليل اسم المضيف مع كل اتصال.
+    """
+
+    def __init__(self, user_agent, timeout=30, pool_size=10, verify=False, cache_max_bytes=DEFAULT_CACHE_MAX_BYTES,
+                 max_body_bytes=DEFAULT_MAX_BODY_BYTES, disk_cache=None, resolver=None):
+        """
+        تهيئة عميل HTTP
+
+        المعطيات:
+            user_agent (str): وكيل المستخدم المرسل مع كل طلب
+            timeout (int): مهلة الاتصال الافتراضية بالثواني
+            pool_size (int): الحد الأقصى للاتصالات المفتوحة لكل مضيف
+            verify (bool): التحقق من شهادات TLS
+            cache_max_bytes (int): الحد الأقصى لحجم الاستجابات المخزنة مؤقتًا (0 لتعطيل التخزين)
+            max_body_bytes (int): الحد الأقصى لحجم المحتوى المقروء من كل استجابة (0 بلا حد)
+            disk_cache (HttpCache): ذاكرة HTTP الدائمة للطلبات الشرطية (اختياري)
+            resolver (DnsResolver): محلل أسماء النطاقات للاتصالات الجديدة (اختياري)
+        """
+        self.timeout = timeout
+        self.pool_size = max(1, pool_size)
+        self.max_body_bytes = max(0, max_body_bytes or 0)
+        self.disk_cache = disk_cache
+        self.resolver = resolver
+
+        self.cache_max_bytes = max(0, cache_max_bytes or 0)
+        self.cache_bytes = 0
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = user_agent
+        self.session.verify = verify
+
+        if resolver is not None:
+            adapter = ResolvingAdapter(resolver, pool_connections=self.pool_size, pool_maxsize=self.pool_size,
+                                       max_retries=0)
+        else:
+            adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # منفذ الطلبات غير المتزامنة (يُنشأ عند أول طلب غير متزامن)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config, timeout=None, pool_size=None):
+        """
+        إنشاء عميل HTTP من كائن التكوين
+
+        المعطيات:
+            config (Config): كائن التكوين
+            timeout (int): مهلة الاتصال (افتراضيًا: مهلة التكوين)
+            pool_size (int): حجم مجمع الاتصالات (افتراضيًا: إعداد web.pool_size أو عدد المواضيع)
+
+        المخرجات:
+            HttpClient: عميل HTTP
+        """
+        configured_pool_size = config.get("web", "pool_size")
+        cache_max_bytes = config.get("web", "response_cache_bytes")
+        max_body_bytes = config.get("web", "max_body_bytes")
+        http_cache = config.get("web", "http_cache")
+        return cls(
+            config.get_user_agent(),
+            timeout=timeout if timeout is not None else config.get_timeout(),
+            pool_size=configured_pool_size or pool_size or config.get_threads(),
+            cache_max_bytes=DEFAULT_CACHE_MAX_BYTES if cache_max_bytes is None else cache_max_bytes,
+            max_body_bytes=DEFAULT_MAX_BODY_BYTES if max_body_bytes is None else max_body_bytes,
+            disk_cache=HttpCache.for_path(http_cache) if http_cache else None,
+            resolver=DnsResolver.shared()
+        )
+
+    def request(self, method, url, max_bytes=None, stop_pattern=None, **kwargs):
+        """
+        إرسال طلب HTTP عبر الجلسة المشتركة
+
+        المعطيات:
+            method (str): طريقة الطلب
+            url (str): عنوان URL
+            max_bytes (int): الحد الأقصى لحجم المحتوى المقروء (افتراضيًا: max_body_bytes)
+            stop_pattern (str): تعبير نمطي تتوقف القراءة بعد أول تطابق له (اختياري)
+            **kwargs: معطيات إضافية تمرر إلى requests
+
+        المخرجات:
+            Response: كائن الاستجابة
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        limit = self.max_body_bytes if max_bytes is None else max_bytes
+
+        # الطلبات التي تقرأ المحتوى بنفسها (stream) تُمرر كما هي
+        if kwargs.pop("stream", False):
+            return self.session.request(method, url, stream=True, **kwargs)
+
+        key = self._cache_key(method, url, kwargs)
+        if key is not None:
+            with self._cache_lock:
+                response = self._cache.get(key)
+                # المحتوى الجزئي يُعاد فقط لطلب بالحد نفسه دون نمط إيقاف
+                if (response is not None and response.truncated
+                        and (stop_pattern is not None or response._max_bytes != limit)):
+                    response = None
+                if response is not None:
+                    self._cache.move_to_end(key)
+                    return response
+
+        # طلب شرطي إذا كانت الاستجابة مخزنة من مسح سابق (يُتجاهل المحتوى الجزئي المخزن بإصدارات سابقة)
+        entry = None
+        if self.disk_cache is not None and key is not None and key[0] == "GET":
+            entry = self.disk_cache.get(url)
+            if entry is not None and entry["truncated"]:
+                entry = None
+            if entry is not None:
+                kwargs["headers"] = self.disk_cache.conditional_headers(entry)
+
+        if method.upper() == "HEAD":
+            response = self.session.request(method, url, **kwargs)
+            response.truncated = False
+        else:
+            response = self.session.request(method, url, stream=True, **kwargs)
+            if entry is not None and response.status_code == 304:
+                response.close()
+                self.disk_cache.touch(url)
+                response = self.disk_cache.response(entry)
+            else:
+                self._read_body(response, limit, stop_pattern)
+                # المحتوى الجزئي (بالحد أو بنمط الإيقاف) لا يُخزن بين عمليات المسح، وإلا أعادته
+                # استجابة 304 لاحقة لطلب بحد آخر أو بنمط آخر أو بدون نمط
+                if (self.disk_cache is not None and key is not None and response.status_code == 200
+                        and not response.truncated):
+                    self.disk_cache.put(url, response)
+        response._request_url = url
+        response._max_bytes = limit
+
+        # المحتوى المقطوع بنمط إيقاف لا يُخزن مؤقتًا لأنه يعتمد على النمط
+        if key is not None and (not response.truncated or stop_pattern is None):
+            self._store(key, response)
+        return response
+
+    def get(self, url, **kwargs):
+        """
+        إرسال طلب GET
+
+        المعطيات:
+            url (str): عنوان URL
+            **kwargs: معطيات إضافية تمرر إلى requests
+
+        المخرجات:
+            Response: كائن الاستجابة
+        """
+        kwargs.setdefault("allow_redirects", True)
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, data=None, **kwargs):
+        """
+        إرسال طلب POST
+
+        المعطيات:
+            url (str): عنوان URL
+            data: بيانات الطلب
+            **kwargs: معطيات إضافية تمرر إلى requests
+
+        المخرجات:
+            Response: كائن الاستجابة
+        """
+        return self.request("POST", url, data=data, **kwargs)
+
+    def head(self, url, **kwargs):
+        """
+        إرسال طلب HEAD
+
+        المعطيات:
+            url (str): عنوان URL
+            **kwargs: معطيات إضافية تمرر إلى requests
+
+        المخرجات:
+            Response: كائن الاستجابة
+        """
+        kwargs.setdefault("allow_redirects", False)
+        return self.request("HEAD", url, **kwargs)
+
+    async def request_async(self, method, url, **kwargs):
+        """
+        إرسال طلب HTTP من حلقة asyncio دون حجبها
+
+        يُنفذ الطلب على الجلسة المشتركة نفسها (ومع ذاكرة التخزين المؤقت نفسها) في منفذ
+        بعدد مسارات مساوٍ لحجم مجمع الاتصالات، لذا لا تنتظر الطلبات اتصالًا حرًا.
+
+        المعطيات:
+            method (str): طريقة الطلب
+            url (str): عنوان URL
+            **kwargs: معطيات إضافية تمرر إلى requests
+
+        المخرجات:
+            Response: كائن الاستجابة
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), functools.partial(self.request, method, url, **kwargs))
+
+    async def get_async(self, url, **kwargs):
+        """
+        إرسال طلب GET غير متزامن
+
+        المعطيات:
+            url (str): عنوان URL
+            **kwargs: معطيات إضافية تمرر إلى requests
+
+        المخرجات:
+            Response: كائن الاستجابة
+        """
+        kwargs.setdefault("allow_redirects", True)
+        return await self.request_async("GET", url, **kwargs)
+
+    async def head_async(self, url, **kwargs):
+        """
+        إرسال طلب HEAD غير متزامن
+
+        المعطيات:
+            url (str): عنوان URL
+            **kwargs: معطيات إضافية تمرر إلى requests
+
+        المخرجات:
+            Response: كائن الاستجابة
+        """
+        kwargs.setdefault("allow_redirects", False)
+        return await self.request_async("HEAD", url, **kwargs)
+
+    def page(self, response):
+        """
+        الحصول على الصفحة المحللة للاستجابة
+
+        يتم تحليل كل استجابة مرة واحدة فقط، وبما أن الاستجابات المخزنة مؤقتًا مشتركة
+        فإن جميع الفحوصات التي تطلب العنوان نفسه تحصل على الصفحة المحللة نفسها.
+
+        المعطيات:
+            response (Response): كائن الاستجابة
+
+        المخرجات:
+            ParsedPage: الصفحة المحللة
+        """
+        page = getattr(response, "_parsed_page", None)
+        if page is None:
+            page = ParsedPage.from_response(response)
+            response._parsed_page = page
+        return page
+
+    def fact(self, response, name, compute):
+        """
+        الحصول على معلومة مستخرجة من استجابة (مثل الإصدار) مع حفظها في ذاكرة HTTP الدائمة
+
+        إذا كانت الاستجابة معادة من الذاكرة الدائمة بعد استجابة 304 تُعاد المعلومة المحفوظة
+        من المسح السابق دون إعادة حسابها.
+
+        المعطيات:
+            response (Response): كائن الاستجابة
+            name (str): اسم المعلومة
+            compute (callable): دالة تستقبل الاستجابة وتعيد القيمة (قابلة للتحويل إلى JSON)
+
+        المخرجات:
+            القيمة
+        """
+        facts = getattr(response, "facts", None)
+        if facts is None:
+            facts = response.facts = {}
+        if name not in facts:
+            facts[name] = compute(response)
+            url = getattr(response, "_request_url", None)
+            if self.disk_cache is not None and url:
+                self.disk_cache.set_fact(url, name, facts[name])
+        return facts[name]
+
+    def extract(self, response, pattern):
+        """
+        استخراج المجموعة الأولى لتعبير نمطي من محتوى الاستجابة (تُحفظ كمعلومة مستخرجة)
+
+        المعطيات:
+            response (Response): كائن الاستجابة
+            pattern (str): التعبير النمطي
+
+        المخرجات:
+            str: قيمة المجموعة الأولى أو None إذا لم يتطابق النمط
+        """
+        def compute(response):
+            match = re.search(pattern, response.text)
+            return match.group(1) if match else None
+
+        return self.fact(response, pattern, compute)
+
+    def _read_body(self, response, max_bytes, stop_pattern=None):
+        """
+        قراءة محتوى الاستجابة على أجزاء حتى الحد الأقصى أو تطابق نمط الإيقاف
+
+        المعطيات:
+            response (Response): كائن الاستجابة (مرسل بـ stream=True)
+            max_bytes (int): الحد الأقصى لعدد البايتات (0 بلا حد)
+            stop_pattern (str): تعبير نمطي تتوقف القراءة بعد أول تطابق له (اختياري)
+        """
+        if isinstance(stop_pattern, str):
+            stop_pattern = re.compile(stop_pattern.encode("utf-8"))
+
+        # المحتوى مقروء مسبقًا (مثلًا من محول لا يدعم القراءة على أجزاء)
+        if response._content is not False:
+            content = response._content or b""
+            response.truncated = bool(max_bytes) and len(content) > max_bytes
+            response._content = content[:max_bytes] if response.truncated else content
+            return
+
+        body = bytearray()
+        truncated = False
+        try:
+            for chunk in response.iter_content(BODY_CHUNK_BYTES):
+                start = max(0, len(body) - STOP_PATTERN_OVERLAP)
+                body += chunk
+                if max_bytes and len(body) > max_bytes:
+                    del body[max_bytes:]
+                    truncated = True
+                    break
+                if stop_pattern is not None and stop_pattern.search(body, start):
+                    truncated = True
+                    break
+        finally:
+            # إغلاق الاتصال إذا لم يُقرأ المحتوى كاملًا (وإلا يعود إلى المجمع)
+            if truncated:
+                response.close()
+
+        response._content = bytes(body)
+        response._content_consumed = True
+        response.truncated = truncated
+
+    def clear_cache(self):
+        """
+        مسح ذاكرة التخزين المؤقت للاستجابات
+        """
+        with self._cache_lock:
+            self._cache.clear()
+            self.cache_bytes = 0
+
+    def close(self):
+        """
+        إغلاق الجلسة وجميع الاتصالات المفتوحة
+        """
+        self.clear_cache()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self.session.close()
+
+    def _get_executor(self):
+        """
+        الحصول على منفذ الطلبات غير المتزامنة
+
+        المخرجات:
+            ThreadPoolExecutor: المنفذ
+        """
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix="http")
+        return self._executor
+
+    def _cache_key(self, method, url, kwargs):
+        """
+        حساب مفتاح التخزين المؤقت للطلب
+
+        المعطيات:
+            method (str): طريقة الطلب
+            url (str): عنوان URL
+            kwargs (dict): معطيات الطلب
+
+        المخرجات:
+            tuple: مفتاح التخزين أو None إذا كان الطلب غير قابل للتخزين
+        """
+        method = method.upper()
+        if not self.cache_max_bytes or method not in CACHEABLE_METHODS:
+            return None
+        if any(name not in CACHE_NEUTRAL_KWARGS for name in kwargs):
+            return None
+        return method, url, kwargs.get("allow_redirects", True)
+
+    def _store(self, key, response):
+        """
+        تخزين الاستجابة مؤقتًا مع إزالة الأقدم استخدامًا عند تجاوز الحد الأقصى
+
+        المعطيات:
+            key (tuple): مفتاح التخزين
+            response (Response): كائن الاستجابة
+        """
+        size = len(response.content or b"")
+        if size > self.cache_max_bytes:
+            return
+
+        with self._cache_lock:
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self.cache_bytes -= previous._cache_size
+            response._cache_size = size
+            self._cache[key] = response
+            self.cache_bytes += size
+
+            while self.cache_bytes > self.cache_max_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self.cache_bytes -= evicted._cache_size
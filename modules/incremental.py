@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة المسح التزايدي لأداة SaudiAttack
+
+تُحمّل نتائج مسح سابق وتُقارن مدخلات كل مرحلة بها: إذا لم تتغير المنافذ المفتوحة
+وإصدارات الخدمات لا تُعاد نصوص NSE واكتشاف نظام التشغيل، وإذا لم يتغير إصدار نظام
+إدارة المحتوى وقائمة مكوناته لا تُعاد مرحلة فحص ثغراته، وتُنقل نتائج المسح السابق
+بدلاً من ذلك. في النهاية تُحسب الفروقات بين الثغرات (جديدة، تم حلها، دون تغيير).
+"""
+
+import os
+import json
+
+# أقسام النتائج التي تحتوي على الثغرات
+FINDING_SECTIONS = (
+    "vulnerabilities", "web_vulnerabilities", "wordpress_vulnerabilities", "joomla_vulnerabilities"
+)
+
+# الحقول التي تحدد هوية الثغرة (الوصف والخطورة والإصدارات قد تتغير دون أن تتغير الثغرة)
+IDENTITY_FIELDS = (
+    "type", "name", "title", "vulnerability", "port", "service", "url",
+    "plugin", "theme", "component", "module", "template", "path"
+)
+
+
+def result_target(results):
+    """
+    الحصول على الهدف الذي تخصه نتائج مسح
+
+    المعطيات:
+        results (dict): نتائج المسح
+
+    المخرجات:
+        str: الهدف (أو None)
+    """
+    target_info = results.get("target_info", {})
+    return results.get("target") or target_info.get("domain") or target_info.get("ip")
+
+
+def load_previous_results(path):
+    """
+    تحميل نتائج مسح سابق
+
+    يقبل ملف JSON لنتائج هدف واحد أو قائمة نتائج أو قاموسًا مفهرسًا حسب الهدف، أو ملف
+    JSON Lines، أو دليل تقارير بتنسيق JSON. ملف الفهرس index.jsonl للمسح متعدد الأهداف
+    يحتوي على ملخصات فقط، لذا تُحمّل النتائج الكاملة من ملفات JSON التي يشير إليها.
+
+    المعطيات:
+        path (str): مسار الملف أو الدليل
+
+    المخرجات:
+        dict: النتائج السابقة مفهرسة حسب الهدف
+    """
+    documents = []
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if name.endswith(".json"):
+                with open(os.path.join(path, name), "r", encoding="utf-8") as f:
+                    documents.append(json.load(f))
+    elif path.endswith(".jsonl"):
+        with open(path, "r", encoding="utf-8") as f:
+            documents = [json.loads(line) for line in f if line.strip()]
+        if any(_is_index_row(row) for row in documents):
+            documents = _load_indexed_results(path, documents)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, list):
+            documents = data
+        elif "target_info" in data or "target" in data:
+            documents = [data]
+        else:
+            return {target: results for target, results in data.items() if isinstance(results, dict)}
+
+    previous = {}
+    for results in documents:
+        target = result_target(results) if isinstance(results, dict) else None
+        if target:
+            previous[target] = results
+    return previous
+
+
+def _is_index_row(row):
+    """
+    التحقق مما إذا كان السطر ملخصًا من ملف فهرس ReportSink وليس نتائج كاملة
+
+    المعطيات:
+        row (dict): السطر
+
+    المخرجات:
+        bool: True إذا كان السطر ملخصًا
+    """
+    return isinstance(row, dict) and "status" in row and not isinstance(row.get("open_ports", []), list)
+
+
+def _load_indexed_results(path, rows):
+    """
+    تحميل النتائج الكاملة التي يشير إليها ملف فهرس
+
+    المعطيات:
+        path (str): مسار ملف الفهرس
+        rows (list): أسطر الفهرس
+
+    المخرجات:
+        list: نتائج الأهداف (ValueError إذا لم يشر الفهرس إلى أي ملف نتائج)
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    documents = []
+    for row in rows:
+        if not isinstance(row, dict) or not row.get("results"):
+            continue
+        # المسار كما كُتب نسبي لدليل التشغيل السابق، لذا يُبحث عن الملف بجانب الفهرس
+        results_file = os.path.join(directory, os.path.basename(row["results"]))
+        with open(results_file, "r", encoding="utf-8") as f:
+            documents.append(json.load(f))
+
+    if not documents:
+        raise ValueError(f"{path} فهرس ملخصات لا يحتوي على نتائج كاملة؛ استخدم دليل التقارير أو ملف JSON للنتائج")
+    return documents
+
+
+def service_signature(port_data):
+    """
+    بصمة خدمة منفذ (الاسم والمنتج والإصدار)
+
+    المعطيات:
+        port_data (dict): بيانات المنفذ من nmap أو عنصر من results["services"]
+
+    المخرجات:
+        tuple: البصمة
+    """
+    return (port_data.get("name", ""), port_data.get("product", ""), port_data.get("version", ""))
+
+
+def changed_ports(previous, tcp_data):
+    """
+    المنافذ المفتوحة الجديدة أو التي تغيرت خدمتها مقارنة بالمسح السابق
+
+    المعطيات:
+        previous (dict): نتائج المسح السابق
+        tcp_data (dict): بيانات منافذ TCP من nmap للمسح الحالي
+
+    المخرجات:
+        list: المنافذ مرتبة
+    """
+    before = {int(service["port"]): service_signature(service) for service in previous.get("services", [])}
+    return sorted(
+        int(port) for port, port_data in tcp_data.items()
+        if port_data.get("state") == "open" and before.get(int(port)) != service_signature(port_data)
+    )
+
+
+def merge_host_data(services_data, rescan_data):
+    """
+    دمج مسح الخدمات مع إعادة مسح المنافذ المتغيرة
+
+    إعادة المسح لا تكتشف الإصدارات، لذا تبقى بيانات الخدمة من مسح الخدمات وتُضاف إليها
+    الحقول الجديدة فقط (مثل مخرجات النصوص) ونظام التشغيل.
+
+    المعطيات:
+        services_data (dict): بيانات المضيف من مسح الخدمات (بدون NSE أو نظام التشغيل)
+        rescan_data (dict): بيانات المضيف من إعادة مسح المنافذ المتغيرة
+
+    المخرجات:
+        dict: بيانات المضيف المدمجة
+    """
+    merged = dict(services_data)
+    merged["tcp"] = dict(services_data.get("tcp", {}))
+    for port, port_data in rescan_data.get("tcp", {}).items():
+        merged["tcp"][port] = {**port_data, **merged["tcp"].get(port, {})}
+    if rescan_data.get("osmatch"):
+        merged["osmatch"] = rescan_data["osmatch"]
+    return merged
+
+
+def inventory_signature(info, fields):
+    """
+    بصمة مخزون نظام إدارة المحتوى (الإصدار وأسماء المكونات وإصداراتها)
+
+    المعطيات:
+        info (dict): معلومات نظام إدارة المحتوى (wordpress_info أو joomla_info)
+        fields (iterable): الحقول المقارنة
+
+    المخرجات:
+        tuple: البصمة
+    """
+    signature = []
+    for field in fields:
+        value = info.get(field)
+        if isinstance(value, list):
+            value = tuple(sorted(
+                (item.get("name", ""), item.get("version", "")) if isinstance(item, dict) else (str(item), "")
+                for item in value
+            ))
+        signature.append((field, value))
+    return tuple(signature)
+
+
+def finding_key(section, finding):
+    """
+    مفتاح هوية الثغرة للمقارنة بين مسحين
+
+    المعطيات:
+        section (str): قسم النتائج
+        finding (dict): الثغرة
+
+    المخرجات:
+        str: المفتاح
+    """
+    identity = {field: finding[field] for field in IDENTITY_FIELDS if field in finding}
+    return json.dumps([section, identity], sort_keys=True, ensure_ascii=False, default=str)
+
+
+def diff_findings(previous, current):
+    """
+    حساب الفروقات بين ثغرات مسحين
+
+    المعطيات:
+        previous (dict): نتائج المسح السابق
+        current (dict): نتائج المسح الحالي
+
+    المخرجات:
+        dict: الثغرات الجديدة (new) والتي تم حلها (resolved) والتي لم تتغير (unchanged)،
+              كل ثغرة مع اسم قسمها (section)
+    """
+    def index(results):
+        findings = {}
+        for section in FINDING_SECTIONS:
+            for finding in results.get(section, []) or []:
+                findings.setdefault(finding_key(section, finding), {"section": section, **finding})
+        return findings
+
+    before = index(previous or {})
+    after = index(current or {})
+    return {
+        "new": [finding for key, finding in after.items() if key not in before],
+        "resolved": [finding for key, finding in before.items() if key not in after],
+        "unchanged": [finding for key, finding in after.items() if key in before]
+    }
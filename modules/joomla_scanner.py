@@ -6,23 +6,29 @@
 """
 
 import re
-import requests
 import json
+import asyncio
 from urllib.parse import urlparse, urljoin
-from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 from .web_scanner import WebServerScanner
 from .utils import get_severity_color
+from .vulnerability_database import VulnerabilityDatabase, describe_vulnerability
 
 console = Console()
 
+# المعلومات التي إذا لم تتغير منذ المسح السابق لا تُعاد مرحلة فحص الثغرات
+JOOMLA_INVENTORY_FIELDS = ("version", "components", "modules", "templates")
+
+# ملفات المعلومات التي يتم فحصها داخل مجلد كل قالب
+TEMPLATE_SENSITIVE_FILES = ("templateDetails.xml", "params.ini", "index.php", "css/template.css", "js/template.js")
+
 class JoomlaScanner(WebServerScanner):
     """
     فئة ماسح جوملا
     """
     
-    def __init__(self, target, ports=[80, 443], threads=5, timeout=30, logger=None):
+    def __init__(self, target, ports=[80, 443], threads=5, timeout=30, logger=None, config=None):
         """
         تهيئة ماسح جوملا
         
@@ -32,8 +38,9 @@ class JoomlaScanner(WebServerScanner):
             threads (int): عدد مسارات التنفيذ المتوازية
             timeout (int): مهلة الاتصال بالثواني
             logger (Logger): كائن المسجل
+            config (Config): كائن التكوين (اختياري)
         """
-        super().__init__(target, ports, threads, timeout, logger)
+        super().__init__(target, ports, threads, timeout, logger, config)
         
         # إضافة معلومات خاصة بجوملا إلى النتائج
         self.results["joomla_info"] = {
@@ -45,8 +52,8 @@ class JoomlaScanner(WebServerScanner):
         }
         self.results["joomla_vulnerabilities"] = []
         
-        # قائمة الثغرات المعروفة في جوملا
-        self.known_vulnerabilities = self._load_known_vulnerabilities()
+        # قاعدة بيانات الثغرات المشتركة (تُحمّل وتُفهرس مرة واحدة لكل عملية)
+        self.vulnerability_db = VulnerabilityDatabase.shared()
     
     def scan(self):
         """
@@ -78,173 +85,75 @@ class JoomlaScanner(WebServerScanner):
         console.print(f"[bold green]تم اكتشاف موقع جوملا على: {self.base_url}[/bold green]")
         
         # جمع معلومات جوملا
-        self._gather_joomla_info()
+        if not self._restore_stage("joomla_info"):
+            self._gather_joomla_info()
+            self._checkpoint_stage("joomla_info", ("joomla_info",))
         
-        # فحص الثغرات الأمنية في جوملا
-        self._scan_joomla_vulnerabilities()
+        # فحص الثغرات الأمنية في جوملا (إلا إذا لم يتغير الإصدار والمكونات منذ المسح السابق)
+        if not self._restore_stage("joomla_vulnerabilities"):
+            if not self._reuse_previous_stage("joomla_info", "joomla_vulnerabilities", JOOMLA_INVENTORY_FIELDS):
+                self._scan_joomla_vulnerabilities()
+            self._checkpoint_stage("joomla_vulnerabilities", ("joomla_vulnerabilities",))
         
         self.logger.info(f"اكتمل مسح جوملا على الهدف: {self.target}")
         console.print(f"[bold green]اكتمل مسح جوملا على الهدف: {self.target}[/bold green]")
         
         return self.results
     
-    def _load_known_vulnerabilities(self):
+    async def scan_async(self):
         """
-        تحميل قاعدة بيانات الثغرات المعروفة في جوملا
+        تنفيذ مسح جوملا بشكل غير متزامن
+        
+        تعمل مراحل جمع المعلومات المستقلة (الإصدار والمكونات والمستخدمين) في الوقت نفسه.
         
         المخرجات:
-            dict: قاعدة بيانات الثغرات المعروفة
-        """
-        # هذه مجرد قاعدة بيانات بسيطة للثغرات المعروفة
-        # في التطبيق الحقيقي، يمكن تحميلها من ملف أو API
-        return {
-            "core": {
-                "4.0.0": [
-                    {
-                        "name": "CVE-2021-23132",
-                        "description": "ثغرة XSS في محرر المحتوى",
-                        "severity": "medium",
-                        "fixed_in": "4.0.1"
-                    }
-                ],
-                "3.9.0": [
-                    {
-                        "name": "CVE-2020-35616",
-                        "description": "ثغرة في إدارة الجلسات تسمح بتجاوز المصادقة",
-                        "severity": "high",
-                        "fixed_in": "3.9.24"
-                    }
-                ],
-                "3.8.0": [
-                    {
-                        "name": "CVE-2020-14693",
-                        "description": "ثغرة CSRF في واجهة المستخدم الإدارية",
-                        "severity": "medium",
-                        "fixed_in": "3.8.10"
-                    }
-                ],
-                "3.7.0": [
-                    {
-                        "name": "CVE-2017-8917",
-                        "description": "ثغرة SQL Injection في مكون com_fields",
-                        "severity": "high",
-                        "fixed_in": "3.7.1"
-                    }
-                ],
-                "3.6.0": [
-                    {
-                        "name": "CVE-2016-9081",
-                        "description": "ثغرة في مكون com_users تسمح بتسجيل المستخدمين غير المصرح به",
-                        "severity": "medium",
-                        "fixed_in": "3.6.4"
-                    }
-                ],
-                "3.4.0": [
-                    {
-                        "name": "CVE-2015-8562",
-                        "description": "ثغرة في معالجة User-Agent تسمح بتنفيذ التعليمات البرمجية عن بُعد",
-                        "severity": "critical",
-                        "fixed_in": "3.4.6"
-                    }
-                ]
-            },
-            "components": {
-                "com_contact": {
-                    "3.5.0": [
-                        {
-                            "name": "CVE-2017-9934",
-                            "description": "ثغرة XSS في نماذج الاتصال",
-                            "severity": "medium",
-                            "fixed_in": "3.5.1"
-                        }
-                    ]
-                },
-                "com_content": {
-                    "3.7.0": [
-                        {
-                            "name": "CVE-2017-8917",
-                            "description": "ثغرة SQL Injection في معالجة المحتوى",
-                            "severity": "high",
-                            "fixed_in": "3.7.1"
-                        }
-                    ]
-                },
-                "com_users": {
-                    "3.6.0": [
-                        {
-                            "name": "CVE-2016-8870",
-                            "description": "ثغرة في إعادة تعيين كلمة المرور",
-                            "severity": "medium",
-                            "fixed_in": "3.6.4"
-                        }
-                    ]
-                },
-                "com_media": {
-                    "3.5.0": [
-                        {
-                            "name": "CVE-2016-9836",
-                            "description": "ثغرة في رفع الملفات تسمح بتنفيذ التعليمات البرمجية",
-                            "severity": "high",
-                            "fixed_in": "3.5.1"
-                        }
-                    ]
-                },
-                "com_fields": {
-                    "3.7.0": [
-                        {
-                            "name": "CVE-2017-8917",
-                            "description": "ثغرة SQL Injection في معالجة الحقول المخصصة",
-                            "severity": "high",
-                            "fixed_in": "3.7.1"
-                        }
-                    ]
-                }
-            },
-            "modules": {
-                "mod_menu": {
-                    "3.6.0": [
-                        {
-                            "name": "CVE-2016-9837",
-                            "description": "ثغرة XSS في عرض القائمة",
-                            "severity": "low",
-                            "fixed_in": "3.6.5"
-                        }
-                    ]
-                },
-                "mod_articles_latest": {
-                    "3.5.0": [
-                        {
-                            "name": "CVE-2016-9838",
-                            "description": "ثغرة في عرض المقالات الأخيرة",
-                            "severity": "low",
-                            "fixed_in": "3.5.1"
-                        }
-                    ]
-                }
-            },
-            "templates": {
-                "beez3": {
-                    "3.6.0": [
-                        {
-                            "name": "CVE-2016-9839",
-                            "description": "ثغرة XSS في قالب Beez3",
-                            "severity": "medium",
-                            "fixed_in": "3.6.5"
-                        }
-                    ]
-                },
-                "protostar": {
-                    "3.5.0": [
-                        {
-                            "name": "CVE-2016-9840",
-                            "description": "ثغرة في قالب Protostar",
-                            "severity": "low",
-                            "fixed_in": "3.5.1"
-                        }
-                    ]
-                }
-            }
-        }
+            dict: نتائج المسح
+        """
+        self.logger.info(f"بدء مسح جوملا على الهدف: {self.target}")
+        console.print(f"[bold]بدء مسح جوملا على الهدف: {self.target}[/bold]")
+        
+        # تنفيذ المسح الأساسي لخادم الويب أولاً
+        await super().scan_async()
+        
+        # التحقق مما إذا كان الموقع يستخدم جوملا
+        if not await self._run_blocking(self._is_joomla):
+            self.logger.warning(f"الهدف {self.target} لا يبدو أنه يستخدم جوملا.")
+            console.print(f"[bold yellow]الهدف {self.target} لا يبدو أنه يستخدم جوملا.[/bold yellow]")
+            return self.results
+        
+        # تحديد عنوان URL الأساسي
+        self.base_url = self._get_joomla_base_url()
+        if not self.base_url:
+            self.logger.error("لم يتم العثور على عنوان URL أساسي صالح لجوملا.")
+            console.print("[bold red]لم يتم العثور على عنوان URL أساسي صالح لجوملا.[/bold red]")
+            return self.results
+        
+        self.logger.info(f"تم اكتشاف موقع جوملا على: {self.base_url}")
+        console.print(f"[bold green]تم اكتشاف موقع جوملا على: {self.base_url}[/bold green]")
+        
+        # جمع معلومات جوملا (المراحل المستقلة بالتوازي)
+        if not self._restore_stage("joomla_info"):
+            self.logger.info(f"جمع معلومات جوملا من: {self.base_url}")
+            console.print(f"[bold]جمع معلومات جوملا من: {self.base_url}[/bold]")
+            await asyncio.gather(
+                self._run_blocking(self._get_joomla_version),
+                self._run_blocking(self._get_joomla_components),
+                self._run_blocking(self._get_joomla_modules),
+                self._run_blocking(self._get_joomla_templates),
+                self._run_blocking(self._get_joomla_users)
+            )
+            self._checkpoint_stage("joomla_info", ("joomla_info",))
+        
+        # فحص الثغرات الأمنية في جوملا (إلا إذا لم يتغير الإصدار والمكونات منذ المسح السابق)
+        if not self._restore_stage("joomla_vulnerabilities"):
+            if not self._reuse_previous_stage("joomla_info", "joomla_vulnerabilities", JOOMLA_INVENTORY_FIELDS):
+                await self._run_blocking(self._scan_joomla_vulnerabilities)
+            self._checkpoint_stage("joomla_vulnerabilities", ("joomla_vulnerabilities",))
+        
+        self.logger.info(f"اكتمل مسح جوملا على الهدف: {self.target}")
+        console.print(f"[bold green]اكتمل مسح جوملا على الهدف: {self.target}[/bold green]")
+        
+        return self.results
     
     def _is_joomla(self):
         """
@@ -280,18 +189,16 @@ class JoomlaScanner(WebServerScanner):
         # التحقق من محتوى HTML
         for url in self.results["web_info"]["headers"].keys():
             try:
-                response = requests.get(url, timeout=self.timeout, verify=False)
-                if "joomla" in response.text.lower() or "com_content" in response.text.lower():
+                page = self.http.page(self.http.get(url))
+                if "joomla" in page.lower_text or "com_content" in page.lower_text:
                     return True
                 
                 # التحقق من العلامات الوصفية
-                soup = BeautifulSoup(response.text, "html.parser")
-                meta_generator = soup.find("meta", {"name": "generator"})
-                if meta_generator and "Joomla" in meta_generator.get("content", ""):
+                if "Joomla" in page.meta_generator:
                     return True
                 
                 # التحقق من وجود ملفات جوملا المميزة
-                if "Joomla!" in response.text or "window.JoomlaInitReCaptcha" in response.text:
+                if "Joomla!" in page.text or "window.JoomlaInitReCaptcha" in page.text:
                     return True
             except:
                 pass
@@ -362,22 +269,21 @@ class JoomlaScanner(WebServerScanner):
             ]
             
             for xml_file in xml_files:
-                response = requests.get(f"{self.base_url}{xml_file}", timeout=self.timeout, verify=False)
+                response = self.http.get(f"{self.base_url}{xml_file}", stop_pattern=r"<version>[\d.]+</version>")
                 if response.status_code == 200:
-                    version_match = re.search(r"<version>([\d.]+)</version>", response.text)
-                    if version_match:
-                        self.results["joomla_info"]["version"] = version_match.group(1)
+                    version = self.http.extract(response, r"<version>([\d.]+)</version>")
+                    if version:
+                        self.results["joomla_info"]["version"] = version
                         self.logger.info(f"إصدار جوملا: {self.results['joomla_info']['version']}")
                         console.print(f"[green]إصدار جوملا: {self.results['joomla_info']['version']}[/green]")
                         return
             
             # طريقة 2: من الصفحة الرئيسية
-            response = requests.get(self.base_url, timeout=self.timeout, verify=False)
+            response = self.http.get(self.base_url)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, "html.parser")
-                meta_generator = soup.find("meta", {"name": "generator"})
-                if meta_generator and "Joomla" in meta_generator.get("content", ""):
-                    version_match = re.search(r"Joomla!\s+([\d.]+)", meta_generator.get("content", ""))
+                meta_generator = self.http.page(response).meta_generator
+                if "Joomla" in meta_generator:
+                    version_match = re.search(r"Joomla!\s+([\d.]+)", meta_generator)
                     if version_match:
                         self.results["joomla_info"]["version"] = version_match.group(1)
                         self.logger.info(f"إصدار جوملا: {self.results['joomla_info']['version']}")
@@ -385,11 +291,11 @@ class JoomlaScanner(WebServerScanner):
                         return
             
             # طريقة 3: من ملف README.txt
-            response = requests.get(f"{self.base_url}/README.txt", timeout=self.timeout, verify=False)
+            response = self.http.get(f"{self.base_url}/README.txt", stop_pattern=r"Joomla!\s+[\d.]+[^\d.]")
             if response.status_code == 200 and "Joomla!" in response.text:
-                version_match = re.search(r"Joomla!\s+([\d.]+)", response.text)
-                if version_match:
-                    self.results["joomla_info"]["version"] = version_match.group(1)
+                version = self.http.extract(response, r"Joomla!\s+([\d.]+)")
+                if version:
+                    self.results["joomla_info"]["version"] = version
                     self.logger.info(f"إصدار جوملا: {self.results['joomla_info']['version']}")
                     console.print(f"[green]إصدار جوملا: {self.results['joomla_info']['version']}[/green]")
                     return
@@ -407,11 +313,11 @@ class JoomlaScanner(WebServerScanner):
         """
         try:
             # البحث عن روابط المكونات في الصفحة الرئيسية
-            response = requests.get(self.base_url, timeout=self.timeout, verify=False)
+            response = self.http.get(self.base_url)
             if response.status_code == 200:
                 # البحث عن روابط المكونات
                 component_pattern = r"option=com_([a-zA-Z0-9_]+)"
-                component_matches = re.findall(component_pattern, response.text)
+                component_matches = re.findall(component_pattern, self.http.page(response).text)
                 
                 for component_name in set(component_matches):
                     component_info = {
@@ -431,22 +337,24 @@ class JoomlaScanner(WebServerScanner):
                 "com_newsfeeds", "com_plugins", "com_search", "com_tags", "com_templates"
             ]
             
-            for component in common_components:
+            def probe_component(component):
                 component_url = f"{self.base_url}/index.php?option={component}"
-                try:
-                    response = requests.get(component_url, timeout=self.timeout, verify=False)
-                    if response.status_code == 200 and "404" not in response.text:
-                        component_info = {
-                            "name": component,
-                            "url": component_url
-                        }
-                        
-                        if component_info not in self.results["joomla_info"]["components"]:
-                            self.results["joomla_info"]["components"].append(component_info)
-                            self.logger.info(f"تم اكتشاف مكون: {component}")
-                            console.print(f"[green]تم اكتشاف مكون: {component}[/green]")
-                except:
-                    pass
+                response = self.http.get(component_url)
+                if response.status_code == 200 and "404" not in response.text:
+                    return component_url
+                return None
+            
+            # فحص المكونات بشكل متزامن ودمج النتائج بترتيب القائمة
+            for component, component_url in self.scheduler.map(probe_component, common_components, host=urlparse(self.base_url).netloc):
+                component_info = {
+                    "name": component,
+                    "url": component_url
+                }
+                
+                if component_info not in self.results["joomla_info"]["components"]:
+                    self.results["joomla_info"]["components"].append(component_info)
+                    self.logger.info(f"تم اكتشاف مكون: {component}")
+                    console.print(f"[green]تم اكتشاف مكون: {component}[/green]")
             
             if not self.results["joomla_info"]["components"]:
                 self.logger.warning("لم يتم العثور على مكونات جوملا.")
@@ -462,11 +370,11 @@ class JoomlaScanner(WebServerScanner):
         """
         try:
             # البحث عن روابط الوحدات في الصفحة الرئيسية
-            response = requests.get(self.base_url, timeout=self.timeout, verify=False)
+            response = self.http.get(self.base_url)
             if response.status_code == 200:
                 # البحث عن روابط الوحدات
                 module_pattern = r"mod_([a-zA-Z0-9_]+)"
-                module_matches = re.findall(module_pattern, response.text)
+                module_matches = re.findall(module_pattern, self.http.page(response).text)
                 
                 for module_name in set(module_matches):
                     module_info = {
@@ -492,11 +400,11 @@ class JoomlaScanner(WebServerScanner):
         """
         try:
             # البحث عن روابط القوالب في الصفحة الرئيسية
-            response = requests.get(self.base_url, timeout=self.timeout, verify=False)
+            response = self.http.get(self.base_url)
             if response.status_code == 200:
                 # البحث عن روابط القوالب
                 template_pattern = r"templates/([a-zA-Z0-9_-]+)/"
-                template_matches = re.findall(template_pattern, response.text)
+                template_matches = re.findall(template_pattern, self.http.page(response).text)
                 
                 for template_name in set(template_matches):
                     template_info = {
@@ -522,33 +430,33 @@ class JoomlaScanner(WebServerScanner):
         الحصول على المستخدمين
         """
         try:
-            # محاولة استخراج المستخدمين من خلال مكون com_users
-            for i in range(1, 10):  # فحص أول 10 معرفات
+            def probe_user(i):
                 user_url = f"{self.base_url}/index.php?option=com_users&view=profile&id={i}"
-                response = requests.get(user_url, timeout=self.timeout, verify=False)
+                response = self.http.get(user_url)
                 if response.status_code == 200 and "404" not in response.text and "not found" not in response.text.lower():
-                    # محاولة استخراج اسم المستخدم
-                    soup = BeautifulSoup(response.text, "html.parser")
-                    username = ""
-                    
-                    # البحث عن العنوان
-                    title_tag = soup.find("title")
-                    if title_tag and ":" in title_tag.text:
-                        username = title_tag.text.split(":")[0].strip()
-                    
-                    # إذا لم يتم العثور على اسم المستخدم، استخدام المعرف
-                    if not username:
-                        username = f"User {i}"
-                    
-                    user_info = {
-                        "id": i,
-                        "name": username,
-                        "url": user_url
-                    }
-                    
-                    self.results["joomla_info"]["users"].append(user_info)
-                    self.logger.info(f"تم اكتشاف مستخدم: {username} (المعرف: {i})")
-                    console.print(f"[green]تم اكتشاف مستخدم: {username} (المعرف: {i})[/green]")
+                    return user_url, self.http.page(response).title
+                return None
+            
+            # محاولة استخراج المستخدمين من خلال مكون com_users (فحص أول 10 معرفات بشكل متزامن)
+            for i, (user_url, title) in self.scheduler.map(probe_user, range(1, 10), host=urlparse(self.base_url).netloc):
+                # محاولة استخراج اسم المستخدم من العنوان
+                username = ""
+                if ":" in title:
+                    username = title.split(":")[0].strip()
+                
+                # إذا لم يتم العثور على اسم المستخدم، استخدام المعرف
+                if not username:
+                    username = f"User {i}"
+                
+                user_info = {
+                    "id": i,
+                    "name": username,
+                    "url": user_url
+                }
+                
+                self.results["joomla_info"]["users"].append(user_info)
+                self.logger.info(f"تم اكتشاف مستخدم: {username} (المعرف: {i})")
+                console.print(f"[green]تم اكتشاف مستخدم: {username} (المعرف: {i})[/green]")
             
             if not self.results["joomla_info"]["users"]:
                 self.logger.warning("لم يتم العثور على مستخدمي جوملا.")
@@ -599,49 +507,29 @@ class JoomlaScanner(WebServerScanner):
         
         version = self.results["joomla_info"]["version"]
         
-        # البحث عن الثغرات المعروفة للإصدار الحالي أو الإصدارات السابقة
-        for ver, vulns in self.known_vulnerabilities["core"].items():
-            if self._is_version_vulnerable(version, ver):
-                for vuln in vulns:
-                    vuln_info = {
-                        "type": "core",
-                        "name": vuln["name"],
-                        "description": vuln["description"],
-                        "severity": vuln["severity"],
-                        "affected_version": ver,
-                        "fixed_in": vuln["fixed_in"]
-                    }
-                    self.results["joomla_vulnerabilities"].append(vuln_info)
-                    self.logger.warning(f"تم اكتشاف ثغرة في نواة جوملا: {vuln['name']} (خطورة: {vuln['severity']})")
-                    console.print(f"[{get_severity_color(vuln['severity'])}]تم اكتشاف ثغرة في نواة جوملا: {vuln['name']} (خطورة: {vuln['severity']})[/{get_severity_color(vuln['severity'])}]")
-        
-        # فحص ملفات حساسة
-        sensitive_files = [
-            "/configuration.php",
-            "/htaccess.txt",
-            "/web.config.txt",
-            "/administrator/manifests/files/joomla.xml",
-            "/administrator/logs/",
-            "/installation/"
-        ]
+        # البحث عن الثغرات المعروفة للإصدار الحالي في قاعدة بيانات الثغرات
+        for vuln in self.vulnerability_db.check_joomla_core_vulnerabilities(version):
+            vuln_info = {
+                "type": "core",
+                **describe_vulnerability(vuln)
+            }
+            self.results["joomla_vulnerabilities"].append(vuln_info)
+            self.logger.warning(f"تم اكتشاف ثغرة في نواة جوملا: {vuln_info['name']} (خطورة: {vuln_info['severity']})")
+            console.print(f"[{get_severity_color(vuln_info['severity'])}]تم اكتشاف ثغرة في نواة جوملا: {vuln_info['name']} (خطورة: {vuln_info['severity']})[/{get_severity_color(vuln_info['severity'])}]")
         
-        for file in sensitive_files:
-            file_url = f"{self.base_url}{file}"
-            try:
-                response = requests.get(file_url, timeout=self.timeout, verify=False)
-                if response.status_code == 200:
-                    vuln_info = {
-                        "type": "sensitive_file",
-                        "name": "Sensitive File Exposure",
-                        "description": f"تم العثور على ملف حساس: {file_url}",
-                        "severity": "high",
-                        "url": file_url
-                    }
-                    self.results["joomla_vulnerabilities"].append(vuln_info)
-                    self.logger.warning(f"تم العثور على ملف حساس: {file_url}")
-                    console.print(f"[red]تم العثور على ملف حساس: {file_url}[/red]")
-            except:
-                pass
+        # فحص ملفات حساسة من ملف التكوين
+        for found in self.path_prober.probe(self.base_url, self.config.get_paths_to_check("joomla")):
+            file_url = found["url"]
+            vuln_info = {
+                "type": "sensitive_file",
+                "name": "Sensitive File Exposure",
+                "description": f"تم العثور على ملف حساس: {file_url}",
+                "severity": "high",
+                "url": file_url
+            }
+            self.results["joomla_vulnerabilities"].append(vuln_info)
+            self.logger.warning(f"تم العثور على ملف حساس: {file_url}")
+            console.print(f"[red]تم العثور على ملف حساس: {file_url}[/red]")
     
     def _check_component_vulnerabilities(self):
         """
@@ -655,46 +543,43 @@ class JoomlaScanner(WebServerScanner):
         for component in self.results["joomla_info"]["components"]:
             component_name = component["name"]
             
-            # التحقق مما إذا كان المكون معروفًا في قاعدة البيانات
-            if component_name in self.known_vulnerabilities["components"]:
-                # البحث عن الثغرات المعروفة للمكون
-                for ver, vulns in self.known_vulnerabilities["components"][component_name].items():
-                    # نفترض أن المكون عرضة للثغرات لأننا لا نعرف إصداره
-                    for vuln in vulns:
-                        vuln_info = {
-                            "type": "component",
-                            "name": vuln["name"],
-                            "description": vuln["description"],
-                            "severity": vuln["severity"],
-                            "component": component_name,
-                            "affected_version": ver,
-                            "fixed_in": vuln["fixed_in"]
-                        }
-                        self.results["joomla_vulnerabilities"].append(vuln_info)
-                        self.logger.warning(f"تم اكتشاف ثغرة في مكون {component_name}: {vuln['name']} (خطورة: {vuln['severity']})")
-                        console.print(f"[{get_severity_color(vuln['severity'])}]تم اكتشاف ثغرة في مكون {component_name}: {vuln['name']} (خطورة: {vuln['severity']})[/{get_severity_color(vuln['severity'])}]")
-            
-            # فحص ثغرات SQL Injection في المكونات
-            if "url" in component:
-                sql_injection_params = ["id", "catid", "cid", "sid", "uid", "itemid", "section"]
-                for param in sql_injection_params:
-                    test_url = f"{component['url']}&{param}=1'"
-                    try:
-                        response = requests.get(test_url, timeout=self.timeout, verify=False)
-                        if response.status_code == 200 and ("SQL syntax" in response.text or "mysql_fetch" in response.text or "You have an error in your SQL syntax" in response.text):
-                            vuln_info = {
-                                "type": "sql_injection",
-                                "name": "SQL Injection Vulnerability",
-                                "description": f"تم اكتشاف ثغرة SQL Injection في مكون {component_name} في المعلمة {param}",
-                                "severity": "high",
-                                "component": component_name,
-                                "url": test_url
-                            }
-                            self.results["joomla_vulnerabilities"].append(vuln_info)
-                            self.logger.warning(f"تم اكتشاف ثغرة SQL Injection في مكون {component_name} في المعلمة {param}")
-                            console.print(f"[red]تم اكتشاف ثغرة SQL Injection في مكون {component_name} في المعلمة {param}[/red]")
-                    except:
-                        pass
+            # البحث عن الثغرات المعروفة (جميع الثغرات لأن الإصدار غير معروف)
+            for vuln in self.vulnerability_db.check_joomla_component_vulnerabilities(component_name, None):
+                vuln_info = {
+                    "type": "component",
+                    **describe_vulnerability(vuln),
+                    "component": component_name
+                }
+                self.results["joomla_vulnerabilities"].append(vuln_info)
+                self.logger.warning(f"تم اكتشاف ثغرة في مكون {component_name}: {vuln_info['name']} (خطورة: {vuln_info['severity']})")
+                console.print(f"[{get_severity_color(vuln_info['severity'])}]تم اكتشاف ثغرة في مكون {component_name}: {vuln_info['name']} (خطورة: {vuln_info['severity']})[/{get_severity_color(vuln_info['severity'])}]")
+        
+        # فحص ثغرات SQL Injection في جميع المكونات والمعلمات بشكل متزامن
+        sql_injection_params = ["id", "catid", "cid", "sid", "uid", "itemid", "section"]
+        probes = [
+            (component["name"], param, f"{component['url']}&{param}=1'")
+            for component in self.results["joomla_info"]["components"] if "url" in component
+            for param in sql_injection_params
+        ]
+        
+        def probe_sql_injection(probe):
+            response = self.http.get(probe[2])
+            return response.status_code == 200 and ("SQL syntax" in response.text or "mysql_fetch" in response.text or "You have an error in your SQL syntax" in response.text)
+        
+        for (component_name, param, test_url), vulnerable in self.scheduler.map(probe_sql_injection, probes, host=urlparse(self.base_url).netloc):
+            if not vulnerable:
+                continue
+            vuln_info = {
+                "type": "sql_injection",
+                "name": "SQL Injection Vulnerability",
+                "description": f"تم اكتشاف ثغرة SQL Injection في مكون {component_name} في المعلمة {param}",
+                "severity": "high",
+                "component": component_name,
+                "url": test_url
+            }
+            self.results["joomla_vulnerabilities"].append(vuln_info)
+            self.logger.warning(f"تم اكتشاف ثغرة SQL Injection في مكون {component_name} في المعلمة {param}")
+            console.print(f"[red]تم اكتشاف ثغرة SQL Injection في مكون {component_name} في المعلمة {param}[/red]")
     
     def _check_module_vulnerabilities(self):
         """
@@ -708,24 +593,16 @@ class JoomlaScanner(WebServerScanner):
         for module in self.results["joomla_info"]["modules"]:
             module_name = module["name"]
             
-            # التحقق مما إذا كانت الوحدة معروفة في قاعدة البيانات
-            if module_name in self.known_vulnerabilities["modules"]:
-                # البحث عن الثغرات المعروفة للوحدة
-                for ver, vulns in self.known_vulnerabilities["modules"][module_name].items():
-                    # نفترض أن الوحدة عرضة للثغرات لأننا لا نعرف إصدارها
-                    for vuln in vulns:
-                        vuln_info = {
-                            "type": "module",
-                            "name": vuln["name"],
-                            "description": vuln["description"],
-                            "severity": vuln["severity"],
-                            "module": module_name,
-                            "affected_version": ver,
-                            "fixed_in": vuln["fixed_in"]
-                        }
-                        self.results["joomla_vulnerabilities"].append(vuln_info)
-                        self.logger.warning(f"تم اكتشاف ثغرة في وحدة {module_name}: {vuln['name']} (خطورة: {vuln['severity']})")
-                        console.print(f"[{get_severity_color(vuln['severity'])}]تم اكتشاف ثغرة في وحدة {module_name}: {vuln['name']} (خطورة: {vuln['severity']})[/{get_severity_color(vuln['severity'])}]")
+            # البحث عن الثغرات المعروفة (جميع الثغرات لأن الإصدار غير معروف)
+            for vuln in self.vulnerability_db.check_joomla_module_vulnerabilities(module_name, None):
+                vuln_info = {
+                    "type": "module",
+                    **describe_vulnerability(vuln),
+                    "module": module_name
+                }
+                self.results["joomla_vulnerabilities"].append(vuln_info)
+                self.logger.warning(f"تم اكتشاف ثغرة في وحدة {module_name}: {vuln_info['name']} (خطورة: {vuln_info['severity']})")
+                console.print(f"[{get_severity_color(vuln_info['severity'])}]تم اكتشاف ثغرة في وحدة {module_name}: {vuln_info['name']} (خطورة: {vuln_info['severity']})[/{get_severity_color(vuln_info['severity'])}]")
     
     def _check_template_vulnerabilities(self):
         """
@@ -739,53 +616,34 @@ class JoomlaScanner(WebServerScanner):
         for template in self.results["joomla_info"]["templates"]:
             template_name = template["name"]
             
-            # التحقق مما إذا كان القالب معروفًا في قاعدة البيانات
-            if template_name in self.known_vulnerabilities["templates"]:
-                # البحث عن الثغرات المعروفة للقالب
-                for ver, vulns in self.known_vulnerabilities["templates"][template_name].items():
-                    # نفترض أن القالب عرضة للثغرات لأننا لا نعرف إصداره
-                    for vuln in vulns:
-                        vuln_info = {
-                            "type": "template",
-                            "name": vuln["name"],
-                            "description": vuln["description"],
-                            "severity": vuln["severity"],
-                            "template": template_name,
-                            "affected_version": ver,
-                            "fixed_in": vuln["fixed_in"]
-                        }
-                        self.results["joomla_vulnerabilities"].append(vuln_info)
-                        self.logger.warning(f"تم اكتشاف ثغرة في قالب {template_name}: {vuln['name']} (خطورة: {vuln['severity']})")
-                        console.print(f"[{get_severity_color(vuln['severity'])}]تم اكتشاف ثغرة في قالب {template_name}: {vuln['name']} (خطورة: {vuln['severity']})[/{get_severity_color(vuln['severity'])}]")
+            # البحث عن الثغرات المعروفة (جميع الثغرات لأن الإصدار غير معروف)
+            for vuln in self.vulnerability_db.check_joomla_template_vulnerabilities(template_name, None):
+                vuln_info = {
+                    "type": "template",
+                    **describe_vulnerability(vuln),
+                    "template": template_name
+                }
+                self.results["joomla_vulnerabilities"].append(vuln_info)
+                self.logger.warning(f"تم اكتشاف ثغرة في قالب {template_name}: {vuln_info['name']} (خطورة: {vuln_info['severity']})")
+                console.print(f"[{get_severity_color(vuln_info['severity'])}]تم اكتشاف ثغرة في قالب {template_name}: {vuln_info['name']} (خطورة: {vuln_info['severity']})[/{get_severity_color(vuln_info['severity'])}]")
             
             # فحص ملفات حساسة للقالب
             if "url" in template:
-                sensitive_files = [
-                    "templateDetails.xml",
-                    "params.ini",
-                    "index.php",
-                    "css/template.css",
-                    "js/template.js"
-                ]
+                sensitive_files = [f"/templates/{template_name}/{file}" for file in TEMPLATE_SENSITIVE_FILES]
                 
-                for file in sensitive_files:
-                    file_url = f"{template['url']}{file}"
-                    try:
-                        response = requests.get(file_url, timeout=self.timeout, verify=False)
-                        if response.status_code == 200:
-                            vuln_info = {
-                                "type": "information_disclosure",
-                                "name": "Template Information Disclosure",
-                                "description": f"تم العثور على ملف معلومات للقالب {template_name}: {file_url}",
-                                "severity": "low",
-                                "template": template_name,
-                                "url": file_url
-                            }
-                            self.results["joomla_vulnerabilities"].append(vuln_info)
-                            self.logger.info(f"تم العثور على ملف معلومات للقالب {template_name}: {file_url}")
-                            console.print(f"[green]تم العثور على ملف معلومات للقالب {template_name}: {file_url}[/green]")
-                    except:
-                        pass
+                for found in self.path_prober.probe(self.base_url, sensitive_files):
+                    file_url = found["url"]
+                    vuln_info = {
+                        "type": "information_disclosure",
+                        "name": "Template Information Disclosure",
+                        "description": f"تم العثور على ملف معلومات للقالب {template_name}: {file_url}",
+                        "severity": "low",
+                        "template": template_name,
+                        "url": file_url
+                    }
+                    self.results["joomla_vulnerabilities"].append(vuln_info)
+                    self.logger.info(f"تم العثور على ملف معلومات للقالب {template_name}: {file_url}")
+                    console.print(f"[green]تم العثور على ملف معلومات للقالب {template_name}: {file_url}[/green]")
     
     def _check_other_vulnerabilities(self):
         """
@@ -794,7 +652,7 @@ class JoomlaScanner(WebServerScanner):
         # فحص صفحة تسجيل الدخول الإدارية
         admin_url = f"{self.base_url}/administrator/"
         try:
-            response = requests.get(admin_url, timeout=self.timeout, verify=False)
+            response = self.http.get(admin_url)
             if response.status_code == 200 and ("Joomla" in response.text or "Administration Login" in response.text):
                 vuln_info = {
                     "type": "admin_login",
@@ -812,7 +670,7 @@ class JoomlaScanner(WebServerScanner):
         # فحص دليل التثبيت
         install_url = f"{self.base_url}/installation/"
         try:
-            response = requests.get(install_url, timeout=self.timeout, verify=False)
+            response = self.http.get(install_url)
             if response.status_code == 200 and ("Joomla" in response.text and "Installation" in response.text):
                 vuln_info = {
                     "type": "installation_directory",
@@ -831,7 +689,7 @@ class JoomlaScanner(WebServerScanner):
         for i in range(1, 5):  # فحص أول 5 معرفات
             user_url = f"{self.base_url}/index.php?option=com_users&view=profile&id={i}"
             try:
-                response = requests.get(user_url, timeout=self.timeout, verify=False)
+                response = self.http.get(user_url)
                 if response.status_code == 200 and "404" not in response.text and "not found" not in response.text.lower():
                     vuln_info = {
                         "type": "user_enumeration",
@@ -866,27 +724,12 @@ class JoomlaScanner(WebServerScanner):
         
         المعطيات:
             current_version (str): الإصدار الحالي
-            vulnerable_version (str): الإصدار المعرض للثغرات
+            vulnerable_version (str): آخر إصدار معرض للثغرات
             
         المخرجات:
-            bool: True إذا كان الإصدار الحالي عرضة للثغرات، False خلاف ذلك
-        """
-        # تحويل الإصدارات إلى قوائم من الأرقام
-        current_parts = [int(part) for part in current_version.split(".")]
-        vulnerable_parts = [int(part) for part in vulnerable_version.split(".")]
-        
-        # إضافة أصفار إذا كانت القوائم غير متساوية في الطول
-        while len(current_parts) < len(vulnerable_parts):
-            current_parts.append(0)
-        while len(vulnerable_parts) < len(current_parts):
-            vulnerable_parts.append(0)
-        
-        # مقارنة الإصدارات
-        for i in range(len(current_parts)):
-            if current_parts[i] < vulnerable_parts[i]:
-                return False
-            elif current_parts[i] > vulnerable_parts[i]:
-                return False
-        
-        # الإصدارات متطابقة
-        return True
\ No newline at end of file
+            bool: True إذا كان الإصدار الحالي عرضة للثغرات (أو غير معروف)، False خلاف ذلك
+        """
+        if not current_version or current_version == "غير معروف":
+            return True
+        
+        return self.vulnerability_db._is_version_affected(current_version, [f"<={vulnerable_version}"])
\ No newline at end of file
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة تخزين الروابط والنماذج لأداة SaudiAttack
+
+تحتفظ المخازن بترتيب الإضافة مع فحص تكرار بزمن ثابت (قاموس بدلاً من البحث في
+قائمة)، وتُوحد الروابط قبل المقارنة، ولكل مخزن حد أقصى يتم بعده تجاهل العناصر
+الجديدة حتى لا تنمو الذاكرة بلا حدود في الصفحات الكبيرة.
+"""
+
+import threading
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+# الحدود الافتراضية لعدد الروابط والنماذج المخزنة
+DEFAULT_MAX_LINKS = 10000
+DEFAULT_MAX_FORMS = 1000
+
+# المنافذ الافتراضية التي تُحذف من الروابط الموحدة
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# البروتوكولات التي لا تمثل روابط قابلة للفحص
+IGNORED_SCHEMES = ("javascript:", "mailto:", "tel:", "data:")
+
+
+def normalize_url(href, base_url=""):
+    """
+    توحيد رابط: تحويله إلى رابط مطلق وحذف الجزء (#) والمنفذ الافتراضي وتوحيد حالة
+    أحرف البروتوكول واسم المضيف
+
+    المعطيات:
+        href (str): الرابط (مطلق أو نسبي)
+        base_url (str): عنوان URL للصفحة التي ظهر فيها الرابط
+
+    المخرجات:
+        str: الرابط الموحد أو None إذا لم يكن رابط HTTP قابلاً للفحص
+    """
+    href = (href or "").strip()
+    if not href or href.startswith("#") or href.lower().startswith(IGNORED_SCHEMES):
+        return None
+
+    parts = urlsplit(urljoin(base_url, href))
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return None
+
+    netloc = parts.hostname.lower()
+    try:
+        port = parts.port
+    except ValueError:
+        return None
+    if port and port != DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{port}"
+
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+
+def form_signature(form, base_url=""):
+    """
+    حساب التوقيع الموحد لنموذج (الوجهة والطريقة وأسماء الحقول وأنواعها)
+
+    المعطيات:
+        form (dict): النموذج كما تعيده ParsedPage.forms
+        base_url (str): عنوان URL للصفحة التي ظهر فيها النموذج
+
+    المخرجات:
+        tuple: التوقيع
+    """
+    action = normalize_url(form.get("action") or base_url, base_url) or form.get("action", "")
+    fields = sorted((field.get("name", ""), field.get("type", "")) for field in form.get("inputs", []))
+    return (action, form.get("method", "GET").upper(), tuple(fields))
+
+
+class LinkStore:
+    """
+    فئة مخزن الروابط الفريدة مرتبة حسب الإضافة
+    """
+
+    def __init__(self, max_links=DEFAULT_MAX_LINKS):
+        """
+        تهيئة مخزن الروابط
+
+        المعطيات:
+            max_links (int): الحد الأقصى لعدد الروابط (0 بلا حد)
+        """
+        self.max_links = max(0, max_links or 0)
+        self.dropped = 0
+        self._links = {}
+        self._lock = threading.Lock()
+
+    def add(self, url):
+        """
+        إضافة رابط موحد
+
+        المعطيات:
+            url (str): الرابط (يجب أن يكون موحدًا بـ normalize_url)
+
+        المخرجات:
+            bool: True إذا أضيف الرابط لأول مرة
+        """
+        with self._lock:
+            if url in self._links:
+                return False
+            if self.max_links and len(self._links) >= self.max_links:
+                self.dropped += 1
+                return False
+            self._links[url] = None
+            return True
+
+    def __contains__(self, url):
+        return url in self._links
+
+    def __len__(self):
+        return len(self._links)
+
+    def __iter__(self):
+        return iter(list(self._links))
+
+
+class FormStore:
+    """
+    فئة مخزن النماذج الفريدة حسب التوقيع الموحد
+    """
+
+    def __init__(self, max_forms=DEFAULT_MAX_FORMS):
+        """
+        تهيئة مخزن النماذج
+
+        المعطيات:
+            max_forms (int): الحد الأقصى لعدد النماذج (0 بلا حد)
+        """
+        self.max_forms = max(0, max_forms or 0)
+        self.dropped = 0
+        self._signatures = set()
+        self._lock = threading.Lock()
+
+    def add(self, form, base_url=""):
+        """
+        إضافة نموذج إذا لم يسبق تسجيل نموذج بالتوقيع نفسه
+
+        المعطيات:
+            form (dict): النموذج
+            base_url (str): عنوان URL للصفحة التي ظهر فيها النموذج
+
+        المخرجات:
+            bool: True إذا أضيف النموذج لأول مرة
+        """
+        signature = form_signature(form, base_url)
+        with self._lock:
+            if signature in self._signatures:
+                return False
+            if self.max_forms and len(self._signatures) >= self.max_forms:
+                self.dropped += 1
+                return False
+            self._signatures.add(signature)
+            return True
+
+    def __len__(self):
+        return len(self._signatures)
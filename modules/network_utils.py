@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة أدوات الشبكة لأداة SaudiAttack
+"""
+
+import asyncio
+import socket
+import ssl
+import requests
+
+# وكيل المستخدم المستخدم في طلبات HTTP المستقلة
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# ترويسات الأمان التي يتم التحقق منها
+SECURITY_HEADERS = [
+    "Strict-Transport-Security",
+    "Content-Security-Policy",
+    "X-Content-Type-Options",
+    "X-Frame-Options",
+    "X-XSS-Protection"
+]
+
+# الحد الافتراضي لعدد الاتصالات المتزامنة في الماسح غير المتزامن
+DEFAULT_SCAN_CONCURRENCY = 500
+
+
+def get_ip_info(ip):
+    """
+    الحصول على معلومات عنوان IP
+
+    المعطيات:
+        ip (str): عنوان IP
+
+    المخرجات:
+        dict: معلومات عنوان IP (فارغة في حال الفشل)
+    """
+    try:
+        response = requests.get(f"https://ipinfo.io/{ip}/json", timeout=5)
+        if response.status_code == 200:
+            return response.json()
+    except requests.exceptions.RequestException:
+        pass
+    return {}
+
+
+def get_whois_info(domain):
+    """
+    الحصول على معلومات WHOIS للنطاق
+
+    المعطيات:
+        domain (str): اسم النطاق
+
+    المخرجات:
+        str: نص سجل WHOIS (فارغ في حال الفشل)
+    """
+    try:
+        response = requests.get(f"https://api.hackertarget.com/whois/?q={domain}", timeout=5)
+        if response.status_code == 200:
+            return response.text
+    except requests.exceptions.RequestException:
+        pass
+    return ""
+
+
+def get_dns_records(domain):
+    """
+    الحصول على عناوين IP المرتبطة بالنطاق
+
+    المعطيات:
+        domain (str): اسم النطاق
+
+    المخرجات:
+        list: قائمة عناوين IP الفريدة
+    """
+    records = []
+    try:
+        for info in socket.getaddrinfo(domain, None):
+            ip = info[4][0]
+            if ip not in records:
+                records.append(ip)
+    except socket.gaierror:
+        pass
+    return records
+
+
+def get_reverse_dns(ip):
+    """
+    الحصول على اسم المضيف من عنوان IP
+
+    المعطيات:
+        ip (str): عنوان IP
+
+    المخرجات:
+        str: اسم المضيف (فارغ في حال الفشل)
+    """
+    try:
+        return socket.gethostbyaddr(ip)[0]
+    except (socket.herror, socket.gaierror):
+        return ""
+
+
+def is_port_open(host, port, timeout=2):
+    """
+    التحقق مما إذا كان المنفذ مفتوحًا عبر اتصال TCP
+
+    المعطيات:
+        host (str): المضيف
+        port (int): رقم المنفذ
+        timeout (int): مهلة الاتصال بالثواني
+
+    المخرجات:
+        bool: True إذا كان المنفذ مفتوحًا
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        return sock.connect_ex((host, port)) == 0
+    except (socket.error, OSError):
+        return False
+    finally:
+        sock.close()
+
+
+def sniff_tls(host, port, timeout=3):
+    """
+    التحقق مما إذا كان المنفذ يتحدث TLS بمحاولة مصافحة دون التحقق من الشهادة
+
+    المعطيات:
+        host (str): المضيف
+        port (int): رقم المنفذ
+        timeout (int): مهلة الاتصال والمصافحة بالثواني
+
+    المخرجات:
+        bool: True إذا نجحت مصافحة TLS
+    """
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    try:
+        with socket.create_connection((host, port), timeout=timeout) as sock:
+            with context.wrap_socket(sock, server_hostname=host):
+                return True
+    except (ssl.SSLError, socket.error, OSError):
+        return False
+
+
+def scan_port_range(host, ports, timeout=2):
+    """
+    مسح قائمة من المنافذ بشكل متسلسل
+
+    المعطيات:
+        host (str): المضيف
+        ports (list): قائمة المنافذ
+        timeout (int): مهلة الاتصال بالثواني
+
+    المخرجات:
+        dict: حالة كل منفذ (True إذا كان مفتوحًا)
+    """
+    return {port: is_port_open(host, port, timeout) for port in ports}
+
+
+def check_open_ports(host, ports):
+    """
+    التحقق من المنافذ المفتوحة على المضيف
+
+    المعطيات:
+        host (str): المضيف
+        ports (list): قائمة المنافذ
+
+    المخرجات:
+        dict: حالة كل منفذ (True إذا كان مفتوحًا)
+    """
+    return scan_port_range(host, ports)
+
+
+async def async_is_port_open(host, port, timeout=1.0):
+    """
+    التحقق غير المتزامن مما إذا كان المنفذ مفتوحًا عبر اتصال TCP
+
+    المعطيات:
+        host (str): المضيف
+        port (int): رقم المنفذ
+        timeout (float): مهلة الاتصال بالثواني
+
+    المخرجات:
+        bool: True إذا كان المنفذ مفتوحًا
+    """
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except (asyncio.TimeoutError, OSError):
+        return False
+
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
+
+
+async def async_scan_ports(hosts, ports, concurrency=DEFAULT_SCAN_CONCURRENCY, timeout=1.0):
+    """
+    مسح منافذ عدة مضيفين بشكل متزامن مع حد أقصى لعدد الاتصالات المفتوحة
+
+    يتم توليد أزواج (المضيف، المنفذ) عند الطلب، لذا يبقى استهلاك الذاكرة ثابتًا
+    مهما كان عدد المضيفين أو المنافذ.
+
+    المعطيات:
+        hosts (list): قائمة المضيفين (أو مضيف واحد كسلسلة نصية)
+        ports (list): قائمة المنافذ
+        concurrency (int): الحد الأقصى للاتصالات المتزامنة
+        timeout (float): مهلة الاتصال بالثواني
+
+    المخرجات:
+        dict: المنافذ المفتوحة مرتبة لكل مضيف
+    """
+    if isinstance(hosts, str):
+        hosts = [hosts]
+
+    open_ports = {}
+    semaphore = asyncio.BoundedSemaphore(max(1, concurrency))
+    pending = set()
+
+    async def probe(host, port):
+        try:
+            if await async_is_port_open(host, port, timeout):
+                open_ports[host].append(port)
+        finally:
+            semaphore.release()
+
+    for host in hosts:
+        open_ports.setdefault(host, [])
+        for port in ports:
+            # انتظار توفر مكان قبل إنشاء المهمة التالية للحفاظ على عدد ثابت من المهام
+            await semaphore.acquire()
+            task = asyncio.ensure_future(probe(host, port))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+    if pending:
+        await asyncio.gather(*pending)
+
+    for host in open_ports:
+        open_ports[host].sort()
+    return open_ports
+
+
+def fast_scan_ports(hosts, ports, concurrency=DEFAULT_SCAN_CONCURRENCY, timeout=1.0):
+    """
+    واجهة متزامنة لـ async_scan_ports
+
+    المعطيات:
+        hosts (list): قائمة المضيفين (أو مضيف واحد كسلسلة نصية)
+        ports (list): قائمة المنافذ
+        concurrency (int): الحد الأقصى للاتصالات المتزامنة
+        timeout (float): مهلة الاتصال بالثواني
+
+    المخرجات:
+        dict: المنافذ المفتوحة مرتبة لكل مضيف
+    """
+    return asyncio.run(async_scan_ports(hosts, ports, concurrency, timeout))
+
+
+def get_ssl_certificate_info(hostname, port=443, timeout=10):
+    """
+    الحصول على معلومات شهادة SSL
+
+    المعطيات:
+        hostname (str): اسم المضيف
+        port (int): رقم المنفذ
+        timeout (int): مهلة الاتصال والقراءة بالثواني
+
+    المخرجات:
+        dict: معلومات الشهادة (فارغة في حال الفشل)
+    """
+    try:
+        context = ssl.create_default_context()
+        sock = socket.create_connection((hostname, port), timeout=timeout)
+        try:
+            sock.settimeout(timeout)
+            ssock = context.wrap_socket(sock, server_hostname=hostname)
+            try:
+                cert = ssock.getpeercert()
+            finally:
+                ssock.close()
+        finally:
+            sock.close()
+    except (ssl.SSLError, socket.error, OSError):
+        return {}
+
+    subject = dict(x[0] for x in cert.get("subject", ()))
+    issuer = dict(x[0] for x in cert.get("issuer", ()))
+    return {
+        "subject": subject.get("commonName", ""),
+        "issuer": issuer.get("commonName", issuer.get("organizationName", "")),
+        "valid_from": cert.get("notBefore", ""),
+        "valid_until": cert.get("notAfter", ""),
+        "version": cert.get("version"),
+        "serial_number": cert.get("serialNumber", "")
+    }
+
+
+def get_http_headers(url):
+    """
+    الحصول على ترويسات استجابة HTTP
+
+    المعطيات:
+        url (str): عنوان URL
+
+    المخرجات:
+        dict: ترويسات الاستجابة (فارغة في حال الفشل)
+    """
+    try:
+        response = requests.get(url, timeout=5, verify=False, allow_redirects=True, headers={
+            "User-Agent": DEFAULT_USER_AGENT
+        })
+        return dict(response.headers)
+    except requests.exceptions.RequestException:
+        return {}
+
+
+def make_http_request(url, method="GET", timeout=5):
+    """
+    إجراء طلب HTTP بسيط
+
+    المعطيات:
+        url (str): عنوان URL
+        method (str): طريقة الطلب
+        timeout (int): مهلة الاتصال بالثواني
+
+    المخرجات:
+        tuple: (رمز الحالة، المحتوى، الترويسات) أو (None, "", {}) في حال الفشل
+    """
+    try:
+        if method.upper() == "GET":
+            response = requests.get(url, timeout=timeout, verify=False, headers={"User-Agent": DEFAULT_USER_AGENT})
+        else:
+            response = requests.request(method, url, timeout=timeout, verify=False, headers={"User-Agent": DEFAULT_USER_AGENT})
+        return response.status_code, response.text, dict(response.headers)
+    except requests.exceptions.RequestException:
+        return None, "", {}
+
+
+def get_geolocation(ip):
+    """
+    الحصول على الموقع الجغرافي لعنوان IP
+
+    المعطيات:
+        ip (str): عنوان IP
+
+    المخرجات:
+        dict: معلومات الموقع الجغرافي (فارغة في حال الفشل)
+    """
+    try:
+        response = requests.get(f"https://freegeoip.app/json/{ip}", timeout=5)
+        if response.status_code == 200:
+            return response.json()
+    except requests.exceptions.RequestException:
+        pass
+    return {}
+
+
+def get_asn_info(ip):
+    """
+    الحصول على معلومات النظام المستقل (ASN) لعنوان IP
+
+    المعطيات:
+        ip (str): عنوان IP
+
+    المخرجات:
+        dict: معلومات ASN (فارغة في حال الفشل)
+    """
+    try:
+        response = requests.get(f"https://ipinfo.io/{ip}/asn", timeout=5)
+        if response.status_code == 200:
+            return response.json()
+    except requests.exceptions.RequestException:
+        pass
+    return {}
+
+
+def check_common_vulnerabilities(host):
+    """
+    التحقق من الثغرات الشائعة (ترويسات الأمان وشهادة SSL)
+
+    المعطيات:
+        host (str): المضيف
+
+    المخرجات:
+        dict: نتائج التحقق
+    """
+    headers = get_http_headers(f"https://{host}")
+    certificate = get_ssl_certificate_info(host, 443)
+
+    present_headers = [header for header in SECURITY_HEADERS if header in headers]
+    missing_headers = [header for header in SECURITY_HEADERS if header not in headers]
+
+    return {
+        "security_headers": {
+            "present_headers": present_headers,
+            "missing_headers": missing_headers
+        },
+        "ssl_certificate": certificate,
+        "server": headers.get("Server", "")
+    }
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة التحليل التدفقي لمخرج nmap لأداة SaudiAttack
+
+يُشغل nmap مع الخيار "-oX -" ويُغذى مخرجه إلى المحلل على أجزاء فور وصولها. يُصدر المحلل
+حدثًا لكل منفذ عند اكتمال عنصره وحدثًا لكل مضيف عند اكتمال عنصره، ثم يحذف العناصر
+المعالجة من الشجرة، لذا تبقى الذاكرة ثابتة مهما كان عدد المضيفين وتظهر النتائج أثناء
+المسح. بيانات المنفذ والمضيف بالتنسيق نفسه الذي يعيده python-nmap.
+"""
+
+from xml.etree import ElementTree
+
+
+def parse_port(element):
+    """
+    تحويل عنصر port إلى بيانات المنفذ
+
+    المعطيات:
+        element (Element): عنصر port
+
+    المخرجات:
+        dict: بيانات المنفذ (state, reason, name, product, version, extrainfo, tunnel, conf, cpe, script)
+    """
+    state = element.find("state")
+    service = element.find("service")
+    state = state.attrib if state is not None else {}
+    service = service if service is not None else ElementTree.Element("service")
+
+    port_data = {
+        "state": state.get("state", ""),
+        "reason": state.get("reason", ""),
+        "name": service.get("name", ""),
+        "product": service.get("product", ""),
+        "version": service.get("version", ""),
+        "extrainfo": service.get("extrainfo", ""),
+        "tunnel": service.get("tunnel", ""),
+        "conf": service.get("conf", ""),
+        "cpe": " ".join(cpe.text or "" for cpe in service.findall("cpe"))
+    }
+    scripts = {script.get("id"): script.get("output", "") for script in element.findall("script")}
+    if scripts:
+        port_data["script"] = scripts
+    return port_data
+
+
+def parse_host(element):
+    """
+    تحويل عنصر host (بعد حذف منافذه) إلى بيانات المضيف
+
+    المعطيات:
+        element (Element): عنصر host
+
+    المخرجات:
+        dict: بيانات المضيف (status, hostnames, osmatch)
+    """
+    status = element.find("status")
+    return {
+        "status": dict(status.attrib) if status is not None else {},
+        "hostnames": [
+            {"name": hostname.get("name", ""), "type": hostname.get("type", "")}
+            for hostname in element.iterfind("hostnames/hostname")
+        ],
+        "osmatch": [
+            {"name": match.get("name", ""), "accuracy": match.get("accuracy", ""), "line": match.get("line", "")}
+            for match in element.iterfind("os/osmatch")
+        ]
+    }
+
+
+class NmapXmlStream:
+    """
+    فئة المحلل التدفقي لمخرج XML من nmap
+
+    الأحداث الصادرة:
+        ("port", العنوان، رقم المنفذ، البروتوكول، بيانات المنفذ)
+        ("host", العنوان، بيانات المضيف)
+    """
+
+    def __init__(self):
+        """
+        تهيئة المحلل
+        """
+        self._parser = ElementTree.XMLPullParser(events=("start", "end"))
+        self._root = None
+        self._host = None
+        self._ports = None
+        self._address = None
+        self._depth = 0
+
+    def feed(self, data):
+        """
+        تغذية المحلل بجزء من المخرج
+
+        المعطيات:
+            data (bytes): جزء المخرج
+
+        المخرجات:
+            list: الأحداث المكتملة في هذا الجزء
+        """
+        self._parser.feed(data)
+        return list(self._events())
+
+    def close(self):
+        """
+        إنهاء التحليل
+
+        المخرجات:
+            list: الأحداث المتبقية
+        """
+        self._parser.close()
+        return list(self._events())
+
+    def _events(self):
+        """
+        تحويل أحداث المحلل إلى أحداث المنافذ والمضيفين وحذف العناصر المعالجة
+
+        المخرجات:
+            generator: الأحداث
+        """
+        for event, element in self._parser.read_events():
+            if event == "start":
+                self._depth += 1
+                if element.tag == "nmaprun":
+                    self._root = element
+                elif element.tag == "host":
+                    self._host = element
+                elif element.tag == "ports" and self._host is not None:
+                    self._ports = element
+                continue
+
+            self._depth -= 1
+            if self._host is not None:
+                if element.tag == "address" and element.get("addrtype") in ("ipv4", "ipv6"):
+                    self._address = element.get("addr")
+                elif element.tag == "port" and self._ports is not None:
+                    yield ("port", self._address, int(element.get("portid")), element.get("protocol", "tcp"),
+                           parse_port(element))
+                    self._ports.remove(element)
+                elif element.tag == "host":
+                    yield ("host", self._address, parse_host(element))
+                    self._host = self._ports = self._address = None
+
+            # حذف العناصر المكتملة من المستوى الأعلى (المضيفون وتلميحات المضيفين والتقدم)
+            if self._depth == 1 and self._root is not None:
+                self._root.remove(element)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة تخطيط نصوص NSE حسب الخدمة لأداة SaudiAttack
+
+بدلاً من تشغيل فئة "vuln" كاملة على كل منفذ، تُحدد لكل منفذ مفتوح نصوص الثغرات الخاصة
+بخدمته المكتشفة فقط من ملف بيانات (مثلاً http إلى نصوص http-vuln-* و ssl إلى نصوص ssl-*)،
+ثم تُجمع المنافذ التي تحتاج النصوص نفسها في مجموعة واحدة تُمسح باستدعاء nmap واحد مع
+الخيارين --script و -p. المضيف الذي لا يفتح إلا SSH و HTTPS لا تُشغل عليه نصوص SMB أو RDP.
+
+الخدمات اكتُشفت مسبقًا، لذا تعمل مجموعات النصوص دون اكتشاف الإصدارات. تختار نصوص NSE
+منافذها حسب اسم الخدمة أو رقم المنفذ، وبدون اكتشاف الإصدارات يأخذ nmap اسم الخدمة من رقم
+المنفذ، لذا تحتاج المجموعة اكتشافًا خفيفًا للإصدارات (--version-light) فقط إذا كانت إحدى
+خدماتها على منفذ غير معتاد لها.
+"""
+
+import os
+import json
+import threading
+
+from .vulnerability_database import DATA_DIR
+
+# ملف ربط الخدمات بنصوص NSE المضمن
+DEFAULT_NSE_SERVICE_SCRIPTS_FILE = os.path.join(DATA_DIR, "nse_service_scripts.json")
+
+
+class NseScriptPlanner:
+    """
+    فئة تخطيط نصوص NSE لكل منفذ حسب خدمته
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path=DEFAULT_NSE_SERVICE_SCRIPTS_FILE):
+        """
+        تحميل ملف ربط الخدمات بالنصوص
+
+        يحتوي الملف على services (اسم الخدمة إلى قائمة النصوص) و aliases (اسم الخدمة كما
+        يكتشفها nmap إلى أسماء الخدمات في services) و ports (اسم الخدمة إلى المنافذ التي تتعرف
+        عليها نصوصها دون اكتشاف الإصدارات).
+
+        المعطيات:
+            path (str): مسار الملف
+        """
+        self.path = path
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.services = {name.lower(): list(scripts) for name, scripts in data.get("services", {}).items()}
+        self.aliases = {name.lower(): list(targets) for name, targets in data.get("aliases", {}).items()}
+        self.ports = {name.lower(): set(ports) for name, ports in data.get("ports", {}).items()}
+
+    @classmethod
+    def for_path(cls, path=None):
+        """
+        الحصول على المخطط المحمل من الملف (يُحمّل مرة واحدة لكل مسار في العملية)
+
+        المعطيات:
+            path (str): مسار الملف (افتراضيًا: الملف المضمن)
+
+        المخرجات:
+            NseScriptPlanner: المخطط
+        """
+        path = path or DEFAULT_NSE_SERVICE_SCRIPTS_FILE
+        with cls._instances_lock:
+            if path not in cls._instances:
+                cls._instances[path] = cls(path)
+            return cls._instances[path]
+
+    def service_keys(self, port_data):
+        """
+        أسماء خدمات المنفذ في ملف الربط
+
+        المعطيات:
+            port_data (dict): بيانات المنفذ من nmap
+
+        المخرجات:
+            list: أسماء الخدمات (تُضاف ssl للخدمات المغلفة بـ TLS)
+        """
+        name = (port_data.get("name") or "").lower()
+        # قد يكتب nmap الخدمة المغلفة بالشكل "ssl/http"
+        tunnel, _, name = name.rpartition("/")
+        keys = list(self.aliases.get(name, [name]))
+        if "ssl" in (tunnel, (port_data.get("tunnel") or "").lower()) and "ssl" not in keys:
+            keys.append("ssl")
+        return keys
+
+    def scripts_for(self, port_data):
+        """
+        نصوص NSE لمنفذ
+
+        المعطيات:
+            port_data (dict): بيانات المنفذ من nmap
+
+        المخرجات:
+            tuple: النصوص مرتبة (فارغة إذا لم تكن للخدمة نصوص)
+        """
+        scripts = set()
+        for key in self.service_keys(port_data):
+            scripts.update(self.services.get(key, []))
+        return tuple(sorted(scripts))
+
+    def needs_version_detection(self, port, port_data):
+        """
+        التحقق مما إذا كانت نصوص المنفذ تحتاج اكتشاف الإصدارات لتتعرف على خدمته
+
+        المعطيات:
+            port (int): رقم المنفذ
+            port_data (dict): بيانات المنفذ من nmap
+
+        المخرجات:
+            bool: True إذا كانت إحدى خدمات المنفذ ذات النصوص على منفذ غير معتاد لها
+        """
+        return any(
+            port not in self.ports.get(key, ())
+            for key in self.service_keys(port_data) if self.services.get(key)
+        )
+
+    def plan(self, tcp_data, ports=None):
+        """
+        تجميع المنافذ المفتوحة حسب النصوص التي تحتاجها
+
+        المعطيات:
+            tcp_data (dict): بيانات منافذ TCP من nmap (رقم المنفذ إلى بياناته)
+            ports (iterable): المنافذ المراد تخطيطها فقط (افتراضيًا: كل المنافذ المفتوحة)
+
+        المخرجات:
+            list: المجموعات بالشكل {"scripts": [...], "ports": [...], "version_light": bool}
+        """
+        selected = set(ports) if ports is not None else None
+        groups = {}
+        for port, port_data in sorted(tcp_data.items()):
+            if port_data.get("state") != "open" or (selected is not None and port not in selected):
+                continue
+            scripts = self.scripts_for(port_data)
+            if scripts:
+                groups.setdefault((scripts, self.needs_version_detection(port, port_data)), []).append(port)
+        return [
+            {"scripts": list(scripts), "ports": ports, "version_light": version_light}
+            for (scripts, version_light), ports in groups.items()
+        ]
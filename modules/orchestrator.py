@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة تنسيق المسح متعدد الأهداف لأداة SaudiAttack
+"""
+
+import asyncio
+import threading
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from rich.console import Console
+from .incremental import diff_findings
+from .dns_resolver import DnsResolver, DEFAULT_RESOLVE_CONCURRENCY
+from .utils import get_target_type
+
+console = Console()
+
+
+class ScanOrchestrator:
+    """
+    فئة تنسيق مسح عدة أهداف بالتوازي
+
+    يتم تشغيل عدد محدود من الماسحات في الوقت نفسه (الحد العام)، ويستخدم كل ماسح
+    عدد مسارات التنفيذ الخاص به (الحد لكل مضيف). تُسحب الأهداف من المولد عند الحاجة
+    فقط، وتُمرر نتيجة كل مضيف إلى دالة الاستقبال فور اكتماله دون الاحتفاظ بها.
+    تُسحب الأهداف على دفعات، وتُحلل أسماء النطاقات في كل دفعة بالتوازي قبل إنشاء
+    ماسحاتها حتى لا يحلل كل ماسح اسمه بشكل متتابع.
+    """
+
+    def __init__(self, scanner_class, ports, threads=5, timeout=30, logger=None, config=None, max_workers=4,
+                 previous=None, journal=None):
+        """
+        تهيئة منسق المسح
+
+        المعطيات:
+            scanner_class (type): فئة الماسح (VulnerabilityScanner أو إحدى الفئات المشتقة)
+            ports (list): قائمة المنافذ للفحص
+            threads (int): عدد مسارات التنفيذ لكل مضيف
+            timeout (int): مهلة الاتصال بالثواني
+            logger (Logger): كائن المسجل
+            config (Config): كائن التكوين (اختياري)
+            max_workers (int): الحد الأقصى لعدد المضيفين الممسوحين في الوقت نفسه
+            previous (dict): نتائج مسح سابق مفهرسة حسب الهدف للمسح التزايدي (اختياري)
+            journal (ScanJournal): سجل تقدم المسح لاستئناف المسح المنقطع (اختياري)
+        """
+        self.scanner_class = scanner_class
+        self.ports = ports
+        self.threads = threads
+        self.timeout = timeout
+        self.logger = logger
+        self.config = config
+        self.max_workers = max(1, max_workers)
+        self.previous = previous
+        self.journal = journal
+        self.resolver = DnsResolver.shared()
+        self.dns_batch = (config.get("scanning", "dns_concurrency") if config is not None else None) \
+            or DEFAULT_RESOLVE_CONCURRENCY
+        # الماسحات الجارية في run (لإيقافها عند المقاطعة)
+        self._scanners = set()
+        self._scanners_lock = threading.Lock()
+
+    def run(self, targets, on_result):
+        """
+        مسح جميع الأهداف وتمرير نتيجة كل هدف إلى دالة الاستقبال
+
+        المعطيات:
+            targets (iterable): الأهداف (يمكن أن تكون مولدًا)
+            on_result (callable): دالة تستقبل (الهدف، النتائج، الخطأ) عند اكتمال كل هدف
+
+        المخرجات:
+            dict: إحصائيات المسح (عدد الأهداف المكتملة والفاشلة والمتخطاة)
+        """
+        stats = {"completed": 0, "failed": 0, "skipped": 0}
+        targets = self._pending_targets(targets, stats)
+        batch = deque()
+        pending = {}
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            exhausted = False
+            while True:
+                # ملء مجمع العمل حتى الحد العام فقط للحفاظ على كسل المولد
+                while not exhausted and len(pending) < self.max_workers:
+                    if not batch:
+                        batch.extend(islice(targets, self.dns_batch))
+                        self.resolver.resolve_many(self._domains(batch), self.dns_batch)
+                    if not batch:
+                        exhausted = True
+                        break
+                    target = batch.popleft()
+                    pending[executor.submit(self._scan_target, target)] = target
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    target = pending.pop(future)
+                    try:
+                        results = future.result()
+                        error = None
+                        stats["completed"] += 1
+                    except Exception as e:
+                        results = None
+                        error = e
+                        stats["failed"] += 1
+                        self.logger.error(f"فشل مسح الهدف {target}: {str(e)}")
+                        console.print(f"[bold red]فشل مسح الهدف {target}: {str(e)}[/bold red]")
+
+                    on_result(target, results, error)
+
+        except KeyboardInterrupt:
+            # عدم انتظار المسوحات الجارية (مسح nmap قد يستغرق دقائق): إلغاء الأهداف المعلقة
+            # وإيقاف عمليات nmap الجارية ليعود الاستدعاء فورًا
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._stop_scanners()
+            raise
+        executor.shutdown()
+
+        return stats
+
+    def _pending_targets(self, targets, stats):
+        """
+        تخطي الأهداف التي اكتمل مسحها في تشغيل سابق حسب سجل التقدم
+        
+        المعطيات:
+            targets (iterable): الأهداف
+            stats (dict): إحصائيات المسح (يُحدّث عدد الأهداف المتخطاة)
+            
+        المخرجات:
+            iterator: الأهداف المتبقية
+        """
+        for target in targets:
+            if self.journal is not None and self.journal.is_completed(target):
+                stats["skipped"] += 1
+                self.logger.info(f"تخطي الهدف {target}: اكتمل مسحه في تشغيل سابق")
+                console.print(f"[bold blue]تخطي الهدف {target}: اكتمل مسحه في تشغيل سابق[/bold blue]")
+                continue
+            yield target
+    
+    def _domains(self, targets):
+        """
+        أسماء النطاقات من بين الأهداف (العناوين لا تحتاج إلى تحليل)
+        
+        المعطيات:
+            targets (iterable): الأهداف
+            
+        المخرجات:
+            list: أسماء النطاقات
+        """
+        return [target for target in targets if get_target_type(target) == "domain"]
+    
+    def _prepare_scanner(self, scanner, target):
+        """
+        ربط الماسح بالنتائج السابقة وسجل التقدم
+        
+        المعطيات:
+            scanner (VulnerabilityScanner): الماسح
+            target (str): الهدف
+            
+        المخرجات:
+            dict: نتائج المسح السابق للهدف (أو None)
+        """
+        previous = None
+        if self.previous is not None:
+            previous = self.previous.get(target)
+            if previous is None:
+                self.logger.warning(f"لا توجد نتائج سابقة للهدف {target}. سيتم تنفيذ مسح كامل.")
+                console.print(f"[bold yellow]لا توجد نتائج سابقة للهدف {target}. سيتم تنفيذ مسح كامل.[/bold yellow]")
+            else:
+                scanner.use_previous_results(previous)
+        if self.journal is not None:
+            scanner.use_journal(self.journal)
+        return previous
+    
+    def _finish_target(self, target, results, previous):
+        """
+        إضافة الفروقات إلى النتائج وتسجيل اكتمال الهدف
+        
+        المعطيات:
+            target (str): الهدف
+            results (dict): نتائج المسح
+            previous (dict): نتائج المسح السابق للهدف (أو None)
+            
+        المخرجات:
+            dict: نتائج المسح
+        """
+        if previous is not None:
+            results["delta"] = diff_findings(previous, results)
+        if self.journal is not None:
+            self.journal.mark_completed(target)
+        return results
+    
+    def _scan_target(self, target):
+        """
+        مسح هدف واحد
+
+        المعطيات:
+            target (str): الهدف
+
+        المخرجات:
+            dict: نتائج المسح
+        """
+        scanner = self.scanner_class(target, self.ports, self.threads, self.timeout, self.logger, self.config)
+        with self._scanners_lock:
+            self._scanners.add(scanner)
+        try:
+            previous = self._prepare_scanner(scanner, target)
+            return self._finish_target(target, scanner.scan(), previous)
+        finally:
+            with self._scanners_lock:
+                self._scanners.discard(scanner)
+            # كل هدف ينشئ جلسة HTTP ومنفذًا خاصين به، لذا يجب إغلاقهما حتى لا تتراكم مع آلاف الأهداف
+            scanner.close()
+    
+    def _stop_scanners(self):
+        """
+        إيقاف جميع الماسحات الجارية (عند مقاطعة المسح)
+        """
+        with self._scanners_lock:
+            scanners = list(self._scanners)
+        for scanner in scanners:
+            scanner.stop()
+
+    async def run_async(self, targets, on_result):
+        """
+        مسح جميع الأهداف في حلقة asyncio واحدة باستخدام scan_async لكل ماسح
+
+        المعطيات:
+            targets (iterable): الأهداف (يمكن أن تكون مولدًا)
+            on_result (callable): دالة تستقبل (الهدف، النتائج، الخطأ) عند اكتمال كل هدف
+
+        المخرجات:
+            dict: إحصائيات المسح (عدد الأهداف المكتملة والفاشلة والمتخطاة)
+        """
+        stats = {"completed": 0, "failed": 0, "skipped": 0}
+        targets = self._pending_targets(targets, stats)
+        batch = deque()
+        pending = {}
+        exhausted = False
+
+        while True:
+            # ملء مجمع العمل حتى الحد العام فقط للحفاظ على كسل المولد
+            while not exhausted and len(pending) < self.max_workers:
+                if not batch:
+                    batch.extend(islice(targets, self.dns_batch))
+                    await self.resolver.resolve_many_async(self._domains(batch), self.dns_batch)
+                if not batch:
+                    exhausted = True
+                    break
+                target = batch.popleft()
+                pending[asyncio.ensure_future(self._scan_target_async(target))] = target
+
+            if not pending:
+                break
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                target = pending.pop(task)
+                try:
+                    results = task.result()
+                    error = None
+                    stats["completed"] += 1
+                except Exception as e:
+                    results = None
+                    error = e
+                    stats["failed"] += 1
+                    self.logger.error(f"فشل مسح الهدف {target}: {str(e)}")
+                    console.print(f"[bold red]فشل مسح الهدف {target}: {str(e)}[/bold red]")
+
+                on_result(target, results, error)
+
+        return stats
+
+    async def _scan_target_async(self, target):
+        """
+        مسح هدف واحد بشكل غير متزامن
+
+        المعطيات:
+            target (str): الهدف
+
+        المخرجات:
+            dict: نتائج المسح
+        """
+        # إنشاء الماسح يتضمن تحليل DNS الحاجب، لذا يتم في المنفذ الافتراضي
+        loop = asyncio.get_running_loop()
+        scanner = await loop.run_in_executor(
+            None, self.scanner_class, target, self.ports, self.threads, self.timeout, self.logger, self.config
+        )
+        try:
+            previous = self._prepare_scanner(scanner, target)
+            return self._finish_target(target, await scanner.scan_async(), previous)
+        finally:
+            scanner.close()
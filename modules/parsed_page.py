@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة نموذج الصفحة المحللة لأداة SaudiAttack
+
+يتم تحليل كل استجابة HTML مرة واحدة فقط، ثم تُمرر الصفحة المحللة إلى جميع
+المحللات (النماذج، الروابط، التقنيات، اكتشاف ووردبريس وجوملا). يتم حساب كل خاصية
+عند أول طلب لها فقط.
+"""
+
+from bs4 import BeautifulSoup
+
+from .link_store import normalize_url
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+class ParsedPage:
+    """
+    فئة الصفحة المحللة
+    """
+
+    def __init__(self, html, url=""):
+        """
+        تهيئة الصفحة المحللة
+
+        المعطيات:
+            html (str): محتوى HTML الخام
+            url (str): عنوان URL للصفحة (لتحويل الروابط النسبية إلى مطلقة)
+        """
+        self.text = html or ""
+        self.url = url
+        self._soup = None
+        self._lower_text = None
+        self._forms = None
+        self._links = None
+        self._meta = None
+        self._script_srcs = None
+
+    @classmethod
+    def from_response(cls, response):
+        """
+        إنشاء صفحة محللة من استجابة HTTP
+
+        المعطيات:
+            response (Response): كائن الاستجابة
+
+        المخرجات:
+            ParsedPage: الصفحة المحللة
+        """
+        return cls(response.text, response.url or "")
+
+    @property
+    def soup(self):
+        """
+        شجرة HTML المحللة (BeautifulSoup مع محلل lxml إن توفر)
+        """
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.text, HTML_PARSER)
+        return self._soup
+
+    @property
+    def lower_text(self):
+        """
+        محتوى HTML بأحرف صغيرة (للبحث غير الحساس لحالة الأحرف)
+        """
+        if self._lower_text is None:
+            self._lower_text = self.text.lower()
+        return self._lower_text
+
+    @property
+    def title(self):
+        """
+        عنوان الصفحة (فارغ إذا لم يوجد)
+        """
+        title_tag = self.soup.find("title")
+        return title_tag.text if title_tag else ""
+
+    @property
+    def forms(self):
+        """
+        النماذج الموجودة في الصفحة مع حقول الإدخال الخاصة بكل نموذج
+        """
+        if self._forms is None:
+            self._forms = []
+            for form in self.soup.find_all("form"):
+                form_info = {
+                    "action": form.get("action", ""),
+                    "method": form.get("method", "get").upper(),
+                    "inputs": []
+                }
+
+                for input_field in form.find_all(["input", "textarea", "select"]):
+                    form_info["inputs"].append({
+                        "name": input_field.get("name", ""),
+                        "type": input_field.get("type", "text") if input_field.name == "input" else input_field.name,
+                        "required": input_field.has_attr("required")
+                    })
+
+                self._forms.append(form_info)
+        return self._forms
+
+    @property
+    def links(self):
+        """
+        الروابط المطلقة الموحدة الفريدة في الصفحة بترتيب ظهورها
+        """
+        if self._links is None:
+            links = {}
+
+            for link in self.soup.find_all("a"):
+                # تحويل الروابط النسبية إلى مطلقة وتوحيدها
+                href = normalize_url(link.get("href"), self.url)
+                if href:
+                    links[href] = None
+
+            self._links = list(links)
+        return self._links
+
+    @property
+    def meta(self):
+        """
+        العلامات الوصفية مفهرسة حسب الاسم بأحرف صغيرة (الاسم ← قائمة القيم)
+        """
+        if self._meta is None:
+            self._meta = {}
+            for tag in self.soup.find_all("meta"):
+                name = tag.get("name") or tag.get("property")
+                content = tag.get("content")
+                if name and content:
+                    self._meta.setdefault(name.lower(), []).append(content)
+        return self._meta
+
+    @property
+    def meta_generators(self):
+        """
+        قيم جميع العلامات الوصفية من نوع generator
+        """
+        return self.meta.get("generator", [])
+
+    @property
+    def meta_generator(self):
+        """
+        قيمة أول علامة وصفية من نوع generator (فارغة إذا لم توجد)
+        """
+        generators = self.meta_generators
+        return generators[0] if generators else ""
+
+    @property
+    def script_srcs(self):
+        """
+        مصادر ملفات JavaScript الخارجية في الصفحة
+        """
+        if self._script_srcs is None:
+            self._script_srcs = [
+                script.get("src") for script in self.soup.find_all("script")
+                if script.get("src")
+            ]
+        return self._script_srcs
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة فحص المسارات الحساسة لأداة SaudiAttack
+
+تُفحص المسارات بشكل متزامن عبر مجدول الفحوصات. قبل الفحص يتم طلب مسار عشوائي غير
+موجود لكل مضيف (ولكل امتداد) للحصول على بصمة صفحة "غير موجود" الخاصة به (رمز الحالة
+والطول والبصمة). إذا أعاد المضيف 404 بشكل صحيح تُستخدم طلبات HEAD فقط، وإلا تُستخدم
+طلبات GET محدودة بالنطاق (Range) وتُقارن بصمة كل استجابة ببصمة الصفحة العشوائية
+لاستبعاد صفحات 404 الزائفة التي تعيد 200 لكل مسار.
+"""
+
+import os
+import uuid
+import hashlib
+import threading
+from urllib.parse import urlparse, quote
+
+# عدد البايتات المقروءة من كل استجابة لحساب البصمة
+FINGERPRINT_BYTES = 4096
+
+# الفرق المسموح في الطول (نسبة) لاعتبار الاستجابة مطابقة لصفحة "غير موجود"
+LENGTH_TOLERANCE = 0.02
+
+# رموز الحالة التي تعني عدم دعم طريقة HEAD
+HEAD_UNSUPPORTED_STATUS_CODES = (405, 501)
+
+
+def _suffix(path):
+    """
+    الحصول على فئة المسار لاختيار بصمة الصفحة العشوائية المناسبة
+
+    المعطيات:
+        path (str): المسار
+
+    المخرجات:
+        str: "/" للمجلدات، أو امتداد الملف، أو نص فارغ
+    """
+    if path.endswith("/"):
+        return "/"
+    return os.path.splitext(urlparse(path).path)[1].lower()
+
+
+class PathProber:
+    """
+    فئة فحص المسارات الحساسة
+    """
+
+    def __init__(self, http, scheduler):
+        """
+        تهيئة فاحص المسارات
+
+        المعطيات:
+            http (HttpClient): عميل HTTP المشترك
+            scheduler (ProbeScheduler): مجدول الفحوصات المتزامنة
+        """
+        self.http = http
+        self.scheduler = scheduler
+
+        self._baselines = {}
+        self._baseline_locks = {}
+        self._baseline_lock = threading.Lock()
+
+    def probe(self, base_url, paths):
+        """
+        فحص المسارات وإعادة الموجود منها
+
+        المعطيات:
+            base_url (str): عنوان URL الأساسي للمضيف (بدون شرطة في النهاية)
+            paths (iterable): المسارات المراد فحصها (تبدأ بشرطة)
+
+        المخرجات:
+            list: المسارات الموجودة بترتيب المدخلات، كل منها قاموس (path, url, status, length)
+        """
+        base_url = base_url.rstrip("/")
+
+        def probe_path(path):
+            url = f"{base_url}{path}"
+            baseline = self.baseline(base_url, _suffix(path))
+
+            if baseline is None or baseline["status"] != 200:
+                fingerprint = self._head(url)
+                if fingerprint is None:
+                    fingerprint = self._fingerprint(url, path)
+            else:
+                fingerprint = self._fingerprint(url, path)
+
+            if fingerprint["status"] != 200 or self._is_soft_404(fingerprint, baseline):
+                return None
+
+            return {
+                "path": path,
+                "url": url,
+                "status": fingerprint["status"],
+                "length": fingerprint["length"]
+            }
+
+        found = self.scheduler.map(probe_path, paths, host=urlparse(base_url).netloc)
+        return [result for _, result in found]
+
+    def baseline(self, base_url, suffix=""):
+        """
+        الحصول على بصمة صفحة "غير موجود" للمضيف (تُطلب مرة واحدة لكل مضيف وامتداد)
+
+        المعطيات:
+            base_url (str): عنوان URL الأساسي للمضيف
+            suffix (str): امتداد المسار ("/" للمجلدات)
+
+        المخرجات:
+            dict: البصمة (status, length, hash) أو None إذا تعذر الاتصال
+        """
+        key = (base_url.rstrip("/"), suffix)
+        with self._baseline_lock:
+            key_lock = self._baseline_locks.setdefault(key, threading.Lock())
+
+        # طلب واحد فقط لكل مفتاح حتى عند الفحص المتزامن
+        with key_lock:
+            if key not in self._baselines:
+                path = "/" + uuid.uuid4().hex + ("/" if suffix == "/" else suffix)
+                try:
+                    self._baselines[key] = self._fingerprint(f"{key[0]}{path}", path)
+                except Exception:
+                    self._baselines[key] = None
+            return self._baselines[key]
+
+    def _head(self, url):
+        """
+        فحص مسار بطلب HEAD
+
+        المعطيات:
+            url (str): عنوان URL
+
+        المخرجات:
+            dict: البصمة (بدون hash) أو None إذا لم يدعم الخادم طريقة HEAD
+        """
+        response = self.http.head(url)
+        if response.status_code in HEAD_UNSUPPORTED_STATUS_CODES:
+            return None
+        length = response.headers.get("Content-Length", "")
+        return {
+            "status": response.status_code,
+            "length": int(length) if length.isdigit() else None,
+            "hash": None
+        }
+
+    def _fingerprint(self, url, path):
+        """
+        حساب بصمة استجابة بطلب GET محدود بالنطاق
+
+        يُقرأ أول FINGERPRINT_BYTES بايت فقط حتى إذا تجاهل الخادم ترويسة Range، ويُحذف
+        المسار المطلوب من المحتوى قبل حساب البصمة لأن صفحات "غير موجود" تعرضه غالبًا.
+
+        المعطيات:
+            url (str): عنوان URL
+            path (str): المسار المطلوب
+
+        المخرجات:
+            dict: البصمة (status, length, hash)
+        """
+        response = self.http.get(
+            url,
+            headers={"Range": f"bytes=0-{FINGERPRINT_BYTES - 1}"},
+            allow_redirects=False,
+            stream=True
+        )
+        try:
+            body = b""
+            for chunk in response.iter_content(FINGERPRINT_BYTES):
+                body += chunk
+                if len(body) >= FINGERPRINT_BYTES:
+                    break
+            body = body[:FINGERPRINT_BYTES]
+        finally:
+            response.close()
+
+        # الطول الكامل من Content-Range (للاستجابة 206) أو Content-Length
+        length = None
+        content_range = response.headers.get("Content-Range", "")
+        if "/" in content_range and content_range.rsplit("/", 1)[1].isdigit():
+            length = int(content_range.rsplit("/", 1)[1])
+        elif response.headers.get("Content-Length", "").isdigit() and response.status_code != 206:
+            length = int(response.headers["Content-Length"])
+        if length is None:
+            length = len(body)
+
+        for token in {path, quote(path)}:
+            body = body.replace(token.encode("utf-8", "ignore"), b"")
+
+        return {
+            "status": 200 if response.status_code == 206 else response.status_code,
+            "length": length,
+            "hash": hashlib.sha1(body).hexdigest()
+        }
+
+    def _is_soft_404(self, fingerprint, baseline):
+        """
+        التحقق مما إذا كانت الاستجابة مطابقة لصفحة "غير موجود" الخاصة بالمضيف
+
+        المعطيات:
+            fingerprint (dict): بصمة الاستجابة
+            baseline (dict): بصمة الصفحة العشوائية
+
+        المخرجات:
+            bool: True إذا كانت الاستجابة صفحة "غير موجود" زائفة
+        """
+        if baseline is None or baseline["status"] != fingerprint["status"]:
+            return False
+        if fingerprint["hash"] is not None and fingerprint["hash"] == baseline["hash"]:
+            return True
+        if fingerprint["length"] is None or baseline["length"] is None:
+            return False
+        return abs(fingerprint["length"] - baseline["length"]) <= baseline["length"] * LENGTH_TOLERANCE
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة جدولة الفحوصات المتزامنة لأداة SaudiAttack
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+def iter_wordlist(path):
+    """
+    قراءة قائمة كلمات سطرًا بسطر دون تحميلها كاملة في الذاكرة
+
+    يتم تجاهل الأسطر الفارغة والتعليقات (التي تبدأ بـ #) والتكرارات.
+
+    المعطيات:
+        path (str): مسار ملف قائمة الكلمات
+
+    المخرجات:
+        generator: الكلمات بترتيب ظهورها
+    """
+    seen = set()
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            word = line.strip()
+            if not word or word.startswith("#") or word in seen:
+                continue
+            seen.add(word)
+            yield word
+
+
+class ProbeScheduler:
+    """
+    فئة جدولة الفحوصات المتزامنة
+
+    تنفذ الفحوصات (طلبات HTTP غالبًا) بعدد محدود من مسارات التنفيذ المشتركة بين جميع الاستدعاءات، مع حد أقصى
+    لمعدل الطلبات وعدد الطلبات المتزامنة لكل مضيف. تُسحب العناصر من المدخلات عند الحاجة فقط، لذا يمكن
+    تمرير قوائم كلمات كبيرة كمولدات، ويمكن إيقاف الجدولة مبكرًا عند تحقق شرط معين.
+    """
+
+    def __init__(self, width=5, rate_limit=0, per_host_limit=0):
+        """
+        تهيئة مجدول الفحوصات
+
+        المعطيات:
+            width (int): الحد الأقصى للفحوصات المتزامنة
+            rate_limit (float): الحد الأقصى للطلبات في الثانية لكل مضيف (0 بلا حد)
+            per_host_limit (int): الحد الأقصى للطلبات المتزامنة لكل مضيف (0 للعرض الكامل)
+        """
+        self.width = max(1, int(width or 1))
+        self.rate_limit = float(rate_limit or 0)
+        self.per_host_limit = min(self.width, int(per_host_limit or self.width))
+
+        self._rate_lock = threading.Lock()
+        self._next_slot = {}
+        self._host_slots = {}
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config, width=None):
+        """
+        إنشاء مجدول الفحوصات من كائن التكوين
+
+        المعطيات:
+            config (Config): كائن التكوين
+            width (int): عدد الفحوصات المتزامنة إذا لم يحدده التكوين (افتراضيًا: عدد المواضيع)
+
+        المخرجات:
+            ProbeScheduler: مجدول الفحوصات
+        """
+        return cls(
+            width=config.get("web", "probe_width") or width or config.get_threads(),
+            rate_limit=config.get("web", "rate_limit") or 0,
+            per_host_limit=config.get("web", "per_host_limit") or 0
+        )
+
+    def throttle(self, host):
+        """
+        الانتظار حتى يسمح حد المعدل بإرسال طلب جديد إلى المضيف
+
+        المعطيات:
+            host (str): المضيف
+        """
+        if self.rate_limit <= 0:
+            return
+
+        interval = 1.0 / self.rate_limit
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + interval
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def close(self):
+        """
+        إيقاف مسارات تنفيذ الفحوصات
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    def _get_executor(self):
+        """
+        الحصول على منفذ الفحوصات المشترك بين جميع استدعاءات map
+
+        المخرجات:
+            ThreadPoolExecutor: المنفذ (يُنشأ عند أول استخدام)
+        """
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.width, thread_name_prefix="probe")
+        return self._executor
+
+    def _host_slot(self, host):
+        """
+        الحصول على إشارة تحديد الطلبات المتزامنة للمضيف
+
+        المعطيات:
+            host (str): المضيف
+
+        المخرجات:
+            BoundedSemaphore: الإشارة الخاصة بالمضيف
+        """
+        with self._rate_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._host_slots[host]
+
+    def map(self, probe, items, host=None, stop_when=None):
+        """
+        تنفيذ دالة الفحص على جميع العناصر بشكل متزامن
+
+        يتم تجاهل العناصر التي تفشل دالة الفحص فيها باستثناء، وتُعاد النتائج بترتيب
+        العناصر في المدخلات بغض النظر عن ترتيب اكتمالها.
+
+        المعطيات:
+            probe (callable): دالة الفحص (تستقبل عنصرًا وتعيد نتيجة أو None)
+            items (iterable): العناصر المراد فحصها (يمكن أن تكون مولدًا)
+            host (str): المضيف المستخدم لحدود المعدل والتزامن (اختياري)
+            stop_when (callable): دالة تستقبل (العنصر، النتيجة) وتعيد True لإيقاف الفحوصات المتبقية
+
+        المخرجات:
+            list: أزواج (العنصر، النتيجة) للفحوصات المكتملة التي أعادت نتيجة غير None
+        """
+        items = enumerate(items)
+        pending = {}
+        results = {}
+        stop = threading.Event()
+
+        def run(item):
+            if stop.is_set():
+                return None
+            if not host:
+                return probe(item)
+            with self._host_slot(host):
+                self.throttle(host)
+                return probe(item)
+
+        executor = self._get_executor()
+        exhausted = False
+        while True:
+            # الاحتفاظ بعدد محدود من المهام المعلقة للحفاظ على كسل المدخلات
+            while not exhausted and not stop.is_set() and len(pending) < self.width * 2:
+                entry = next(items, None)
+                if entry is None:
+                    exhausted = True
+                    break
+                position, item = entry
+                pending[executor.submit(run, item)] = (position, item)
+
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                position, item = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception:
+                    continue
+                if result is None:
+                    continue
+
+                results[position] = (item, result)
+                if stop_when and stop_when(item, result):
+                    stop.set()
+
+            if stop.is_set():
+                for future in pending:
+                    future.cancel()
+
+        return [results[position] for position in sorted(results)]
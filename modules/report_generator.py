@@ -90,6 +90,27 @@ class ReportGenerator:
             console.print(f"[bold red]خطأ أثناء كتابة التقرير: {str(e)}[/bold red]")
             return None
     
+    def generate_with_results(self, format_type="html"):
+        """
+        إنشاء تقرير بالتنسيق المحدد مع ملف JSON للنتائج الكاملة بجانبه
+        
+        ملف JSON هو ما يقرؤه --since في المسح التالي، لذا يُكتب دائمًا حتى لو كان
+        التقرير بتنسيق آخر (مثلاً report.html و report.json).
+        
+        المعطيات:
+            format_type (str): نوع تنسيق التقرير
+            
+        المخرجات:
+            tuple: (مسار التقرير، مسار ملف النتائج)
+        """
+        report_path = self.generate_report(format_type)
+        if format_type.lower() == "json":
+            return report_path, report_path
+        
+        results_file = f"{os.path.splitext(self.output_file)[0]}.json"
+        results_path = ReportGenerator(self.results, results_file, self.logger).generate_report("json")
+        return report_path, results_path
+    
     def _generate_html_report(self):
         """
         إنشاء تقرير HTML
@@ -1019,4 +1040,70 @@ class ReportGenerator:
             "low": "🟢",
             "info": "🔵"
         }
-        return severity_emojis.get(severity.lower(), "")
\ No newline at end of file
+        return severity_emojis.get(severity.lower(), "")
+
+
+class ReportSink:
+    """
+    فئة استقبال نتائج المسح متعدد الأهداف
+
+    تكتب تقريرًا مستقلاً لكل مضيف فور اكتمال مسحه (مع ملف JSON لنتائجه الكاملة يصلح
+    مدخلاً لـ --since)، وتضيف سطرًا ملخصًا إلى ملف فهرس بتنسيق JSON Lines، بحيث لا يلزم
+    الاحتفاظ بنتائج جميع المضيفين في الذاكرة.
+    """
+    
+    def __init__(self, output_dir, format_type="html", logger=None):
+        """
+        تهيئة مستقبل التقارير
+        
+        المعطيات:
+            output_dir (str): دليل التقارير
+            format_type (str): تنسيق تقرير كل مضيف
+            logger (Logger): كائن المسجل
+        """
+        self.output_dir = output_dir
+        self.format_type = format_type
+        self.logger = logger
+        self.index_file = os.path.join(output_dir, "index.jsonl")
+        
+        os.makedirs(output_dir, exist_ok=True)
+    
+    def write(self, target, results, scan_info=None, error=None):
+        """
+        كتابة تقرير مضيف واحد وتحديث ملف الفهرس
+        
+        المعطيات:
+            target (str): الهدف
+            results (dict): نتائج المسح (None في حال الفشل)
+            scan_info (dict): معلومات المسح
+            error (Exception): الخطأ في حال فشل المسح
+            
+        المخرجات:
+            str: مسار تقرير المضيف (None في حال الفشل)
+        """
+        report_path = None
+        summary = {"target": target, "status": "failed" if error else "completed"}
+        
+        if results:
+            results["target"] = target
+            if scan_info:
+                results["scan_info"] = scan_info
+            
+            safe_name = target.replace(".", "_").replace(":", "_").replace("/", "_")
+            output_file = os.path.join(self.output_dir, f"report_{safe_name}.{self.format_type}")
+            report_path, results_path = ReportGenerator(results, output_file, self.logger).generate_with_results(self.format_type)
+            
+            summary["report"] = report_path
+            summary["results"] = results_path
+            summary["open_ports"] = len(results.get("open_ports", []))
+            summary["vulnerabilities"] = sum(
+                len(results.get(key, []))
+                for key in ("vulnerabilities", "web_vulnerabilities", "wordpress_vulnerabilities", "joomla_vulnerabilities")
+            )
+        elif error:
+            summary["error"] = str(error)
+        
+        with open(self.index_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(summary, ensure_ascii=False) + "\n")
+        
+        return report_path
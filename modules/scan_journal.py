@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة سجل تقدم المسح لأداة SaudiAttack
+
+سجل إلحاقي فقط بتنسيق JSON Lines: عند اكتمال كل مرحلة من مراحل مسح هدف (المنافذ
+ونظام التشغيل والثغرات، المعلومات الإضافية، خادم الويب، مراحل ووردبريس وجوملا)
+يُضاف سطر يحتوي على أقسام النتائج التي أنتجتها، وعند اكتمال الهدف يُضاف سطر
+إكماله. عند الاستئناف بالسجل نفسه تُستعاد المراحل المكتملة بدلاً من إعادتها
+وتُتخطى الأهداف المكتملة. السطر الأخير غير المكتمل (عند انقطاع الكتابة) يُتجاهل.
+"""
+
+import os
+import copy
+import json
+import threading
+
+
+class ScanJournal:
+    """
+    فئة سجل تقدم المسح
+    """
+
+    def __init__(self, path):
+        """
+        فتح السجل (يُنشأ إذا لم يكن موجودًا) وتحميل المراحل المكتملة
+
+        المعطيات:
+            path (str): مسار ملف السجل
+        """
+        self.path = path
+        self._stages = {}
+        self._completed = set()
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            with open(path, "rb+") as f:
+                complete = 0
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    complete += len(line)
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    self._apply(record)
+                # إزالة السطر الأخير غير المكتمل حتى لا تلتصق به السجلات الجديدة
+                f.truncate(complete)
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _apply(self, record):
+        """
+        تطبيق سجل محمل على الحالة في الذاكرة
+
+        المعطيات:
+            record (dict): السجل
+        """
+        target = record.get("target")
+        if record.get("event") == "stage":
+            self._stages.setdefault(target, {})[record["stage"]] = record["results"]
+        elif record.get("event") == "completed":
+            self._completed.add(target)
+
+    def _append(self, record):
+        """
+        إضافة سجل إلى نهاية الملف وكتابته على القرص فورًا
+
+        المعطيات:
+            record (dict): السجل
+        """
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            self._apply(json.loads(line))
+            self._file.write(line + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def record_stage(self, target, stage, results):
+        """
+        تسجيل اكتمال مرحلة
+
+        المعطيات:
+            target (str): الهدف
+            stage (str): اسم المرحلة
+            results (dict): أقسام النتائج التي أنتجتها المرحلة
+        """
+        self._append({"event": "stage", "target": target, "stage": stage, "results": results})
+
+    def stage_results(self, target, stage):
+        """
+        الحصول على نتائج مرحلة مكتملة
+
+        المعطيات:
+            target (str): الهدف
+            stage (str): اسم المرحلة
+
+        المخرجات:
+            dict: نسخة من أقسام النتائج أو None إذا لم تكتمل المرحلة
+        """
+        with self._lock:
+            results = self._stages.get(target, {}).get(stage)
+            return copy.deepcopy(results) if results is not None else None
+
+    def mark_completed(self, target):
+        """
+        تسجيل اكتمال مسح هدف
+
+        المعطيات:
+            target (str): الهدف
+        """
+        self._append({"event": "completed", "target": target})
+
+    def is_completed(self, target):
+        """
+        التحقق من اكتمال مسح هدف في تشغيل سابق
+
+        المعطيات:
+            target (str): الهدف
+
+        المخرجات:
+            bool: True إذا اكتمل الهدف
+        """
+        with self._lock:
+            return target in self._completed
+
+    def close(self):
+        """
+        إغلاق ملف السجل
+        """
+        with self._lock:
+            self._file.close()
@@ -5,24 +5,37 @@
 وحدة الماسح الأساسي لأداة SaudiAttack
 """
 
-import nmap
-import socket
-import threading
-import time
-import json
-import requests
-from concurrent.futures import ThreadPoolExecutor
+import shlex
+import shutil
+import tempfile
+import subprocess
+import asyncio
+import functools
 from rich.console import Console
-from .utils import get_target_type, resolve_domain_to_ip, get_severity_color
+from .config import Config
+from .network_utils import async_scan_ports
+from .incremental import changed_ports, merge_host_data, inventory_signature
+from .dns_resolver import DnsResolver
+from .geoip import GeoLocator
+from .nmap_stream import NmapXmlStream
+from .nse_planner import NseScriptPlanner
+from .whois_cache import WhoisCache, PublicSuffixList, DEFAULT_WHOIS_TTL, DEFAULT_WHOIS_NEGATIVE_TTL
+from .utils import get_target_type, get_severity_color
 
 console = Console()
 
+# حجم الأجزاء المقروءة من مخرج XML لـ nmap أثناء المسح
+NMAP_READ_CHUNK_BYTES = 64 * 1024
+
+# أقسام النتائج التي تنتجها مرحلة مسح المضيف (المنافذ والخدمات ونظام التشغيل والثغرات)
+HOST_STAGE_SECTIONS = ("open_ports", "services", "os_info", "vulnerabilities")
+
 class VulnerabilityScanner:
     """
     فئة الماسح الأساسي للثغرات الأمنية
     """
     
-    def __init__(self, target, ports, threads=5, timeout=30, logger=None):
+    def __init__(self, target, ports, threads=5, timeout=30, logger=None, config=None):
         """
         تهيئة الماسح
         
@@ -32,14 +45,23 @@ class VulnerabilityScanner:
             threads (int): عدد مسارات التنفيذ المتوازية
             timeout (int): مهلة الاتصال بالثواني
             logger (Logger): كائن المسجل
+            config (Config): كائن التكوين (اختياري)
         """
         self.target = target
         self.ports = ports
         self.threads = threads
         self.timeout = timeout
         self.logger = logger
+        self.config = config if config is not None else Config()
         self.target_type = get_target_type(target)
-        self.nm = nmap.PortScanner()
+        self.resolver = DnsResolver.shared()
+        self.geolocator = GeoLocator.from_config(self.config, timeout=self.timeout)
+        self.nmap_path = shutil.which("nmap") or "nmap"
+        # عمليات nmap الجارية (انظر stop)
+        self._nmap_processes = set()
+        self._stopped = False
+        self.os_detection = True
+        self.script_planner = NseScriptPlanner.for_path(self.config.get("scanning", "nse_service_scripts"))
         self.results = {
             "target_info": {},
             "open_ports": [],
@@ -49,9 +71,16 @@ class VulnerabilityScanner:
             "additional_info": {}
         }
         
+        # نتائج المسح السابق للمسح التزايدي (انظر use_previous_results)
+        self.previous_results = None
+        self._changed_ports = []
+        
+        # سجل تقدم المسح لاستئناف المسح المنقطع (انظر use_journal)
+        self.journal = None
+        
         # تحويل النطاق إلى IP إذا لزم الأمر
         if self.target_type == "domain":
-            self.ip = resolve_domain_to_ip(target)
+            self.ip = self.resolver.resolve_one(target)
             if not self.ip:
                 raise ValueError(f"لا يمكن تحليل النطاق: {target}")
             self.results["target_info"]["domain"] = target
@@ -70,100 +99,791 @@ class VulnerabilityScanner:
         self.logger.info(f"بدء المسح الأساسي على الهدف: {self.target}")
         console.print(f"[bold]بدء المسح الأساسي على الهدف: {self.target}[/bold]")
         
-        # مسح المنافذ
-        self._scan_ports()
+        if not self._restore_stage("host"):
+            # اكتشاف المنافذ المفتوحة مسبقًا (اختياري) لتمرير المنافذ المفتوحة فقط إلى nmap
+            ports = self._discover_open_ports() if self.config.get("scanning", "fast_discovery") else self.ports
+            
+            # مسح المنافذ والخدمات ونظام التشغيل، ثم نصوص NSE الخاصة بالخدمات المكتشفة فقط
+            host_data = self._run_host_nmap_scan(ports)
+            self._run_service_scripts(host_data.get("tcp", {}), self._script_ports())
+            self._finish_host_stage(host_data)
         
-        # مسح نظام التشغيل
-        self._scan_os()
+        # جمع معلومات إضافية
+        if not self._restore_stage("additional_info"):
+            self._gather_additional_info()
+            self._checkpoint_stage("additional_info", ("additional_info",))
         
-        # مسح الثغرات الأمنية
-        self._scan_vulnerabilities()
+        self.logger.info(f"اكتمل المسح الأساسي على الهدف: {self.target}")
+        console.print(f"[bold green]اكتمل المسح الأساسي على الهدف: {self.target}[/bold green]")
         
-        # جمع معلومات إضافية
-        self._gather_additional_info()
+        return self.results
+    
+    async def scan_async(self):
+        """
+        تنفيذ المسح الأساسي بشكل غير متزامن
+        
+        يعمل مسح nmap كعملية فرعية غير متزامنة، ويتم جمع المعلومات الإضافية (DNS و WHOIS
+        والموقع الجغرافي) بالتوازي معه لأنها لا تعتمد على نتيجته.
+        
+        المخرجات:
+            dict: نتائج المسح
+        """
+        self.logger.info(f"بدء المسح الأساسي على الهدف: {self.target}")
+        console.print(f"[bold]بدء المسح الأساسي على الهدف: {self.target}[/bold]")
+        
+        additional_info = None
+        if not self._restore_stage("additional_info"):
+            additional_info = asyncio.ensure_future(self._run_blocking(self._gather_additional_info))
+        
+        if not self._restore_stage("host"):
+            ports = await self._discover_open_ports_async() if self.config.get("scanning", "fast_discovery") else self.ports
+            host_data = await self._run_host_nmap_scan_async(ports)
+            await self._run_service_scripts_async(host_data.get("tcp", {}), self._script_ports())
+            self._finish_host_stage(host_data)
+        
+        if additional_info is not None:
+            await additional_info
+            self._checkpoint_stage("additional_info", ("additional_info",))
         
         self.logger.info(f"اكتمل المسح الأساسي على الهدف: {self.target}")
         console.print(f"[bold green]اكتمل المسح الأساسي على الهدف: {self.target}[/bold green]")
         
         return self.results
     
-    def _scan_ports(self):
+    def use_previous_results(self, previous):
+        """
+        تفعيل المسح التزايدي اعتمادًا على نتائج مسح سابق للهدف نفسه
+        
+        تُعاد نصوص NSE واكتشاف نظام التشغيل للمنافذ الجديدة أو التي تغيرت خدمتها فقط،
+        ولا تُعاد مرحلة فحص ثغرات نظام إدارة المحتوى إذا لم يتغير إصداره ومكوناته.
+        
+        المعطيات:
+            previous (dict): نتائج المسح السابق (None لتعطيل المسح التزايدي)
+        """
+        self.previous_results = previous
+    
+    def use_journal(self, journal):
+        """
+        تسجيل تقدم المسح في سجل واستعادة المراحل المكتملة منه
+        
+        المعطيات:
+            journal (ScanJournal): سجل تقدم المسح (None لتعطيل التسجيل)
+        """
+        self.journal = journal
+    
+    def close(self):
+        """
+        تحرير موارد الماسح بعد انتهاء المسح (الموارد المشتركة بين الماسحات لا تُغلق)
+        """
+        pass
+    
+    def stop(self):
+        """
+        إيقاف المسح من مسار تنفيذ آخر: إنهاء عمليات nmap الجارية وتخطي عمليات nmap اللاحقة
+        """
+        self._stopped = True
+        for process in list(self._nmap_processes):
+            try:
+                process.kill()
+            except OSError:
+                pass
+    
+    def _restore_stage(self, stage):
+        """
+        استعادة نتائج مرحلة مكتملة من سجل تقدم المسح
+        
+        المعطيات:
+            stage (str): اسم المرحلة
+            
+        المخرجات:
+            bool: True إذا استُعيدت المرحلة ولا حاجة لتنفيذها
+        """
+        if self.journal is None:
+            return False
+        
+        sections = self.journal.stage_results(self.target, stage)
+        if sections is None:
+            return False
+        
+        self.results.update(sections)
+        self.logger.info(f"استعادة المرحلة {stage} للهدف {self.target} من سجل التقدم")
+        console.print(f"[bold blue]استعادة المرحلة {stage} للهدف {self.target} من سجل التقدم[/bold blue]")
+        return True
+    
+    def _checkpoint_stage(self, stage, sections):
+        """
+        تسجيل اكتمال مرحلة وأقسام النتائج التي أنتجتها في سجل تقدم المسح
+        
+        المعطيات:
+            stage (str): اسم المرحلة
+            sections (iterable): أقسام النتائج
+        """
+        if self.journal is None:
+            return
+        
+        try:
+            self.journal.record_stage(self.target, stage, {section: self.results.get(section) for section in sections})
+        except Exception as e:
+            self.logger.warning(f"فشل تسجيل المرحلة {stage} في سجل التقدم: {str(e)}")
+            console.print(f"[yellow]فشل تسجيل المرحلة {stage} في سجل التقدم: {str(e)}[/yellow]")
+    
+    def _run_host_nmap_scan(self, ports):
+        """
+        مسح nmap الموحد للمضيف مع تسجيل المنافذ فور وصولها، ثم إعادة مسح المنافذ المتغيرة
+        لاكتشاف نظام التشغيل في المسح التزايدي
+        
+        المعطيات:
+            ports (list): المنافذ المراد مسحها
+            
+        المخرجات:
+            dict: بيانات المضيف
+        """
+        if not ports:
+            return {}
+        host_data = self._run_nmap_scan(self._build_host_scan_plan(ports), on_port=self._record_port)
+        rescan_plan = self._build_rescan_plan(host_data)
+        if rescan_plan is None:
+            return host_data
+        return merge_host_data(host_data, self._run_nmap_scan(rescan_plan))
+    
+    async def _run_host_nmap_scan_async(self, ports):
+        """
+        مسح nmap الموحد للمضيف بشكل غير متزامن (انظر _run_host_nmap_scan)
+        
+        المعطيات:
+            ports (list): المنافذ المراد مسحها
+            
+        المخرجات:
+            dict: بيانات المضيف
+        """
+        if not ports:
+            return {}
+        host_data = await self._run_nmap_scan_async(self._build_host_scan_plan(ports), on_port=self._record_port)
+        rescan_plan = self._build_rescan_plan(host_data)
+        if rescan_plan is None:
+            return host_data
+        return merge_host_data(host_data, await self._run_nmap_scan_async(rescan_plan))
+    
+    def _build_host_scan_plan(self, ports):
+        """
+        خطة مسح المضيف: المنافذ والخدمات ونظام التشغيل، أو المنافذ والخدمات فقط في المسح
+        التزايدي (يُكتشف نظام التشغيل للمنافذ المتغيرة فقط، انظر _build_rescan_plan)
+        
+        المعطيات:
+            ports (list): المنافذ المراد مسحها
+            
+        المخرجات:
+            dict: خطة المسح
+        """
+        if self.previous_results is None:
+            return self._build_scan_plan(ports=ports)
+        return self._build_scan_plan(os_detection=False, ports=ports)
+    
+    def _build_rescan_plan(self, host_data):
+        """
+        تحديد المنافذ الجديدة أو المتغيرة منذ المسح السابق وبناء خطة اكتشاف نظام التشغيل لها
+        
+        لا تعيد الخطة اكتشاف الإصدارات، ولا تلزم إذا لم يكن المسح تزايديًا أو لم تتغير
+        المنافذ أو كان اكتشاف نظام التشغيل معطلاً.
+        
+        المعطيات:
+            host_data (dict): بيانات المضيف من مسح الخدمات
+            
+        المخرجات:
+            dict: خطة المسح (أو None إذا لم تلزم إعادة المسح)
+        """
+        if self.previous_results is None:
+            return None
+        
+        self._changed_ports = changed_ports(self.previous_results, host_data.get("tcp", {}))
+        if not self._changed_ports:
+            self._log_unchanged_services()
+            return None
+        
+        self.logger.info(f"منافذ جديدة أو متغيرة منذ المسح السابق: {self._changed_ports}")
+        console.print(f"[bold]منافذ جديدة أو متغيرة منذ المسح السابق: {self._changed_ports}[/bold]")
+        if not self.os_detection:
+            return None
+        return self._build_scan_plan(os_detection=True, ports=self._changed_ports, version_detection=False)
+    
+    def _script_ports(self):
+        """
+        المنافذ التي تحتاج نصوص NSE بعد مسح المضيف
+        
+        المخرجات:
+            list: المنافذ المتغيرة في المسح التزايدي (None لكل المنافذ المفتوحة)
+        """
+        return self._changed_ports if self.previous_results is not None else None
+    
+    def _finish_host_stage(self, host_data):
+        """
+        إكمال مرحلة مسح المضيف: الملخص ونظام التشغيل ونقل النتائج السابقة وتسجيل المرحلة
+        
+        المعطيات:
+            host_data (dict): بيانات المضيف من nmap
+        """
+        self._log_port_summary()
+        self._scan_os(host_data)
+        self._carry_over_host_results()
+        self._checkpoint_stage("host", HOST_STAGE_SECTIONS)
+    
+    def _log_unchanged_services(self):
+        """
+        تسجيل عدم تغير الخدمات منذ المسح السابق
+        """
+        self.logger.info("لم تتغير المنافذ المفتوحة وإصدارات الخدمات منذ المسح السابق. إعادة استخدام النتائج السابقة.")
+        console.print("[green]لم تتغير المنافذ المفتوحة وإصدارات الخدمات منذ المسح السابق. إعادة استخدام النتائج السابقة.[/green]")
+    
+    def _carry_over_host_results(self):
+        """
+        نقل الثغرات ونظام التشغيل من المسح السابق للمنافذ التي لم تتغير
+        """
+        if self.previous_results is None:
+            return
+        
+        open_ports = {port_info["port"] for port_info in self.results["open_ports"]}
+        unchanged = open_ports - set(self._changed_ports)
+        for vuln in self.previous_results.get("vulnerabilities", []):
+            if vuln.get("port") in unchanged:
+                self.results["vulnerabilities"].append(vuln)
+        
+        if not self._changed_ports and not self.results["os_info"]:
+            self.results["os_info"] = self.previous_results.get("os_info", {})
+    
+    def _reuse_previous_stage(self, info_key, findings_key, fields):
+        """
+        نقل ثغرات مرحلة من المسح السابق إذا لم تتغير مدخلاتها
+        
+        المعطيات:
+            info_key (str): قسم المعلومات الذي يمثل مدخلات المرحلة (مثل wordpress_info)
+            findings_key (str): قسم الثغرات الناتج عن المرحلة
+            fields (iterable): حقول المعلومات المقارنة (الإصدار وقوائم المكونات)
+            
+        المخرجات:
+            bool: True إذا تم نقل النتائج ويجب تخطي المرحلة
+        """
+        previous = self.previous_results
+        if previous is None or findings_key not in previous or info_key not in previous:
+            return False
+        if inventory_signature(previous[info_key], fields) != inventory_signature(self.results[info_key], fields):
+            return False
+        
+        self.results[findings_key].extend(previous[findings_key])
+        self.logger.info(f"لم يتغير {info_key} منذ المسح السابق. إعادة استخدام {len(previous[findings_key])} نتيجة.")
+        console.print(f"[green]لم يتغير {info_key} منذ المسح السابق. إعادة استخدام {len(previous[findings_key])} نتيجة.[/green]")
+        return True
+    
+    async def _run_blocking(self, func, *args):
+        """
+        تنفيذ دالة حاجبة في منفذ حلقة asyncio الافتراضي
+        
+        المعطيات:
+            func (callable): الدالة
+            *args: معطيات الدالة
+            
+        المخرجات:
+            القيمة التي تعيدها الدالة
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args))
+    
+    async def _discover_open_ports_async(self):
+        """
+        اكتشاف المنافذ المفتوحة بماسح اتصال TCP غير متزامن دون الحاجة إلى nmap
+        
+        المخرجات:
+            list: المنافذ المفتوحة من قائمة المنافذ المطلوبة
+        """
+        self.logger.info(f"اكتشاف سريع للمنافذ المفتوحة على الهدف: {self.ip}")
+        console.print(f"[bold]اكتشاف سريع للمنافذ المفتوحة على الهدف: {self.ip}[/bold]")
+        
+        try:
+            open_ports = (await async_scan_ports(
+                self.ip,
+                self.ports,
+                concurrency=self.config.get("scanning", "discovery_concurrency"),
+                timeout=self.config.get("scanning", "discovery_timeout")
+            )).get(self.ip, [])
+        except Exception as e:
+            # الرجوع إلى قائمة المنافذ الكاملة ليتولى nmap الاكتشاف
+            self.logger.error(f"خطأ أثناء الاكتشاف السريع للمنافذ: {str(e)}")
+            console.print(f"[bold red]خطأ أثناء الاكتشاف السريع للمنافذ: {str(e)}[/bold red]")
+            return self.ports
+        
+        self.logger.info(f"اكتمل الاكتشاف السريع. {len(open_ports)} منفذ مفتوح من أصل {len(self.ports)}.")
+        console.print(f"[bold]اكتمل الاكتشاف السريع. {len(open_ports)} منفذ مفتوح من أصل {len(self.ports)}.[/bold]")
+        
+        return open_ports
+    
+    def _discover_open_ports(self):
+        """
+        واجهة متزامنة لـ _discover_open_ports_async
+        
+        المخرجات:
+            list: المنافذ المفتوحة من قائمة المنافذ المطلوبة
+        """
+        return asyncio.run(self._discover_open_ports_async())
+    
+    def _build_scan_plan(self, os_detection=None, ports=None, scripts=None, version_detection=True):
+        """
+        بناء خطة مسح nmap موحدة تغطي قائمة المنافذ المطلوبة واكتشاف الإصدارات
+        واكتشاف نظام التشغيل ونصوص NSE المحددة
+        
+        المعطيات:
+            os_detection (bool): تفعيل اكتشاف نظام التشغيل (افتراضيًا: قيمة self.os_detection)
+            ports (list): المنافذ المراد مسحها (افتراضيًا: self.ports)
+            scripts (list): نصوص NSE (افتراضيًا: بدون نصوص، انظر _run_service_scripts)
+            version_detection (bool|str): اكتشاف الإصدارات (True، أو "light" لـ --version-light، أو False)
+            
+        المخرجات:
+            dict: المنافذ ومعطيات سطر أوامر nmap
+        """
+        if os_detection is None:
+            os_detection = self.os_detection
+        if ports is None:
+            ports = self.ports
+        if scripts is None:
+            scripts = []
+        
+        arguments = []
+        if version_detection:
+            arguments.append("-sV")
+            if version_detection == "light":
+                arguments.append("--version-light")
+        arguments.append("-T4")
+        if os_detection:
+            arguments.append("-O")
+        if scripts:
+            arguments.append(f"--script {','.join(scripts)}")
+        
+        return {
+            "ports": ",".join(map(str, ports)),
+            "port_list": list(ports),
+            "arguments": " ".join(arguments),
+            "os_detection": os_detection,
+            "scripts": list(scripts),
+            "version_detection": version_detection
+        }
+    
+    def _nmap_command(self, plan):
+        """
+        سطر أوامر nmap لخطة المسح مع مخرج XML على المخرج القياسي
+        
+        المعطيات:
+            plan (dict): خطة المسح الناتجة عن _build_scan_plan
+            
+        المخرجات:
+            list: سطر الأوامر
         """
-        مسح المنافذ المفتوحة والخدمات
+        command = [self.nmap_path, "-oX", "-", "-p", plan["ports"]]
+        return command + shlex.split(plan["arguments"]) + [self.ip]
+    
+    def _handle_nmap_events(self, events, host_data, on_port):
         """
-        self.logger.info(f"بدء مسح المنافذ على الهدف: {self.ip}")
-        console.print(f"[bold]بدء مسح المنافذ على الهدف: {self.ip}[/bold]")
+        معالجة أحداث المحلل التدفقي لمخرج nmap
         
+        المعطيات:
+            events (list): أحداث NmapXmlStream
+            host_data (dict): بيانات المضيف المراد تعبئتها
+            on_port (callable): دالة تستقبل (المنفذ، بيانات المنفذ) لكل منفذ TCP فور وصوله (اختياري)
+        """
+        for event in events:
+            if event[0] == "port":
+                _, _, port, protocol, port_data = event
+                host_data.setdefault(protocol, {})[port] = port_data
+                if on_port is not None and protocol == "tcp":
+                    on_port(port, port_data)
+            elif event[0] == "host":
+                host_data.update(event[2])
+    
+    def _nmap_failed(self, plan, returncode, nmap_err):
+        """
+        تسجيل فشل nmap وتحديد ما إذا كان يجب إعادة المسح بدون اكتشاف نظام التشغيل
+        
+        المعطيات:
+            plan (dict): خطة المسح
+            returncode (int): رمز خروج nmap
+            nmap_err (str): مخرج الأخطاء
+            
+        المخرجات:
+            bool: True إذا كان يجب إعادة المسح بدون اكتشاف نظام التشغيل
+        """
+        # اكتشاف نظام التشغيل يتطلب صلاحيات الجذر، لذا نعيد المسح بدونه بدلاً من فقدان النتائج كلها
+        if plan["os_detection"] and "root" in nmap_err.lower():
+            # المسوحات اللاحقة لهذا الهدف تتخطى اكتشاف نظام التشغيل أيضًا
+            self.os_detection = False
+            if not plan["version_detection"] and not plan["scripts"]:
+                # خطة اكتشاف نظام التشغيل فقط لا يبقى منها شيء لإعادته
+                self.logger.warning("اكتشاف نظام التشغيل يتطلب صلاحيات الجذر. تخطي اكتشاف نظام التشغيل.")
+                console.print("[yellow]اكتشاف نظام التشغيل يتطلب صلاحيات الجذر. تخطي اكتشاف نظام التشغيل.[/yellow]")
+                return False
+            self.logger.warning("اكتشاف نظام التشغيل يتطلب صلاحيات الجذر. إعادة المسح بدونه.")
+            console.print("[yellow]اكتشاف نظام التشغيل يتطلب صلاحيات الجذر. إعادة المسح بدونه.[/yellow]")
+            return True
+        
+        self._log_nmap_error(nmap_err.strip() or f"رمز الخروج {returncode}")
+        return False
+    
+    def _run_nmap_scan(self, plan, on_port=None):
+        """
+        تنفيذ خطة المسح باستدعاء nmap واحد وتحليل مخرجه أثناء وصوله
+        
+        المعطيات:
+            plan (dict): خطة المسح الناتجة عن _build_scan_plan
+            on_port (callable): دالة تستقبل (المنفذ، بيانات المنفذ) لكل منفذ فور وصوله (اختياري)
+            
+        المخرجات:
+            dict: بيانات المضيف بتنسيق python-nmap
+        """
+        host_data = {}
+        if not self._begin_nmap_scan(plan):
+            return host_data
+        
+        stream = NmapXmlStream()
         try:
-            # تحويل قائمة المنافذ إلى سلسلة نصية
-            ports_str = ",".join(map(str, self.ports))
-            
-            # تنفيذ مسح المنافذ باستخدام nmap
-            self.nm.scan(self.ip, ports_str, arguments="-sV -T4")
-            
-            # معالجة النتائج
-            if self.ip in self.nm.all_hosts():
-                for port in self.nm[self.ip]['tcp']:
-                    if self.nm[self.ip]['tcp'][port]['state'] == 'open':
-                        port_info = {
-                            "port": port,
-                            "service": self.nm[self.ip]['tcp'][port]['name'],
-                            "version": self.nm[self.ip]['tcp'][port]['product'] + " " + self.nm[self.ip]['tcp'][port]['version'],
-                            "state": "open"
-                        }
-                        self.results["open_ports"].append(port_info)
-                        
-                        service_info = {
-                            "port": port,
-                            "name": self.nm[self.ip]['tcp'][port]['name'],
-                            "product": self.nm[self.ip]['tcp'][port]['product'],
-                            "version": self.nm[self.ip]['tcp'][port]['version'],
-                            "extra_info": self.nm[self.ip]['tcp'][port]['extrainfo']
-                        }
-                        self.results["services"].append(service_info)
-                        
-                        self.logger.info(f"منفذ مفتوح: {port} - {self.nm[self.ip]['tcp'][port]['name']}")
-                        console.print(f"[green]منفذ مفتوح: {port} - {self.nm[self.ip]['tcp'][port]['name']}[/green]")
-            
-            self.logger.info(f"اكتمل مسح المنافذ. تم العثور على {len(self.results['open_ports'])} منفذ مفتوح.")
-            console.print(f"[bold]اكتمل مسح المنافذ. تم العثور على {len(self.results['open_ports'])} منفذ مفتوح.[/bold]")
+            returncode, nmap_err = self._exec_nmap(plan, stream, host_data, on_port)
+            retry_plan = self._end_nmap_scan(plan, returncode, nmap_err, stream, host_data, on_port)
+            if retry_plan is not None:
+                return self._run_nmap_scan(retry_plan, on_port)
+        except Exception as e:
+            self._log_nmap_error(str(e))
+        
+        return host_data
+    
+    async def _run_nmap_scan_async(self, plan, on_port=None):
+        """
+        تنفيذ خطة المسح بتشغيل nmap كعملية فرعية غير متزامنة (انظر _run_nmap_scan)
+        
+        المعطيات:
+            plan (dict): خطة المسح الناتجة عن _build_scan_plan
+            on_port (callable): دالة تستقبل (المنفذ، بيانات المنفذ) لكل منفذ فور وصوله (اختياري)
             
+        المخرجات:
+            dict: بيانات المضيف بتنسيق python-nmap
+        """
+        host_data = {}
+        if not self._begin_nmap_scan(plan):
+            return host_data
+        
+        stream = NmapXmlStream()
+        try:
+            returncode, nmap_err = await self._exec_nmap_async(plan, stream, host_data, on_port)
+            retry_plan = self._end_nmap_scan(plan, returncode, nmap_err, stream, host_data, on_port)
+            if retry_plan is not None:
+                return await self._run_nmap_scan_async(retry_plan, on_port)
         except Exception as e:
-            self.logger.error(f"خطأ أثناء مسح المنافذ: {str(e)}")
-            console.print(f"[bold red]خطأ أثناء مسح المنافذ: {str(e)}[/bold red]")
+            self._log_nmap_error(str(e))
+        
+        return host_data
     
-    def _scan_os(self):
+    def _exec_nmap(self, plan, stream, host_data, on_port):
         """
-        مسح نظام التشغيل
+        تشغيل nmap كعملية فرعية وتمرير مخرجه إلى المحلل التدفقي أثناء وصوله
+        
+        المعطيات:
+            plan (dict): خطة المسح
+            stream (NmapXmlStream): المحلل التدفقي
+            host_data (dict): بيانات المضيف المراد تعبئتها
+            on_port (callable): دالة تستقبل (المنفذ، بيانات المنفذ) لكل منفذ (اختياري)
+            
+        المخرجات:
+            tuple: (رمز الخروج، مخرج الأخطاء)
         """
-        self.logger.info(f"بدء مسح نظام التشغيل على الهدف: {self.ip}")
-        console.print(f"[bold]بدء مسح نظام التشغيل على الهدف: {self.ip}[/bold]")
+        with tempfile.TemporaryFile() as stderr:
+            process = subprocess.Popen(self._nmap_command(plan), stdout=subprocess.PIPE, stderr=stderr)
+            self._nmap_processes.add(process)
+            try:
+                for chunk in iter(lambda: process.stdout.read1(NMAP_READ_CHUNK_BYTES), b""):
+                    self._handle_nmap_events(stream.feed(chunk), host_data, on_port)
+                returncode = process.wait()
+            finally:
+                self._nmap_processes.discard(process)
+                if process.poll() is None:
+                    process.kill()
+                process.stdout.close()
+            
+            stderr.seek(0)
+            return returncode, stderr.read().decode("utf-8", "ignore")
+    
+    async def _exec_nmap_async(self, plan, stream, host_data, on_port):
+        """
+        تشغيل nmap كعملية فرعية غير متزامنة وتمرير مخرجه إلى المحلل التدفقي أثناء وصوله
         
+        المعطيات:
+            plan (dict): خطة المسح
+            stream (NmapXmlStream): المحلل التدفقي
+            host_data (dict): بيانات المضيف المراد تعبئتها
+            on_port (callable): دالة تستقبل (المنفذ، بيانات المنفذ) لكل منفذ (اختياري)
+            
+        المخرجات:
+            tuple: (رمز الخروج، مخرج الأخطاء)
+        """
+        process = await asyncio.create_subprocess_exec(
+            *self._nmap_command(plan), stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        stderr = asyncio.ensure_future(process.stderr.read())
         try:
-            # تنفيذ مسح نظام التشغيل باستخدام nmap
-            self.nm.scan(self.ip, arguments="-O")
-            
-            # معالجة النتائج
-            if self.ip in self.nm.all_hosts() and 'osmatch' in self.nm[self.ip]:
-                for os_match in self.nm[self.ip]['osmatch']:
-                    os_info = {
-                        "name": os_match['name'],
-                        "accuracy": os_match['accuracy'],
-                        "type": ""
-                    }
-                    
-                    # تحديد نوع نظام التشغيل
-                    if "windows" in os_match['name'].lower():
-                        os_info["type"] = "Windows"
-                    elif "linux" in os_match['name'].lower():
-                        os_info["type"] = "Linux"
-                    elif "mac" in os_match['name'].lower() or "darwin" in os_match['name'].lower():
-                        os_info["type"] = "MacOS"
-                    else:
-                        os_info["type"] = "Other"
-                    
-                    self.results["os_info"] = os_info
-                    break  # أخذ أول نتيجة فقط
+            while True:
+                chunk = await process.stdout.read(NMAP_READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                self._handle_nmap_events(stream.feed(chunk), host_data, on_port)
+            returncode = await process.wait()
+        finally:
+            if process.returncode is None:
+                process.kill()
+        return returncode, (await stderr).decode("utf-8", "ignore")
+    
+    def _begin_nmap_scan(self, plan):
+        """
+        تسجيل بدء مسح nmap
+        
+        المعطيات:
+            plan (dict): خطة المسح
+            
+        المخرجات:
+            bool: False إذا أُوقف الماسح ولا يجب تشغيل nmap
+        """
+        if self._stopped:
+            return False
+        self.logger.info(f"بدء مسح nmap الموحد على الهدف: {self.ip} ({plan['arguments']})")
+        console.print(f"[bold]بدء مسح nmap الموحد على الهدف: {self.ip}[/bold]")
+        return True
+    
+    def _end_nmap_scan(self, plan, returncode, nmap_err, stream, host_data, on_port):
+        """
+        معالجة انتهاء عملية nmap: إكمال تحليل المخرج أو تسجيل الفشل وتحديد إعادة المسح
+        
+        المعطيات:
+            plan (dict): خطة المسح
+            returncode (int): رمز خروج nmap
+            nmap_err (str): مخرج الأخطاء
+            stream (NmapXmlStream): المحلل التدفقي
+            host_data (dict): بيانات المضيف المراد تعبئتها
+            on_port (callable): دالة تستقبل (المنفذ، بيانات المنفذ) لكل منفذ (اختياري)
+            
+        المخرجات:
+            dict: خطة إعادة المسح بدون اكتشاف نظام التشغيل (أو None)
+        """
+        if self._stopped:
+            return None
+        
+        if returncode != 0:
+            if self._nmap_failed(plan, returncode, nmap_err):
+                return self._build_scan_plan(
+                    os_detection=False, ports=plan["port_list"], scripts=plan["scripts"],
+                    version_detection=plan["version_detection"]
+                )
+            return None
+        
+        self._handle_nmap_events(stream.close(), host_data, on_port)
+        return None
+    
+    def _log_nmap_error(self, message):
+        """
+        تسجيل خطأ أثناء مسح nmap
+        
+        المعطيات:
+            message (str): رسالة الخطأ
+        """
+        self.logger.error(f"خطأ أثناء مسح nmap: {message}")
+        console.print(f"[bold red]خطأ أثناء مسح nmap: {message}[/bold red]")
+    
+    def _run_service_scripts(self, tcp_data, ports=None):
+        """
+        تشغيل نصوص NSE الخاصة بخدمة كل منفذ مفتوح (استدعاء nmap واحد لكل مجموعة منافذ تحتاج النصوص نفسها)
+        
+        المعطيات:
+            tcp_data (dict): بيانات منافذ TCP المكتشفة
+            ports (list): المنافذ المراد فحصها فقط (افتراضيًا: كل المنافذ المفتوحة)
+        """
+        on_port, plans = self._service_script_plans(tcp_data, ports)
+        for plan in plans:
+            self._run_nmap_scan(plan, on_port=on_port)
+    
+    async def _run_service_scripts_async(self, tcp_data, ports=None):
+        """
+        تشغيل نصوص NSE الخاصة بخدمة كل منفذ مفتوح (مجموعات المنافذ بالتوازي)
+        
+        المعطيات:
+            tcp_data (dict): بيانات منافذ TCP المكتشفة
+            ports (list): المنافذ المراد فحصها فقط (افتراضيًا: كل المنافذ المفتوحة)
+        """
+        on_port, plans = self._service_script_plans(tcp_data, ports)
+        await asyncio.gather(*(self._run_nmap_scan_async(plan, on_port=on_port) for plan in plans))
+    
+    def _service_script_plans(self, tcp_data, ports):
+        """
+        خطط مسح مجموعات نصوص NSE ودالة تسجيل ثغراتها
+        
+        المعطيات:
+            tcp_data (dict): بيانات منافذ TCP المكتشفة
+            ports (list): المنافذ المراد فحصها فقط (None لكل المنافذ المفتوحة)
+            
+        المخرجات:
+            tuple: (دالة on_port لتسجيل الثغرات، خطط المسح)
+        """
+        on_port = functools.partial(self._record_script_findings, tcp_data)
+        return on_port, [self._build_script_plan(group) for group in self._plan_service_scripts(tcp_data, ports)]
+    
+    def _build_script_plan(self, group):
+        """
+        بناء خطة مسح لمجموعة نصوص NSE (دون إعادة اكتشاف الإصدارات أو نظام التشغيل)
+        
+        المعطيات:
+            group (dict): مجموعة من NseScriptPlanner.plan
+            
+        المخرجات:
+            dict: خطة المسح
+        """
+        return self._build_scan_plan(
+            os_detection=False, ports=group["ports"], scripts=group["scripts"],
+            version_detection="light" if group["version_light"] else False
+        )
+    
+    def _record_script_findings(self, tcp_data, port, port_data):
+        """
+        إضافة ثغرات مسح نصوص NSE إلى النتائج مع بيانات الخدمة من مسح الاكتشاف
+        
+        المعطيات:
+            tcp_data (dict): بيانات منافذ TCP المكتشفة
+            port (int): رقم المنفذ
+            port_data (dict): بيانات المنفذ من مسح النصوص
+        """
+        self._record_vulnerabilities(port, dict(tcp_data.get(port, port_data), script=port_data.get("script", {})))
+    
+    def _plan_service_scripts(self, tcp_data, ports):
+        """
+        تجميع المنافذ المفتوحة حسب نصوص NSE الخاصة بخدماتها
+        
+        المعطيات:
+            tcp_data (dict): بيانات منافذ TCP المكتشفة
+            ports (list): المنافذ المراد فحصها فقط (None لكل المنافذ المفتوحة)
+            
+        المخرجات:
+            list: المجموعات بالشكل {"scripts": [...], "ports": [...]}
+        """
+        groups = self.script_planner.plan(tcp_data, ports)
+        for group in groups:
+            self.logger.info(f"نصوص NSE للمنافذ {group['ports']}: {', '.join(group['scripts'])}")
+            console.print(f"[bold]نصوص NSE للمنافذ {group['ports']}: {', '.join(group['scripts'])}[/bold]")
+        return groups
+    
+    def _record_port(self, port, port_data):
+        """
+        إضافة منفذ مفتوح وخدمته وثغراته المكتشفة بنصوص NSE إلى النتائج
+        
+        المعطيات:
+            port (int): رقم المنفذ
+            port_data (dict): بيانات المنفذ من nmap
+        """
+        try:
+            if port_data.get("state") != "open":
+                return
+            
+            name = port_data.get("name", "")
+            product = port_data.get("product", "")
+            version = port_data.get("version", "")
+            
+            self.results["open_ports"].append({
+                "port": port,
+                "service": name,
+                "version": product + " " + version,
+                "state": "open"
+            })
+            self.results["services"].append({
+                "port": port,
+                "name": name,
+                "product": product,
+                "version": version,
+                "extra_info": port_data.get("extrainfo", "")
+            })
+            
+            self.logger.info(f"منفذ مفتوح: {port} - {name}")
+            console.print(f"[green]منفذ مفتوح: {port} - {name}[/green]")
+            
+            self._record_vulnerabilities(port, port_data)
+            
+        except Exception as e:
+            self.logger.error(f"خطأ أثناء معالجة المنفذ {port}: {str(e)}")
+            console.print(f"[bold red]خطأ أثناء معالجة المنفذ {port}: {str(e)}[/bold red]")
+    
+    def _record_vulnerabilities(self, port, port_data):
+        """
+        إضافة الثغرات المكتشفة بنصوص NSE على منفذ إلى النتائج
+        
+        المعطيات:
+            port (int): رقم المنفذ
+            port_data (dict): بيانات المنفذ من nmap
+        """
+        try:
+            if port_data.get("state") != "open":
+                return
+            
+            name = port_data.get("name", "")
+            for script_name, script_output in port_data.get("script", {}).items():
+                if 'VULNERABLE' not in script_output:
+                    continue
+                
+                # تحديد مستوى الخطورة
+                output = script_output.lower()
+                severity = "medium"  # افتراضي
+                if "high" in output or "critical" in output:
+                    severity = "high"
+                elif "low" in output:
+                    severity = "low"
+                
+                self.results["vulnerabilities"].append({
+                    "port": port,
+                    "service": name,
+                    "vulnerability": script_name,
+                    "description": script_output.strip(),
+                    "severity": severity
+                })
+                
+                self.logger.info(f"تم اكتشاف ثغرة: {script_name} على المنفذ {port} (خطورة: {severity})")
+                console.print(f"[{get_severity_color(severity)}]تم اكتشاف ثغرة: {script_name} على المنفذ {port} (خطورة: {severity})[/{get_severity_color(severity)}]")
+            
+        except Exception as e:
+            self.logger.error(f"خطأ أثناء معالجة المنفذ {port}: {str(e)}")
+            console.print(f"[bold red]خطأ أثناء معالجة المنفذ {port}: {str(e)}[/bold red]")
+    
+    def _log_port_summary(self):
+        """
+        تسجيل عدد المنافذ المفتوحة والثغرات بعد اكتمال مسح nmap
+        """
+        self.logger.info(f"اكتمل مسح المنافذ. تم العثور على {len(self.results['open_ports'])} منفذ مفتوح.")
+        console.print(f"[bold]اكتمل مسح المنافذ. تم العثور على {len(self.results['open_ports'])} منفذ مفتوح.[/bold]")
+        self.logger.info(f"اكتمل مسح الثغرات الأمنية. تم العثور على {len(self.results['vulnerabilities'])} ثغرة.")
+        console.print(f"[bold]اكتمل مسح الثغرات الأمنية. تم العثور على {len(self.results['vulnerabilities'])} ثغرة.[/bold]")
+    
+    def _scan_os(self, host_data):
+        """
+        استخراج معلومات نظام التشغيل من نتيجة المسح الموحد
+        
+        المعطيات:
+            host_data (dict): بيانات المضيف من nmap
+        """
+        try:
+            for os_match in host_data.get("osmatch", []):
+                os_info = {
+                    "name": os_match['name'],
+                    "accuracy": os_match['accuracy'],
+                    "type": ""
+                }
+                
+                # تحديد نوع نظام التشغيل
+                if "windows" in os_match['name'].lower():
+                    os_info["type"] = "Windows"
+                elif "linux" in os_match['name'].lower():
+                    os_info["type"] = "Linux"
+                elif "mac" in os_match['name'].lower() or "darwin" in os_match['name'].lower():
+                    os_info["type"] = "MacOS"
+                else:
+                    os_info["type"] = "Other"
+                
+                self.results["os_info"] = os_info
+                break  # أخذ أول نتيجة فقط
             
             self.logger.info(f"اكتمل مسح نظام التشغيل.")
             console.print(f"[bold]اكتمل مسح نظام التشغيل.[/bold]")
@@ -179,50 +899,44 @@ class VulnerabilityScanner:
             self.logger.error(f"خطأ أثناء مسح نظام التشغيل: {str(e)}")
             console.print(f"[bold red]خطأ أثناء مسح نظام التشغيل: {str(e)}[/bold red]")
     
-    def _scan_vulnerabilities(self):
+    def _lookup_whois(self):
         """
-        مسح الثغرات الأمنية
+        الحصول على معلومات WHOIS للنطاق القابل للتسجيل الذي يتبعه الهدف
+        
+        تُخزن النتيجة في ذاكرة WHOIS (scanning.whois_cache) لتشترك فيها النطاقات الفرعية
+        الأخرى وعمليات المسح التالية حتى انتهاء مدة صلاحيتها.
+        
+        المخرجات:
+            dict: معلومات WHOIS أو None إذا لم يوجد سجل
         """
-        self.logger.info(f"بدء مسح الثغرات الأمنية على الهدف: {self.ip}")
-        console.print(f"[bold]بدء مسح الثغرات الأمنية على الهدف: {self.ip}[/bold]")
+        import whois
         
-        try:
-            # تنفيذ مسح الثغرات باستخدام nmap
-            self.nm.scan(self.ip, arguments="-sV --script vuln")
-            
-            # معالجة النتائج
-            if self.ip in self.nm.all_hosts():
-                for port in self.nm[self.ip]['tcp']:
-                    if self.nm[self.ip]['tcp'][port]['state'] == 'open' and 'script' in self.nm[self.ip]['tcp'][port]:
-                        for script_name, script_output in self.nm[self.ip]['tcp'][port]['script'].items():
-                            if 'VULNERABLE' in script_output:
-                                # تحديد مستوى الخطورة
-                                severity = "medium"  # افتراضي
-                                if "high" in script_output.lower() or "critical" in script_output.lower():
-                                    severity = "high"
-                                elif "low" in script_output.lower():
-                                    severity = "low"
-                                
-                                # إنشاء معلومات الثغرة
-                                vuln_info = {
-                                    "port": port,
-                                    "service": self.nm[self.ip]['tcp'][port]['name'],
-                                    "vulnerability": script_name,
-                                    "description": script_output.strip(),
-                                    "severity": severity
-                                }
-                                
-                                self.results["vulnerabilities"].append(vuln_info)
-                                
-                                self.logger.info(f"تم اكتشاف ثغرة: {script_name} على المنفذ {port} (خطورة: {severity})")
-                                console.print(f"[{get_severity_color(severity)}]تم اكتشاف ثغرة: {script_name} على المنفذ {port} (خطورة: {severity})[/{get_severity_color(severity)}]")
-            
-            self.logger.info(f"اكتمل مسح الثغرات الأمنية. تم العثور على {len(self.results['vulnerabilities'])} ثغرة.")
-            console.print(f"[bold]اكتمل مسح الثغرات الأمنية. تم العثور على {len(self.results['vulnerabilities'])} ثغرة.[/bold]")
-            
-        except Exception as e:
-            self.logger.error(f"خطأ أثناء مسح الثغرات الأمنية: {str(e)}")
-            console.print(f"[bold red]خطأ أثناء مسح الثغرات الأمنية: {str(e)}[/bold red]")
+        suffixes = PublicSuffixList.for_path(self.config.get("scanning", "public_suffix_list"))
+        domain = suffixes.registrable_domain(self.target) or self.target
+        
+        def fetch(domain):
+            try:
+                whois_info = whois.whois(domain)
+            except Exception as e:
+                self.logger.warning(f"فشل استعلام WHOIS عن النطاق {domain}: {str(e)}")
+                return None
+            if not (whois_info.registrar or whois_info.creation_date):
+                return None
+            return {
+                "domain": domain,
+                "registrar": whois_info.registrar,
+                "creation_date": str(whois_info.creation_date),
+                "expiration_date": str(whois_info.expiration_date),
+                "name_servers": whois_info.name_servers
+            }
+        
+        ttl = self.config.get("scanning", "whois_ttl")
+        negative_ttl = self.config.get("scanning", "whois_negative_ttl")
+        return WhoisCache.for_path(self.config.get("scanning", "whois_cache")).lookup(
+            domain, fetch,
+            ttl=DEFAULT_WHOIS_TTL if ttl is None else ttl,
+            negative_ttl=DEFAULT_WHOIS_NEGATIVE_TTL if negative_ttl is None else negative_ttl
+        )
     
     def _gather_additional_info(self):
         """
@@ -232,48 +946,29 @@ class VulnerabilityScanner:
         console.print(f"[bold]جمع معلومات إضافية عن الهدف: {self.target}[/bold]")
         
         try:
-            # الحصول على معلومات DNS
+            # الحصول على معلومات DNS (من ذاكرة المحلل المشتركة، محللة مسبقًا عند إنشاء الماسح)
             if self.target_type == "domain":
                 try:
-                    dns_info = socket.getaddrinfo(self.target, None)
-                    self.results["additional_info"]["dns_records"] = []
-                    for info in dns_info:
-                        if info[4][0] not in [record["ip"] for record in self.results["additional_info"]["dns_records"]]:
-                            self.results["additional_info"]["dns_records"].append({
-                                "type": "A" if info[0] == socket.AF_INET else "AAAA",
-                                "ip": info[4][0]
-                            })
+                    self.results["additional_info"]["dns_records"] = self.resolver.resolve(self.target)
                 except Exception as e:
                     self.logger.error(f"خطأ أثناء الحصول على معلومات DNS: {str(e)}")
             
-            # الحصول على معلومات WHOIS (تنفيذ بسيط)
+            # الحصول على معلومات WHOIS للنطاق القابل للتسجيل (من الذاكرة الدائمة إن وجدت)
             if self.target_type == "domain":
                 try:
-                    import whois
-                    whois_info = whois.whois(self.target)
-                    self.results["additional_info"]["whois"] = {
-                        "registrar": whois_info.registrar,
-                        "creation_date": str(whois_info.creation_date),
-                        "expiration_date": str(whois_info.expiration_date),
-                        "name_servers": whois_info.name_servers
-                    }
+                    whois_info = self._lookup_whois()
+                    if whois_info:
+                        self.results["additional_info"]["whois"] = whois_info
                 except ImportError:
                     self.logger.warning("حزمة python-whois غير متوفرة. تخطي معلومات WHOIS.")
                 except Exception as e:
                     self.logger.error(f"خطأ أثناء الحصول على معلومات WHOIS: {str(e)}")
             
-            # الحصول على معلومات الموقع الجغرافي للـ IP
+            # الحصول على معلومات الموقع الجغرافي و ASN للـ IP (القاعدة المحلية أولاً ثم المزود البعيد)
             try:
-                geo_response = requests.get(f"https://ipinfo.io/{self.ip}/json", timeout=self.timeout)
-                if geo_response.status_code == 200:
-                    geo_data = geo_response.json()
-                    self.results["additional_info"]["geolocation"] = {
-                        "country": geo_data.get("country", "Unknown"),
-                        "region": geo_data.get("region", "Unknown"),
-                        "city": geo_data.get("city", "Unknown"),
-                        "loc": geo_data.get("loc", "Unknown"),
-                        "org": geo_data.get("org", "Unknown")
-                    }
+                geolocation = self.geolocator.lookup(self.ip)
+                if geolocation:
+                    self.results["additional_info"]["geolocation"] = geolocation
             except Exception as e:
                 self.logger.error(f"خطأ أثناء الحصول على معلومات الموقع الجغرافي: {str(e)}")
             
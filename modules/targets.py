@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة توسيع الأهداف لأداة SaudiAttack
+
+تحول مواصفات الأهداف (عنوان IP، اسم نطاق، شبكة CIDR، نطاق عناوين) إلى أهداف
+مفردة بشكل كسول عبر المولدات، بحيث يمكن مسح شبكات كبيرة (مثل /16) دون تحميل
+جميع العناوين في الذاكرة.
+"""
+
+import ipaddress
+
+
+def is_multi_target(spec):
+    """
+    التحقق مما إذا كانت مواصفة الهدف تشير إلى أكثر من هدف واحد
+
+    المعطيات:
+        spec (str): مواصفة الهدف
+
+    المخرجات:
+        bool: True إذا كانت المواصفة شبكة CIDR أو نطاق عناوين أو قائمة مفصولة بفواصل
+    """
+    spec = spec.strip()
+    if "," in spec:
+        return True
+    if "/" in spec:
+        try:
+            return ipaddress.ip_network(spec, strict=False).num_addresses > 1
+        except ValueError:
+            return False
+    return _parse_range(spec) is not None
+
+
+def _parse_range(spec):
+    """
+    تحليل نطاق عناوين بصيغة 10.0.0.1-50 أو 10.0.0.1-10.0.0.50
+
+    المعطيات:
+        spec (str): مواصفة النطاق
+
+    المخرجات:
+        tuple: (العنوان الأول، العنوان الأخير) أو None إذا لم تكن المواصفة نطاقًا
+    """
+    if "-" not in spec:
+        return None
+
+    start, end = spec.split("-", 1)
+    try:
+        first = ipaddress.ip_address(start.strip())
+    except ValueError:
+        return None
+
+    end = end.strip()
+    try:
+        last = ipaddress.ip_address(end)
+    except ValueError:
+        # الصيغة المختصرة: استبدال الجزء الأخير من العنوان الأول فقط
+        if first.version != 4 or not end.isdigit() or int(end) > 255:
+            return None
+        octets = str(first).split(".")
+        last = ipaddress.ip_address(".".join(octets[:3] + [end]))
+
+    # لا يمكن المقارنة بين عنوانين من إصدارين مختلفين (IPv4 و IPv6)
+    if last.version != first.version or last < first:
+        return None
+    return first, last
+
+
+def expand_target(spec):
+    """
+    توسيع مواصفة هدف واحدة إلى أهداف مفردة
+
+    المعطيات:
+        spec (str): عنوان IP أو اسم نطاق أو شبكة CIDR أو نطاق عناوين
+
+    المخرجات:
+        generator: الأهداف المفردة كسلاسل نصية
+    """
+    spec = spec.strip()
+    if not spec:
+        return
+
+    if "/" in spec:
+        try:
+            network = ipaddress.ip_network(spec, strict=False)
+        except ValueError:
+            yield spec
+            return
+        if network.num_addresses == 1:
+            yield str(network.network_address)
+        else:
+            for host in network.hosts():
+                yield str(host)
+        return
+
+    address_range = _parse_range(spec)
+    if address_range:
+        first, last = address_range
+        # الجمع على العنوان نفسه يحافظ على إصداره (ip_address لعدد صغير يعيد IPv4 دائمًا)
+        for offset in range(int(last) - int(first) + 1):
+            yield str(first + offset)
+        return
+
+    yield spec
+
+
+def iter_targets(targets=None, targets_file=None):
+    """
+    توليد جميع الأهداف من سطر الأوامر ومن ملف الأهداف بشكل كسول
+
+    يتم تجاهل الأسطر الفارغة والتعليقات (التي تبدأ بـ #) في ملف الأهداف.
+
+    المعطيات:
+        targets (str): مواصفة هدف أو عدة مواصفات مفصولة بفواصل (اختياري)
+        targets_file (str): مسار ملف يحتوي على مواصفة هدف في كل سطر (اختياري)
+
+    المخرجات:
+        generator: الأهداف المفردة كسلاسل نصية
+    """
+    if targets:
+        for spec in targets.split(","):
+            yield from expand_target(spec)
+
+    if targets_file:
+        with open(targets_file, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    yield from expand_target(line)
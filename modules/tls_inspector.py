@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة فحص TLS لأداة SaudiAttack
+
+تُستخرج الشهادة وسلسلة الشهادات وإصدار البروتوكول والتشفير المتفق عليه من مصافحة
+واحدة مع تطبيق مهلة الفحص على الاتصال والمصافحة، وتُخزن النتيجة لكل (مضيف، منفذ، SNI)
+طوال العملية حتى لا تُعاد المصافحة عند فحص عدة مواقع افتراضية أو عدة أهداف على
+الخادم نفسه. إذا فشل التحقق من الشهادة تُجرى مصافحة ثانية بدون تحقق للحصول على
+البروتوكول والتشفير وبصمة الشهادة فقط.
+"""
+
+import ssl
+import socket
+import hashlib
+import threading
+
+from .dns_resolver import DnsResolver
+
+# المهلة الافتراضية للاتصال والمصافحة بالثواني
+DEFAULT_TIMEOUT = 10
+
+
+def _name(entries):
+    """
+    تحويل اسم (subject أو issuer) من صيغة getpeercert إلى قاموس
+
+    المعطيات:
+        entries (tuple): الاسم كما تعيده getpeercert
+
+    المخرجات:
+        dict: الحقول والقيم
+    """
+    return dict(item for entry in entries for item in entry)
+
+
+def _certificate_info(cert, der=None):
+    """
+    استخراج معلومات الشهادة
+
+    المعطيات:
+        cert (dict): الشهادة كما تعيدها getpeercert (فارغة بدون تحقق)
+        der (bytes): الشهادة بصيغة DER
+
+    المخرجات:
+        dict: معلومات الشهادة
+    """
+    info = {}
+    if cert:
+        info = {
+            "subject": _name(cert.get("subject", ())),
+            "issuer": _name(cert.get("issuer", ())),
+            "version": cert.get("version"),
+            "notBefore": cert.get("notBefore"),
+            "notAfter": cert.get("notAfter"),
+            "serialNumber": cert.get("serialNumber"),
+            "subjectAltName": [value for _, value in cert.get("subjectAltName", ())]
+        }
+    if der:
+        info["sha256"] = hashlib.sha256(der).hexdigest()
+    return info
+
+
+class TlsInspector:
+    """
+    فئة فحص TLS مع تخزين النتائج لكل (مضيف، منفذ، SNI)
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, resolver=None):
+        """
+        تهيئة فاحص TLS
+
+        المعطيات:
+            resolver (DnsResolver): محلل أسماء النطاقات المستخدم للاتصال (اختياري)
+        """
+        self.resolver = resolver
+        self._results = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """
+        الحصول على فاحص TLS المشترك (ذاكرة تخزين واحدة لكل عملية)
+
+        المخرجات:
+            TlsInspector: فاحص TLS
+        """
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls(resolver=DnsResolver.shared())
+        return cls._shared
+
+    def inspect(self, host, port=443, sni=None, timeout=DEFAULT_TIMEOUT):
+        """
+        فحص TLS لمنفذ (تُجرى المصافحة مرة واحدة فقط لكل مفتاح حتى عند الفحص المتزامن)
+
+        المعطيات:
+            host (str): اسم المضيف أو عنوان IP
+            port (int): المنفذ
+            sni (str): الاسم المرسل في SNI والمستخدم في التحقق (افتراضيًا: المضيف)
+            timeout (float): مهلة الاتصال والمصافحة بالثواني
+
+        المخرجات:
+            dict: النتيجة (certificate, chain, protocol, cipher, verified, verify_error, error)
+        """
+        key = (host.lower(), port, (sni or host).lower())
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            if key not in self._results:
+                self._results[key] = self._handshake(host, port, key[2], timeout)
+            return self._results[key]
+
+    def clear(self):
+        """
+        مسح النتائج المخزنة
+        """
+        with self._lock:
+            self._results.clear()
+            self._locks.clear()
+
+    def _handshake(self, host, port, sni, timeout):
+        """
+        إجراء المصافحة وجمع بياناتها
+
+        المعطيات:
+            host (str): اسم المضيف أو عنوان IP
+            port (int): المنفذ
+            sni (str): الاسم المرسل في SNI
+            timeout (float): مهلة الاتصال والمصافحة بالثواني
+
+        المخرجات:
+            dict: النتيجة
+        """
+        result = {
+            "host": host,
+            "port": port,
+            "sni": sni,
+            "protocol": None,
+            "cipher": {},
+            "certificate": {},
+            "chain": [],
+            "verified": False,
+            "verify_error": None,
+            "error": None
+        }
+
+        try:
+            self._connect(host, port, sni, timeout, ssl.create_default_context(), result)
+            result["verified"] = True
+        except ssl.SSLCertVerificationError as e:
+            result["verify_error"] = e.verify_message or str(e)
+            # مصافحة بدون تحقق للحصول على البروتوكول والتشفير وبصمة الشهادة
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+            try:
+                self._connect(host, port, sni, timeout, context, result)
+            except (OSError, ssl.SSLError) as e:
+                result["error"] = str(e)
+        except (OSError, ssl.SSLError) as e:
+            # socket.timeout و ssl.SSLError مشتقة من OSError
+            result["error"] = str(e) or e.__class__.__name__
+
+        return result
+
+    def _connect(self, host, port, sni, timeout, context, result):
+        """
+        الاتصال وإجراء مصافحة واحدة وتعبئة النتيجة
+
+        المعطيات:
+            host (str): اسم المضيف أو عنوان IP
+            port (int): المنفذ
+            sni (str): الاسم المرسل في SNI
+            timeout (float): مهلة الاتصال والمصافحة بالثواني
+            context (SSLContext): سياق SSL
+            result (dict): النتيجة المراد تعبئتها
+        """
+        address = self.resolver.resolve_one(host) if self.resolver is not None else None
+        with socket.create_connection((address or host, port), timeout=timeout) as sock:
+            sock.settimeout(timeout)
+            with context.wrap_socket(sock, server_hostname=sni) as ssock:
+                cert = ssock.getpeercert()
+                der = ssock.getpeercert(binary_form=True)
+                name, protocol, bits = ssock.cipher() or (None, None, None)
+
+                result["protocol"] = ssock.version()
+                result["cipher"] = {"name": name, "protocol": protocol, "bits": bits}
+                result["certificate"] = _certificate_info(cert, der)
+
+                # السلسلة الكاملة متاحة في Python 3.13 وما بعده، وإلا الشهادة الطرفية فقط
+                get_chain = getattr(ssock, "get_verified_chain" if cert else "get_unverified_chain", None)
+                if get_chain is not None:
+                    result["chain"] = [
+                        _certificate_info(item.get_info(), ssl.PEM_cert_to_DER_cert(item.public_bytes()))
+                        for item in get_chain() or []
+                    ]
+                    if result["chain"] and not cert:
+                        result["certificate"] = result["chain"][0]
+                elif result["certificate"]:
+                    result["chain"] = [result["certificate"]]
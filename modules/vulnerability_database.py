@@ -0,0 +1,664 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة قاعدة بيانات الثغرات الأمنية لأداة SaudiAttack
+
+تُخزن الثغرات في ملف data/vulnerabilities.json بالصيغة التالية:
+
+    {
+        "wordpress": {
+            "core": {"vulnerabilities": [...]},
+            "plugins": {"contact-form-7": {"vulnerabilities": [...]}},
+            "themes": {...}
+        },
+        "joomla": {"core": {...}, "components": {...}, "modules": {...}, "templates": {...}},
+        "web_servers": {"apache": {"vulnerabilities": [...]}}
+    }
+
+تحتوي كل ثغرة على قائمة affected_versions: الإصدارات المحددة (مثل "2.5.0") يكفي
+تطابق أحدها، والمقارنات (مثل ">=1.0.0" و "<2.0.0") يجب أن تتحقق جميعها. تُحلل قيود
+كل ثغرة مرة واحدة وتُحوّل إلى مجالات إصدارات تُفهرس في شجرة مجالات مركزية، بحيث يكلف
+البحث عن إصدار O(log n + k) حتى مع المجالات المفتوحة (مثل "<1.0")، ولا يتم فحص إلا
+الثغرات التي يقع الإصدار المطلوب ضمن مجالها.
+"""
+
+import os
+import re
+import json
+import math
+import threading
+from bisect import bisect_left
+
+# المسار الافتراضي لملف قاعدة البيانات
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+DEFAULT_DB_FILE = os.path.join(DATA_DIR, "vulnerabilities.json")
+
+# الملفات القديمة المفهرسة حسب الإصدار (المنتج ← المسار)
+LEGACY_DB_FILES = {
+    "wordpress": os.path.join(DATA_DIR, "wordpress_vulnerabilities.json"),
+    "joomla": os.path.join(DATA_DIR, "joomla_vulnerabilities.json")
+}
+
+_VERSION_PATTERN = re.compile(r"^\s*v?(\d+(?:\.\d+)*)(?:[-_.+]?([0-9A-Za-z][0-9A-Za-z.\-_]*))?\s*$")
+_CONSTRAINT_PATTERN = re.compile(r"^\s*(<=|>=|==|!=|<|>|=)?\s*(.+?)\s*$")
+
+# حدود المجالات المفتوحة
+_MIN_KEY = ((), (-1,))
+_MAX_KEY = ((math.inf,), (2,))
+
+
+def parse_version(version):
+    """
+    تحويل سلسلة إصدار إلى مفتاح قابل للمقارنة
+
+    يتم تجاهل الأصفار في نهاية الإصدار (5.0 = 5.0.0)، والإصدارات التجريبية
+    (مثل 1.0.0-beta و 1.0.0-rc1) تسبق الإصدار النهائي.
+
+    المعطيات:
+        version (str): الإصدار
+
+    المخرجات:
+        tuple: مفتاح المقارنة أو None إذا لم يكن الإصدار صالحًا
+    """
+    match = _VERSION_PATTERN.match(str(version or ""))
+    if not match:
+        return None
+
+    release = [int(part) for part in match.group(1).split(".")]
+    while release and release[-1] == 0:
+        release.pop()
+
+    prerelease = match.group(2)
+    if not prerelease:
+        return tuple(release), (1,)
+
+    parts = tuple(
+        (0, int(part)) if part.isdigit() else (1, part.lower())
+        for part in re.findall(r"\d+|[A-Za-z]+", prerelease)
+    )
+    return tuple(release), (0, parts)
+
+
+def _parse_constraint(constraint):
+    """
+    تحليل قيد إصدار واحد
+
+    المعطيات:
+        constraint (str): القيد (مثل "<5.3.2" أو "2.5.0")
+
+    المخرجات:
+        tuple: (المعامل، مفتاح الإصدار) أو None إذا لم يكن القيد صالحًا
+    """
+    match = _CONSTRAINT_PATTERN.match(str(constraint))
+    if not match:
+        return None
+    operator = match.group(1) or "=="
+    if operator == "=":
+        operator = "=="
+    key = parse_version(match.group(2))
+    if key is None:
+        return None
+    return operator, key
+
+
+def _satisfies(key, operator, bound):
+    """
+    التحقق من تحقق قيد لمفتاح إصدار
+    """
+    if operator == "<":
+        return key < bound
+    if operator == "<=":
+        return key <= bound
+    if operator == ">":
+        return key > bound
+    if operator == ">=":
+        return key >= bound
+    if operator == "!=":
+        return key != bound
+    return key == bound
+
+
+def _compile_constraints(affected_versions):
+    """
+    تحليل قائمة الإصدارات المتأثرة مرة واحدة
+
+    المعطيات:
+        affected_versions (list): الإصدارات المتأثرة
+
+    المخرجات:
+        tuple: (مفاتيح الإصدارات المحددة، المقارنات بالشكل (المعامل، مفتاح الإصدار))
+    """
+    exact = set()
+    comparisons = []
+    for constraint in affected_versions or []:
+        parsed = _parse_constraint(constraint)
+        if parsed is None:
+            continue
+        operator, bound = parsed
+        if operator == "==" and not str(constraint).lstrip().startswith("="):
+            exact.add(bound)
+        else:
+            comparisons.append((operator, bound))
+    return frozenset(exact), tuple(comparisons)
+
+
+def _matches(key, compiled):
+    """
+    التحقق من تأثر مفتاح إصدار بقيود محللة
+
+    المعطيات:
+        key (tuple): مفتاح الإصدار
+        compiled (tuple): القيود الناتجة عن _compile_constraints
+
+    المخرجات:
+        bool: True إذا كان الإصدار متأثرًا
+    """
+    exact, comparisons = compiled
+    if key in exact:
+        return True
+    return bool(comparisons) and all(_satisfies(key, operator, bound) for operator, bound in comparisons)
+
+
+class _IntervalTree:
+    """
+    شجرة مجالات مركزية للبحث عن المجالات التي تحتوي نقطة
+
+    كل عقدة تحتفظ بالمجالات التي تحتوي مركزها مرتبة حسب البداية وحسب النهاية، والمجالات
+    الواقعة بالكامل قبل المركز أو بعده في الفرعين الأيسر والأيمن. تُستبدل حدود المجالات
+    بترتيبها بين جميع الحدود (أعداد صحيحة زوجية) لأن مقارنة مفاتيح الإصدارات أبطأ بكثير.
+    """
+
+    def __init__(self, intervals):
+        """
+        بناء الشجرة
+
+        المعطيات:
+            intervals (list): مجالات بالشكل (البداية، النهاية، القيمة)
+        """
+        intervals = list(intervals)
+        self.endpoints = sorted({point for low, high, _ in intervals for point in (low, high)})
+        rank = {point: 2 * index for index, point in enumerate(self.endpoints)}
+        self.root = self._build([(rank[low], rank[high], value) for low, high, value in intervals],
+                                0, 2 * len(self.endpoints))
+
+    def _rank(self, point):
+        """
+        ترتيب نقطة بين حدود المجالات (زوجي إذا كانت حدًا، وفردي بين حدين)
+        """
+        index = bisect_left(self.endpoints, point)
+        if index < len(self.endpoints) and self.endpoints[index] == point:
+            return 2 * index
+        return 2 * index - 1
+
+    @classmethod
+    def _build(cls, intervals, lowest, highest):
+        """
+        بناء عقدة لمجالات تقع حدودها بين lowest و highest (المركز منتصفهما، لذا عمق الشجرة لوغاريتمي)
+        """
+        if not intervals:
+            return None
+        center = (lowest + highest) // 2
+
+        left, right, here = [], [], []
+        for interval in intervals:
+            if interval[1] < center:
+                left.append(interval)
+            elif interval[0] > center:
+                right.append(interval)
+            else:
+                here.append(interval)
+
+        by_low = sorted(here, key=lambda interval: interval[0])
+        by_high = sorted(here, key=lambda interval: interval[1], reverse=True)
+        return (center, by_low, by_high, cls._build(left, lowest, center - 1), cls._build(right, center + 1, highest))
+
+    def query(self, point):
+        """
+        القيم التي تحتوي مجالاتها النقطة
+
+        المعطيات:
+            point: النقطة
+
+        المخرجات:
+            list: القيم
+        """
+        found = []
+        point = self._rank(point)
+        node = self.root
+        while node is not None:
+            center, by_low, by_high, left, right = node
+            if point < center:
+                for low, _, value in by_low:
+                    if low > point:
+                        break
+                    found.append(value)
+                node = left
+            elif point > center:
+                for _, high, value in by_high:
+                    if high < point:
+                        break
+                    found.append(value)
+                node = right
+            else:
+                found.extend(value for _, _, value in by_low)
+                break
+        return found
+
+
+def _intervals(compiled):
+    """
+    تحويل القيود المحللة إلى مجالات مغلقة تغطيها
+
+    المعطيات:
+        compiled (tuple): القيود الناتجة عن _compile_constraints
+
+    المخرجات:
+        list: مجالات (البداية، النهاية)
+    """
+    exact, comparisons = compiled
+    intervals = [(key, key) for key in exact]
+    low, high = _MIN_KEY, _MAX_KEY
+
+    for operator, key in comparisons:
+        if operator in (">", ">=", "=="):
+            low = max(low, key)
+        if operator in ("<", "<=", "=="):
+            high = min(high, key)
+
+    if comparisons or not intervals:
+        intervals.append((low, high))
+    return intervals
+
+
+def cvss_to_severity(cvss):
+    """
+    تحويل درجة CVSS إلى مستوى خطورة
+
+    المعطيات:
+        cvss (float): درجة CVSS
+
+    المخرجات:
+        str: مستوى الخطورة
+    """
+    try:
+        cvss = float(cvss)
+    except (TypeError, ValueError):
+        return "info"
+    if cvss >= 9.0:
+        return "critical"
+    if cvss >= 7.0:
+        return "high"
+    if cvss >= 4.0:
+        return "medium"
+    if cvss > 0:
+        return "low"
+    return "info"
+
+
+def describe_vulnerability(vuln):
+    """
+    استخراج الحقول التي تعرضها الماسحات من سجل ثغرة
+
+    المعطيات:
+        vuln (dict): سجل الثغرة
+
+    المخرجات:
+        dict: الاسم والوصف والخطورة والإصدارات المتأثرة وإصدار الإصلاح
+    """
+    return {
+        "name": vuln.get("title") or vuln.get("name") or vuln.get("id", ""),
+        "description": vuln.get("description", ""),
+        "severity": vuln.get("severity") or cvss_to_severity(vuln.get("cvss")),
+        "affected_version": ", ".join(vuln.get("affected_versions", [])),
+        "fixed_in": vuln.get("fixed_version", "")
+    }
+
+
+def normalize_legacy_database(product, legacy):
+    """
+    تحويل قاعدة بيانات قديمة مفهرسة حسب الإصدار إلى صيغة المجالات
+
+    في الملفات القديمة يمثل مفتاح الإصدار آخر إصدار متأثر، ما لم يحدد اسم الثغرة
+    مجالًا صريحًا (مثل "4.7.0-4.7.1").
+
+    المعطيات:
+        product (str): اسم المنتج (wordpress أو joomla)
+        legacy (dict): القاعدة القديمة ({"core": {الإصدار: [...]}, "plugins": {الاسم: {الإصدار: [...]}}})
+
+    المخرجات:
+        dict: القاعدة بالصيغة الجديدة
+    """
+    def convert(versions):
+        by_id = {}
+        for version, vulns in versions.items():
+            for vuln in vulns:
+                entry = by_id.setdefault(vuln.get("id") or vuln.get("name"), (dict(vuln), []))
+                entry[1].append(version)
+
+        converted = []
+        for vuln, versions_seen in by_id.values():
+            range_match = re.search(r"(\d[\d.]*)\s*-\s*(\d[\d.]*)\s+-", vuln.get("name", ""))
+            if range_match:
+                vuln["affected_versions"] = [f">={range_match.group(1)}", f"<={range_match.group(2)}"]
+            else:
+                latest = max(versions_seen, key=lambda v: parse_version(v) or _MIN_KEY)
+                vuln["affected_versions"] = [f"<={latest}"]
+            converted.append(vuln)
+        return {"vulnerabilities": converted}
+
+    normalized = {}
+    for section, content in legacy.items():
+        if section == "core":
+            normalized[section] = convert(content)
+        else:
+            normalized[section] = {name: convert(versions) for name, versions in content.items()}
+    return {product: normalized}
+
+
+class VulnerabilityDatabase:
+    """
+    فئة قاعدة بيانات الثغرات الأمنية
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, db_file=None):
+        """
+        تهيئة قاعدة البيانات وتحميل الملف
+
+        المعطيات:
+            db_file (str): مسار ملف قاعدة البيانات (افتراضيًا: data/vulnerabilities.json)
+        """
+        self.db_file = db_file or DEFAULT_DB_FILE
+        self._index = {}
+        self._index_lock = threading.Lock()
+        self._db = self._load_file(self.db_file)
+
+    @classmethod
+    def shared(cls):
+        """
+        الحصول على قاعدة البيانات الافتراضية المشتركة
+
+        يتم تحميل الملفات القديمة بعد تحويلها ودمج الملف الافتراضي معها مرة واحدة
+        لكل عملية، وتشترك جميع الماسحات في الفهرس نفسه.
+
+        المخرجات:
+            VulnerabilityDatabase: قاعدة البيانات
+        """
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    database = cls()
+                    current = database.db
+                    # السجلات القديمة أولاً لأنها موثقة بمراجع، ثم الثغرات غير المكررة من الملف الافتراضي
+                    database.db = {}
+                    for product, path in LEGACY_DB_FILES.items():
+                        legacy = cls._load_file(path)
+                        if legacy:
+                            database.merge_vulnerabilities(normalize_legacy_database(product, legacy))
+                    database.merge_vulnerabilities(current)
+                    cls._shared = database
+        return cls._shared
+
+    @staticmethod
+    def _load_file(path):
+        """
+        تحميل ملف JSON
+
+        المعطيات:
+            path (str): مسار الملف
+
+        المخرجات:
+            dict: المحتوى (فارغ إذا كان الملف مفقودًا أو غير صالح)
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @property
+    def db(self):
+        """
+        محتوى قاعدة البيانات
+        """
+        return self._db
+
+    @db.setter
+    def db(self, value):
+        self._db = value
+        self._index = {}
+
+    def check_wordpress_core_vulnerabilities(self, version):
+        """
+        التحقق من ثغرات نواة ووردبريس
+
+        المعطيات:
+            version (str): الإصدار (None لإرجاع جميع الثغرات)
+
+        المخرجات:
+            list: الثغرات التي تؤثر على الإصدار
+        """
+        return self.lookup(("wordpress", "core"), version)
+
+    def check_wordpress_plugin_vulnerabilities(self, plugin, version):
+        """
+        التحقق من ثغرات إضافة ووردبريس
+
+        المعطيات:
+            plugin (str): اسم الإضافة
+            version (str): الإصدار (None لإرجاع جميع الثغرات)
+
+        المخرجات:
+            list: الثغرات التي تؤثر على الإصدار
+        """
+        return self.lookup(("wordpress", "plugins", plugin), version)
+
+    def check_wordpress_theme_vulnerabilities(self, theme, version):
+        """
+        التحقق من ثغرات قالب ووردبريس
+
+        المعطيات:
+            theme (str): اسم القالب
+            version (str): الإصدار (None لإرجاع جميع الثغرات)
+
+        المخرجات:
+            list: الثغرات التي تؤثر على الإصدار
+        """
+        return self.lookup(("wordpress", "themes", theme), version)
+
+    def check_joomla_core_vulnerabilities(self, version):
+        """
+        التحقق من ثغرات نواة جوملا
+
+        المعطيات:
+            version (str): الإصدار (None لإرجاع جميع الثغرات)
+
+        المخرجات:
+            list: الثغرات التي تؤثر على الإصدار
+        """
+        return self.lookup(("joomla", "core"), version)
+
+    def check_joomla_component_vulnerabilities(self, component, version):
+        """
+        التحقق من ثغرات مكون جوملا
+
+        المعطيات:
+            component (str): اسم المكون
+            version (str): الإصدار (None لإرجاع جميع الثغرات)
+
+        المخرجات:
+            list: الثغرات التي تؤثر على الإصدار
+        """
+        return self.lookup(("joomla", "components", component), version)
+
+    def check_joomla_module_vulnerabilities(self, module, version):
+        """
+        التحقق من ثغرات وحدة جوملا
+
+        المعطيات:
+            module (str): اسم الوحدة
+            version (str): الإصدار (None لإرجاع جميع الثغرات)
+
+        المخرجات:
+            list: الثغرات التي تؤثر على الإصدار
+        """
+        return self.lookup(("joomla", "modules", module), version)
+
+    def check_joomla_template_vulnerabilities(self, template, version):
+        """
+        التحقق من ثغرات قالب جوملا
+
+        المعطيات:
+            template (str): اسم القالب
+            version (str): الإصدار (None لإرجاع جميع الثغرات)
+
+        المخرجات:
+            list: الثغرات التي تؤثر على الإصدار
+        """
+        return self.lookup(("joomla", "templates", template), version)
+
+    def check_web_server_vulnerabilities(self, server, version):
+        """
+        التحقق من ثغرات خادم الويب
+
+        المعطيات:
+            server (str): اسم الخادم (مثل apache أو nginx)
+            version (str): الإصدار (None لإرجاع جميع الثغرات)
+
+        المخرجات:
+            list: الثغرات التي تؤثر على الإصدار
+        """
+        return self.lookup(("web_servers", server.lower()), version)
+
+    def lookup(self, path, version):
+        """
+        البحث عن الثغرات التي تؤثر على إصدار معين
+
+        المعطيات:
+            path (tuple): مسار العنصر في قاعدة البيانات (مثل ("wordpress", "plugins", "akismet"))
+            version (str): الإصدار (None لإرجاع جميع الثغرات)
+
+        المخرجات:
+            list: الثغرات بترتيبها في قاعدة البيانات
+        """
+        vulnerabilities, compiled, tree = self._get_index(path)
+        if version is None:
+            return list(vulnerabilities)
+
+        key = parse_version(version)
+        if key is None:
+            return []
+
+        # المجالات تغطي القيود تقريبيًا (لا تمثل "!=")، لذا تُتحقق القيود المحللة للمرشحين
+        matched = {position for position in tree.query(key) if _matches(key, compiled[position])}
+        return [vulnerabilities[position] for position in sorted(matched)]
+
+    def _get_index(self, path):
+        """
+        الحصول على فهرس المجالات لعنصر (يُبنى عند أول طلب)
+
+        المعطيات:
+            path (tuple): مسار العنصر
+
+        المخرجات:
+            tuple: (الثغرات، القيود المحللة لكل ثغرة، شجرة المجالات)
+        """
+        index = self._index.get(path)
+        if index is not None:
+            return index
+
+        with self._index_lock:
+            index = self._index.get(path)
+            if index is None:
+                vulnerabilities = self._find(path).get("vulnerabilities", [])
+                compiled = [_compile_constraints(vuln.get("affected_versions", [])) for vuln in vulnerabilities]
+                tree = _IntervalTree(
+                    (low, high, position)
+                    for position, constraints in enumerate(compiled)
+                    for low, high in _intervals(constraints)
+                )
+                index = (vulnerabilities, compiled, tree)
+                self._index[path] = index
+        return index
+
+    def _find(self, path):
+        """
+        الوصول إلى عنصر في قاعدة البيانات (مع مطابقة غير حساسة لحالة الأحرف عند الحاجة)
+
+        المعطيات:
+            path (tuple): مسار العنصر
+
+        المخرجات:
+            dict: العنصر (فارغ إذا لم يوجد)
+        """
+        node = self.db
+        for part in path:
+            if not isinstance(node, dict):
+                return {}
+            if part in node:
+                node = node[part]
+                continue
+            lowered = str(part).lower()
+            node = next((value for name, value in node.items() if str(name).lower() == lowered), None)
+            if node is None:
+                return {}
+        return node if isinstance(node, dict) else {}
+
+    def _is_version_affected(self, version, affected_versions):
+        """
+        التحقق مما إذا كان الإصدار متأثرًا
+
+        المعطيات:
+            version (str): الإصدار
+            affected_versions (list): الإصدارات المحددة (يكفي أحدها) والمقارنات (يجب تحققها جميعًا)
+
+        المخرجات:
+            bool: True إذا كان الإصدار متأثرًا
+        """
+        key = parse_version(version)
+        if key is None:
+            return False
+        return _matches(key, _compile_constraints(affected_versions))
+
+    def update_database(self, data):
+        """
+        استبدال محتوى قاعدة البيانات وحفظه في الملف
+
+        المعطيات:
+            data (dict): المحتوى الجديد
+        """
+        self.db = data
+        with open(self.db_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+
+    def merge_vulnerabilities(self, new_vulnerabilities):
+        """
+        دمج ثغرات جديدة في قاعدة البيانات (تُتجاهل الثغرات المكررة حسب المعرف)
+
+        المعطيات:
+            new_vulnerabilities (dict): الثغرات الجديدة بصيغة قاعدة البيانات نفسها
+
+        المخرجات:
+            dict: قاعدة البيانات بعد الدمج
+        """
+        def merge(target, source):
+            for key, value in source.items():
+                if key == "vulnerabilities" and isinstance(value, list):
+                    existing = target.setdefault(key, [])
+                    known_ids = {vuln.get("id") for vuln in existing}
+                    for vuln in value:
+                        if vuln.get("id") is None or vuln.get("id") not in known_ids:
+                            existing.append(vuln)
+                            known_ids.add(vuln.get("id"))
+                elif isinstance(value, dict) and isinstance(target.get(key), dict):
+                    merge(target[key], value)
+                else:
+                    target[key] = json.loads(json.dumps(value))
+
+        merged = json.loads(json.dumps(self.db))
+        merge(merged, new_vulnerabilities)
+        self.db = merged
+        return merged
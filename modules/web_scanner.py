@@ -6,25 +6,35 @@
 """
 
 import requests
+import asyncio
+import threading
 import ssl
-import socket
 import json
-import re
 from urllib.parse import urlparse
-from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 from .scanner import VulnerabilityScanner
+from .http_client import HttpClient
+from .fingerprint import FingerprintEngine
+from .probe_scheduler import ProbeScheduler
+from .path_prober import PathProber
+from .link_store import LinkStore, FormStore
+from .crawler import Crawler
+from .tls_inspector import TlsInspector
+from .network_utils import sniff_tls
 from .utils import get_severity_color
 
 console = Console()
 
+# أقسام النتائج التي تنتجها مرحلة مسح خادم الويب
+WEB_STAGE_SECTIONS = ("web_info", "web_vulnerabilities")
+
 class WebServerScanner(VulnerabilityScanner):
     """
     فئة ماسح خادم الويب
     """
     
-    def __init__(self, target, ports=[80, 443], threads=5, timeout=30, logger=None):
+    def __init__(self, target, ports=[80, 443], threads=5, timeout=30, logger=None, config=None):
         """
         تهيئة ماسح خادم الويب
         
@@ -34,13 +44,26 @@ class WebServerScanner(VulnerabilityScanner):
             threads (int): عدد مسارات التنفيذ المتوازية
             timeout (int): مهلة الاتصال بالثواني
             logger (Logger): كائن المسجل
+            config (Config): كائن التكوين (اختياري)
         """
-        super().__init__(target, ports, threads, timeout, logger)
+        super().__init__(target, ports, threads, timeout, logger, config)
+        
+        # عميل HTTP مشترك بين جميع الفحوصات والماسحات المشتقة (ووردبريس وجوملا)
+        self.http = HttpClient.from_config(self.config, timeout=self.timeout, pool_size=self.threads)
+        
+        # مجدول الفحوصات المتزامنة (بعرض مساوٍ لعدد المواضيع وحد معدل لكل مضيف)
+        self.scheduler = ProbeScheduler.from_config(self.config, width=self.threads)
+        
+        # فاحص المسارات الحساسة (مع استبعاد صفحات 404 الزائفة)
+        self.path_prober = PathProber(self.http, self.scheduler)
         
         # إضافة معلومات خاصة بخادم الويب إلى النتائج
         self.results["web_info"] = {
             "server": "",
+            "servers": {},
+            "endpoints": {},
             "technologies": [],
+            "technology_versions": {},
             "headers": {},
             "cookies": [],
             "forms": [],
@@ -48,6 +71,24 @@ class WebServerScanner(VulnerabilityScanner):
             "security_headers": {}
         }
         self.results["web_vulnerabilities"] = []
+        
+        # قفل دمج النتائج عند مسح عدة منافذ ويب في الوقت نفسه
+        self._results_lock = threading.Lock()
+        
+        # مخازن الروابط والنماذج الفريدة (فحص تكرار بزمن ثابت مع حد أقصى للذاكرة)
+        self.link_store = LinkStore(self.config.get("web", "max_links"))
+        self.form_store = FormStore(self.config.get("web", "max_forms"))
+        
+        # زاحف الصفحات (تُمرر نماذج وروابط كل صفحة جديدة إلى فحوصات الثغرات فور جلبها)
+        self.crawler = Crawler.from_config(self.config, self.http, self.scheduler)
+    
+    def close(self):
+        """
+        إغلاق عميل HTTP الخاص بالماسح (الجلسة ومنفذ الطلبات غير المتزامنة) ومجدول الفحوصات
+        """
+        self.http.close()
+        self.scheduler.close()
+        super().close()
     
     def scan(self):
         """
@@ -62,53 +103,194 @@ class WebServerScanner(VulnerabilityScanner):
         # تنفيذ المسح الأساسي أولاً
         super().scan()
         
+        if self._restore_stage("web"):
+            return self.results
+        
         # تحديد منافذ الويب المفتوحة
-        web_ports = [port_info["port"] for port_info in self.results["open_ports"]
-                    if port_info["service"] in ["http", "https"]]
+        urls = self._get_web_urls()
+        if not urls:
+            self.logger.warning("لم يتم العثور على منافذ ويب مفتوحة.")
+            console.print("[bold yellow]لم يتم العثور على منافذ ويب مفتوحة.[/bold yellow]")
+            return self.results
         
-        if not web_ports:
+        # مسح جميع منافذ الويب المفتوحة في الوقت نفسه
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            list(executor.map(self._scan_url, urls))
+        self._summarize_endpoints(urls)
+        self._checkpoint_stage("web", WEB_STAGE_SECTIONS)
+        
+        self.logger.info(f"اكتمل مسح خادم الويب على الهدف: {self.target}")
+        console.print(f"[bold green]اكتمل مسح خادم الويب على الهدف: {self.target}[/bold green]")
+        
+        return self.results
+    
+    async def scan_async(self):
+        """
+        تنفيذ مسح خادم الويب بشكل غير متزامن
+        
+        يتم مسح جميع منافذ الويب في الوقت نفسه، ولكل منفذ يعمل فحص شهادة SSL بالتوازي
+        مع جلب الصفحة وتحليلها.
+        
+        المخرجات:
+            dict: نتائج المسح
+        """
+        self.logger.info(f"بدء مسح خادم الويب على الهدف: {self.target}")
+        console.print(f"[bold]بدء مسح خادم الويب على الهدف: {self.target}[/bold]")
+        
+        # تنفيذ المسح الأساسي أولاً
+        await super().scan_async()
+        
+        if self._restore_stage("web"):
+            return self.results
+        
+        urls = await self._run_blocking(self._get_web_urls)
+        if not urls:
             self.logger.warning("لم يتم العثور على منافذ ويب مفتوحة.")
             console.print("[bold yellow]لم يتم العثور على منافذ ويب مفتوحة.[/bold yellow]")
             return self.results
         
-        # مسح كل منفذ ويب مفتوح
-        for port in web_ports:
-            protocol = "https" if port == 443 else "http"
-            url = f"{protocol}://{self.target}:{port}"
-            
-            self.logger.info(f"مسح خادم الويب على: {url}")
-            console.print(f"[bold]مسح خادم الويب على: {url}[/bold]")
-            
-            # جمع معلومات خادم الويب
-            self._gather_web_info(url)
-            
-            # فحص الثغرات الأمنية لخادم الويب
-            self._scan_web_vulnerabilities(url)
+        await asyncio.gather(*(self._scan_url_async(url) for url in urls))
+        self._summarize_endpoints(urls)
+        self._checkpoint_stage("web", WEB_STAGE_SECTIONS)
         
         self.logger.info(f"اكتمل مسح خادم الويب على الهدف: {self.target}")
         console.print(f"[bold green]اكتمل مسح خادم الويب على الهدف: {self.target}[/bold green]")
         
         return self.results
     
+    def _get_web_urls(self):
+        """
+        الحصول على عناوين URL لمنافذ الويب المفتوحة
+        
+        يُحدد البروتوكول من اسم الخدمة في nmap إذا كان https، وإلا بمحاولة مصافحة TLS
+        على المنفذ (تتم لجميع المنافذ في الوقت نفسه)، لذا يُفحص 8443 مثلًا عبر HTTPS.
+        
+        المخرجات:
+            list: عناوين URL مرتبة حسب المنفذ
+        """
+        web_ports = sorted({port_info["port"]: port_info["service"] for port_info in self.results["open_ports"]
+                            if port_info["service"].startswith("http")}.items())
+        if not web_ports:
+            return []
+        
+        def detect_scheme(port_service):
+            port, service = port_service
+            if service.startswith("https") or sniff_tls(self.target, port, timeout=min(self.timeout, 5)):
+                return "https"
+            return "http"
+        
+        with ThreadPoolExecutor(max_workers=len(web_ports)) as executor:
+            schemes = list(executor.map(detect_scheme, web_ports))
+        
+        return [f"{scheme}://{self.target}:{port}" for (port, _), scheme in zip(web_ports, schemes)]
+    
+    def _scan_url(self, url):
+        """
+        مسح منفذ ويب واحد
+        
+        المعطيات:
+            url (str): عنوان URL للفحص
+        """
+        self.logger.info(f"مسح خادم الويب على: {url}")
+        console.print(f"[bold]مسح خادم الويب على: {url}[/bold]")
+        
+        # جمع معلومات خادم الويب
+        links, forms = self._gather_web_info(url)
+        
+        # فحص الثغرات الأمنية لخادم الويب
+        self._scan_web_vulnerabilities(url, links=links, forms=forms)
+        
+        # الزحف إلى بقية صفحات الموقع وفحص كل صفحة جديدة فور جلبها
+        self._crawl(url)
+    
+    def _endpoint(self, url):
+        """
+        الحصول على نتائج منفذ ويب واحد (تُنشأ عند أول استخدام)
+        
+        المعطيات:
+            url (str): عنوان URL للمنفذ
+            
+        المخرجات:
+            dict: نتائج المنفذ
+        """
+        parsed_url = urlparse(url)
+        key = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        with self._results_lock:
+            return self.results["web_info"]["endpoints"].setdefault(key, {
+                "url": key,
+                "scheme": parsed_url.scheme,
+                "port": parsed_url.port,
+                "server": "",
+                "technologies": [],
+                "ssl_certificate": {}
+            })
+    
+    def _summarize_endpoints(self, urls):
+        """
+        تعبئة الحقول الإجمالية (الخادم وشهادة SSL) من أول منفذ يحتويها بترتيب المنافذ
+        
+        المعطيات:
+            urls (list): عناوين URL للمنافذ الممسوحة
+        """
+        web_info = self.results["web_info"]
+        for url in urls:
+            endpoint = web_info["endpoints"].get(url, {})
+            if not web_info["server"] and endpoint.get("server"):
+                web_info["server"] = endpoint["server"]
+            if "ssl_certificate" not in web_info and endpoint.get("ssl_certificate"):
+                web_info["ssl_certificate"] = endpoint["ssl_certificate"]
+    
+    async def _scan_url_async(self, url):
+        """
+        مسح منفذ ويب واحد بشكل غير متزامن
+        
+        المعطيات:
+            url (str): عنوان URL للفحص
+        """
+        self.logger.info(f"مسح خادم الويب على: {url}")
+        console.print(f"[bold]مسح خادم الويب على: {url}[/bold]")
+        
+        # فحص شهادة SSL لا يعتمد على محتوى الصفحة، لذا يبدأ فورًا
+        ssl_check = asyncio.ensure_future(self._run_blocking(self._check_ssl_certificate, url)) if url.startswith("https") else None
+        
+        links, forms = [], []
+        try:
+            response = await self.http.get_async(url, allow_redirects=True)
+            await self._run_blocking(self._analyze_response, url, response)
+            links, forms = await self._run_blocking(self._analyze_page_content, url, response)
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"خطأ أثناء الاتصال بـ {url}: {str(e)}")
+            console.print(f"[bold red]خطأ أثناء الاتصال بـ {url}: {str(e)}[/bold red]")
+        
+        # فحص الثغرات يعتمد على النماذج والروابط المستخرجة من الصفحة
+        await self._run_blocking(self._scan_web_vulnerabilities, url, links, forms)
+        await self._run_blocking(self._crawl, url)
+        if ssl_check is not None:
+            await ssl_check
+    
     def _gather_web_info(self, url):
         """
         جمع معلومات خادم الويب
         
         المعطيات:
             url (str): عنوان URL للفحص
+            
+        المخرجات:
+            tuple: (الروابط الجديدة، النماذج الجديدة) في الصفحة
         """
         self.logger.info(f"جمع معلومات خادم الويب: {url}")
         console.print(f"[bold]جمع معلومات خادم الويب: {url}[/bold]")
         
+        links, forms = [], []
         try:
             # إجراء طلب HTTP
-            response = requests.get(url, timeout=self.timeout, verify=False, allow_redirects=True)
+            response = self.http.get(url, allow_redirects=True)
             
             # تحليل الاستجابة
             self._analyze_response(url, response)
             
             # تحليل محتوى الصفحة
-            self._analyze_page_content(url, response)
+            links, forms = self._analyze_page_content(url, response)
             
             # فحص شهادة SSL (إذا كان HTTPS)
             if url.startswith("https"):
@@ -120,6 +302,8 @@ class WebServerScanner(VulnerabilityScanner):
         except requests.exceptions.RequestException as e:
             self.logger.error(f"خطأ أثناء الاتصال بـ {url}: {str(e)}")
             console.print(f"[bold red]خطأ أثناء الاتصال بـ {url}: {str(e)}[/bold red]")
+        
+        return links, forms
     
     def _analyze_response(self, url, response):
         """
@@ -131,11 +315,10 @@ class WebServerScanner(VulnerabilityScanner):
         """
         # تحليل الترويسات
         headers = dict(response.headers)
-        self.results["web_info"]["headers"][url] = headers
         
         # تحديد نوع خادم الويب
         if "Server" in headers:
-            self.results["web_info"]["server"] = headers["Server"]
+            self._endpoint(url)["server"] = headers["Server"]
             self.logger.info(f"خادم الويب: {headers['Server']}")
             console.print(f"[green]خادم الويب: {headers['Server']}[/green]")
         
@@ -147,12 +330,10 @@ class WebServerScanner(VulnerabilityScanner):
             "X-Frame-Options": headers.get("X-Frame-Options", "غير موجود"),
             "X-XSS-Protection": headers.get("X-XSS-Protection", "غير موجود")
         }
-        self.results["web_info"]["security_headers"][url] = security_headers
         
         # تحليل الكوكيز
-        cookies = response.cookies
-        for cookie in cookies:
-            cookie_info = {
+        cookies = [
+            {
                 "name": cookie.name,
                 "value": cookie.value,
                 "domain": cookie.domain,
@@ -160,7 +341,16 @@ class WebServerScanner(VulnerabilityScanner):
                 "secure": cookie.secure,
                 "httponly": "HttpOnly" in cookie._rest
             }
-            self.results["web_info"]["cookies"].append(cookie_info)
+            for cookie in response.cookies
+        ]
+        
+        # تُحلل المنافذ بالتوازي، لذا تُكتب النتائج المشتركة تحت القفل
+        with self._results_lock:
+            self.results["web_info"]["headers"][url] = headers
+            if "Server" in headers:
+                self.results["web_info"]["servers"][url] = headers["Server"]
+            self.results["web_info"]["security_headers"][url] = security_headers
+            self.results["web_info"]["cookies"].extend(cookies)
     
     def _analyze_page_content(self, url, response):
         """
@@ -169,193 +359,197 @@ class WebServerScanner(VulnerabilityScanner):
         المعطيات:
             url (str): عنوان URL
             response (Response): كائن الاستجابة
+            
+        المخرجات:
+            tuple: (الروابط الجديدة، النماذج الجديدة) في الصفحة
         """
         try:
-            # تحليل HTML
-            soup = BeautifulSoup(response.text, "html.parser")
+            # تحليل HTML مرة واحدة ومشاركة الصفحة المحللة مع جميع المحللات
+            page = self.http.page(response)
             
-            # استخراج النماذج
-            forms = soup.find_all("form")
-            for form in forms:
-                form_info = {
-                    "action": form.get("action", ""),
-                    "method": form.get("method", "get").upper(),
-                    "inputs": []
-                }
-                
-                # استخراج حقول الإدخال
-                inputs = form.find_all(["input", "textarea", "select"])
-                for input_field in inputs:
-                    input_info = {
-                        "name": input_field.get("name", ""),
-                        "type": input_field.get("type", "text") if input_field.name == "input" else input_field.name,
-                        "required": input_field.has_attr("required")
-                    }
-                    form_info["inputs"].append(input_info)
-                
-                self.results["web_info"]["forms"].append(form_info)
-            
-            # استخراج الروابط
-            links = soup.find_all("a")
-            for link in links:
-                href = link.get("href")
-                if href and not href.startswith("#") and not href.startswith("javascript:"):
-                    # تحويل الروابط النسبية إلى مطلقة
-                    if not href.startswith("http"):
-                        parsed_url = urlparse(url)
-                        base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-                        if href.startswith("/"):
-                            href = f"{base_url}{href}"
-                        else:
-                            href = f"{base_url}/{href}"
-                    
-                    if href not in self.results["web_info"]["links"]:
-                        self.results["web_info"]["links"].append(href)
+            # استخراج النماذج والروابط الجديدة فقط
+            links, forms = self._collect_page(page)
             
             # اكتشاف التقنيات المستخدمة
-            self._detect_technologies(response.text, soup)
+            self._detect_technologies(page, dict(response.headers), response.cookies.keys(), url=url)
+            
+            return links, forms
             
         except Exception as e:
             self.logger.error(f"خطأ أثناء تحليل محتوى الصفحة: {str(e)}")
             console.print(f"[bold red]خطأ أثناء تحليل محتوى الصفحة: {str(e)}[/bold red]")
+            return [], []
+    
+    def _collect_page(self, page):
+        """
+        إضافة النماذج والروابط الجديدة في الصفحة إلى النتائج
+        
+        المعطيات:
+            page (ParsedPage): الصفحة المحللة
+            
+        المخرجات:
+            tuple: (الروابط، النماذج) التي أضيفت لأول مرة
+        """
+        new_links = [href for href in page.links if self.link_store.add(href)]
+        new_forms = [form for form in page.forms if self.form_store.add(form, page.url)]
+        
+        with self._results_lock:
+            self.results["web_info"]["links"].extend(new_links)
+            self.results["web_info"]["forms"].extend(new_forms)
+        
+        return new_links, new_forms
     
-    def _detect_technologies(self, html, soup):
+    def _crawl(self, url):
+        """
+        الزحف إلى صفحات الموقع بالعرض أولاً وفحص نماذج وروابط كل صفحة جديدة فور جلبها
+        
+        لا تُفحص إلا العناصر التي تظهر لأول مرة، لذا لا يتكرر تسجيل الثغرة نفسها ولا تحتاج
+        الفحوصات إلى المرور على كل ما تم جمعه.
+        
+        المعطيات:
+            url (str): عنوان URL للبداية
+        """
+        def on_page(page_url, page):
+            links, forms = self._collect_page(page)
+            self._check_xss_vulnerabilities(page_url, forms=forms)
+            self._check_sql_injection(page_url, forms=forms)
+            self._check_directory_traversal(page_url, links=links)
+        
+        try:
+            pages = self.crawler.crawl(url, on_page)
+            if pages:
+                self.logger.info(f"تم الزحف إلى {pages} صفحة على: {url}")
+                console.print(f"[green]تم الزحف إلى {pages} صفحة على: {url}[/green]")
+        except Exception as e:
+            self.logger.error(f"خطأ أثناء الزحف إلى {url}: {str(e)}")
+            console.print(f"[bold red]خطأ أثناء الزحف إلى {url}: {str(e)}[/bold red]")
+    
+    def _detect_technologies(self, page, headers=None, cookies=None, url=None):
         """
         اكتشاف التقنيات المستخدمة في الموقع
         
         المعطيات:
-            html (str): محتوى HTML
-            soup (BeautifulSoup): كائن BeautifulSoup
-        """
-        technologies = []
-        
-        # فحص إطار العمل/المكتبات الشائعة
-        tech_patterns = {
-            "jQuery": r"jquery[.-]\d+\.\d+\.\d+\.min\.js",
-            "Bootstrap": r"bootstrap[.-]\d+\.\d+\.\d+\.min\.css",
-            "React": r"react[.-]\d+\.\d+\.\d+\.min\.js",
-            "Angular": r"angular[.-]\d+\.\d+\.\d+\.min\.js",
-            "Vue.js": r"vue[.-]\d+\.\d+\.\d+\.min\.js",
-            "Font Awesome": r"font-awesome[.-]\d+\.\d+\.\d+\.min\.css",
-            "WordPress": r"wp-content|wp-includes",
-            "Joomla": r"joomla",
-            "Drupal": r"drupal",
-            "Magento": r"magento",
-            "Laravel": r"laravel",
-            "Django": r"django",
-            "ASP.NET": r"asp\.net"
-        }
+            page (ParsedPage): الصفحة المحللة
+            headers (dict): ترويسات الاستجابة
+            cookies (list): أسماء الكوكيز
+            url (str): عنوان URL للمنفذ (لتسجيل التقنيات في نتائجه أيضًا)
+        """
+        detected = FingerprintEngine.shared().analyze(
+            html=page.text,
+            scripts=page.script_srcs,
+            headers=headers,
+            cookies=cookies,
+            meta=page.meta
+        )
         
-        for tech, pattern in tech_patterns.items():
-            if re.search(pattern, html, re.IGNORECASE):
-                technologies.append(tech)
-        
-        # فحص العلامات الوصفية
-        meta_tags = soup.find_all("meta")
-        for meta in meta_tags:
-            if meta.get("name") == "generator" and meta.get("content"):
-                generator = meta.get("content")
-                technologies.append(f"Generator: {generator}")
-        
-        # فحص نصوص JavaScript
-        scripts = soup.find_all("script")
-        for script in scripts:
-            src = script.get("src", "")
-            if src:
-                for tech, pattern in tech_patterns.items():
-                    if re.search(pattern, src, re.IGNORECASE) and tech not in technologies:
-                        technologies.append(tech)
+        technologies = list(detected)
+        
+        # إضافة قيم العلامات الوصفية من نوع generator كما هي
+        for generator in page.meta_generators:
+            technologies.append(f"Generator: {generator}")
+        
+        if url:
+            self._endpoint(url)["technologies"] = technologies
         
         # إضافة التقنيات المكتشفة إلى النتائج
-        for tech in technologies:
-            if tech not in self.results["web_info"]["technologies"]:
-                self.results["web_info"]["technologies"].append(tech)
-                self.logger.info(f"تم اكتشاف تقنية: {tech}")
-                console.print(f"[green]تم اكتشاف تقنية: {tech}[/green]")
+        with self._results_lock:
+            for tech in technologies:
+                version = detected.get(tech)
+                if version:
+                    self.results["web_info"]["technology_versions"][tech] = version
+                if tech not in self.results["web_info"]["technologies"]:
+                    self.results["web_info"]["technologies"].append(tech)
+                    label = f"{tech} (الإصدار: {version})" if version else tech
+                    self.logger.info(f"تم اكتشاف تقنية: {label}")
+                    console.print(f"[green]تم اكتشاف تقنية: {label}[/green]")
     
     def _check_ssl_certificate(self, url):
         """
-        فحص شهادة SSL
+        فحص شهادة SSL وبيانات مصافحة TLS
         
         المعطيات:
             url (str): عنوان URL
         """
         try:
             parsed_url = urlparse(url)
-            hostname = parsed_url.netloc.split(":")[0]
+            hostname = parsed_url.hostname
             port = parsed_url.port or 443
             
-            # إنشاء اتصال SSL
-            context = ssl.create_default_context()
-            with socket.create_connection((hostname, port)) as sock:
-                with context.wrap_socket(sock, server_hostname=hostname) as ssock:
-                    cert = ssock.getpeercert()
-                    
-                    # استخراج معلومات الشهادة
-                    cert_info = {
-                        "subject": dict(x[0] for x in cert["subject"]),
-                        "issuer": dict(x[0] for x in cert["issuer"]),
-                        "version": cert["version"],
-                        "notBefore": cert["notBefore"],
-                        "notAfter": cert["notAfter"],
-                        "serialNumber": cert["serialNumber"]
-                    }
-                    
-                    # إضافة معلومات الشهادة إلى النتائج
-                    self.results["web_info"]["ssl_certificate"] = cert_info
-                    
-                    self.logger.info(f"تم فحص شهادة SSL: {hostname}")
-                    console.print(f"[green]تم فحص شهادة SSL: {hostname}[/green]")
-                    
-                    # التحقق من صلاحية الشهادة
-                    import datetime
-                    not_after = ssl.cert_time_to_seconds(cert["notAfter"])
-                    not_before = ssl.cert_time_to_seconds(cert["notBefore"])
-                    now = datetime.datetime.now().timestamp()
-                    
-                    if now > not_after:
-                        vuln_info = {
-                            "type": "ssl",
-                            "name": "Expired SSL Certificate",
-                            "description": f"شهادة SSL منتهية الصلاحية: {cert['notAfter']}",
-                            "severity": "high"
-                        }
-                        self.results["web_vulnerabilities"].append(vuln_info)
-                        self.logger.warning(f"شهادة SSL منتهية الصلاحية: {cert['notAfter']}")
-                        console.print(f"[bold red]شهادة SSL منتهية الصلاحية: {cert['notAfter']}[/bold red]")
-                    
-                    if now < not_before:
-                        vuln_info = {
-                            "type": "ssl",
-                            "name": "Not Yet Valid SSL Certificate",
-                            "description": f"شهادة SSL غير صالحة بعد: {cert['notBefore']}",
-                            "severity": "high"
-                        }
-                        self.results["web_vulnerabilities"].append(vuln_info)
-                        self.logger.warning(f"شهادة SSL غير صالحة بعد: {cert['notBefore']}")
-                        console.print(f"[bold red]شهادة SSL غير صالحة بعد: {cert['notBefore']}[/bold red]")
-        
-        except ssl.SSLError as e:
-            vuln_info = {
-                "type": "ssl",
-                "name": "SSL Certificate Error",
-                "description": f"خطأ في شهادة SSL: {str(e)}",
-                "severity": "high"
+            # مصافحة واحدة مع مهلة الفحص (النتيجة مشتركة لكل مضيف ومنفذ وSNI في العملية)
+            tls = TlsInspector.shared().inspect(hostname, port, timeout=self.timeout)
+            if tls["error"]:
+                self.logger.error(f"خطأ أثناء فحص شهادة SSL: {tls['error']}")
+                console.print(f"[bold red]خطأ أثناء فحص شهادة SSL: {tls['error']}[/bold red]")
+                return
+            
+            # إضافة معلومات الشهادة وبيانات المصافحة إلى النتائج
+            cert = tls["certificate"]
+            endpoint = self._endpoint(url)
+            endpoint["ssl_certificate"] = cert
+            endpoint["tls"] = {
+                "protocol": tls["protocol"],
+                "cipher": tls["cipher"],
+                "chain": tls["chain"],
+                "verified": tls["verified"]
             }
-            self.results["web_vulnerabilities"].append(vuln_info)
-            self.logger.error(f"خطأ في شهادة SSL: {str(e)}")
-            console.print(f"[bold red]خطأ في شهادة SSL: {str(e)}[/bold red]")
             
+            self.logger.info(f"تم فحص شهادة SSL: {hostname} ({tls['protocol']}, {tls['cipher'].get('name')})")
+            console.print(f"[green]تم فحص شهادة SSL: {hostname} ({tls['protocol']}, {tls['cipher'].get('name')})[/green]")
+            
+            if tls["verify_error"]:
+                vuln_info = {
+                    "type": "ssl",
+                    "name": "SSL Certificate Error",
+                    "description": f"خطأ في شهادة SSL: {tls['verify_error']}",
+                    "severity": "high"
+                }
+                self.results["web_vulnerabilities"].append(vuln_info)
+                self.logger.error(f"خطأ في شهادة SSL: {tls['verify_error']}")
+                console.print(f"[bold red]خطأ في شهادة SSL: {tls['verify_error']}[/bold red]")
+            
+            if not cert.get("notAfter"):
+                return
+            
+            # التحقق من صلاحية الشهادة
+            import datetime
+            not_after = ssl.cert_time_to_seconds(cert["notAfter"])
+            not_before = ssl.cert_time_to_seconds(cert["notBefore"])
+            now = datetime.datetime.now().timestamp()
+            
+            if now > not_after:
+                vuln_info = {
+                    "type": "ssl",
+                    "name": "Expired SSL Certificate",
+                    "description": f"شهادة SSL منتهية الصلاحية: {cert['notAfter']}",
+                    "severity": "high"
+                }
+                self.results["web_vulnerabilities"].append(vuln_info)
+                self.logger.warning(f"شهادة SSL منتهية الصلاحية: {cert['notAfter']}")
+                console.print(f"[bold red]شهادة SSL منتهية الصلاحية: {cert['notAfter']}[/bold red]")
+            
+            if now < not_before:
+                vuln_info = {
+                    "type": "ssl",
+                    "name": "Not Yet Valid SSL Certificate",
+                    "description": f"شهادة SSL غير صالحة بعد: {cert['notBefore']}",
+                    "severity": "high"
+                }
+                self.results["web_vulnerabilities"].append(vuln_info)
+                self.logger.warning(f"شهادة SSL غير صالحة بعد: {cert['notBefore']}")
+                console.print(f"[bold red]شهادة SSL غير صالحة بعد: {cert['notBefore']}[/bold red]")
+        
         except Exception as e:
             self.logger.error(f"خطأ أثناء فحص شهادة SSL: {str(e)}")
             console.print(f"[bold red]خطأ أثناء فحص شهادة SSL: {str(e)}[/bold red]")
     
-    def _scan_web_vulnerabilities(self, url):
+    def _scan_web_vulnerabilities(self, url, links=None, forms=None):
         """
         فحص الثغرات الأمنية لخادم الويب
         
         المعطيات:
             url (str): عنوان URL للفحص
+            links (list): الروابط المراد فحصها (افتراضيًا: جميع الروابط المجمعة)
+            forms (list): النماذج المراد فحصها (افتراضيًا: جميع النماذج المجمعة)
         """
         self.logger.info(f"فحص الثغرات الأمنية لخادم الويب: {url}")
         console.print(f"[bold]فحص الثغرات الأمنية لخادم الويب: {url}[/bold]")
@@ -365,13 +559,13 @@ class WebServerScanner(VulnerabilityScanner):
             self._check_missing_security_headers(url)
             
             # فحص ثغرات XSS البسيطة
-            self._check_xss_vulnerabilities(url)
+            self._check_xss_vulnerabilities(url, forms=forms)
             
             # فحص ثغرات SQL Injection البسيطة
-            self._check_sql_injection(url)
+            self._check_sql_injection(url, forms=forms)
             
             # فحص ثغرات Directory Traversal
-            self._check_directory_traversal(url)
+            self._check_directory_traversal(url, links=links)
             
             # فحص ثغرات Information Disclosure
             self._check_information_disclosure(url)
@@ -417,15 +611,16 @@ class WebServerScanner(VulnerabilityScanner):
                 self.logger.warning(f"ترويسة الأمان {header} مفقودة على {url}")
                 console.print(f"[yellow]ترويسة الأمان {header} مفقودة على {url}[/yellow]")
     
-    def _check_xss_vulnerabilities(self, url):
+    def _check_xss_vulnerabilities(self, url, forms=None):
         """
         فحص ثغرات XSS البسيطة
         
         المعطيات:
             url (str): عنوان URL للفحص
+            forms (list): النماذج المراد فحصها (افتراضيًا: جميع النماذج المجمعة)
         """
         # فحص النماذج للثغرات المحتملة
-        for form in self.results["web_info"]["forms"]:
+        for form in (forms if forms is not None else self.results["web_info"]["forms"]):
             if form["method"] == "GET":
                 # فحص حقول الإدخال للثغرات المحتملة
                 for input_field in form["inputs"]:
@@ -443,15 +638,16 @@ class WebServerScanner(VulnerabilityScanner):
                         console.print(f"[yellow]ثغرة XSS محتملة في نموذج على {url}[/yellow]")
                         break  # تسجيل ثغرة واحدة فقط لكل نموذج
     
-    def _check_sql_injection(self, url):
+    def _check_sql_injection(self, url, forms=None):
         """
         فحص ثغرات SQL Injection البسيطة
         
         المعطيات:
             url (str): عنوان URL للفحص
+            forms (list): النماذج المراد فحصها (افتراضيًا: جميع النماذج المجمعة)
         """
         # فحص النماذج للثغرات المحتملة
-        for form in self.results["web_info"]["forms"]:
+        for form in (forms if forms is not None else self.results["web_info"]["forms"]):
             # فحص حقول الإدخال للثغرات المحتملة
             for input_field in form["inputs"]:
                 if input_field["type"] in ["text", "search", "hidden"] and input_field["name"].lower() in [
@@ -470,15 +666,16 @@ class WebServerScanner(VulnerabilityScanner):
                     console.print(f"[red]ثغرة SQL Injection محتملة في نموذج على {url}[/red]")
                     break  # تسجيل ثغرة واحدة فقط لكل نموذج
     
-    def _check_directory_traversal(self, url):
+    def _check_directory_traversal(self, url, links=None):
         """
         فحص ثغرات Directory Traversal
         
         المعطيات:
             url (str): عنوان URL للفحص
+            links (list): الروابط المراد فحصها (افتراضيًا: جميع الروابط المجمعة)
         """
         # فحص الروابط للثغرات المحتملة
-        for link in self.results["web_info"]["links"]:
+        for link in (links if links is not None else self.results["web_info"]["links"]):
             parsed_link = urlparse(link)
             query = parsed_link.query
             
@@ -502,44 +699,19 @@ class WebServerScanner(VulnerabilityScanner):
         المعطيات:
             url (str): عنوان URL للفحص
         """
-        # قائمة المسارات الحساسة للفحص
-        sensitive_paths = [
-            "/robots.txt",
-            "/.git/",
-            "/.svn/",
-            "/.env",
-            "/config.php",
-            "/wp-config.php",
-            "/phpinfo.php",
-            "/server-status",
-            "/server-info",
-            "/admin/",
-            "/backup/",
-            "/db/",
-            "/logs/"
-        ]
-        
         parsed_url = urlparse(url)
         base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
         
-        for path in sensitive_paths:
-            test_url = f"{base_url}{path}"
-            try:
-                response = requests.get(test_url, timeout=self.timeout, verify=False, allow_redirects=False)
-                
-                # التحقق من الاستجابة
-                if response.status_code == 200:
-                    vuln_info = {
-                        "type": "information_disclosure",
-                        "name": "Information Disclosure",
-                        "description": f"تم العثور على ملف/مسار حساس: {test_url}",
-                        "severity": "medium",
-                        "url": test_url
-                    }
-                    self.results["web_vulnerabilities"].append(vuln_info)
-                    self.logger.warning(f"تم العثور على ملف/مسار حساس: {test_url}")
-                    console.print(f"[yellow]تم العثور على ملف/مسار حساس: {test_url}[/yellow]")
-            
-            except requests.exceptions.RequestException:
-                # تجاهل أخطاء الاتصال
-                pass
\ No newline at end of file
+        # فحص المسارات الحساسة من ملف التكوين بشكل متزامن
+        for found in self.path_prober.probe(base_url, self.config.get_paths_to_check("web")):
+            test_url = found["url"]
+            vuln_info = {
+                "type": "information_disclosure",
+                "name": "Information Disclosure",
+                "description": f"تم العثور على ملف/مسار حساس: {test_url}",
+                "severity": "medium",
+                "url": test_url
+            }
+            self.results["web_vulnerabilities"].append(vuln_info)
+            self.logger.warning(f"تم العثور على ملف/مسار حساس: {test_url}")
+            console.print(f"[yellow]تم العثور على ملف/مسار حساس: {test_url}[/yellow]")
\ No newline at end of file
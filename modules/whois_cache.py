@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+وحدة ذاكرة WHOIS الدائمة لأداة SaudiAttack
+
+تُخزن نتائج WHOIS في قاعدة SQLite مفهرسة حسب النطاق القابل للتسجيل (يُحدد من قائمة
+اللواحق العامة)، لذا تشترك النطاقات الفرعية للمؤسسة نفسها في استعلام واحد. لكل نتيجة
+مدة صلاحية، ويُخزن عدم وجود نتيجة (أو فشل الاستعلام) لمدة أقصر حتى لا يُعاد الاستعلام
+مع كل هدف. الاستعلامات المتزامنة عن النطاق نفسه من عدة أهداف تنتظر استعلامًا واحدًا.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+
+from .vulnerability_database import DATA_DIR
+
+# المسار الافتراضي لقاعدة البيانات وملف قائمة اللواحق العامة
+DEFAULT_WHOIS_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.saudi_attack', 'whois_cache.sqlite')
+DEFAULT_PUBLIC_SUFFIX_FILE = os.path.join(DATA_DIR, "public_suffix_list.dat")
+
+# مدة صلاحية النتائج ومدة صلاحية عدم وجود نتيجة بالثواني
+DEFAULT_WHOIS_TTL = 7 * 24 * 3600
+DEFAULT_WHOIS_NEGATIVE_TTL = 3600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS whois (
+    domain TEXT PRIMARY KEY,
+    data TEXT,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+class PublicSuffixList:
+    """
+    فئة قائمة اللواحق العامة (بتنسيق publicsuffix.org: قواعد عادية و * و !)
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path=DEFAULT_PUBLIC_SUFFIX_FILE):
+        """
+        تحميل القائمة
+
+        المعطيات:
+            path (str): مسار ملف القائمة
+        """
+        self.rules = set()
+        self.wildcards = set()
+        self.exceptions = set()
+
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                fields = line.split()
+                if not fields or fields[0].startswith("//"):
+                    continue
+                rule = fields[0].lower()
+                if rule.startswith("!"):
+                    self.exceptions.add(rule[1:])
+                elif rule.startswith("*."):
+                    self.wildcards.add(rule[2:])
+                else:
+                    self.rules.add(rule)
+
+    @classmethod
+    def for_path(cls, path=None):
+        """
+        الحصول على القائمة المحملة من الملف (تُحمّل مرة واحدة لكل مسار في العملية)
+
+        المعطيات:
+            path (str): مسار ملف القائمة (افتراضيًا: القائمة المضمنة)
+
+        المخرجات:
+            PublicSuffixList: القائمة
+        """
+        path = path or DEFAULT_PUBLIC_SUFFIX_FILE
+        with cls._instances_lock:
+            if path not in cls._instances:
+                cls._instances[path] = cls(path)
+            return cls._instances[path]
+
+    def suffix_length(self, labels):
+        """
+        عدد مقاطع اللاحقة العامة في نهاية اسم
+
+        المعطيات:
+            labels (list): مقاطع الاسم
+
+        المخرجات:
+            int: عدد المقاطع (مقطع واحد على الأقل حسب القاعدة الافتراضية "*")
+        """
+        length = 1
+        for index in range(len(labels)):
+            candidate = ".".join(labels[index:])
+            parent = ".".join(labels[index + 1:])
+            if candidate in self.exceptions:
+                return len(labels) - index - 1
+            if candidate in self.rules or parent in self.wildcards:
+                length = max(length, len(labels) - index)
+        return length
+
+    def registrable_domain(self, host):
+        """
+        النطاق القابل للتسجيل لاسم (اللاحقة العامة ومقطع واحد قبلها)
+
+        المعطيات:
+            host (str): اسم المضيف
+
+        المخرجات:
+            str: النطاق القابل للتسجيل أو None إذا كان الاسم لاحقة عامة
+        """
+        labels = host.lower().rstrip(".").split(".")
+        length = self.suffix_length(labels)
+        if len(labels) <= length:
+            return None
+        return ".".join(labels[-length - 1:])
+
+
+class WhoisCache:
+    """
+    فئة ذاكرة WHOIS الدائمة
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path):
+        """
+        فتح قاعدة البيانات (تُنشأ إذا لم تكن موجودة، و":memory:" لذاكرة غير دائمة)
+
+        المعطيات:
+            path (str): مسار ملف قاعدة البيانات
+        """
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._locks = {}
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(SCHEMA)
+
+    @classmethod
+    def for_path(cls, path):
+        """
+        الحصول على ذاكرة WHOIS لمسار (اتصال واحد مشترك لكل ملف في العملية)
+
+        المعطيات:
+            path (str): مسار ملف قاعدة البيانات (None لذاكرة غير دائمة مشتركة في العملية)
+
+        المخرجات:
+            WhoisCache: ذاكرة WHOIS
+        """
+        key = os.path.abspath(os.path.expanduser(path)) if path else ":memory:"
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(key)
+            return cls._instances[key]
+
+    def get(self, domain):
+        """
+        الحصول على نتيجة مخزنة لم تنته صلاحيتها
+
+        المعطيات:
+            domain (str): النطاق
+
+        المخرجات:
+            tuple: (True إذا وُجدت النتيجة، النتيجة أو None لعدم وجود سجل)
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data, expires_at FROM whois WHERE domain = ?", (domain,)
+            ).fetchone()
+        if row is None or row[1] <= time.time():
+            return False, None
+        return True, json.loads(row[0]) if row[0] is not None else None
+
+    def put(self, domain, data, ttl):
+        """
+        تخزين نتيجة
+
+        المعطيات:
+            domain (str): النطاق
+            data (dict): النتيجة (None لعدم وجود سجل)
+            ttl (float): مدة الصلاحية بالثواني
+        """
+        value = json.dumps(data, ensure_ascii=False, default=str) if data is not None else None
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO whois (domain, data, expires_at) VALUES (?, ?, ?)",
+                (domain, value, time.time() + ttl)
+            )
+
+    def lookup(self, domain, fetch, ttl=DEFAULT_WHOIS_TTL, negative_ttl=DEFAULT_WHOIS_NEGATIVE_TTL):
+        """
+        الحصول على نتيجة WHOIS من الذاكرة أو بالاستعلام (مرة واحدة فقط حتى عند الطلب المتزامن)
+
+        المعطيات:
+            domain (str): النطاق القابل للتسجيل
+            fetch (callable): دالة الاستعلام، تعيد النتيجة أو None لعدم وجود سجل
+            ttl (float): مدة صلاحية النتيجة بالثواني
+            negative_ttl (float): مدة صلاحية عدم وجود سجل بالثواني
+
+        المخرجات:
+            dict: النتيجة أو None
+        """
+        domain = domain.lower()
+        with self._lock:
+            key_lock = self._locks.setdefault(domain, threading.Lock())
+
+        with key_lock:
+            found, data = self.get(domain)
+            if found:
+                return data
+
+            data = fetch(domain)
+            self.put(domain, data, ttl if data is not None else negative_ttl)
+            return data
+
+    def close(self):
+        """
+        إغلاق قاعدة البيانات
+        """
+        with self._lock:
+            self._db.close()
@@ -6,23 +6,40 @@
 """
 
 import re
-import requests
 import json
+import asyncio
 from urllib.parse import urlparse, urljoin
-from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 from .web_scanner import WebServerScanner
 from .utils import get_severity_color
+from .vulnerability_database import VulnerabilityDatabase, describe_vulnerability
+from .probe_scheduler import iter_wordlist
 
 console = Console()
 
+# ملف الإصدار والتعبير النمطي لاستخراج الإصدار لكل نوع من المكونات
+WORDPRESS_VERSION_FILES = {
+    "plugins": ("readme.txt", r"Stable tag:\s*([\d.]+)"),
+    "themes": ("style.css", r"Version:\s*([\d.]+)"),
+}
+
+# المعلومات التي إذا لم تتغير منذ المسح السابق لا تُعاد مرحلة فحص الثغرات
+WORDPRESS_INVENTORY_FIELDS = ("version", "themes", "plugins")
+
+# رموز الحالة التي تدل على تقييد الخادم للطلبات (يتوقف التخمين عندها)
+THROTTLE_STATUS_CODES = (429, 503)
+
+# ملفات المعلومات التي يتم فحصها داخل مجلد كل إضافة أو قالب
+PLUGIN_SENSITIVE_FILES = ("README.txt", "readme.txt", "changelog.txt", "CHANGELOG.txt")
+THEME_SENSITIVE_FILES = PLUGIN_SENSITIVE_FILES + ("screenshot.png",)
+
 class WordPressScanner(WebServerScanner):
     """
     فئة ماسح ووردبريس
     """
     
-    def __init__(self, target, ports=[80, 443], threads=5, timeout=30, logger=None):
+    def __init__(self, target, ports=[80, 443], threads=5, timeout=30, logger=None, config=None):
         """
         تهيئة ماسح ووردبريس
         
@@ -32,8 +49,9 @@ class WordPressScanner(WebServerScanner):
             threads (int): عدد مسارات التنفيذ المتوازية
             timeout (int): مهلة الاتصال بالثواني
             logger (Logger): كائن المسجل
+            config (Config): كائن التكوين (اختياري)
         """
-        super().__init__(target, ports, threads, timeout, logger)
+        super().__init__(target, ports, threads, timeout, logger, config)
         
         # إضافة معلومات خاصة بووردبريس إلى النتائج
         self.results["wordpress_info"] = {
@@ -45,8 +63,8 @@ class WordPressScanner(WebServerScanner):
         }
         self.results["wordpress_vulnerabilities"] = []
         
-        # قائمة الثغرات المعروفة في ووردبريس
-        self.known_vulnerabilities = self._load_known_vulnerabilities()
+        # قاعدة بيانات الثغرات المشتركة (تُحمّل وتُفهرس مرة واحدة لكل عملية)
+        self.vulnerability_db = VulnerabilityDatabase.shared()
     
     def scan(self):
         """
@@ -78,151 +96,75 @@ class WordPressScanner(WebServerScanner):
         console.print(f"[bold green]تم اكتشاف موقع ووردبريس على: {self.base_url}[/bold green]")
         
         # جمع معلومات ووردبريس
-        self._gather_wordpress_info()
+        if not self._restore_stage("wordpress_info"):
+            self._gather_wordpress_info()
+            self._checkpoint_stage("wordpress_info", ("wordpress_info",))
         
-        # فحص الثغرات الأمنية في ووردبريس
-        self._scan_wordpress_vulnerabilities()
+        # فحص الثغرات الأمنية في ووردبريس (إلا إذا لم يتغير الإصدار والمكونات منذ المسح السابق)
+        if not self._restore_stage("wordpress_vulnerabilities"):
+            if not self._reuse_previous_stage("wordpress_info", "wordpress_vulnerabilities", WORDPRESS_INVENTORY_FIELDS):
+                self._scan_wordpress_vulnerabilities()
+            self._checkpoint_stage("wordpress_vulnerabilities", ("wordpress_vulnerabilities",))
         
         self.logger.info(f"اكتمل مسح ووردبريس على الهدف: {self.target}")
         console.print(f"[bold green]اكتمل مسح ووردبريس على الهدف: {self.target}[/bold green]")
         
         return self.results
     
-    def _load_known_vulnerabilities(self):
+    async def scan_async(self):
         """
-        تحميل قاعدة بيانات الثغرات المعروفة في ووردبريس
+        تنفيذ مسح ووردبريس بشكل غير متزامن
+        
+        تعمل مراحل جمع المعلومات المستقلة (الإصدار والمكونات والمستخدمين) في الوقت نفسه.
         
         المخرجات:
-            dict: قاعدة بيانات الثغرات المعروفة
-        """
-        # هذه مجرد قاعدة بيانات بسيطة للثغرات المعروفة
-        # في التطبيق الحقيقي، يمكن تحميلها من ملف أو API
-        return {
-            "core": {
-                "5.8.0": [
-                    {
-                        "name": "CVE-2021-44223",
-                        "description": "ثغرة XSS في محرر المحتوى",
-                        "severity": "medium",
-                        "fixed_in": "5.8.1"
-                    }
-                ],
-                "5.7.0": [
-                    {
-                        "name": "CVE-2021-29447",
-                        "description": "ثغرة XXE في معالج الوسائط",
-                        "severity": "high",
-                        "fixed_in": "5.7.1"
-                    }
-                ],
-                "5.6.0": [
-                    {
-                        "name": "CVE-2021-29450",
-                        "description": "ثغرة CSRF في واجهة المستخدم الإدارية",
-                        "severity": "medium",
-                        "fixed_in": "5.6.2"
-                    }
-                ],
-                "5.4.0": [
-                    {
-                        "name": "CVE-2020-35489",
-                        "description": "ثغرة SQL Injection في استعلامات قاعدة البيانات",
-                        "severity": "high",
-                        "fixed_in": "5.4.2"
-                    }
-                ],
-                "4.9.0": [
-                    {
-                        "name": "CVE-2020-11027",
-                        "description": "ثغرة XSS في لوحة التحكم",
-                        "severity": "medium",
-                        "fixed_in": "4.9.16"
-                    }
-                ],
-                "4.7.0": [
-                    {
-                        "name": "CVE-2017-6514",
-                        "description": "ثغرة في واجهة REST API تسمح بالوصول غير المصرح به",
-                        "severity": "high",
-                        "fixed_in": "4.7.2"
-                    }
-                ]
-            },
-            "plugins": {
-                "contact-form-7": {
-                    "5.4.0": [
-                        {
-                            "name": "CVE-2020-35489",
-                            "description": "ثغرة XSS في نماذج الاتصال",
-                            "severity": "medium",
-                            "fixed_in": "5.4.2"
-                        }
-                    ]
-                },
-                "woocommerce": {
-                    "5.5.0": [
-                        {
-                            "name": "CVE-2021-32052",
-                            "description": "ثغرة SQL Injection في معالجة الطلبات",
-                            "severity": "high",
-                            "fixed_in": "5.5.1"
-                        }
-                    ]
-                },
-                "yoast-seo": {
-                    "16.0.0": [
-                        {
-                            "name": "CVE-2021-25118",
-                            "description": "ثغرة XSS في محرر العلامات الوصفية",
-                            "severity": "medium",
-                            "fixed_in": "16.0.2"
-                        }
-                    ]
-                },
-                "elementor": {
-                    "3.1.0": [
-                        {
-                            "name": "CVE-2021-24175",
-                            "description": "ثغرة في إدارة الصلاحيات تسمح بتصعيد الامتيازات",
-                            "severity": "high",
-                            "fixed_in": "3.1.4"
-                        }
-                    ]
-                },
-                "wp-super-cache": {
-                    "1.7.0": [
-                        {
-                            "name": "CVE-2021-24340",
-                            "description": "ثغرة في معالجة ملفات التخزين المؤقت",
-                            "severity": "medium",
-                            "fixed_in": "1.7.2"
-                        }
-                    ]
-                }
-            },
-            "themes": {
-                "twentytwenty": {
-                    "1.5": [
-                        {
-                            "name": "CVE-2021-24499",
-                            "description": "ثغرة XSS في معالجة التعليقات",
-                            "severity": "low",
-                            "fixed_in": "1.6"
-                        }
-                    ]
-                },
-                "astra": {
-                    "2.5.0": [
-                        {
-                            "name": "CVE-2020-35848",
-                            "description": "ثغرة في معالجة الإعدادات",
-                            "severity": "medium",
-                            "fixed_in": "2.5.2"
-                        }
-                    ]
-                }
-            }
-        }
+            dict: نتائج المسح
+        """
+        self.logger.info(f"بدء مسح ووردبريس على الهدف: {self.target}")
+        console.print(f"[bold]بدء مسح ووردبريس على الهدف: {self.target}[/bold]")
+        
+        # تنفيذ المسح الأساسي لخادم الويب أولاً
+        await super().scan_async()
+        
+        # التحقق مما إذا كان الموقع يستخدم ووردبريس
+        if not await self._run_blocking(self._is_wordpress):
+            self.logger.warning(f"الهدف {self.target} لا يبدو أنه يستخدم ووردبريس.")
+            console.print(f"[bold yellow]الهدف {self.target} لا يبدو أنه يستخدم ووردبريس.[/bold yellow]")
+            return self.results
+        
+        # تحديد عنوان URL الأساسي
+        self.base_url = self._get_wordpress_base_url()
+        if not self.base_url:
+            self.logger.error("لم يتم العثور على عنوان URL أساسي صالح لووردبريس.")
+            console.print("[bold red]لم يتم العثور على عنوان URL أساسي صالح لووردبريس.[/bold red]")
+            return self.results
+        
+        self.logger.info(f"تم اكتشاف موقع ووردبريس على: {self.base_url}")
+        console.print(f"[bold green]تم اكتشاف موقع ووردبريس على: {self.base_url}[/bold green]")
+        
+        # جمع معلومات ووردبريس (المراحل المستقلة بالتوازي)
+        if not self._restore_stage("wordpress_info"):
+            self.logger.info(f"جمع معلومات ووردبريس من: {self.base_url}")
+            console.print(f"[bold]جمع معلومات ووردبريس من: {self.base_url}[/bold]")
+            await asyncio.gather(
+                self._run_blocking(self._get_wordpress_version),
+                self._run_blocking(self._get_wordpress_themes),
+                self._run_blocking(self._get_wordpress_plugins),
+                self._run_blocking(self._get_wordpress_users),
+                self._run_blocking(self._check_multisite)
+            )
+            self._checkpoint_stage("wordpress_info", ("wordpress_info",))
+        
+        # فحص الثغرات الأمنية في ووردبريس (إلا إذا لم يتغير الإصدار والمكونات منذ المسح السابق)
+        if not self._restore_stage("wordpress_vulnerabilities"):
+            if not self._reuse_previous_stage("wordpress_info", "wordpress_vulnerabilities", WORDPRESS_INVENTORY_FIELDS):
+                await self._run_blocking(self._scan_wordpress_vulnerabilities)
+            self._checkpoint_stage("wordpress_vulnerabilities", ("wordpress_vulnerabilities",))
+        
+        self.logger.info(f"اكتمل مسح ووردبريس على الهدف: {self.target}")
+        console.print(f"[bold green]اكتمل مسح ووردبريس على الهدف: {self.target}[/bold green]")
+        
+        return self.results
     
     def _is_wordpress(self):
         """
@@ -257,18 +199,16 @@ class WordPressScanner(WebServerScanner):
         # التحقق من محتوى HTML
         for url in self.results["web_info"]["headers"].keys():
             try:
-                response = requests.get(url, timeout=self.timeout, verify=False)
-                if "wp-content" in response.text or "wp-includes" in response.text:
+                page = self.http.page(self.http.get(url))
+                if "wp-content" in page.text or "wp-includes" in page.text:
                     return True
                 
                 # التحقق من العلامات الوصفية
-                soup = BeautifulSoup(response.text, "html.parser")
-                meta_generator = soup.find("meta", {"name": "generator"})
-                if meta_generator and "WordPress" in meta_generator.get("content", ""):
+                if "WordPress" in page.meta_generator:
                     return True
                 
                 # التحقق من وجود ملف feed
-                if "<link rel=\"alternate\" type=\"application/rss+xml\"" in response.text:
+                if "<link rel=\"alternate\" type=\"application/rss+xml\"" in page.text:
                     return True
             except:
                 pass
@@ -332,32 +272,31 @@ class WordPressScanner(WebServerScanner):
         """
         try:
             # طريقة 1: من ملف readme.html
-            response = requests.get(f"{self.base_url}/readme.html", timeout=self.timeout, verify=False)
+            response = self.http.get(f"{self.base_url}/readme.html", stop_pattern=r"Version\s+[\d.]+[^\d.]")
             if response.status_code == 200:
-                version_match = re.search(r"Version\s+([\d.]+)", response.text)
-                if version_match:
-                    self.results["wordpress_info"]["version"] = version_match.group(1)
+                version = self.http.extract(response, r"Version\s+([\d.]+)")
+                if version:
+                    self.results["wordpress_info"]["version"] = version
                     self.logger.info(f"إصدار ووردبريس: {self.results['wordpress_info']['version']}")
                     console.print(f"[green]إصدار ووردبريس: {self.results['wordpress_info']['version']}[/green]")
                     return
             
             # طريقة 2: من ملف feed
-            response = requests.get(f"{self.base_url}/feed/", timeout=self.timeout, verify=False)
+            response = self.http.get(f"{self.base_url}/feed/", stop_pattern=r'generator="WordPress\s+[\d.]+"')
             if response.status_code == 200:
-                version_match = re.search(r'generator="WordPress\s+([\d.]+)"', response.text)
-                if version_match:
-                    self.results["wordpress_info"]["version"] = version_match.group(1)
+                version = self.http.extract(response, r'generator="WordPress\s+([\d.]+)"')
+                if version:
+                    self.results["wordpress_info"]["version"] = version
                     self.logger.info(f"إصدار ووردبريس: {self.results['wordpress_info']['version']}")
                     console.print(f"[green]إصدار ووردبريس: {self.results['wordpress_info']['version']}[/green]")
                     return
             
             # طريقة 3: من الصفحة الرئيسية
-            response = requests.get(self.base_url, timeout=self.timeout, verify=False)
+            response = self.http.get(self.base_url)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, "html.parser")
-                meta_generator = soup.find("meta", {"name": "generator"})
-                if meta_generator and "WordPress" in meta_generator.get("content", ""):
-                    version_match = re.search(r"WordPress\s+([\d.]+)", meta_generator.get("content", ""))
+                meta_generator = self.http.page(response).meta_generator
+                if "WordPress" in meta_generator:
+                    version_match = re.search(r"WordPress\s+([\d.]+)", meta_generator)
                     if version_match:
                         self.results["wordpress_info"]["version"] = version_match.group(1)
                         self.logger.info(f"إصدار ووردبريس: {self.results['wordpress_info']['version']}")
@@ -377,33 +316,19 @@ class WordPressScanner(WebServerScanner):
         """
         try:
             # البحث عن روابط القوالب في الصفحة الرئيسية
-            response = requests.get(self.base_url, timeout=self.timeout, verify=False)
+            response = self.http.get(self.base_url)
             if response.status_code == 200:
                 # البحث عن روابط القوالب
                 theme_pattern = r"wp-content/themes/([^/]+)/"
-                theme_matches = re.findall(theme_pattern, response.text)
+                theme_matches = re.findall(theme_pattern, self.http.page(response).text)
                 
-                for theme_name in set(theme_matches):
-                    # محاولة الحصول على إصدار القالب من ملف style.css
-                    theme_url = f"{self.base_url}/wp-content/themes/{theme_name}/style.css"
-                    try:
-                        theme_response = requests.get(theme_url, timeout=self.timeout, verify=False)
-                        if theme_response.status_code == 200:
-                            version_match = re.search(r"Version:\s*([\d.]+)", theme_response.text)
-                            version = version_match.group(1) if version_match else "غير معروف"
-                            
-                            theme_info = {
-                                "name": theme_name,
-                                "version": version,
-                                "url": f"{self.base_url}/wp-content/themes/{theme_name}/"
-                            }
-                            
-                            if theme_info not in self.results["wordpress_info"]["themes"]:
-                                self.results["wordpress_info"]["themes"].append(theme_info)
-                                self.logger.info(f"تم اكتشاف قالب: {theme_name} (الإصدار: {version})")
-                                console.print(f"[green]تم اكتشاف قالب: {theme_name} (الإصدار: {version})[/green]")
-                    except:
-                        pass
+                # محاولة الحصول على إصدار كل قالب من ملف style.css بشكل متزامن
+                for theme_name, (status, version) in self._probe_wordpress_components("themes", dict.fromkeys(theme_matches)):
+                    if status == 200:
+                        self._add_wordpress_theme(theme_name, version)
+            
+            # تخمين القوالب من قائمة الكلمات إن وجدت
+            self._enumerate_wordpress_wordlist("themes", self.config.get("wordpress", "theme_wordlist"))
             
             if not self.results["wordpress_info"]["themes"]:
                 self.logger.warning("لم يتم العثور على قوالب ووردبريس.")
@@ -419,43 +344,20 @@ class WordPressScanner(WebServerScanner):
         """
         try:
             # البحث عن روابط الإضافات في الصفحة الرئيسية
-            response = requests.get(self.base_url, timeout=self.timeout, verify=False)
+            response = self.http.get(self.base_url)
             if response.status_code == 200:
                 # البحث عن روابط الإضافات
                 plugin_pattern = r"wp-content/plugins/([^/]+)/"
-                plugin_matches = re.findall(plugin_pattern, response.text)
+                plugin_matches = re.findall(plugin_pattern, self.http.page(response).text)
                 
-                for plugin_name in set(plugin_matches):
-                    # محاولة الحصول على إصدار الإضافة من ملف readme.txt
-                    plugin_url = f"{self.base_url}/wp-content/plugins/{plugin_name}/readme.txt"
-                    try:
-                        plugin_response = requests.get(plugin_url, timeout=self.timeout, verify=False)
-                        if plugin_response.status_code == 200:
-                            version_match = re.search(r"Stable tag:\s*([\d.]+)", plugin_response.text)
-                            version = version_match.group(1) if version_match else "غير معروف"
-                            
-                            plugin_info = {
-                                "name": plugin_name,
-                                "version": version,
-                                "url": f"{self.base_url}/wp-content/plugins/{plugin_name}/"
-                            }
-                            
-                            if plugin_info not in self.results["wordpress_info"]["plugins"]:
-                                self.results["wordpress_info"]["plugins"].append(plugin_info)
-                                self.logger.info(f"تم اكتشاف إضافة: {plugin_name} (الإصدار: {version})")
-                                console.print(f"[green]تم اكتشاف إضافة: {plugin_name} (الإصدار: {version})[/green]")
-                    except:
-                        # إذا لم يتم العثور على ملف readme.txt، إضافة الإضافة بدون إصدار
-                        plugin_info = {
-                            "name": plugin_name,
-                            "version": "غير معروف",
-                            "url": f"{self.base_url}/wp-content/plugins/{plugin_name}/"
-                        }
-                        
-                        if plugin_info not in self.results["wordpress_info"]["plugins"]:
-                            self.results["wordpress_info"]["plugins"].append(plugin_info)
-                            self.logger.info(f"تم اكتشاف إضافة: {plugin_name} (الإصدار: غير معروف)")
-                            console.print(f"[green]تم اكتشاف إضافة: {plugin_name} (الإصدار: غير معروف)[/green]")
+                # محاولة الحصول على إصدار كل إضافة من ملف readme.txt بشكل متزامن
+                for plugin_name, (status, version) in self._probe_wordpress_components("plugins", dict.fromkeys(plugin_matches)):
+                    # إذا تعذر الوصول إلى ملف readme.txt، إضافة الإضافة بدون إصدار
+                    if status in (200, None):
+                        self._add_wordpress_plugin(plugin_name, version)
+            
+            # تخمين الإضافات من قائمة الكلمات إن وجدت
+            self._enumerate_wordpress_wordlist("plugins", self.config.get("wordpress", "plugin_wordlist"))
             
             if not self.results["wordpress_info"]["plugins"]:
                 self.logger.warning("لم يتم العثور على إضافات ووردبريس.")
@@ -465,6 +367,107 @@ class WordPressScanner(WebServerScanner):
             self.logger.error(f"خطأ أثناء الحصول على إضافات ووردبريس: {str(e)}")
             console.print(f"[bold red]خطأ أثناء الحصول على إضافات ووردبريس: {str(e)}[/bold red]")
     
+    def _probe_wordpress_components(self, kind, names, stop_when=None):
+        """
+        جلب ملفات الإصدار للإضافات أو القوالب بشكل متزامن عبر مجدول الفحوصات
+        
+        المعطيات:
+            kind (str): نوع المكون (plugins أو themes)
+            names (iterable): أسماء المكونات (يمكن أن تكون مولدًا)
+            stop_when (callable): شرط الإيقاف المبكر (اختياري)
+            
+        المخرجات:
+            list: أزواج (الاسم، (رمز الحالة، الإصدار)) بترتيب الأسماء، رمز الحالة None عند تعذر الاتصال
+        """
+        version_file, version_pattern = WORDPRESS_VERSION_FILES[kind]
+        
+        def probe(name):
+            try:
+                # القراءة تتوقف بعد سطر الإصدار بدلاً من تنزيل الملف كاملًا
+                response = self.http.get(
+                    f"{self.base_url}/wp-content/{kind}/{name}/{version_file}",
+                    stop_pattern=version_pattern + r"[^\d.]"
+                )
+            except Exception:
+                return None, "غير معروف"
+            version = self.http.extract(response, version_pattern) if response.status_code == 200 else None
+            return response.status_code, version or "غير معروف"
+        
+        return self.scheduler.map(probe, names, host=urlparse(self.base_url).netloc, stop_when=stop_when)
+    
+    def _enumerate_wordpress_wordlist(self, kind, wordlist):
+        """
+        تخمين الإضافات أو القوالب من قائمة كلمات
+        
+        تُقرأ القائمة بشكل تدريجي، ويتوقف التخمين مبكرًا إذا بدأ الخادم بتقييد الطلبات
+        (رمز الحالة 429 أو 503).
+        
+        المعطيات:
+            kind (str): نوع المكون (plugins أو themes)
+            wordlist (str): مسار ملف قائمة الكلمات (None لتخطي التخمين)
+        """
+        if not wordlist:
+            return
+        
+        add_component = self._add_wordpress_plugin if kind == "plugins" else self._add_wordpress_theme
+        label = "الإضافات" if kind == "plugins" else "القوالب"
+        known = {item["name"] for item in self.results["wordpress_info"][kind]}
+        names = (name for name in iter_wordlist(wordlist) if name not in known)
+        
+        self.logger.info(f"بدء تخمين {label} من قائمة الكلمات: {wordlist}")
+        console.print(f"[bold]بدء تخمين {label} من قائمة الكلمات: {wordlist}[/bold]")
+        
+        throttled = False
+        for name, (status, version) in self._probe_wordpress_components(
+            kind, names, stop_when=lambda name, result: result[0] in THROTTLE_STATUS_CODES
+        ):
+            if status in THROTTLE_STATUS_CODES:
+                throttled = True
+            elif status == 200:
+                add_component(name, version)
+        
+        if throttled:
+            self.logger.warning(f"تم إيقاف تخمين {label} مبكرًا بسبب تقييد الخادم للطلبات")
+            console.print(f"[yellow]تم إيقاف تخمين {label} مبكرًا بسبب تقييد الخادم للطلبات[/yellow]")
+    
+    def _add_wordpress_theme(self, theme_name, version):
+        """
+        إضافة قالب مكتشف إلى النتائج
+        
+        المعطيات:
+            theme_name (str): اسم القالب
+            version (str): إصدار القالب
+        """
+        theme_info = {
+            "name": theme_name,
+            "version": version,
+            "url": f"{self.base_url}/wp-content/themes/{theme_name}/"
+        }
+        
+        if theme_info not in self.results["wordpress_info"]["themes"]:
+            self.results["wordpress_info"]["themes"].append(theme_info)
+            self.logger.info(f"تم اكتشاف قالب: {theme_name} (الإصدار: {version})")
+            console.print(f"[green]تم اكتشاف قالب: {theme_name} (الإصدار: {version})[/green]")
+    
+    def _add_wordpress_plugin(self, plugin_name, version):
+        """
+        إضافة إضافة مكتشفة إلى النتائج
+        
+        المعطيات:
+            plugin_name (str): اسم الإضافة
+            version (str): إصدار الإضافة
+        """
+        plugin_info = {
+            "name": plugin_name,
+            "version": version,
+            "url": f"{self.base_url}/wp-content/plugins/{plugin_name}/"
+        }
+        
+        if plugin_info not in self.results["wordpress_info"]["plugins"]:
+            self.results["wordpress_info"]["plugins"].append(plugin_info)
+            self.logger.info(f"تم اكتشاف إضافة: {plugin_name} (الإصدار: {version})")
+            console.print(f"[green]تم اكتشاف إضافة: {plugin_name} (الإصدار: {version})[/green]")
+    
     def _get_wordpress_users(self):
         """
         الحصول على المستخدمين
@@ -472,7 +475,7 @@ class WordPressScanner(WebServerScanner):
         try:
             # طريقة 1: من خلال REST API
             api_url = f"{self.base_url}/wp-json/wp/v2/users"
-            response = requests.get(api_url, timeout=self.timeout, verify=False)
+            response = self.http.get(api_url)
             if response.status_code == 200:
                 users_data = response.json()
                 for user in users_data:
@@ -490,7 +493,7 @@ class WordPressScanner(WebServerScanner):
             # طريقة 2: من خلال ?author=1
             for i in range(1, 10):  # فحص أول 10 معرفات
                 author_url = f"{self.base_url}/?author={i}"
-                response = requests.get(author_url, timeout=self.timeout, verify=False, allow_redirects=True)
+                response = self.http.get(author_url, allow_redirects=True)
                 if response.status_code == 200:
                     # التحقق من إعادة التوجيه إلى صفحة المؤلف
                     if "/author/" in response.url:
@@ -520,7 +523,7 @@ class WordPressScanner(WebServerScanner):
         try:
             # التحقق من وجود مسار /wp-admin/network/
             network_url = f"{self.base_url}/wp-admin/network/"
-            response = requests.get(network_url, timeout=self.timeout, verify=False, allow_redirects=False)
+            response = self.http.head(network_url)
             if response.status_code == 302 and "wp-login.php" in response.headers.get("Location", ""):
                 self.results["wordpress_info"]["is_multisite"] = True
                 self.logger.info("الموقع هو موقع ووردبريس متعدد المواقع.")
@@ -529,7 +532,7 @@ class WordPressScanner(WebServerScanner):
             
             # التحقق من وجود مسار /wp-signup.php
             signup_url = f"{self.base_url}/wp-signup.php"
-            response = requests.get(signup_url, timeout=self.timeout, verify=False)
+            response = self.http.get(signup_url)
             if response.status_code == 200 and "Multisite Network" in response.text:
                 self.results["wordpress_info"]["is_multisite"] = True
                 self.logger.info("الموقع هو موقع ووردبريس متعدد المواقع.")
@@ -582,48 +585,29 @@ class WordPressScanner(WebServerScanner):
         
         version = self.results["wordpress_info"]["version"]
         
-        # البحث عن الثغرات المعروفة للإصدار الحالي أو الإصدارات السابقة
-        for ver, vulns in self.known_vulnerabilities["core"].items():
-            if self._is_version_vulnerable(version, ver):
-                for vuln in vulns:
-                    vuln_info = {
-                        "type": "core",
-                        "name": vuln["name"],
-                        "description": vuln["description"],
-                        "severity": vuln["severity"],
-                        "affected_version": ver,
-                        "fixed_in": vuln["fixed_in"]
-                    }
-                    self.results["wordpress_vulnerabilities"].append(vuln_info)
-                    self.logger.warning(f"تم اكتشاف ثغرة في نواة ووردبريس: {vuln['name']} (خطورة: {vuln['severity']})")
-                    console.print(f"[{get_severity_color(vuln['severity'])}]تم اكتشاف ثغرة في نواة ووردبريس: {vuln['name']} (خطورة: {vuln['severity']})[/{get_severity_color(vuln['severity'])}]")
-        
-        # فحص ملفات حساسة
-        sensitive_files = [
-            "/wp-config.php",
-            "/wp-config-sample.php",
-            "/wp-content/debug.log",
-            "/.wp-config.php.swp",
-            "/wp-content/uploads/wp-config.php"
-        ]
-        
-        for file in sensitive_files:
-            file_url = f"{self.base_url}{file}"
-            try:
-                response = requests.get(file_url, timeout=self.timeout, verify=False)
-                if response.status_code == 200:
-                    vuln_info = {
-                        "type": "sensitive_file",
-                        "name": "Sensitive File Exposure",
-                        "description": f"تم العثور على ملف حساس: {file_url}",
-                        "severity": "high",
-                        "url": file_url
-                    }
-                    self.results["wordpress_vulnerabilities"].append(vuln_info)
-                    self.logger.warning(f"تم العثور على ملف حساس: {file_url}")
-                    console.print(f"[red]تم العثور على ملف حساس: {file_url}[/red]")
-            except:
-                pass
+        # البحث عن الثغرات المعروفة للإصدار الحالي في قاعدة بيانات الثغرات
+        for vuln in self.vulnerability_db.check_wordpress_core_vulnerabilities(version):
+            vuln_info = {
+                "type": "core",
+                **describe_vulnerability(vuln)
+            }
+            self.results["wordpress_vulnerabilities"].append(vuln_info)
+            self.logger.warning(f"تم اكتشاف ثغرة في نواة ووردبريس: {vuln_info['name']} (خطورة: {vuln_info['severity']})")
+            console.print(f"[{get_severity_color(vuln_info['severity'])}]تم اكتشاف ثغرة في نواة ووردبريس: {vuln_info['name']} (خطورة: {vuln_info['severity']})[/{get_severity_color(vuln_info['severity'])}]")
+        
+        # فحص ملفات حساسة من ملف التكوين
+        for found in self.path_prober.probe(self.base_url, self.config.get_paths_to_check("wordpress")):
+            file_url = found["url"]
+            vuln_info = {
+                "type": "sensitive_file",
+                "name": "Sensitive File Exposure",
+                "description": f"تم العثور على ملف حساس: {file_url}",
+                "severity": "high",
+                "url": file_url
+            }
+            self.results["wordpress_vulnerabilities"].append(vuln_info)
+            self.logger.warning(f"تم العثور على ملف حساس: {file_url}")
+            console.print(f"[red]تم العثور على ملف حساس: {file_url}[/red]")
     
     def _check_plugin_vulnerabilities(self):
         """
@@ -638,52 +622,35 @@ class WordPressScanner(WebServerScanner):
             plugin_name = plugin["name"]
             plugin_version = plugin["version"]
             
-            # التحقق مما إذا كانت الإضافة معروفة في قاعدة البيانات
-            if plugin_name in self.known_vulnerabilities["plugins"]:
-                # البحث عن الثغرات المعروفة للإصدار الحالي أو الإصدارات السابقة
-                for ver, vulns in self.known_vulnerabilities["plugins"][plugin_name].items():
-                    if plugin_version == "غير معروف" or self._is_version_vulnerable(plugin_version, ver):
-                        for vuln in vulns:
-                            vuln_info = {
-                                "type": "plugin",
-                                "name": vuln["name"],
-                                "description": vuln["description"],
-                                "severity": vuln["severity"],
-                                "plugin": plugin_name,
-                                "plugin_version": plugin_version,
-                                "affected_version": ver,
-                                "fixed_in": vuln["fixed_in"]
-                            }
-                            self.results["wordpress_vulnerabilities"].append(vuln_info)
-                            self.logger.warning(f"تم اكتشاف ثغرة في إضافة {plugin_name}: {vuln['name']} (خطورة: {vuln['severity']})")
-                            console.print(f"[{get_severity_color(vuln['severity'])}]تم اكتشاف ثغرة في إضافة {plugin_name}: {vuln['name']} (خطورة: {vuln['severity']})[/{get_severity_color(vuln['severity'])}]")
+            # البحث عن الثغرات المعروفة (جميع ثغرات الإضافة إذا كان إصدارها غير معروف)
+            lookup_version = None if plugin_version == "غير معروف" else plugin_version
+            for vuln in self.vulnerability_db.check_wordpress_plugin_vulnerabilities(plugin_name, lookup_version):
+                vuln_info = {
+                    "type": "plugin",
+                    **describe_vulnerability(vuln),
+                    "plugin": plugin_name,
+                    "plugin_version": plugin_version
+                }
+                self.results["wordpress_vulnerabilities"].append(vuln_info)
+                self.logger.warning(f"تم اكتشاف ثغرة في إضافة {plugin_name}: {vuln_info['name']} (خطورة: {vuln_info['severity']})")
+                console.print(f"[{get_severity_color(vuln_info['severity'])}]تم اكتشاف ثغرة في إضافة {plugin_name}: {vuln_info['name']} (خطورة: {vuln_info['severity']})[/{get_severity_color(vuln_info['severity'])}]")
             
             # فحص ملفات حساسة للإضافة
-            sensitive_files = [
-                f"/wp-content/plugins/{plugin_name}/README.txt",
-                f"/wp-content/plugins/{plugin_name}/readme.txt",
-                f"/wp-content/plugins/{plugin_name}/changelog.txt",
-                f"/wp-content/plugins/{plugin_name}/CHANGELOG.txt"
-            ]
-            
-            for file in sensitive_files:
-                file_url = f"{self.base_url}{file}"
-                try:
-                    response = requests.get(file_url, timeout=self.timeout, verify=False)
-                    if response.status_code == 200:
-                        vuln_info = {
-                            "type": "information_disclosure",
-                            "name": "Plugin Information Disclosure",
-                            "description": f"تم العثور على ملف معلومات للإضافة {plugin_name}: {file_url}",
-                            "severity": "low",
-                            "plugin": plugin_name,
-                            "url": file_url
-                        }
-                        self.results["wordpress_vulnerabilities"].append(vuln_info)
-                        self.logger.info(f"تم العثور على ملف معلومات للإضافة {plugin_name}: {file_url}")
-                        console.print(f"[green]تم العثور على ملف معلومات للإضافة {plugin_name}: {file_url}[/green]")
-                except:
-                    pass
+            sensitive_files = [f"/wp-content/plugins/{plugin_name}/{file}" for file in PLUGIN_SENSITIVE_FILES]
+            
+            for found in self.path_prober.probe(self.base_url, sensitive_files):
+                file_url = found["url"]
+                vuln_info = {
+                    "type": "information_disclosure",
+                    "name": "Plugin Information Disclosure",
+                    "description": f"تم العثور على ملف معلومات للإضافة {plugin_name}: {file_url}",
+                    "severity": "low",
+                    "plugin": plugin_name,
+                    "url": file_url
+                }
+                self.results["wordpress_vulnerabilities"].append(vuln_info)
+                self.logger.info(f"تم العثور على ملف معلومات للإضافة {plugin_name}: {file_url}")
+                console.print(f"[green]تم العثور على ملف معلومات للإضافة {plugin_name}: {file_url}[/green]")
     
     def _check_theme_vulnerabilities(self):
         """
@@ -698,53 +665,35 @@ class WordPressScanner(WebServerScanner):
             theme_name = theme["name"]
             theme_version = theme["version"]
             
-            # التحقق مما إذا كان القالب معروفًا في قاعدة البيانات
-            if theme_name in self.known_vulnerabilities["themes"]:
-                # البحث عن الثغرات المعروفة للإصدار الحالي أو الإصدارات السابقة
-                for ver, vulns in self.known_vulnerabilities["themes"][theme_name].items():
-                    if theme_version == "غير معروف" or self._is_version_vulnerable(theme_version, ver):
-                        for vuln in vulns:
-                            vuln_info = {
-                                "type": "theme",
-                                "name": vuln["name"],
-                                "description": vuln["description"],
-                                "severity": vuln["severity"],
-                                "theme": theme_name,
-                                "theme_version": theme_version,
-                                "affected_version": ver,
-                                "fixed_in": vuln["fixed_in"]
-                            }
-                            self.results["wordpress_vulnerabilities"].append(vuln_info)
-                            self.logger.warning(f"تم اكتشاف ثغرة في قالب {theme_name}: {vuln['name']} (خطورة: {vuln['severity']})")
-                            console.print(f"[{get_severity_color(vuln['severity'])}]تم اكتشاف ثغرة في قالب {theme_name}: {vuln['name']} (خطورة: {vuln['severity']})[/{get_severity_color(vuln['severity'])}]")
+            # البحث عن الثغرات المعروفة (جميع ثغرات القالب إذا كان إصداره غير معروف)
+            lookup_version = None if theme_version == "غير معروف" else theme_version
+            for vuln in self.vulnerability_db.check_wordpress_theme_vulnerabilities(theme_name, lookup_version):
+                vuln_info = {
+                    "type": "theme",
+                    **describe_vulnerability(vuln),
+                    "theme": theme_name,
+                    "theme_version": theme_version
+                }
+                self.results["wordpress_vulnerabilities"].append(vuln_info)
+                self.logger.warning(f"تم اكتشاف ثغرة في قالب {theme_name}: {vuln_info['name']} (خطورة: {vuln_info['severity']})")
+                console.print(f"[{get_severity_color(vuln_info['severity'])}]تم اكتشاف ثغرة في قالب {theme_name}: {vuln_info['name']} (خطورة: {vuln_info['severity']})[/{get_severity_color(vuln_info['severity'])}]")
             
             # فحص ملفات حساسة للقالب
-            sensitive_files = [
-                f"/wp-content/themes/{theme_name}/README.txt",
-                f"/wp-content/themes/{theme_name}/readme.txt",
-                f"/wp-content/themes/{theme_name}/changelog.txt",
-                f"/wp-content/themes/{theme_name}/CHANGELOG.txt",
-                f"/wp-content/themes/{theme_name}/screenshot.png"
-            ]
-            
-            for file in sensitive_files:
-                file_url = f"{self.base_url}{file}"
-                try:
-                    response = requests.get(file_url, timeout=self.timeout, verify=False)
-                    if response.status_code == 200:
-                        vuln_info = {
-                            "type": "information_disclosure",
-                            "name": "Theme Information Disclosure",
-                            "description": f"تم العثور على ملف معلومات للقالب {theme_name}: {file_url}",
-                            "severity": "low",
-                            "theme": theme_name,
-                            "url": file_url
-                        }
-                        self.results["wordpress_vulnerabilities"].append(vuln_info)
-                        self.logger.info(f"تم العثور على ملف معلومات للقالب {theme_name}: {file_url}")
-                        console.print(f"[green]تم العثور على ملف معلومات للقالب {theme_name}: {file_url}[/green]")
-                except:
-                    pass
+            sensitive_files = [f"/wp-content/themes/{theme_name}/{file}" for file in THEME_SENSITIVE_FILES]
+            
+            for found in self.path_prober.probe(self.base_url, sensitive_files):
+                file_url = found["url"]
+                vuln_info = {
+                    "type": "information_disclosure",
+                    "name": "Theme Information Disclosure",
+                    "description": f"تم العثور على ملف معلومات للقالب {theme_name}: {file_url}",
+                    "severity": "low",
+                    "theme": theme_name,
+                    "url": file_url
+                }
+                self.results["wordpress_vulnerabilities"].append(vuln_info)
+                self.logger.info(f"تم العثور على ملف معلومات للقالب {theme_name}: {file_url}")
+                console.print(f"[green]تم العثور على ملف معلومات للقالب {theme_name}: {file_url}[/green]")
     
     def _check_other_vulnerabilities(self):
         """
@@ -753,7 +702,7 @@ class WordPressScanner(WebServerScanner):
         # فحص XML-RPC
         xmlrpc_url = f"{self.base_url}/xmlrpc.php"
         try:
-            response = requests.post(xmlrpc_url, data="", timeout=self.timeout, verify=False)
+            response = self.http.post(xmlrpc_url, data="")
             if response.status_code == 200 and "XML-RPC server accepts POST requests only." in response.text:
                 vuln_info = {
                     "type": "xmlrpc",
@@ -776,7 +725,7 @@ class WordPressScanner(WebServerScanner):
                 </params>
                 </methodCall>""".format(self.base_url)
                 
-                response = requests.post(xmlrpc_url, data=pingback_data, timeout=self.timeout, verify=False)
+                response = self.http.post(xmlrpc_url, data=pingback_data)
                 if response.status_code == 200 and ("<fault>" not in response.text or "pingback error" in response.text.lower()):
                     vuln_info = {
                         "type": "xmlrpc_pingback",
@@ -794,7 +743,7 @@ class WordPressScanner(WebServerScanner):
         # فحص REST API
         rest_api_url = f"{self.base_url}/wp-json/"
         try:
-            response = requests.get(rest_api_url, timeout=self.timeout, verify=False)
+            response = self.http.get(rest_api_url)
             if response.status_code == 200:
                 vuln_info = {
                     "type": "rest_api",
@@ -809,7 +758,7 @@ class WordPressScanner(WebServerScanner):
                 
                 # التحقق من إمكانية الوصول إلى المستخدمين
                 users_api_url = f"{self.base_url}/wp-json/wp/v2/users"
-                response = requests.get(users_api_url, timeout=self.timeout, verify=False)
+                response = self.http.get(users_api_url)
                 if response.status_code == 200:
                     vuln_info = {
                         "type": "rest_api_users",
@@ -828,7 +777,7 @@ class WordPressScanner(WebServerScanner):
         for i in range(1, 5):  # فحص أول 5 معرفات
             author_url = f"{self.base_url}/?author={i}"
             try:
-                response = requests.get(author_url, timeout=self.timeout, verify=False, allow_redirects=True)
+                response = self.http.get(author_url, allow_redirects=True)
                 if response.status_code == 200 and "/author/" in response.url:
                     vuln_info = {
                         "type": "user_enumeration",
@@ -850,30 +799,12 @@ class WordPressScanner(WebServerScanner):
         
         المعطيات:
             current_version (str): الإصدار الحالي
-            vulnerable_version (str): الإصدار المعرض للثغرات
+            vulnerable_version (str): آخر إصدار معرض للثغرات
             
         المخرجات:
-            bool: True إذا كان الإصدار الحالي عرضة للثغرات، False خلاف ذلك
+            bool: True إذا كان الإصدار الحالي عرضة للثغرات (أو غير معروف)، False خلاف ذلك
         """
-        if current_version == "غير معروف":
+        if not current_version or current_version == "غير معروف":
             return True
         
-        # تحويل الإصدارات إلى قوائم من الأرقام
-        current_parts = [int(part) for part in current_version.split(".")]
-        vulnerable_parts = [int(part) for part in vulnerable_version.split(".")]
-        
-        # إضافة أصفار إذا كانت القوائم غير متساوية في الطول
-        while len(current_parts) < len(vulnerable_parts):
-            current_parts.append(0)
-        while len(vulnerable_parts) < len(current_parts):
-            vulnerable_parts.append(0)
-        
-        # مقارنة الإصدارات
-        for i in range(len(current_parts)):
-            if current_parts[i] < vulnerable_parts[i]:
-                return False
-            elif current_parts[i] > vulnerable_parts[i]:
-                return False
-        
-        # الإصدارات متطابقة
-        return True
\ No newline at end of file
+        return self.vulnerability_db._is_version_affected(current_version, [f"<={vulnerable_version}"])
\ No newline at end of file
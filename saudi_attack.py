@@ -9,11 +9,10 @@ SaudiAttack - أداة إدارة سطح الهجوم وفحص الثغرات ا
 """
 
 import argparse
-import sys
+import asyncio
 import os
 import time
 import json
-import yaml
 import logging
 from datetime import datetime
 from rich.console import Console
@@ -27,7 +26,14 @@ from modules.scanner import VulnerabilityScanner
 from modules.web_scanner import WebServerScanner
 from modules.wordpress_scanner import WordPressScanner
 from modules.joomla_scanner import JoomlaScanner
-from modules.report_generator import ReportGenerator
+from modules.report_generator import ReportGenerator, ReportSink
+from modules.config import Config
+from modules.http_cache import DEFAULT_HTTP_CACHE_FILE
+from modules.incremental import load_previous_results, diff_findings
+from modules.scan_journal import ScanJournal
+from modules.targets import iter_targets, is_multi_target
+from modules.orchestrator import ScanOrchestrator
+from modules.geoip import open_geoip_database
 from modules.utils import banner, check_requirements, setup_logger
 
 # تهيئة الألوان
@@ -37,6 +43,14 @@ console = Console()
 # تعريف الإصدار
 VERSION = "1.0.0"
 
+# فئات الماسحات حسب وضع المسح
+SCANNER_CLASSES = {
+    "general": VulnerabilityScanner,
+    "webserver": WebServerScanner,
+    "wordpress": WordPressScanner,
+    "joomla": JoomlaScanner
+}
+
 def parse_arguments():
     """
     تحليل معطيات سطر الأوامر
@@ -46,7 +60,9 @@ def parse_arguments():
         epilog="المطور: Saudi Linux - SaudiLinux7@gmail.com"
     )
     
-    parser.add_argument("-t", "--target", required=True, help="الهدف (عنوان IP أو اسم النطاق)")
+    parser.add_argument("-t", "--target",
+                        help="الهدف (عنوان IP أو اسم النطاق أو شبكة CIDR أو نطاق عناوين، ويمكن الفصل بفواصل)")
+    parser.add_argument("--targets-file", help="ملف يحتوي على هدف في كل سطر")
     parser.add_argument("-m", "--mode", required=True, choices=["general", "webserver", "wordpress", "joomla"],
                         help="وضع المسح (general, webserver, wordpress, joomla)")
     parser.add_argument("-o", "--output", help="اسم ملف التقرير المخرج")
@@ -54,21 +70,90 @@ def parse_arguments():
     parser.add_argument("-v", "--verbose", action="store_true", help="عرض معلومات تفصيلية أثناء المسح")
     parser.add_argument("--version", action="version", version=f"SaudiAttack v{VERSION}")
     parser.add_argument("--config", help="ملف التكوين (YAML)")
-    parser.add_argument("--threads", type=int, default=5, help="عدد مسارات التنفيذ المتوازية")
-    parser.add_argument("--timeout", type=int, default=30, help="مهلة الاتصال بالثواني")
+    parser.add_argument("--threads", type=int, help="عدد مسارات التنفيذ المتوازية (افتراضيًا: من ملف التكوين)")
+    parser.add_argument("--timeout", type=int, help="مهلة الاتصال بالثواني (افتراضيًا: من ملف التكوين)")
+    parser.add_argument("--fast-discovery", action="store_true",
+                        help="اكتشاف المنافذ المفتوحة بماسح TCP غير متزامن قبل تشغيل nmap")
+    parser.add_argument("--max-hosts", type=int, default=4,
+                        help="الحد الأقصى لعدد المضيفين الممسوحين في الوقت نفسه عند تعدد الأهداف")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="تشغيل المسح في حلقة asyncio مع تداخل المراحل المستقلة")
+    parser.add_argument("--rate-limit", type=float,
+                        help="الحد الأقصى للطلبات في الثانية لكل مضيف (افتراضيًا: من ملف التكوين)")
+    parser.add_argument("--plugin-wordlist", help="ملف قائمة كلمات لتخمين إضافات ووردبريس")
+    parser.add_argument("--theme-wordlist", help="ملف قائمة كلمات لتخمين قوالب ووردبريس")
+    parser.add_argument("--http-cache", nargs="?", const=DEFAULT_HTTP_CACHE_FILE, metavar="PATH",
+                        help="إعادة استخدام الاستجابات غير المتغيرة من المسح السابق عبر الطلبات الشرطية (ETag / Last-Modified)")
+    parser.add_argument("--since", metavar="PREVIOUS_RESULTS",
+                        help="مسح تزايدي: إعادة المراحل التي تغيرت مدخلاتها فقط منذ نتائج JSON سابقة وإظهار الفروقات")
+    parser.add_argument("--crawl-depth", type=int,
+                        help="أقصى عمق للزحف إلى صفحات الموقع (افتراضيًا: من ملف التكوين)")
+    parser.add_argument("--crawl-pages", type=int,
+                        help="الحد الأقصى لعدد الصفحات المزحوف إليها لكل منفذ ويب (0 لتعطيل الزحف)")
+    parser.add_argument("--geoip-db", metavar="PATH",
+                        help="قاعدة بيانات الموقع الجغرافي و ASN المحلية (ملف CSV لنطاقات العناوين أو mmdb)")
+    parser.add_argument("--no-remote-geoip", action="store_true",
+                        help="عدم استخدام ipinfo.io لتحديد الموقع الجغرافي (للأجهزة المعزولة عن الإنترنت)")
+    parser.add_argument("--nse-map", metavar="PATH",
+                        help="ملف JSON يربط الخدمات المكتشفة بنصوص NSE الخاصة بها (افتراضيًا: الملف المضمن)")
+    parser.add_argument("--resume", metavar="JOURNAL",
+                        help="استئناف مسح منقطع من سجل التقدم: تخطي المراحل والأهداف المكتملة")
+    parser.add_argument("--journal", metavar="PATH",
+                        help="تسجيل تقدم المسح في الملف المحدد لاستئنافه لاحقًا بـ --resume (افتراضيًا عند تعدد الأهداف: journal.jsonl في دليل التقارير)")
+    
+    args = parser.parse_args()
+    if not args.target and not args.targets_file:
+        parser.error("يجب تحديد --target أو --targets-file")
     
-    return parser.parse_args()
+    return args
 
-def load_config(config_file):
+def run_multi_target_scan(args, ports, logger, config, previous_results=None):
     """
-    تحميل إعدادات التكوين من ملف YAML
+    مسح عدة أهداف بالتوازي وكتابة تقرير كل هدف فور اكتماله
     """
+    output_dir = args.output if args.output else f"reports_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    sink = ReportSink(output_dir, logger=logger)
+    journal = ScanJournal(args.resume or args.journal or os.path.join(output_dir, "journal.jsonl"))
+    orchestrator = ScanOrchestrator(SCANNER_CLASSES[args.mode], ports, args.threads, args.timeout,
+                                    logger, config, max_workers=args.max_hosts,
+                                    previous=previous_results,
+                                    journal=journal)
+    
+    console.print(Panel(f"[bold green]بدء المسح متعدد الأهداف (الحد الأقصى للمضيفين المتزامنين: {args.max_hosts})[/bold green]"))
+    console.print(f"[bold blue]الوضع: {args.mode}[/bold blue]")
+    console.print(f"[bold blue]المنافذ: {args.ports}[/bold blue]")
+    console.print(f"[bold blue]دليل التقارير: {output_dir}[/bold blue]")
+    console.print(f"[bold blue]سجل التقدم: {journal.path}[/bold blue]")
+    
+    start_time = time.time()
+    
+    def on_result(target, results, error):
+        scan_info = {
+            "target": target,
+            "mode": args.mode,
+            "ports": ports,
+            "scanner_version": VERSION
+        }
+        sink.write(target, results, scan_info, error)
+    
     try:
-        with open(config_file, 'r') as file:
-            return yaml.safe_load(file)
-    except Exception as e:
-        console.print(f"[bold red]خطأ في تحميل ملف التكوين: {str(e)}[/bold red]")
-        sys.exit(1)
+        if args.use_async:
+            stats = asyncio.run(orchestrator.run_async(iter_targets(args.target, args.targets_file), on_result))
+        else:
+            stats = orchestrator.run(iter_targets(args.target, args.targets_file), on_result)
+    except KeyboardInterrupt:
+        console.print("\n[bold yellow]تم إيقاف المسح بواسطة المستخدم[/bold yellow]")
+        console.print(f"[bold yellow]لاستئناف المسح: --resume {journal.path}[/bold yellow]")
+        return
+    finally:
+        journal.close()
+    
+    elapsed_time = time.time() - start_time
+    console.print(f"\n[bold]الأهداف المكتملة: {stats['completed']} - الأهداف الفاشلة: {stats['failed']}"
+                  f" - الأهداف المتخطاة: {stats['skipped']}[/bold]")
+    console.print(f"[bold]فهرس التقارير: {sink.index_file}[/bold]")
+    console.print(f"\n[bold blue]الوقت المستغرق: {elapsed_time:.2f} ثانية[/bold blue]")
+    console.print("\n[bold green]تم الانتهاء من المسح[/bold green]")
 
 def main():
     """
@@ -87,17 +172,72 @@ def main():
     log_file = f"saudi_attack_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
     logger = setup_logger(args.verbose, log_file)
     
-    # تحميل التكوين إذا تم تحديده
-    config = {}
-    if args.config:
-        config = load_config(args.config)
+    # تحميل التكوين (الإعدادات الافتراضية مدمجة مع ملف المستخدم إن وجد)
+    config = Config(args.config)
     
-    # تحديد اسم ملف التقرير
-    output_file = args.output if args.output else f"report_{args.target.replace('.', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+    # معطيات سطر الأوامر لها الأولوية على ملف التكوين
+    if args.threads is not None:
+        config.set("general", "threads", args.threads)
+    if args.timeout is not None:
+        config.set("general", "timeout", args.timeout)
+    args.threads = config.get_threads()
+    args.timeout = config.get_timeout()
+    if args.fast_discovery:
+        config.set("scanning", "fast_discovery", True)
+    if args.rate_limit is not None:
+        config.set("web", "rate_limit", args.rate_limit)
+    if args.plugin_wordlist:
+        config.set("wordpress", "plugin_wordlist", args.plugin_wordlist)
+    if args.theme_wordlist:
+        config.set("wordpress", "theme_wordlist", args.theme_wordlist)
+    if args.http_cache:
+        config.set("web", "http_cache", args.http_cache)
+    if args.crawl_depth is not None:
+        config.set("web", "crawl_max_depth", args.crawl_depth)
+    if args.crawl_pages is not None:
+        config.set("web", "crawl_max_pages", args.crawl_pages)
+    if args.geoip_db:
+        config.set("scanning", "geoip_database", args.geoip_db)
+    if args.no_remote_geoip:
+        config.set("scanning", "geoip_remote", False)
+    if args.nse_map:
+        config.set("scanning", "nse_service_scripts", args.nse_map)
+    
+    # فتح قاعدة بيانات الموقع الجغرافي مرة واحدة قبل المسح (تشترك فيها جميع الماسحات)،
+    # حتى لا يفشل كل هدف على حدة إذا كان الملف مفقودًا أو غير صالح
+    geoip_database = config.get("scanning", "geoip_database")
+    if geoip_database:
+        try:
+            open_geoip_database(geoip_database)
+        except Exception as e:
+            logger.error(f"تعذر فتح قاعدة بيانات الموقع الجغرافي {geoip_database}: {str(e)}")
+            console.print(f"[bold red]تعذر فتح قاعدة بيانات الموقع الجغرافي {geoip_database}: {str(e)}[/bold red]")
+            return
     
     # تحويل المنافذ إلى قائمة
     ports = [int(port.strip()) for port in args.ports.split(',')]
     
+    # نتائج المسح السابق (المسح التزايدي)
+    previous_results = None
+    if args.since:
+        try:
+            previous_results = load_previous_results(args.since)
+        except (OSError, ValueError) as e:
+            logger.error(f"تعذر تحميل النتائج السابقة من {args.since}: {str(e)}")
+            console.print(f"[bold red]تعذر تحميل النتائج السابقة من {args.since}: {str(e)}[/bold red]")
+            return
+        if not previous_results:
+            logger.warning(f"لا توجد نتائج JSON سابقة في {args.since}. سيتم تنفيذ مسح كامل.")
+            console.print(f"[bold yellow]لا توجد نتائج JSON سابقة في {args.since}. سيتم تنفيذ مسح كامل.[/bold yellow]")
+    
+    # المسح متعدد الأهداف (ملف أهداف أو شبكة CIDR أو نطاق عناوين)
+    if args.targets_file or is_multi_target(args.target):
+        run_multi_target_scan(args, ports, logger, config, previous_results)
+        return
+    
+    # تحديد اسم ملف التقرير
+    output_file = args.output if args.output else f"report_{args.target.replace('.', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+    
     # بدء المسح
     start_time = time.time()
     console.print(Panel(f"[bold green]بدء المسح على الهدف: {args.target}[/bold green]"))
@@ -105,42 +245,57 @@ def main():
     console.print(f"[bold blue]المنافذ: {args.ports}[/bold blue]")
     console.print(f"[bold blue]ملف التقرير: {output_file}[/bold blue]")
     
-    # إنشاء كائن مولد التقارير
-    report_generator = ReportGenerator(output_file)
+    # سجل تقدم المسح (يُستعاد منه ما اكتمل من مراحل عند الاستئناف)، فقط عند طلبه صراحة
+    journal = None
+    if args.resume or args.journal:
+        journal = ScanJournal(args.resume or args.journal)
+        console.print(f"[bold blue]سجل التقدم: {journal.path}[/bold blue]")
+    
+    # نتائج المسح السابق للهدف (المسح التزايدي)
+    previous = None
+    if previous_results is not None:
+        previous = previous_results.get(args.target)
+        if previous is None and len(previous_results) == 1:
+            previous = next(iter(previous_results.values()))
+        if previous is None:
+            console.print(f"[bold yellow]لا توجد نتائج سابقة للهدف {args.target} في {args.since}. سيتم تنفيذ مسح كامل.[/bold yellow]")
     
     # تنفيذ المسح حسب الوضع المحدد
     results = {}
+    scanner = None
     with Progress() as progress:
         task = progress.add_task(f"[cyan]جاري المسح...", total=100)
         
         try:
-            if args.mode == "general":
-                scanner = VulnerabilityScanner(args.target, ports, args.threads, args.timeout, logger)
-                results = scanner.scan()
-                progress.update(task, completed=100)
-                
-            elif args.mode == "webserver":
-                scanner = WebServerScanner(args.target, ports, args.threads, args.timeout, logger)
-                results = scanner.scan()
-                progress.update(task, completed=100)
-                
-            elif args.mode == "wordpress":
-                scanner = WordPressScanner(args.target, ports, args.threads, args.timeout, logger)
-                results = scanner.scan()
-                progress.update(task, completed=100)
-                
-            elif args.mode == "joomla":
-                scanner = JoomlaScanner(args.target, ports, args.threads, args.timeout, logger)
-                results = scanner.scan()
-                progress.update(task, completed=100)
+            scanner = SCANNER_CLASSES[args.mode](args.target, ports, args.threads, args.timeout, logger, config)
+            scanner.use_previous_results(previous)
+            scanner.use_journal(journal)
+            results = asyncio.run(scanner.scan_async()) if args.use_async else scanner.scan()
+            progress.update(task, completed=100)
+            
+            if journal is not None:
+                journal.mark_completed(args.target)
         
         except KeyboardInterrupt:
             console.print("\n[bold yellow]تم إيقاف المسح بواسطة المستخدم[/bold yellow]")
+            if journal is not None:
+                console.print(f"[bold yellow]لاستئناف المسح: --resume {journal.path}[/bold yellow]")
             progress.update(task, completed=100)
         except Exception as e:
             console.print(f"\n[bold red]حدث خطأ أثناء المسح: {str(e)}[/bold red]")
+            if journal is not None:
+                console.print(f"[bold yellow]لاستئناف المسح: --resume {journal.path}[/bold yellow]")
             logger.error(f"حدث خطأ أثناء المسح: {str(e)}")
             progress.update(task, completed=100)
+        finally:
+            if scanner is not None:
+                scanner.close()
+            if journal is not None:
+                journal.close()
+    
+    # الفروقات مقارنة بالمسح السابق
+    if previous is not None and results:
+        results["delta"] = diff_findings(previous, results)
     
     # حساب الوقت المستغرق
     elapsed_time = time.time() - start_time
@@ -156,10 +311,16 @@ def main():
         "scanner_version": VERSION
     }
     
-    # إنشاء التقرير
+    # إنشاء التقرير مع ملف JSON للنتائج الكاملة يصلح مدخلاً لـ --since في المسح التالي
     if results:
-        report_generator.generate(results, scan_info)
-        console.print(f"\n[bold green]تم إنشاء التقرير بنجاح: {output_file}[/bold green]")
+        results["target"] = args.target
+        results["scan_info"] = scan_info
+        format_type = os.path.splitext(output_file)[1].lstrip(".").lower() or "html"
+        report_path, results_path = ReportGenerator(results, output_file, logger).generate_with_results(format_type)
+        if report_path:
+            console.print(f"\n[bold green]تم إنشاء التقرير بنجاح: {report_path}[/bold green]")
+        if results_path and results_path != report_path:
+            console.print(f"[bold green]ملف النتائج (لـ --since): {results_path}[/bold green]")
     else:
         console.print("\n[bold yellow]لم يتم العثور على نتائج للمسح[/bold yellow]")
     
@@ -176,6 +337,13 @@ def main():
         console.print(f"ثغرات متوسطة: [bold yellow]{medium_count}[/bold yellow]")
         console.print(f"ثغرات منخفضة: [bold green]{low_count}[/bold green]")
     
+    if results.get("delta"):
+        delta = results["delta"]
+        console.print("\n[bold]الفروقات منذ المسح السابق:[/bold]")
+        console.print(f"ثغرات جديدة: [bold red]{len(delta['new'])}[/bold red]")
+        console.print(f"ثغرات تم حلها: [bold green]{len(delta['resolved'])}[/bold green]")
+        console.print(f"ثغرات دون تغيير: {len(delta['unchanged'])}")
+    
     console.print(f"\n[bold blue]الوقت المستغرق: {elapsed_time:.2f} ثانية[/bold blue]")
     console.print("\n[bold green]تم الانتهاء من المسح[/bold green]")
 
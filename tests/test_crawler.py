@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import os
+import sys
+import threading
+from types import SimpleNamespace
+
+import requests
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# استيراد وحدة الزاحف
+from modules.crawler import Crawler
+from modules.parsed_page import ParsedPage
+from modules.probe_scheduler import ProbeScheduler
+
+
+def make_response(url, status_code, body="", content_type="text/html"):
+    """إنشاء استجابة حقيقية بمحتوى معروف"""
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response._content = body.encode("utf-8")
+    response._content_consumed = True
+    response.encoding = "utf-8"
+    response.headers["Content-Type"] = content_type
+    return response
+
+
+class FakeHttp:
+    """عميل HTTP وهمي يعيد الصفحات حسب المسار"""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+        self.lock = threading.Lock()
+        self.session = SimpleNamespace(headers={"User-Agent": "SaudiAttack"})
+
+    def get(self, url, **kwargs):
+        with self.lock:
+            self.calls.append(url)
+        path = url.split("example.com", 1)[1]
+        if path not in self.pages:
+            return make_response(url, 404, "not found")
+        body = self.pages[path]
+        content_type = "text/plain" if path.endswith((".txt", ".xml")) else "text/html"
+        return make_response(url, 200, body, content_type)
+
+    def page(self, response):
+        return ParsedPage.from_response(response)
+
+
+def link_page(*hrefs, extra=""):
+    """صفحة HTML تحتوي على الروابط المحددة"""
+    return "<html><body>" + "".join(f'<a href="{href}">x</a>' for href in hrefs) + extra + "</body></html>"
+
+
+class TestCrawler:
+    """اختبارات لوحدة الزاحف بالعرض أولاً"""
+
+    def test_breadth_first_with_depth_limit(self):
+        """اختبار الزحف بالعرض أولاً مع احترام حد العمق والبقاء على المضيف نفسه"""
+        http = FakeHttp({
+            "/": link_page("/a", "/b", "https://other.com/x", "/logo.png"),
+            "/a": link_page("/a/deep", "/b"),
+            "/b": link_page("/"),
+            "/a/deep": link_page("/a/deeper"),
+            "/a/deeper": link_page(),
+        })
+        crawler = Crawler(http, ProbeScheduler(width=4), max_depth=2, max_pages=50)
+
+        visited = []
+        fetched = crawler.crawl("http://example.com/", lambda url, page: visited.append(url))
+
+        assert visited == [
+            "http://example.com/", "http://example.com/a", "http://example.com/b", "http://example.com/a/deep"
+        ]
+        assert fetched == 4
+        assert not any("other.com" in url or url.endswith(".png") for url in http.calls)
+
+    def test_page_budget(self):
+        """اختبار التوقف عند بلوغ الحد الأقصى لعدد الصفحات"""
+        http = FakeHttp({"/": link_page(*[f"/p{i}" for i in range(100)])})
+        http.pages.update({f"/p{i}": link_page() for i in range(100)})
+        crawler = Crawler(http, ProbeScheduler(width=4), max_depth=3, max_pages=10, max_frontier=20)
+
+        visited = []
+        crawler.crawl("http://example.com/", lambda url, page: visited.append(url))
+
+        assert len(visited) == 10
+        assert len([url for url in http.calls if "/p" in url]) == 9
+
+    def test_robots_and_sitemap_seeding(self):
+        """اختبار إضافة الروابط من robots.txt و sitemap.xml إلى الواجهة"""
+        http = FakeHttp({
+            "/": link_page(),
+            "/robots.txt": "User-agent: *\nDisallow: /private/\nDisallow: /*.bak$\nSitemap: http://example.com/sitemap.xml\n",
+            "/sitemap.xml": "<urlset><url><loc>http://example.com/news</loc></url></urlset>",
+            "/private/": link_page(),
+            "/news": link_page(),
+        })
+
+        visited = []
+        Crawler(http, ProbeScheduler(width=4)).crawl("http://example.com/", lambda url, page: visited.append(url))
+        assert sorted(visited) == ["http://example.com/", "http://example.com/news", "http://example.com/private/"]
+
+        visited = []
+        Crawler(http, ProbeScheduler(width=4), respect_robots=True).crawl(
+            "http://example.com/", lambda url, page: visited.append(url)
+        )
+        assert sorted(visited) == ["http://example.com/", "http://example.com/news"]
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import os
+import sys
+import time
+import socket
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from unittest.mock import patch
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# استيراد وحدة تحليل أسماء النطاقات
+from modules import dns_resolver
+from modules.dns_resolver import DnsResolver
+from modules.http_client import HttpClient
+
+
+def fake_getaddrinfo(calls, addresses):
+    """getaddrinfo مزيف يسجل الاستدعاءات ويعيد عناوين ثابتة لكل اسم"""
+    real_getaddrinfo = socket.getaddrinfo
+
+    def getaddrinfo(host, port, *args, proto=0, **kwargs):
+        if host not in addresses and host[0].isdigit():
+            return real_getaddrinfo(host, port, *args, **kwargs)
+        calls.append(host)
+        time.sleep(0.02)
+        if host not in addresses:
+            raise socket.gaierror("Name or service not known")
+        return [
+            (socket.AF_INET6 if ":" in ip else socket.AF_INET, socket.SOCK_STREAM, proto, "", (ip, 0))
+            for ip in addresses[host]
+        ]
+    return getaddrinfo
+
+
+@pytest.fixture(autouse=True)
+def without_dnspython():
+    """استخدام getaddrinfo دائمًا في الاختبارات"""
+    with patch.object(dns_resolver, "dns", None):
+        yield
+
+
+class TestDnsResolver:
+    """اختبارات لوحدة تحليل أسماء النطاقات"""
+
+    def test_results_are_cached_until_ttl_expires(self):
+        """اختبار تحليل الاسم مرة واحدة خلال مدة الصلاحية وإعادة تحليله بعدها"""
+        calls = []
+        resolver = DnsResolver(default_ttl=0.2, negative_ttl=0.2)
+        with patch.object(dns_resolver.socket, "getaddrinfo", fake_getaddrinfo(calls, {"example.com": ["93.184.216.34"]})):
+            assert resolver.resolve_one("example.com") == "93.184.216.34"
+            assert resolver.resolve_one("EXAMPLE.com.") == "93.184.216.34"
+            assert resolver.resolve("missing.example") == []
+            assert resolver.resolve("missing.example") == []
+            assert calls == ["example.com", "missing.example"]
+
+            time.sleep(0.25)
+            resolver.resolve("example.com")
+            assert calls == ["example.com", "missing.example", "example.com"]
+
+    def test_ipv6_records_and_ip_literals(self):
+        """اختبار إرجاع سجلات AAAA وتفضيل IPv4 للاتصال وعدم تحليل العناوين"""
+        calls = []
+        addresses = {"dual.example": ["2606:2800:220:1::1", "93.184.216.34"], "v6.example": ["2606:2800:220:1::1"]}
+        resolver = DnsResolver()
+        with patch.object(dns_resolver.socket, "getaddrinfo", fake_getaddrinfo(calls, addresses)):
+            assert resolver.resolve("dual.example") == [
+                {"type": "AAAA", "ip": "2606:2800:220:1::1"}, {"type": "A", "ip": "93.184.216.34"}
+            ]
+            assert resolver.resolve_one("dual.example") == "93.184.216.34"
+            assert resolver.resolve_one("v6.example") == "2606:2800:220:1::1"
+            assert resolver.resolve_one("[::1]") == "::1"
+            assert resolver.resolve_one("10.0.0.1") == "10.0.0.1"
+        assert "10.0.0.1" not in calls
+
+    def test_resolve_many_deduplicates_concurrent_lookups(self):
+        """اختبار التحليل المجمع بالتوازي مع تحليل كل اسم مرة واحدة"""
+        calls = []
+        addresses = {f"host{i}.example": [f"10.0.0.{i}"] for i in range(10)}
+        resolver = DnsResolver()
+        with patch.object(dns_resolver.socket, "getaddrinfo", fake_getaddrinfo(calls, addresses)):
+            start = time.monotonic()
+            results = resolver.resolve_many(list(addresses) * 3, concurrency=10)
+            elapsed = time.monotonic() - start
+
+        assert results["host3.example"] == [{"type": "A", "ip": "10.0.0.3"}]
+        assert sorted(calls) == sorted(addresses)
+        assert elapsed < 0.15
+
+    def test_http_client_connects_to_resolved_address(self):
+        """اختبار اتصال عميل HTTP بالعنوان المحلول مع الإبقاء على ترويسة Host"""
+        hosts = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hosts.append(self.headers["Host"])
+                self.send_response(200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        port = server.server_address[1]
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            calls = []
+            resolver = DnsResolver()
+            client = HttpClient("SaudiAttack/Test", timeout=5, resolver=resolver)
+            with patch.object(dns_resolver.socket, "getaddrinfo", fake_getaddrinfo(calls, {"scanner.test": ["127.0.0.1"]})):
+                assert client.get(f"http://scanner.test:{port}/a").text == "ok"
+                assert client.get(f"http://scanner.test:{port}/b").text == "ok"
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert hosts == [f"scanner.test:{port}"] * 2
+        assert calls == ["scanner.test"]
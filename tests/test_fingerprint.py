@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import os
+import sys
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# استيراد وحدة بصمات التقنيات
+from modules.fingerprint import FingerprintEngine, required_literal
+
+
+class TestFingerprint:
+    """اختبارات لوحدة بصمات التقنيات"""
+
+    def test_required_literal(self):
+        """اختبار استخراج النص الحرفي الإلزامي من النمط"""
+        assert required_literal(r"wp-content") == "wp-content"
+        assert required_literal(r"jquery[.-](?P<version>\d+\.\d+)\.min\.js") == ".min.js"
+        assert required_literal(r"font-awesome/(?P<version>[\d.]+)/") == "font-awesome/"
+        assert required_literal(r"modernizrs?") == "modernizr"
+        assert required_literal(r"Joomla") == "joomla"
+        assert required_literal(r"wordpress|joomla") is None
+        assert required_literal(r"ab\d") is None
+
+    def test_overlapping_literals(self):
+        """اختبار اكتشاف تقنيات تتداخل نصوصها الحرفية في الموضع نفسه"""
+        engine = FingerprintEngine({
+            "WordPress": {"html": ["wp-content"]},
+            "WooCommerce": {"html": ["wp-content/plugins/woocommerce/"]},
+            "Content": {"html": ["content/plugins"]},
+            "Absent": {"html": ["not-on-page"]}
+        })
+
+        detected = engine.analyze(html='<script src="/WP-Content/plugins/woocommerce/x.js"></script>')
+        assert detected == {"WordPress": "", "WooCommerce": "", "Content": ""}
+
+    def test_versions_and_keyed_fields(self):
+        """اختبار استخراج الإصدارات وفحص الترويسات والكوكيز والعلامات الوصفية"""
+        engine = FingerprintEngine.shared()
+
+        detected = engine.analyze(
+            html='<script src="/js/jquery-3.6.0.min.js"></script>',
+            scripts=["/js/jquery-3.6.0.min.js"],
+            headers={"server": "nginx/1.18.0", "X-Powered-By": "PHP/8.1.2"},
+            cookies=["laravel_session"],
+            meta={"generator": ["WordPress 6.2.1"]}
+        )
+
+        assert detected["jQuery"] == "3.6.0"
+        assert detected["Nginx"] == "1.18.0"
+        assert detected["PHP"] == "8.1.2"
+        assert detected["WordPress"] == "6.2.1"
+        assert "Laravel" in detected
+        assert "Joomla" not in detected
+
+    def test_shared_engine_is_loaded_once(self):
+        """اختبار تحميل المحرك المشترك مرة واحدة فقط"""
+        assert FingerprintEngine.shared() is FingerprintEngine.shared()
+
+    def test_scales_with_many_signatures(self):
+        """اختبار أن البصمات غير الموجودة في الصفحة لا يتم التحقق منها"""
+        technologies = {f"Tech{i}": {"html": [f"marker-{i:05d}-(?P<version>[\\d.]+)"]} for i in range(5000)}
+        engine = FingerprintEngine(technologies)
+
+        detected = engine.analyze(html="<p>" + "lorem ipsum " * 1000 + "marker-04242-1.2.3</p>")
+        assert detected == {"Tech4242": "1.2.3"}
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import os
+import sys
+import time
+from unittest.mock import patch, MagicMock
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# استيراد وحدة الموقع الجغرافي
+from modules.geoip import GeoIpDatabase, GeoLocator, IpInfoProvider, MaxMindDatabase, open_geoip_database
+from modules.config import Config
+
+
+RANGES = """start,end,country,region,city,loc,asn,org
+8.8.4.0,8.8.4.255,US,California,Mountain View,"37.4,-122.0",15169,Google LLC
+1.1.1.0,1.1.1.255,AU,,,,13335,Cloudflare
+167772160,184549375,ZZ,,,,,Private
+2001:4860::,2001:4860:ffff:ffff:ffff:ffff:ffff:ffff,US,,,,15169,Google LLC
+"""
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = tmp_path / "geoip.csv"
+    path.write_text(RANGES, encoding="utf-8")
+    return GeoIpDatabase(str(path))
+
+
+class TestGeoIp:
+    """اختبارات لوحدة الموقع الجغرافي"""
+
+    def test_range_lookup(self, database):
+        """اختبار البحث الثنائي في النطاقات غير المرتبة في الملف (IPv4 و IPv6 والأرقام)"""
+        assert len(database) == 4
+        assert database.lookup("8.8.4.4") == {
+            "country": "US", "region": "California", "city": "Mountain View",
+            "loc": "37.4,-122.0", "asn": "15169", "org": "Google LLC"
+        }
+        assert database.lookup("1.1.1.1")["org"] == "Cloudflare"
+        assert database.lookup("10.20.30.40")["country"] == "ZZ"
+        assert database.lookup("2001:4860:4860::8888")["asn"] == "15169"
+        assert database.lookup("8.8.5.1") == {}
+        assert database.lookup("0.0.0.1") == {}
+        assert database.lookup("not-an-ip") == {}
+
+    def test_lookup_is_fast(self, database):
+        """اختبار أن البحث المحلي يكلف ميكروثانيات"""
+        start = time.perf_counter()
+        for _ in range(10000):
+            database.lookup("8.8.4.4")
+        assert (time.perf_counter() - start) / 10000 < 0.0005
+
+    def test_local_database_first_and_remote_optional(self, tmp_path, database):
+        """اختبار استخدام القاعدة المحلية أولاً وعدم الاتصال بالشبكة عند تعطيل المزود البعيد"""
+        config = Config()
+        config.set("scanning", "geoip_database", database.path)
+        config.set("scanning", "geoip_remote", False)
+        locator = GeoLocator.from_config(config)
+
+        with patch("modules.geoip.requests.get") as mock_get:
+            assert locator.lookup("1.1.1.1")["country"] == "AU"
+            assert locator.lookup("1.1.1.1")["city"] == "Unknown"
+            assert locator.lookup("9.9.9.9") == {}
+            mock_get.assert_not_called()
+
+    def test_mmdb_reader_is_shared_per_path(self, tmp_path):
+        """اختبار فتح قارئ mmdb واحد لجميع الماسحات بدلاً من قارئ لكل هدف"""
+        config = Config()
+        config.set("scanning", "geoip_database", str(tmp_path / "city.mmdb"))
+        config.set("scanning", "geoip_remote", False)
+
+        with patch("modules.geoip.maxminddb") as mock_maxminddb, \
+                patch.dict(MaxMindDatabase._instances, clear=True):
+            first = GeoLocator.from_config(config).providers[0]
+            second = GeoLocator.from_config(config).providers[0]
+            assert first is second
+            mock_maxminddb.open_database.assert_called_once()
+
+    def test_missing_database_fails_once(self, tmp_path):
+        """اختبار أن فتح قاعدة بيانات مفقودة يفشل عند التحقق منها قبل المسح"""
+        with pytest.raises(FileNotFoundError):
+            open_geoip_database(str(tmp_path / "missing.csv"))
+        with patch("modules.geoip.maxminddb", None), pytest.raises(ImportError):
+            open_geoip_database(str(tmp_path / "missing.mmdb"))
+
+    def test_remote_provider_splits_asn(self):
+        """اختبار فصل رقم ASN عن اسم المؤسسة في استجابة ipinfo.io"""
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"ip": "8.8.8.8", "country": "US", "org": "AS15169 Google LLC"}
+        with patch("modules.geoip.requests.get", return_value=response):
+            info = IpInfoProvider().lookup("8.8.8.8")
+        assert info == {"country": "US", "asn": "15169", "org": "Google LLC"}
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import os
+import sys
+import io
+from unittest.mock import patch
+
+import requests
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# استيراد وحدة ذاكرة HTTP الدائمة
+from modules.http_cache import HttpCache
+from modules.http_client import HttpClient
+
+
+README = b"=== Contact Form 7 ===\nStable tag: 5.8.4\n\n== Changelog ==\n"
+
+
+class FakeServer:
+    """خادم وهمي يدعم الطلبات الشرطية بـ ETag"""
+
+    def __init__(self, etag='"v1"', body=README):
+        self.etag = etag
+        self.body = body
+        self.requests = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.requests.append(dict(headers or {}))
+        response = requests.Response()
+        response.url = url
+        response.encoding = "utf-8"
+        if headers and headers.get("If-None-Match") == self.etag:
+            response.status_code = 304
+            response.raw = io.BytesIO(b"")
+        else:
+            response.status_code = 200
+            response.headers["ETag"] = self.etag
+            response.headers["Content-Type"] = "text/plain"
+            response.raw = io.BytesIO(self.body)
+        return response
+
+
+class TestHttpCache:
+    """اختبارات لوحدة ذاكرة HTTP الدائمة"""
+
+    def _scan(self, path, server):
+        """محاكاة مسح واحد: عميل جديد وذاكرة مفتوحة من الملف نفسه"""
+        client = HttpClient("SaudiAttack/Test", disk_cache=HttpCache(path))
+        extracted = []
+
+        def compute(response):
+            extracted.append(response.url)
+            return "5.8.4" if b"Stable tag: 5.8.4" in response.content else None
+
+        with patch.object(client.session, "request", side_effect=server.request):
+            response = client.get("http://example.com/wp-content/plugins/contact-form-7/readme.txt")
+            version = client.fact(response, "version", compute)
+
+        client.disk_cache.close()
+        return response, version, extracted
+
+    def test_revalidation_reuses_body_and_facts(self, tmp_path):
+        """اختبار إرسال If-None-Match في المسح التالي وإعادة استخدام المحتوى والإصدار عند 304"""
+        path = str(tmp_path / "http_cache.sqlite")
+        server = FakeServer()
+
+        response, version, extracted = self._scan(path, server)
+        assert version == "5.8.4"
+        assert len(extracted) == 1
+        assert "If-None-Match" not in server.requests[0]
+
+        response, version, extracted = self._scan(path, server)
+        assert server.requests[1]["If-None-Match"] == '"v1"'
+        assert response.status_code == 200
+        assert response.content == README
+        assert response.revalidated
+        assert version == "5.8.4"
+        assert extracted == []
+
+    def test_changed_resource_is_refetched(self, tmp_path):
+        """اختبار تنزيل المحتوى الجديد وإعادة الاستخراج عند تغير الملف"""
+        path = str(tmp_path / "http_cache.sqlite")
+
+        self._scan(path, FakeServer())
+        response, version, extracted = self._scan(path, FakeServer(etag='"v2"', body=b"Stable tag: 5.9\n"))
+
+        assert version is None
+        assert len(extracted) == 1
+        assert HttpCache(path).get(response.url)["etag"] == '"v2"'
+
+    def test_responses_without_validators_are_not_stored(self, tmp_path):
+        """اختبار عدم تخزين الاستجابات التي لا تحمل ETag أو Last-Modified"""
+        cache = HttpCache(str(tmp_path / "http_cache.sqlite"))
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"dynamic"
+
+        assert not cache.put("http://example.com/", response)
+        assert cache.get("http://example.com/") is None
+
+    def test_partial_bodies_are_not_stored(self, tmp_path):
+        """اختبار عدم تخزين المحتوى المقطوع بنمط إيقاف حتى لا يُعاد لطلب لاحق بدون نمط"""
+        path = str(tmp_path / "http_cache.sqlite")
+        url = "http://example.com/wp-content/plugins/contact-form-7/readme.txt"
+        server = FakeServer(body=README + b"* fix\n" * 10000)
+
+        client = HttpClient("SaudiAttack/Test", disk_cache=HttpCache(path))
+        with patch.object(client.session, "request", side_effect=server.request):
+            response = client.get(url, stop_pattern=r"Stable tag:\s*[\d.]+[^\d.]")
+        assert response.truncated
+        assert client.disk_cache.get(url) is None
+        client.disk_cache.close()
+
+        response, _, _ = self._scan(path, server)
+        assert "If-None-Match" not in server.requests[1]
+        assert response.content == server.body
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import os
+import sys
+import io
+import asyncio
+from unittest.mock import patch, MagicMock
+
+import requests
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# استيراد وحدة عميل HTTP
+from modules.http_client import HttpClient
+from modules.config import Config
+
+
+class TestHttpClient:
+    """اختبارات لوحدة عميل HTTP المشترك"""
+
+    def test_session_configuration(self):
+        """اختبار إعداد الجلسة ومجمع الاتصالات"""
+        client = HttpClient("SaudiAttack/Test", timeout=7, pool_size=12)
+
+        assert client.session.headers["User-Agent"] == "SaudiAttack/Test"
+        assert client.session.verify is False
+        adapter = client.session.get_adapter("https://example.com")
+        assert adapter._pool_maxsize == 12
+        assert client.session.get_adapter("http://example.com") is adapter
+
+    def test_from_config(self):
+        """اختبار إنشاء العميل من التكوين"""
+        config = Config()
+        config.set("general", "user_agent", "Custom/1.0")
+
+        client = HttpClient.from_config(config, timeout=5, pool_size=8)
+        assert client.session.headers["User-Agent"] == "Custom/1.0"
+        assert client.timeout == 5
+        assert client.pool_size == 8
+
+        config.set("web", "pool_size", 32)
+        assert HttpClient.from_config(config, pool_size=8).pool_size == 32
+
+    def test_request_uses_default_timeout(self):
+        """اختبار تمرير المهلة الافتراضية وإعادة التوجيه"""
+        client = HttpClient("SaudiAttack/Test", timeout=9)
+
+        with patch.object(client.session, "request") as mock_request:
+            client.get("http://example.com/")
+            mock_request.assert_called_once_with("GET", "http://example.com/", stream=True, timeout=9, allow_redirects=True)
+
+            mock_request.reset_mock()
+            client.get("http://example.com/", allow_redirects=False, timeout=2)
+            mock_request.assert_called_once_with("GET", "http://example.com/", stream=True, timeout=2, allow_redirects=False)
+
+
+    def _response(self, body=b"<html><head><meta name='generator' content='WordPress 6.0'></head></html>"):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        response.encoding = "utf-8"
+        return response
+
+    def test_response_cache_deduplicates_requests(self):
+        """اختبار تنزيل كل عنوان مرة واحدة ومشاركة الصفحة المحللة"""
+        client = HttpClient("SaudiAttack/Test")
+
+        with patch.object(client.session, "request", return_value=self._response()) as mock_request:
+            first = client.get("http://example.com/")
+            second = client.get("http://example.com/")
+            assert first is second
+            assert mock_request.call_count == 1
+            assert client.page(first) is client.page(second)
+            assert client.page(first).meta_generator == "WordPress 6.0"
+
+            # الطلبات ذات المعطيات الإضافية أو طريقة POST لا تخزن مؤقتًا
+            client.get("http://example.com/", headers={"X-Test": "1"})
+            client.post("http://example.com/")
+            client.post("http://example.com/")
+            assert mock_request.call_count == 4
+
+    def test_response_cache_lru_eviction(self):
+        """اختبار إزالة الأقدم استخدامًا عند تجاوز حد الذاكرة"""
+        client = HttpClient("SaudiAttack/Test", cache_max_bytes=10)
+
+        with patch.object(client.session, "request", side_effect=lambda *a, **k: self._response(b"12345")) as mock_request:
+            client.get("http://example.com/a")
+            client.get("http://example.com/b")
+            client.get("http://example.com/a")
+            client.get("http://example.com/c")
+            assert client.cache_bytes == 10
+            assert mock_request.call_count == 3
+
+            # تمت إزالة /b لأنه الأقدم استخدامًا
+            client.get("http://example.com/a")
+            assert mock_request.call_count == 3
+            client.get("http://example.com/b")
+            assert mock_request.call_count == 4
+
+            # الاستجابات الأكبر من الحد لا تخزن
+            mock_request.side_effect = lambda *a, **k: self._response(b"x" * 20)
+            client.get("http://example.com/large")
+            client.get("http://example.com/large")
+            assert mock_request.call_count == 6
+
+    def test_async_requests_share_cache(self):
+        """اختبار الطلبات غير المتزامنة على الجلسة وذاكرة التخزين المؤقت نفسها"""
+        client = HttpClient("SaudiAttack/Test", pool_size=4)
+
+        async def fetch():
+            return await asyncio.gather(*(client.get_async("http://example.com/") for _ in range(3)))
+
+        with patch.object(client.session, "request", side_effect=lambda *a, **k: self._response(b"ok")) as mock_request:
+            responses = asyncio.run(fetch())
+            assert all(response.content == b"ok" for response in responses)
+            assert client.get("http://example.com/").content == b"ok"
+            assert mock_request.call_count <= 3
+
+        client.close()
+        assert client._executor is None
+
+    def _streamed_response(self, body):
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(body)
+        response.encoding = "utf-8"
+        return response
+
+    def test_body_is_capped(self):
+        """اختبار قراءة المحتوى حتى الحد الأقصى فقط"""
+        client = HttpClient("SaudiAttack/Test", max_body_bytes=1000)
+        body = b"x" * 10 * 1024 * 1024
+
+        with patch.object(client.session, "request", side_effect=lambda *a, **k: self._streamed_response(body)) as mock_request:
+            response = client.get("http://example.com/debug.log")
+            assert len(response.content) == 1000
+            assert response.truncated
+            assert mock_request.call_args.kwargs["stream"] is True
+
+            response = client.get("http://example.com/small", max_bytes=0)
+            assert len(response.content) == len(body)
+            assert not response.truncated
+
+    def test_stop_pattern_ends_read_early(self):
+        """اختبار إيقاف القراءة بعد تطابق نمط الإيقاف"""
+        client = HttpClient("SaudiAttack/Test")
+        body = b"=== Plugin ===\nStable tag: 4.2.1\n" + b"changelog\n" * 500000
+
+        with patch.object(client.session, "request", side_effect=lambda *a, **k: self._streamed_response(body)) as mock_request:
+            response = client.get("http://example.com/readme.txt", stop_pattern=r"Stable tag:\s*[\d.]+[^\d.]")
+            assert response.truncated
+            assert len(response.content) < len(body)
+            assert "Stable tag: 4.2.1" in response.text
+
+            # المحتوى الجزئي لا يُخزن مؤقتًا
+            response = client.get("http://example.com/readme.txt")
+            assert len(response.content) == client.max_body_bytes
+            assert mock_request.call_count == 2
+
+    def test_truncated_body_is_not_reused_for_larger_cap(self):
+        """اختبار عدم إعادة محتوى مقطوع بالحد الافتراضي لطلب بحد أكبر"""
+        client = HttpClient("SaudiAttack/Test", max_body_bytes=1000)
+        body = b"x" * 5000
+
+        with patch.object(client.session, "request", side_effect=lambda *a, **k: self._streamed_response(body)) as mock_request:
+            assert len(client.get("http://example.com/big").content) == 1000
+            assert len(client.get("http://example.com/big").content) == 1000
+            assert mock_request.call_count == 1
+
+            response = client.get("http://example.com/big", max_bytes=0)
+            assert len(response.content) == len(body)
+            assert not response.truncated
+            assert mock_request.call_count == 2
+
+            # المحتوى الكامل يكفي لأي طلب لاحق
+            assert len(client.get("http://example.com/big").content) == len(body)
+            assert mock_request.call_count == 2
+
+    def test_explicit_stream_argument(self):
+        """اختبار تمرير stream صراحة من المستدعي"""
+        client = HttpClient("SaudiAttack/Test", timeout=9)
+
+        with patch.object(client.session, "request", side_effect=lambda *a, **k: self._streamed_response(b"ok")) as mock_request:
+            assert client.get("http://example.com/", stream=False).content == b"ok"
+            assert mock_request.call_args.kwargs["stream"] is True
+
+            response = client.get("http://example.com/raw", stream=True)
+            assert mock_request.call_args.kwargs["stream"] is True
+            assert not hasattr(response, "truncated")
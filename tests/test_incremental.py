@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import os
+import sys
+import json
+from unittest.mock import MagicMock
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# استيراد وحدة المسح التزايدي
+from modules.incremental import (
+    load_previous_results, changed_ports, merge_host_data, inventory_signature, diff_findings
+)
+from modules.report_generator import ReportSink
+
+
+PREVIOUS = {
+    "target_info": {"domain": "example.com", "ip": "93.184.216.34"},
+    "services": [
+        {"port": 22, "name": "ssh", "product": "OpenSSH", "version": "8.9"},
+        {"port": 80, "name": "http", "product": "Apache httpd", "version": "2.4.52"},
+    ],
+    "vulnerabilities": [
+        {"port": 80, "service": "http", "vulnerability": "http-vuln-cve2021-41773", "severity": "high"},
+    ],
+    "wordpress_info": {"version": "6.4.1", "plugins": [{"name": "akismet", "version": "5.3"}], "themes": []},
+    "wordpress_vulnerabilities": [
+        {"type": "plugin", "name": "Akismet XSS", "plugin": "akismet", "severity": "medium", "description": "قديم"},
+    ],
+}
+
+
+def nmap_port(name, product, version, state="open"):
+    """بيانات منفذ بصيغة python-nmap"""
+    return {"state": state, "name": name, "product": product, "version": version, "extrainfo": ""}
+
+
+class TestIncremental:
+    """اختبارات لوحدة المسح التزايدي"""
+
+    def test_load_previous_results_formats(self, tmp_path):
+        """اختبار تحميل النتائج من ملف JSON واحد أو JSON Lines أو دليل تقارير"""
+        single = tmp_path / "report.json"
+        single.write_text(json.dumps(PREVIOUS), encoding="utf-8")
+        assert list(load_previous_results(str(single))) == ["example.com"]
+
+        lines = tmp_path / "results.jsonl"
+        lines.write_text("\n".join(json.dumps({"target": t, "open_ports": []}) for t in ("10.0.0.1", "10.0.0.2")))
+        assert sorted(load_previous_results(str(lines))) == ["10.0.0.1", "10.0.0.2"]
+
+        assert list(load_previous_results(str(tmp_path))) == ["example.com"]
+
+    def test_report_directory_is_valid_since_input(self, tmp_path):
+        """اختبار أن مخرجات المسح متعدد الأهداف تصلح مدخلاً لـ --since"""
+        output_dir = tmp_path / "reports"
+        sink = ReportSink(str(output_dir), logger=MagicMock())
+        sink.write("10.0.0.1", dict(PREVIOUS, open_ports=[22, 80]), {"mode": "general"})
+        sink.write("10.0.0.2", None, error=RuntimeError("فشل"))
+
+        for path in (output_dir, output_dir / "index.jsonl"):
+            previous = load_previous_results(str(path))
+            assert list(previous) == ["10.0.0.1"]
+            assert previous["10.0.0.1"]["services"] == PREVIOUS["services"]
+            assert changed_ports(previous["10.0.0.1"], {22: nmap_port("ssh", "OpenSSH", "8.9")}) == []
+
+        # فهرس ملخصات لا يشير إلى نتائج كاملة يُرفض بدلاً من اعتبار كل المنافذ متغيرة
+        summary = tmp_path / "index.jsonl"
+        summary.write_text(json.dumps({"target": "10.0.0.1", "status": "completed", "open_ports": 2}) + "\n")
+        with pytest.raises(ValueError):
+            load_previous_results(str(summary))
+
+    def test_changed_ports_and_merge(self):
+        """اختبار اكتشاف المنافذ الجديدة أو التي تغير إصدار خدمتها فقط"""
+        tcp = {
+            22: nmap_port("ssh", "OpenSSH", "8.9"),
+            80: nmap_port("http", "Apache httpd", "2.4.58"),
+            443: nmap_port("https", "nginx", "1.24"),
+            8080: nmap_port("http-proxy", "", "", state="closed"),
+        }
+        assert changed_ports(PREVIOUS, tcp) == [80, 443]
+
+        rescan = {"tcp": {80: dict(tcp[80], script={"vulners": "VULNERABLE"})}, "osmatch": [{"name": "Linux"}]}
+        merged = merge_host_data({"tcp": tcp}, rescan)
+        assert merged["tcp"][80]["script"] == {"vulners": "VULNERABLE"}
+        assert merged["tcp"][22] == tcp[22]
+        assert merged["osmatch"] == [{"name": "Linux"}]
+
+    def test_inventory_signature_ignores_order(self):
+        """اختبار تطابق بصمة المخزون بغض النظر عن ترتيب المكونات وتغيرها عند تغير الإصدار"""
+        fields = ("version", "plugins", "themes")
+        reordered = {"version": "6.4.1", "themes": [], "plugins": [
+            {"name": "jetpack", "version": "12.0", "url": "/a"}, {"name": "akismet", "version": "5.3"}
+        ]}
+        same = dict(reordered, plugins=list(reversed(reordered["plugins"])))
+        upgraded = dict(reordered, version="6.5")
+
+        assert inventory_signature(reordered, fields) == inventory_signature(same, fields)
+        assert inventory_signature(reordered, fields) != inventory_signature(upgraded, fields)
+
+    def test_diff_findings(self):
+        """اختبار تصنيف الثغرات إلى جديدة وتم حلها ودون تغيير"""
+        current = {
+            "vulnerabilities": [],
+            "wordpress_vulnerabilities": [
+                dict(PREVIOUS["wordpress_vulnerabilities"][0], description="وصف محدث"),
+                {"type": "core", "name": "WordPress 6.4.1 SQLi", "severity": "high"},
+            ],
+        }
+
+        delta = diff_findings(PREVIOUS, current)
+
+        assert [f["name"] for f in delta["new"]] == ["WordPress 6.4.1 SQLi"]
+        assert [f["vulnerability"] for f in delta["resolved"]] == ["http-vuln-cve2021-41773"]
+        assert [(f["section"], f["name"]) for f in delta["unchanged"]] == [("wordpress_vulnerabilities", "Akismet XSS")]
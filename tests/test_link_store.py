@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import os
+import sys
+import time
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# استيراد وحدة تخزين الروابط والنماذج
+from modules.link_store import LinkStore, FormStore, normalize_url, form_signature
+
+
+class TestLinkStore:
+    """اختبارات لوحدة تخزين الروابط والنماذج"""
+
+    def test_normalize_url(self):
+        """اختبار توحيد الروابط"""
+        base = "https://Example.com:443/blog/post.php"
+        assert normalize_url("../about#team", base) == "https://example.com/about"
+        assert normalize_url("comments?id=1", base) == "https://example.com/blog/comments?id=1"
+        assert normalize_url("HTTP://Example.com:8080", base) == "http://example.com:8080/"
+        assert normalize_url("//cdn.example.com/x.js", base) == "https://cdn.example.com/x.js"
+        assert normalize_url("#top", base) is None
+        assert normalize_url("javascript:void(0)", base) is None
+        assert normalize_url("mailto:admin@example.com", base) is None
+
+    def test_link_store_dedup_and_cap(self):
+        """اختبار فحص التكرار والحد الأقصى مع الحفاظ على ترتيب الإضافة"""
+        store = LinkStore(max_links=2)
+
+        assert store.add("https://example.com/a")
+        assert not store.add("https://example.com/a")
+        assert store.add("https://example.com/b")
+        assert not store.add("https://example.com/c")
+
+        assert list(store) == ["https://example.com/a", "https://example.com/b"]
+        assert "https://example.com/a" in store
+        assert store.dropped == 1
+
+    def test_form_store_signature(self):
+        """اختبار اعتبار النماذج ذات التوقيع نفسه مكررة بغض النظر عن ترتيب الحقول"""
+        store = FormStore()
+        login = {"action": "/login", "method": "post", "inputs": [
+            {"name": "user", "type": "text"}, {"name": "pass", "type": "password"}
+        ]}
+        reordered = {"action": "https://example.com/login", "method": "POST", "inputs": [
+            {"name": "pass", "type": "password"}, {"name": "user", "type": "text"}
+        ]}
+        search = {"action": "", "method": "GET", "inputs": [{"name": "q", "type": "search"}]}
+
+        assert form_signature(login, "https://example.com/") == form_signature(reordered, "https://example.com/x")
+        assert store.add(login, "https://example.com/")
+        assert not store.add(reordered, "https://example.com/other")
+        assert store.add(search, "https://example.com/")
+        assert len(store) == 2
+
+    def test_many_links_are_fast(self):
+        """اختبار أن تجميع عدد كبير من الروابط لا يتباطأ تربيعيًا"""
+        links = [normalize_url(f"/page/{i % 20000}", "https://example.com/") for i in range(40000)]
+        store = LinkStore(max_links=0)
+
+        start = time.monotonic()
+        added = [href for href in links if store.add(href)]
+        assert len(added) == 20000
+        assert time.monotonic() - start < 1
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import os
+import sys
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# استيراد وحدة التحليل التدفقي لمخرج nmap
+from modules.nmap_stream import NmapXmlStream
+
+
+NMAP_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE nmaprun>
+<nmaprun scanner="nmap" args="nmap -oX - -p 80,443 -sV 93.184.216.34">
+<scaninfo type="syn" protocol="tcp" numservices="2" services="80,443"/>
+<host starttime="1" endtime="2">
+<status state="up" reason="syn-ack"/>
+<address addr="93.184.216.34" addrtype="ipv4"/>
+<hostnames><hostname name="example.com" type="user"/></hostnames>
+<ports>
+<port protocol="tcp" portid="80"><state state="open" reason="syn-ack"/><service name="http" product="nginx" version="1.18.0" conf="10"><cpe>cpe:/a:igor_sysoev:nginx:1.18.0</cpe></service><script id="http-vuln-cve2017-1001000" output="VULNERABLE: high risk"/></port>
+<port protocol="tcp" portid="443"><state state="closed" reason="reset"/><service name="https" conf="3"/></port>
+</ports>
+<os><osmatch name="Linux 5.4" accuracy="95" line="1"/></os>
+</host>
+<runstats><finished time="2"/></runstats>
+</nmaprun>
+"""
+
+
+class TestNmapXmlStream:
+    """اختبارات لوحدة التحليل التدفقي لمخرج nmap"""
+
+    def test_ports_stream_before_host_completes(self):
+        """اختبار صدور أحداث المنافذ فور اكتمالها وقبل اكتمال المضيف"""
+        stream = NmapXmlStream()
+        events = []
+        for index in range(0, len(NMAP_XML), 37):
+            events.extend(stream.feed(NMAP_XML[index:index + 37]))
+        events.extend(stream.close())
+
+        assert [event[0] for event in events] == ["port", "port", "host"]
+        _, address, port, protocol, port_data = events[0]
+        assert (address, port, protocol) == ("93.184.216.34", 80, "tcp")
+        assert port_data["state"] == "open"
+        assert port_data["product"] == "nginx"
+        assert port_data["cpe"] == "cpe:/a:igor_sysoev:nginx:1.18.0"
+        assert port_data["script"] == {"http-vuln-cve2017-1001000": "VULNERABLE: high risk"}
+        assert "script" not in events[1][4]
+
+        _, address, host_data = events[2]
+        assert host_data["status"]["state"] == "up"
+        assert host_data["hostnames"] == [{"name": "example.com", "type": "user"}]
+        assert host_data["osmatch"][0]["name"] == "Linux 5.4"
+
+    def test_port_event_emitted_mid_stream(self):
+        """اختبار صدور حدث المنفذ قبل وصول بقية المخرج"""
+        stream = NmapXmlStream()
+        cut = NMAP_XML.index(b"</port>") + len(b"</port>")
+        events = stream.feed(NMAP_XML[:cut])
+        assert [(event[0], event[2]) for event in events] == [("port", 80)]
+
+    def test_processed_elements_are_released(self):
+        """اختبار حذف العناصر المعالجة للحفاظ على ثبات الذاكرة"""
+        stream = NmapXmlStream()
+        host = NMAP_XML[NMAP_XML.index(b"<host "):NMAP_XML.index(b"<runstats>")]
+        stream.feed(NMAP_XML[:NMAP_XML.index(b"<host ")])
+        for _ in range(50):
+            stream.feed(host)
+        assert len(stream._root) == 0
+        events = stream.feed(b"</nmaprun>\n") + stream.close()
+        assert events == []
+        assert len(stream._root) == 0
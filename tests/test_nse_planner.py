@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import os
+import sys
+import json
+from unittest.mock import patch, MagicMock
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# استيراد وحدة تخطيط نصوص NSE
+from modules.nse_planner import NseScriptPlanner
+from modules.scanner import VulnerabilityScanner
+
+
+class TestNseScriptPlanner:
+    """اختبارات لوحدة تخطيط نصوص NSE حسب الخدمة"""
+
+    def test_ssh_and_https_skip_unrelated_scripts(self):
+        """اختبار أن مضيفًا بخدمتي SSH و HTTPS فقط لا تُشغل عليه نصوص SMB أو RDP"""
+        planner = NseScriptPlanner.for_path()
+        tcp = {
+            22: {"state": "open", "name": "ssh"},
+            443: {"state": "open", "name": "http", "tunnel": "ssl"},
+            8443: {"state": "open", "name": "https-alt"},
+            445: {"state": "closed", "name": "microsoft-ds"}
+        }
+        groups = planner.plan(tcp)
+
+        assert [group["ports"] for group in groups] == [[22], [443, 8443]]
+        scripts = [script for group in groups for script in group["scripts"]]
+        assert "ssl-heartbleed" in groups[1]["scripts"]
+        assert "http-shellshock" in groups[1]["scripts"]
+        assert not [script for script in scripts if script.startswith(("smb-", "rdp-"))]
+
+    def test_custom_mapping_and_port_filter(self, tmp_path):
+        """اختبار ملف ربط مخصص وتخطيط منافذ محددة فقط"""
+        path = tmp_path / "nse.json"
+        path.write_text(json.dumps({
+            "services": {"smb": ["smb-vuln-ms17-010"], "ssl": ["ssl-heartbleed"]},
+            "aliases": {"microsoft-ds": ["smb"]},
+            "ports": {"smb": [139, 445], "ssl": [993]}
+        }), encoding="utf-8")
+        planner = NseScriptPlanner(str(path))
+        tcp = {
+            445: {"state": "open", "name": "microsoft-ds"},
+            993: {"state": "open", "name": "ssl/imap"},
+            3000: {"state": "open", "name": "unknown"}
+        }
+
+        assert planner.plan(tcp) == [
+            {"scripts": ["smb-vuln-ms17-010"], "ports": [445], "version_light": False},
+            {"scripts": ["ssl-heartbleed"], "ports": [993], "version_light": False}
+        ]
+        assert planner.plan(tcp, ports=[993]) == [{"scripts": ["ssl-heartbleed"], "ports": [993], "version_light": False}]
+        assert planner.plan(tcp, ports=[]) == []
+
+        # خدمة على منفذ غير معتاد لها تحتاج اكتشافًا خفيفًا للإصدارات لتتعرف عليها النصوص
+        assert planner.plan({1445: {"state": "open", "name": "microsoft-ds"}}) == [
+            {"scripts": ["smb-vuln-ms17-010"], "ports": [1445], "version_light": True}
+        ]
+
+    def test_script_groups_skip_version_detection(self):
+        """اختبار أن مجموعات النصوص لا تعيد اكتشاف الإصدارات ونظام التشغيل للمنافذ المكتشفة"""
+        scanner = VulnerabilityScanner("192.0.2.1", [22, 443, 3000], logger=MagicMock())
+        tcp = {
+            22: {"state": "open", "name": "ssh", "product": "OpenSSH"},
+            443: {"state": "open", "name": "http", "tunnel": "ssl"},
+            3000: {"state": "open", "name": "http"}
+        }
+        commands = []
+        findings = {443: {"state": "open", "name": "https", "script": {"ssl-heartbleed": "VULNERABLE: high"}}}
+
+        def run(plan, on_port=None):
+            commands.append(scanner._nmap_command(plan))
+            for port in plan["port_list"]:
+                if port in findings:
+                    on_port(port, findings[port])
+            return {}
+
+        with patch.object(scanner, "_run_nmap_scan", side_effect=run):
+            scanner._run_service_scripts(tcp)
+
+        assert [command[command.index("-p") + 1] for command in commands] == ["22", "443", "3000"]
+        for command in commands:
+            assert "-O" not in command
+            assert "--script" in command
+        assert "-sV" not in commands[0] and "-sV" not in commands[1]
+        assert "--version-light" in commands[2]
+        # بيانات الخدمة من مسح الاكتشاف وليس من اسم المنفذ في مسح النصوص
+        assert scanner.results["vulnerabilities"][0]["service"] == "http"
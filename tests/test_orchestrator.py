@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import os
+import sys
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# استيراد وحدة تنسيق المسح
+from modules.orchestrator import ScanOrchestrator
+from modules.scan_journal import ScanJournal
+
+
+class FakeScanner:
+    """ماسح مزيف يسجل عدد عمليات المسح المتزامنة"""
+
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+    closed = []
+
+    def __init__(self, target, ports, threads, timeout, logger, config):
+        self.target = target
+        if target == "bad":
+            raise ValueError("لا يمكن تحليل النطاق")
+
+    def scan(self):
+        with FakeScanner.lock:
+            FakeScanner.active += 1
+            FakeScanner.max_active = max(FakeScanner.max_active, FakeScanner.active)
+        time.sleep(0.02)
+        with FakeScanner.lock:
+            FakeScanner.active -= 1
+        return {"target_info": {"ip": self.target}}
+
+    async def scan_async(self):
+        with FakeScanner.lock:
+            FakeScanner.active += 1
+            FakeScanner.max_active = max(FakeScanner.max_active, FakeScanner.active)
+        await asyncio.sleep(0.02)
+        with FakeScanner.lock:
+            FakeScanner.active -= 1
+        return {"target_info": {"ip": self.target}}
+
+    def close(self):
+        with FakeScanner.lock:
+            FakeScanner.closed.append(self.target)
+
+
+class TestScanOrchestrator:
+    """اختبارات لوحدة تنسيق المسح"""
+
+    def test_run_streams_results_with_bounded_concurrency(self):
+        """اختبار تمرير النتائج مع الالتزام بالحد الأقصى للمضيفين المتزامنين"""
+        FakeScanner.max_active = 0
+        FakeScanner.closed = []
+        received = []
+        orchestrator = ScanOrchestrator(FakeScanner, [80], logger=MagicMock(), max_workers=3)
+
+        targets = (f"10.0.0.{i}" for i in range(1, 11))
+        stats = orchestrator.run(targets, lambda target, results, error: received.append((target, results, error)))
+
+        assert stats == {"completed": 10, "failed": 0, "skipped": 0}
+        assert len(received) == 10
+        assert FakeScanner.max_active <= 3
+        assert all(results["target_info"]["ip"] == target for target, results, _ in received)
+        # كل ماسح يُغلق بعد انتهاء مسح هدفه
+        assert sorted(FakeScanner.closed) == sorted(f"10.0.0.{i}" for i in range(1, 11))
+
+    def test_run_reports_failures(self):
+        """اختبار تسجيل الأهداف الفاشلة دون إيقاف المسح"""
+        received = []
+        orchestrator = ScanOrchestrator(FakeScanner, [80], logger=MagicMock(), max_workers=2)
+
+        stats = orchestrator.run(["good", "bad"], lambda target, results, error: received.append((target, results, error)))
+
+        assert stats == {"completed": 1, "failed": 1, "skipped": 0}
+        failed = [item for item in received if item[0] == "bad"][0]
+        assert failed[1] is None
+        assert isinstance(failed[2], ValueError)
+
+    def test_run_async(self):
+        """اختبار المسح غير المتزامن مع الالتزام بالحد الأقصى وتسجيل الأهداف الفاشلة"""
+        FakeScanner.max_active = 0
+        FakeScanner.closed = []
+        received = []
+        orchestrator = ScanOrchestrator(FakeScanner, [80], logger=MagicMock(), max_workers=3)
+
+        targets = iter([f"10.0.0.{i}" for i in range(1, 9)] + ["bad"])
+        stats = asyncio.run(orchestrator.run_async(targets, lambda target, results, error: received.append((target, results, error))))
+
+        assert stats == {"completed": 8, "failed": 1, "skipped": 0}
+        assert FakeScanner.max_active <= 3
+        assert len(FakeScanner.closed) == 8
+        assert all(results["target_info"]["ip"] == target for target, results, error in received if error is None)
+
+    def test_previous_results_produce_delta(self):
+        """اختبار تمرير النتائج السابقة إلى الماسح وإضافة الفروقات إلى النتائج"""
+        class IncrementalScanner(FakeScanner):
+            def use_previous_results(self, previous):
+                self.previous = previous
+
+            def scan(self):
+                return {"target_info": {"ip": self.target}, "vulnerabilities": [{"port": 80, "vulnerability": "new"}]}
+
+        previous = {"10.0.0.1": {"vulnerabilities": [{"port": 80, "vulnerability": "old"}]}}
+        received = {}
+        logger = MagicMock()
+        orchestrator = ScanOrchestrator(IncrementalScanner, [80], logger=logger, previous=previous)
+        orchestrator.run(["10.0.0.1", "10.0.0.2"], lambda target, results, error: received.update({target: results}))
+
+        assert [f["vulnerability"] for f in received["10.0.0.1"]["delta"]["new"]] == ["new"]
+        assert [f["vulnerability"] for f in received["10.0.0.1"]["delta"]["resolved"]] == ["old"]
+        assert "delta" not in received["10.0.0.2"]
+        # الهدف الذي لا توجد له نتائج سابقة يُمسح كاملاً مع تحذير
+        assert any("10.0.0.2" in call.args[0] for call in logger.warning.call_args_list)
+        assert not any("10.0.0.1" in call.args[0] for call in logger.warning.call_args_list)
+
+    def test_interrupt_stops_running_scans(self):
+        """اختبار أن المقاطعة تعود فورًا وتوقف الماسحات الجارية دون انتظارها"""
+        class SlowScanner(FakeScanner):
+            stopped = []
+            started = threading.Event()
+
+            def __init__(self, *args):
+                super().__init__(*args)
+                self.event = threading.Event()
+
+            def scan(self):
+                if self.target != "fast":
+                    SlowScanner.started.set()
+                    self.event.wait(5)
+                return {"target_info": {"ip": self.target}}
+
+            def stop(self):
+                SlowScanner.stopped.append(self.target)
+                self.event.set()
+
+        def on_result(target, results, error):
+            SlowScanner.started.wait(5)
+            raise KeyboardInterrupt
+
+        orchestrator = ScanOrchestrator(SlowScanner, [80], logger=MagicMock(), max_workers=2)
+        start = time.monotonic()
+        with pytest.raises(KeyboardInterrupt):
+            orchestrator.run(["fast", "slow", "queued"], on_result)
+
+        assert time.monotonic() - start < 2
+        assert SlowScanner.stopped == ["slow"]
+
+    def test_journal_skips_completed_targets(self, tmp_path):
+        """اختبار تسجيل اكتمال الأهداف وتخطيها عند الاستئناف بالسجل نفسه"""
+        class JournaledScanner(FakeScanner):
+            def use_journal(self, journal):
+                self.journal = journal
+
+        path = str(tmp_path / "journal.jsonl")
+        orchestrator = ScanOrchestrator(JournaledScanner, [80], logger=MagicMock(), journal=ScanJournal(path))
+        orchestrator.run(["10.0.0.1", "bad"], lambda target, results, error: None)
+
+        received = []
+        orchestrator = ScanOrchestrator(JournaledScanner, [80], logger=MagicMock(), journal=ScanJournal(path))
+        stats = orchestrator.run(["10.0.0.1", "10.0.0.2"], lambda target, results, error: received.append(target))
+
+        assert stats == {"completed": 1, "failed": 0, "skipped": 1}
+        assert received == ["10.0.0.2"]
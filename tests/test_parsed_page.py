@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import os
+import sys
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# استيراد وحدة الصفحة المحللة
+from modules.parsed_page import ParsedPage
+
+
+HTML = """
+<html>
+<head>
+    <title>Admin: Profile</title>
+    <meta name="generator" content="WordPress 6.2.1">
+    <script src="/wp-includes/js/jquery/jquery-3.6.0.min.js"></script>
+    <script>var inline = true;</script>
+</head>
+<body>
+    <a href="/about">About</a>
+    <a href="contact">Contact</a>
+    <a href="/about">About again</a>
+    <a href="#top">Top</a>
+    <a href="javascript:void(0)">JS</a>
+    <a href="https://other.example.com/">Other</a>
+    <form action="/login" method="post">
+        <input name="user" required>
+        <textarea name="comment"></textarea>
+    </form>
+</body>
+</html>
+"""
+
+
+class TestParsedPage:
+    """اختبارات لوحدة الصفحة المحللة"""
+
+    def setup_method(self):
+        """إعداد بيئة الاختبار"""
+        self.page = ParsedPage(HTML, "https://example.com/index.php")
+
+    def test_links(self):
+        """اختبار استخراج الروابط المطلقة الفريدة"""
+        assert self.page.links == [
+            "https://example.com/about",
+            "https://example.com/contact",
+            "https://other.example.com/"
+        ]
+
+    def test_forms(self):
+        """اختبار استخراج النماذج وحقول الإدخال"""
+        assert self.page.forms == [{
+            "action": "/login",
+            "method": "POST",
+            "inputs": [
+                {"name": "user", "type": "text", "required": True},
+                {"name": "comment", "type": "textarea", "required": False}
+            ]
+        }]
+
+    def test_meta_scripts_and_title(self):
+        """اختبار العلامات الوصفية ومصادر النصوص البرمجية والعنوان"""
+        assert self.page.meta_generator == "WordPress 6.2.1"
+        assert self.page.script_srcs == ["/wp-includes/js/jquery/jquery-3.6.0.min.js"]
+        assert self.page.title == "Admin: Profile"
+        assert "wordpress 6.2.1" in self.page.lower_text
+
+    def test_lazy_parsing(self):
+        """اختبار عدم تحليل HTML قبل الحاجة وتحليله مرة واحدة فقط"""
+        page = ParsedPage("<html><body>plain</body></html>")
+        assert "plain" in page.text
+        assert page._soup is None
+
+        soup = page.soup
+        assert page.meta_generator == ""
+        assert page.soup is soup
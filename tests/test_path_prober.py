@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import os
+import sys
+import threading
+
+import requests
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# استيراد وحدة فحص المسارات
+from modules.path_prober import PathProber
+from modules.probe_scheduler import ProbeScheduler
+
+
+def make_response(status_code, body=b""):
+    """إنشاء استجابة حقيقية بمحتوى معروف"""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response._content_consumed = True
+    response.headers["Content-Length"] = str(len(body))
+    return response
+
+
+class FakeHttp:
+    """عميل HTTP وهمي يعيد استجابات حسب المسار"""
+
+    def __init__(self, pages, catch_all=None):
+        self.pages = pages
+        self.catch_all = catch_all
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def _respond(self, method, url):
+        with self.lock:
+            self.calls.append((method, url))
+        path = url.split("example.com", 1)[1]
+        if path in self.pages:
+            return make_response(200, self.pages[path])
+        if self.catch_all is not None:
+            return make_response(200, self.catch_all.replace(b"{path}", path.encode()))
+        return make_response(404, b"not found")
+
+    def head(self, url, **kwargs):
+        return self._respond("HEAD", url)
+
+    def get(self, url, **kwargs):
+        return self._respond("GET", url)
+
+
+class TestPathProber:
+    """اختبارات لوحدة فحص المسارات الحساسة"""
+
+    def test_head_when_host_returns_404(self):
+        """اختبار استخدام طلبات HEAD فقط عندما يعيد المضيف 404 بشكل صحيح"""
+        http = FakeHttp({"/.env": b"SECRET=1", "/backup/": b"<ul></ul>"})
+        prober = PathProber(http, ProbeScheduler(width=4))
+
+        found = prober.probe("http://example.com", ["/.git/", "/.env", "/backup/", "/db/"])
+
+        assert [item["path"] for item in found] == ["/.env", "/backup/"]
+        probe_calls = [call for call in http.calls if call[0] == "HEAD"]
+        assert len(probe_calls) == 4
+
+    def test_soft_404_is_filtered(self):
+        """اختبار استبعاد صفحات 404 الزائفة في المواقع التي تعيد 200 لكل مسار"""
+        http = FakeHttp(
+            {"/.env": b"DB_PASSWORD=secret\nAPP_KEY=base64:abcdef"},
+            catch_all=b"<html><body>Sorry, {path} was not found on this server.</body></html>"
+        )
+        prober = PathProber(http, ProbeScheduler(width=4))
+
+        found = prober.probe("http://example.com", ["/.env", "/.git/", "/phpinfo.php", "/server-status"])
+
+        assert [item["path"] for item in found] == ["/.env"]
+
+    def test_baseline_is_cached_per_host_and_suffix(self):
+        """اختبار طلب الصفحة العشوائية مرة واحدة لكل مضيف وامتداد"""
+        http = FakeHttp({})
+        prober = PathProber(http, ProbeScheduler(width=4))
+
+        prober.probe("http://example.com", ["/a.php", "/b.php", "/c/", "/d/"])
+        prober.probe("http://example.com", ["/e.php"])
+
+        baseline_calls = [call for call in http.calls if call[0] == "GET"]
+        assert len(baseline_calls) == 2
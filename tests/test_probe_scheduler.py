@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import os
+import sys
+import time
+import threading
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# استيراد وحدة جدولة الفحوصات
+from modules.probe_scheduler import ProbeScheduler, iter_wordlist
+
+
+class TestProbeScheduler:
+    """اختبارات لوحدة جدولة الفحوصات المتزامنة"""
+
+    def test_results_keep_input_order(self):
+        """اختبار إعادة النتائج بترتيب المدخلات مع تجاهل الفشل والنتائج الفارغة"""
+        scheduler = ProbeScheduler(width=4)
+
+        def probe(item):
+            time.sleep(0.01 * (5 - item))
+            if item == 2:
+                raise ValueError("فشل")
+            return None if item == 3 else item * 10
+
+        assert scheduler.map(probe, range(5)) == [(0, 0), (1, 10), (4, 40)]
+
+    def test_width_is_bounded(self):
+        """اختبار أن عدد الفحوصات المتزامنة لا يتجاوز العرض المحدد"""
+        scheduler = ProbeScheduler(width=3)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def probe(item):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return item
+
+        assert len(scheduler.map(probe, range(20))) == 20
+        assert state["peak"] <= 3
+
+    def test_concurrent_maps_share_executor(self):
+        """اختبار أن الاستدعاءات المتزامنة لـ map تشترك في منفذ واحد بعرض المجدول"""
+        scheduler = ProbeScheduler(width=3)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def probe(item):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return item
+
+        threads = [threading.Thread(target=scheduler.map, args=(probe, range(10))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert state["peak"] <= 3
+        executor = scheduler._executor
+        assert executor is not None
+        scheduler.map(probe, range(2))
+        assert scheduler._executor is executor
+
+        scheduler.close()
+        assert scheduler._executor is None
+
+    def test_per_host_limit(self):
+        """اختبار تحديد عدد الطلبات المتزامنة للمضيف الواحد"""
+        scheduler = ProbeScheduler(width=6, per_host_limit=2)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def probe(item):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return item
+
+        assert [item for item, _ in scheduler.map(probe, range(12), host="example.com")] == list(range(12))
+        assert state["peak"] <= 2
+
+    def test_stop_when_cancels_remaining(self):
+        """اختبار الإيقاف المبكر دون استهلاك بقية المدخلات"""
+        scheduler = ProbeScheduler(width=2)
+        consumed = []
+
+        def items():
+            for i in range(10000):
+                consumed.append(i)
+                yield i
+
+        results = scheduler.map(lambda item: 429 if item == 5 else 200, items(),
+                                stop_when=lambda item, status: status == 429)
+
+        assert (5, 429) in results
+        assert len(consumed) < 100
+
+    def test_rate_limit_per_host(self):
+        """اختبار تباعد الطلبات إلى المضيف نفسه حسب حد المعدل"""
+        scheduler = ProbeScheduler(width=5, rate_limit=50)
+
+        start = time.monotonic()
+        scheduler.map(lambda item: item, range(6), host="example.com")
+        assert time.monotonic() - start >= 0.09
+
+    def test_iter_wordlist(self, tmp_path):
+        """اختبار قراءة قائمة الكلمات مع تجاهل التعليقات والتكرارات"""
+        wordlist = tmp_path / "plugins.txt"
+        wordlist.write_text("# comment\nakismet\n\ncontact-form-7\nakismet\n", encoding="utf-8")
+
+        assert list(iter_wordlist(str(wordlist))) == ["akismet", "contact-form-7"]
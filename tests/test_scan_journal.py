@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import os
+import sys
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# استيراد وحدة سجل تقدم المسح
+from modules.scan_journal import ScanJournal
+
+
+class TestScanJournal:
+    """اختبارات لوحدة سجل تقدم المسح"""
+
+    def test_stages_survive_reopen(self, tmp_path):
+        """اختبار استعادة المراحل والأهداف المكتملة بعد إعادة فتح السجل"""
+        path = str(tmp_path / "journal.jsonl")
+        journal = ScanJournal(path)
+        journal.record_stage("example.com", "host", {"open_ports": [{"port": 80, "service": "http"}]})
+        journal.mark_completed("10.0.0.1")
+        journal.close()
+
+        journal = ScanJournal(path)
+        assert journal.stage_results("example.com", "host") == {"open_ports": [{"port": 80, "service": "http"}]}
+        assert journal.stage_results("example.com", "web") is None
+        assert journal.is_completed("10.0.0.1")
+        assert not journal.is_completed("example.com")
+
+    def test_stage_results_are_copies(self, tmp_path):
+        """اختبار أن تعديل النتائج المستعادة لا يغير ما في السجل"""
+        journal = ScanJournal(str(tmp_path / "journal.jsonl"))
+        journal.record_stage("example.com", "web", {"web_vulnerabilities": []})
+
+        journal.stage_results("example.com", "web")["web_vulnerabilities"].append({"type": "XSS"})
+
+        assert journal.stage_results("example.com", "web") == {"web_vulnerabilities": []}
+
+    def test_truncated_last_line_is_ignored(self, tmp_path):
+        """اختبار تجاهل السطر الأخير غير المكتمل عند انقطاع الكتابة"""
+        path = str(tmp_path / "journal.jsonl")
+        journal = ScanJournal(path)
+        journal.record_stage("example.com", "host", {"vulnerabilities": []})
+        journal.close()
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"event": "stage", "target": "example.com", "stage": "web", "res')
+
+        journal = ScanJournal(path)
+        assert journal.stage_results("example.com", "host") == {"vulnerabilities": []}
+        assert journal.stage_results("example.com", "web") is None
+        journal.record_stage("example.com", "web", {"web_vulnerabilities": []})
+        journal.close()
+
+        assert ScanJournal(path).stage_results("example.com", "web") == {"web_vulnerabilities": []}
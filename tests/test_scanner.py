@@ -24,7 +24,7 @@ class TestVulnerabilityScanner(unittest.TestCase):
         self.timeout = 10
         
         # إنشاء كائن الماسح
-        with patch('modules.scanner.nmap.PortScanner') as mock_port_scanner:
+        with patch('modules.scanner.shutil.which', return_value='/usr/bin/nmap'):
             self.scanner = VulnerabilityScanner(
                 target=self.target,
                 ports=self.ports,
@@ -32,7 +32,6 @@ class TestVulnerabilityScanner(unittest.TestCase):
                 timeout=self.timeout,
                 logger=self.logger
             )
-            self.mock_port_scanner = mock_port_scanner
 
     def test_initialization(self):
         """اختبار تهيئة الماسح"""
@@ -122,5 +121,89 @@ class TestVulnerabilityScanner(unittest.TestCase):
         self.assertEqual(dns_info, {})
 
 
+class TestNmapRetry(unittest.TestCase):
+    """اختبارات إعادة مسح nmap بدون اكتشاف نظام التشغيل"""
+
+    def test_root_error_disables_os_detection(self):
+        """اختبار أن المسوحات اللاحقة تتخطى -O بعد فشله لعدم وجود صلاحيات الجذر"""
+        scanner = VulnerabilityScanner('192.0.2.1', [80], logger=MagicMock())
+        plan = scanner._build_scan_plan()
+        self.assertIn('-O', scanner._nmap_command(plan))
+
+        self.assertTrue(scanner._nmap_failed(plan, 1, 'TCP/IP fingerprinting (for OS scan) requires root privileges.'))
+        self.assertFalse(scanner.os_detection)
+        self.assertNotIn('-O', scanner._nmap_command(scanner._build_scan_plan()))
+        self.assertFalse(scanner._nmap_failed(scanner._build_scan_plan(), 1, 'requires root privileges'))
+
+        # خطة اكتشاف نظام التشغيل فقط لا تُعاد بدونه
+        scanner.os_detection = True
+        os_plan = scanner._build_scan_plan(version_detection=False)
+        self.assertFalse(scanner._nmap_failed(os_plan, 1, 'requires root privileges'))
+        self.assertFalse(scanner.os_detection)
+
+
+class TestIncrementalNmapScan(unittest.TestCase):
+    """اختبارات مسح nmap التزايدي"""
+
+    def _scan(self, os_detection):
+        scanner = VulnerabilityScanner('192.0.2.1', [22, 80], logger=MagicMock())
+        scanner.os_detection = os_detection
+        scanner.use_previous_results({"services": [{"port": 22, "name": "ssh", "product": "OpenSSH", "version": "8.9"}]})
+        tcp = {
+            22: {"state": "open", "name": "ssh", "product": "OpenSSH", "version": "8.9"},
+            80: {"state": "open", "name": "http", "product": "nginx", "version": "1.24"}
+        }
+        plans = []
+
+        def run(plan, on_port=None):
+            plans.append(plan)
+            if plan["version_detection"]:
+                for port in plan["port_list"]:
+                    on_port(port, tcp[port])
+                return {"tcp": dict(tcp)}
+            return {"tcp": {80: {"state": "open", "name": "http"}}, "osmatch": [{"name": "Linux 5.x", "accuracy": "98"}]}
+
+        with patch.object(scanner, "_run_nmap_scan", side_effect=run):
+            host_data = scanner._run_host_nmap_scan([22, 80])
+        return scanner, plans, host_data
+
+    def test_rescan_detects_os_only(self):
+        """اختبار أن إعادة مسح المنافذ المتغيرة لا تعيد اكتشاف الإصدارات"""
+        scanner, plans, host_data = self._scan(os_detection=True)
+
+        self.assertEqual([plan["os_detection"] for plan in plans], [False, True])
+        self.assertEqual([plan["version_detection"] for plan in plans], [True, False])
+        self.assertEqual(plans[1]["port_list"], [80])
+        self.assertNotIn('-sV', scanner._nmap_command(plans[1]))
+        # المنافذ تُسجل أثناء مسح الخدمات، وبيانات الخدمة لا تُستبدل ببيانات مسح نظام التشغيل
+        self.assertEqual([port["port"] for port in scanner.results["open_ports"]], [22, 80])
+        self.assertEqual(host_data["tcp"][80]["product"], "nginx")
+        self.assertEqual(host_data["osmatch"][0]["name"], "Linux 5.x")
+
+    def test_rescan_skipped_without_os_detection(self):
+        """اختبار تخطي إعادة المسح عند تعطيل اكتشاف نظام التشغيل"""
+        scanner, plans, host_data = self._scan(os_detection=False)
+
+        self.assertEqual(len(plans), 1)
+        self.assertEqual(scanner._changed_ports, [80])
+
+
+class TestScannerStop(unittest.TestCase):
+    """اختبارات إيقاف الماسح من مسار تنفيذ آخر"""
+
+    def test_stop_kills_running_nmap_and_skips_later_runs(self):
+        """اختبار إنهاء عمليات nmap الجارية وعدم تشغيل عمليات جديدة بعد الإيقاف"""
+        scanner = VulnerabilityScanner('192.0.2.1', [80], logger=MagicMock())
+        process = MagicMock()
+        scanner._nmap_processes.add(process)
+
+        scanner.stop()
+        process.kill.assert_called_once()
+
+        with patch('modules.scanner.subprocess.Popen') as mock_popen:
+            self.assertEqual(scanner._run_nmap_scan(scanner._build_scan_plan()), {})
+            mock_popen.assert_not_called()
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
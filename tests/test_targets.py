@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import os
+import sys
+import types
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# استيراد وحدة توسيع الأهداف
+from modules.targets import expand_target, iter_targets, is_multi_target
+
+
+class TestTargets:
+    """اختبارات لوحدة توسيع الأهداف"""
+
+    def test_expand_single_targets(self):
+        """اختبار الأهداف المفردة"""
+        assert list(expand_target("192.168.1.10")) == ["192.168.1.10"]
+        assert list(expand_target("example.com")) == ["example.com"]
+        assert list(expand_target("my-site.example.com")) == ["my-site.example.com"]
+        assert list(expand_target("10.0.0.5/32")) == ["10.0.0.5"]
+
+    def test_expand_cidr(self):
+        """اختبار توسيع شبكة CIDR"""
+        hosts = list(expand_target("10.0.0.0/30"))
+        assert hosts == ["10.0.0.1", "10.0.0.2"]
+
+    def test_expand_cidr_is_lazy(self):
+        """اختبار أن توسيع الشبكات الكبيرة يتم بشكل كسول"""
+        targets = expand_target("10.0.0.0/8")
+        assert isinstance(targets, types.GeneratorType)
+        assert next(targets) == "10.0.0.1"
+
+    def test_expand_ranges(self):
+        """اختبار توسيع نطاقات العناوين"""
+        assert list(expand_target("10.0.0.1-3")) == ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+        assert list(expand_target("10.0.0.254-10.0.1.1")) == ["10.0.0.254", "10.0.0.255", "10.0.1.0", "10.0.1.1"]
+        assert list(expand_target("::1-::3")) == ["::1", "::2", "::3"]
+
+        # نطاق يخلط IPv4 و IPv6 ليس نطاقًا صالحًا
+        assert list(expand_target("10.0.0.1-::3")) == ["10.0.0.1-::3"]
+        assert is_multi_target("10.0.0.1-::3") is False
+
+    def test_is_multi_target(self):
+        """اختبار التعرف على مواصفات الأهداف المتعددة"""
+        assert is_multi_target("10.0.0.0/24") is True
+        assert is_multi_target("10.0.0.1-20") is True
+        assert is_multi_target("a.com,b.com") is True
+        assert is_multi_target("10.0.0.1") is False
+        assert is_multi_target("10.0.0.1/32") is False
+        assert is_multi_target("my-site.com") is False
+
+    def test_iter_targets_from_file(self, tmp_path):
+        """اختبار قراءة الأهداف من ملف"""
+        targets_file = tmp_path / "targets.txt"
+        targets_file.write_text("# أهداف الاختبار\nexample.com\n\n10.0.0.0/30  # شبكة\n", encoding="utf-8")
+
+        targets = list(iter_targets("a.com,b.com", str(targets_file)))
+
+        assert targets == ["a.com", "b.com", "example.com", "10.0.0.1", "10.0.0.2"]
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import os
+import sys
+import time
+import socket
+import threading
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# استيراد وحدة فحص TLS
+from modules.tls_inspector import TlsInspector
+
+
+class TestTlsInspector:
+    """اختبارات لوحدة فحص TLS"""
+
+    def test_handshake_is_cached_per_host_port_and_sni(self):
+        """اختبار إجراء المصافحة مرة واحدة لكل (مضيف، منفذ، SNI) حتى عند الفحص المتزامن"""
+        inspector = TlsInspector()
+        calls = []
+
+        def fake_handshake(host, port, sni, timeout):
+            calls.append((host, port, sni))
+            time.sleep(0.05)
+            return {"host": host, "port": port, "sni": sni}
+
+        inspector._handshake = fake_handshake
+
+        threads = [
+            threading.Thread(target=inspector.inspect, args=("Example.com", 443))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        inspector.inspect("example.com", 443, sni="www.example.com")
+        inspector.inspect("example.com", 8443)
+
+        assert sorted(calls) == [
+            ("Example.com", 443, "example.com"),
+            ("example.com", 443, "www.example.com"),
+            ("example.com", 8443, "example.com"),
+        ]
+
+    def test_stalled_handshake_times_out(self):
+        """اختبار عدم توقف الفحص عند خادم يقبل الاتصال ولا يكمل المصافحة"""
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        port = server.getsockname()[1]
+
+        try:
+            start = time.monotonic()
+            result = TlsInspector().inspect("127.0.0.1", port, timeout=0.5)
+            assert time.monotonic() - start < 5
+        finally:
+            server.close()
+
+        assert result["error"]
+        assert not result["verified"]
+        assert result["certificate"] == {}
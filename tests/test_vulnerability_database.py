@@ -11,7 +11,7 @@ from unittest.mock import patch, MagicMock, mock_open
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # استيراد وحدة قاعدة بيانات الثغرات الأمنية
-from modules.vulnerability_database import VulnerabilityDatabase
+from modules.vulnerability_database import VulnerabilityDatabase, parse_version
 
 
 class TestVulnerabilityDatabase:
@@ -351,4 +351,63 @@ class TestVulnerabilityDatabase:
         assert "woocommerce" in merged_db["wordpress"]["plugins"]
         assert "contact-form-7" in merged_db["wordpress"]["plugins"]
         assert len(merged_db["wordpress"]["plugins"]["woocommerce"]["vulnerabilities"]) == 1
-        assert merged_db["wordpress"]["plugins"]["woocommerce"]["vulnerabilities"][0]["id"] == "CVE-2021-12345"
\ No newline at end of file
+        assert merged_db["wordpress"]["plugins"]["woocommerce"]["vulnerabilities"][0]["id"] == "CVE-2021-12345"
+
+    def test_normalize_legacy_database(self):
+        """اختبار تحويل الملفات القديمة المفهرسة حسب الإصدار إلى مجالات"""
+        from modules.vulnerability_database import normalize_legacy_database
+
+        legacy = {
+            "core": {
+                "4.7.0": [{"id": "CVE-2017-5611", "name": "WordPress 4.7.0-4.7.1 - Content Type Bypass"}],
+                "4.7.1": [{"id": "CVE-2017-5611", "name": "WordPress 4.7.0-4.7.1 - Content Type Bypass"}]
+            },
+            "plugins": {
+                "contact-form-7": {"5.3.1": [{"id": "CVE-2020-35489", "name": "Contact Form 7 <= 5.3.1 - Upload"}]}
+            }
+        }
+
+        db = VulnerabilityDatabase()
+        db.db = normalize_legacy_database("wordpress", legacy)
+
+        assert [v["id"] for v in db.check_wordpress_core_vulnerabilities("4.7.1")] == ["CVE-2017-5611"]
+        assert db.check_wordpress_core_vulnerabilities("4.6.9") == []
+        assert db.check_wordpress_core_vulnerabilities("4.7.2") == []
+        assert len(db.check_wordpress_plugin_vulnerabilities("contact-form-7", "5.0")) == 1
+        assert db.check_wordpress_plugin_vulnerabilities("contact-form-7", "5.3.2") == []
+        assert len(db.check_wordpress_plugin_vulnerabilities("contact-form-7", None)) == 1
+
+    def test_interval_index_lookup(self):
+        """اختبار البحث في فهرس المجالات مع عدد كبير من الثغرات"""
+        vulnerabilities = [
+            {"id": f"CVE-{i}", "affected_versions": [f">={i}.0", f"<{i}.5"]}
+            for i in range(1, 20001)
+        ]
+        vulnerabilities.append({"id": "CVE-ALL", "affected_versions": ["<100000"]})
+        vulnerabilities.append({"id": "CVE-EXACT", "affected_versions": ["1234.7", "1234.8"]})
+
+        db = VulnerabilityDatabase()
+        db.db = {"web_servers": {"apache": {"vulnerabilities": vulnerabilities}}}
+
+        assert [v["id"] for v in db.check_web_server_vulnerabilities("Apache", "1234.2")] == ["CVE-1234", "CVE-ALL"]
+        assert [v["id"] for v in db.check_web_server_vulnerabilities("apache", "1234.8")] == ["CVE-ALL", "CVE-EXACT"]
+        assert [v["id"] for v in db.check_web_server_vulnerabilities("apache", "1234.5")] == ["CVE-ALL"]
+        assert db.check_web_server_vulnerabilities("apache", "غير معروف") == []
+
+    def test_open_range_does_not_widen_lookup(self):
+        """اختبار أن مجالًا مفتوحًا لا يجعل البحث يفحص كل المجالات"""
+        vulnerabilities = [{"id": "CVE-ALL", "affected_versions": ["<1000000"]}]
+        vulnerabilities += [
+            {"id": f"CVE-{i}", "affected_versions": [f">={i}.0", f"<={i}.5"]}
+            for i in range(1, 20001)
+        ]
+        vulnerabilities.append({"id": "CVE-NOT", "affected_versions": [">=500", "!=500.1", "<501"]})
+
+        db = VulnerabilityDatabase()
+        db.db = {"web_servers": {"apache": {"vulnerabilities": vulnerabilities}}}
+        _, _, tree = db._get_index(("web_servers", "apache"))
+
+        assert sorted(tree.query(parse_version("500.1"))) == [0, 500, 20001]
+        assert [v["id"] for v in db.check_web_server_vulnerabilities("apache", "500.1")] == ["CVE-ALL", "CVE-500"]
+        assert [v["id"] for v in db.check_web_server_vulnerabilities("apache", "500.2")] == ["CVE-ALL", "CVE-500", "CVE-NOT"]
+        assert [v["id"] for v in db.check_web_server_vulnerabilities("apache", "1000000")] == []
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import os
+import sys
+import time
+import threading
+
+# إضافة المجلد الرئيسي إلى مسار البحث
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# استيراد وحدة ذاكرة WHOIS
+from modules.whois_cache import WhoisCache, PublicSuffixList
+
+
+class TestWhoisCache:
+    """اختبارات لوحدة ذاكرة WHOIS"""
+
+    def test_registrable_domain(self, tmp_path):
+        """اختبار تحديد النطاق القابل للتسجيل مع اللواحق متعددة المستويات والقواعد * و !"""
+        suffixes = PublicSuffixList.for_path()
+        assert suffixes.registrable_domain("www.example.com") == "example.com"
+        assert suffixes.registrable_domain("mail.moh.gov.sa") == "moh.gov.sa"
+        assert suffixes.registrable_domain("a.b.example.co.uk") == "example.co.uk"
+        assert suffixes.registrable_domain("project.github.io") == "project.github.io"
+        assert suffixes.registrable_domain("com.sa") is None
+
+        path = tmp_path / "psl.dat"
+        path.write_text("// test\n*.ck\n!www.ck\n", encoding="utf-8")
+        custom = PublicSuffixList(str(path))
+        assert custom.registrable_domain("shop.example.co.ck") == "example.co.ck"
+        assert custom.registrable_domain("www.ck") == "www.ck"
+
+    def test_results_persist_with_negative_caching(self, tmp_path):
+        """اختبار حفظ النتائج بين العمليات وتخزين عدم وجود سجل لمدة أقصر"""
+        path = str(tmp_path / "whois.sqlite")
+        calls = []
+
+        def fetch(domain):
+            calls.append(domain)
+            return {"registrar": "Example Registrar"} if domain == "example.com" else None
+
+        cache = WhoisCache(path)
+        assert cache.lookup("example.com", fetch)["registrar"] == "Example Registrar"
+        assert cache.lookup("missing.sa", fetch, negative_ttl=0.1) is None
+        cache.close()
+
+        cache = WhoisCache(path)
+        assert cache.lookup("Example.com", fetch)["registrar"] == "Example Registrar"
+        assert cache.lookup("missing.sa", fetch) is None
+        assert calls == ["example.com", "missing.sa"]
+
+        time.sleep(0.15)
+        cache.lookup("missing.sa", fetch)
+        assert calls == ["example.com", "missing.sa", "missing.sa"]
+
+    def test_concurrent_lookups_are_deduplicated(self, tmp_path):
+        """اختبار انتظار الأهداف المتزامنة لاستعلام واحد عن النطاق نفسه"""
+        cache = WhoisCache(str(tmp_path / "whois.sqlite"))
+        calls = []
+
+        def fetch(domain):
+            calls.append(domain)
+            time.sleep(0.05)
+            return {"registrar": "Example Registrar"}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.lookup("example.com", fetch)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert calls == ["example.com"]
+        assert len(results) == 8
+        assert all(result == {"registrar": "Example Registrar"} for result in results)